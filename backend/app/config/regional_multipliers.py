@@ -12,7 +12,9 @@ Design goals:
 from __future__ import annotations
 
 import re
-from typing import Dict, Optional, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
 
 
 # ---------------------------------------------------------------------------
@@ -332,6 +334,22 @@ STATE_NAME_TO_CODE: Dict[str, str] = {
 
 SORTED_STATE_NAMES = sorted(STATE_NAME_TO_CODE.keys(), key=len, reverse=True)
 
+
+def _build_state_suffix_index(names: Iterable[str]) -> Dict[str, Tuple[str, ...]]:
+    # A trailing state name always ends with the location's last word, so
+    # bucket names by that word ("carolina" -> north/south carolina) and
+    # only test the handful of candidates, longest first.
+    index: Dict[str, List[str]] = {}
+    for name in sorted(names, key=len, reverse=True):
+        index.setdefault(name.rsplit(" ", 1)[-1], []).append(name)
+    return {word: tuple(candidates) for word, candidates in index.items()}
+
+
+STATE_SUFFIX_INDEX = _build_state_suffix_index(STATE_NAME_TO_CODE.keys())
+
+# Distinct strings kept by the resolve_location_context memo.
+LOCATION_CONTEXT_CACHE_SIZE = 4096
+
 def _normalize_city(city: str) -> str:
     return re.sub(r"\s+", " ", city.strip().lower())
 
@@ -357,6 +375,15 @@ def _resolve_state_token(value: str) -> Optional[str]:
         return STATE_NAME_TO_CODE[normalized]
     return None
 
+def _match_state_suffix(normalized: str) -> Optional[str]:
+    """Longest state name that ``normalized`` ends with (after a space)."""
+    candidates = STATE_SUFFIX_INDEX.get(normalized.rsplit(" ", 1)[-1])
+    if candidates:
+        for state_name in candidates:
+            if normalized.endswith(f" {state_name}"):
+                return state_name
+    return None
+
 def parse_location(location: str) -> Tuple[Optional[str], Optional[str]]:
     """
     Attempt to parse a user-provided location string into (city, state).
@@ -384,14 +411,12 @@ def parse_location(location: str) -> Tuple[Optional[str], Optional[str]]:
         state = _normalize_state(m.group("state"))
         return city, state
 
-    loc_lower = _normalize_state_name_text(loc)
-    for state_name in SORTED_STATE_NAMES:
-        suffix = f" {state_name}"
-        if loc_lower.endswith(suffix):
-            city_part = loc[: -len(suffix)].rstrip(", ").strip()
-            city = _normalize_city(city_part)
-            if city:
-                return city, STATE_NAME_TO_CODE[state_name]
+    state_name = _match_state_suffix(_normalize_state_name_text(loc))
+    if state_name:
+        city_part = loc[: -len(state_name) - 1].rstrip(", ").strip()
+        city = _normalize_city(city_part)
+        if city:
+            return city, STATE_NAME_TO_CODE[state_name]
 
     # City-only fallback: try to infer state for known cities
     city_only = _normalize_city(loc)
@@ -454,6 +479,8 @@ def _location_has_explicit_state(location: Optional[str]) -> bool:
     if not location:
         return False
     loc = location.strip()
+    if not loc:
+        return False
     if "," in loc:
         _, state_part = loc.split(",", 1)
         return _resolve_state_token(state_part) is not None
@@ -462,19 +489,49 @@ def _location_has_explicit_state(location: Optional[str]) -> bool:
     if len(tail) == 2 and tail.isalpha():
         return True
 
-    loc_lower = _normalize_state_name_text(loc)
-    for state_name in SORTED_STATE_NAMES:
-        if loc_lower.endswith(f" {state_name}"):
-            return True
-    return False
+    return _match_state_suffix(_normalize_state_name_text(loc)) is not None
 
 
 def resolve_location_context(location: Optional[str]) -> Dict[str, Optional[str]]:
     """
     Return a structured view of how a location string resolved so callers
     can persist explainable metadata.
+
+    The result is a fresh dict the caller may keep or modify; read-only hot
+    paths should use ``lookup_location_context`` and skip the copy.
+    """
+    return dict(lookup_location_context(location))
+
+
+def lookup_location_context(location: Optional[str]) -> Mapping[str, Any]:
+    """Memoized, read-only ``resolve_location_context``."""
+    return _cached_location_context(location or "")
+
+
+def resolve_location_contexts(locations: Iterable[Optional[str]]) -> List[Mapping[str, Any]]:
+    """
+    Resolve many locations at once (batch imports), in input order.
+
+    Repeated strings are resolved once per call, so a large import does not
+    evict the shared memo with its own duplicates.
     """
-    loc = location or ""
+    resolved: Dict[str, Mapping[str, Any]] = {}
+    results: List[Mapping[str, Any]] = []
+    for location in locations:
+        loc = location or ""
+        context = resolved.get(loc)
+        if context is None:
+            context = resolved[loc] = _cached_location_context(loc)
+        results.append(context)
+    return results
+
+
+@lru_cache(maxsize=LOCATION_CONTEXT_CACHE_SIZE)
+def _cached_location_context(loc: str) -> Mapping[str, Any]:
+    return MappingProxyType(_build_location_context(loc))
+
+
+def _build_location_context(loc: str) -> Dict[str, Any]:
     city, state = parse_location(loc)
     explicit_state = _location_has_explicit_state(loc)
     inferred_city_state = bool(state and not explicit_state)
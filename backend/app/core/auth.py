@@ -2,13 +2,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 import uuid
 
 import httpx
-from fastapi import Depends, Header, HTTPException, status
+from fastapi import Depends, Header, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.auth_bypass import (
@@ -16,7 +17,8 @@ from app.core.auth_bypass import (
     is_testing_bypass_enabled,
 )
 from app.core.config import settings
-from app.db.database import get_db
+from app.core.rate_limiter import remember_rate_limit_identity
+from app.db.database import get_async_db
 from app.db.models import Organization, OrganizationMember
 
 
@@ -204,14 +206,24 @@ def _resolve_membership(
     return _upsert_default_membership(db, user_id=user_id, email=email)
 
 
+def _resolve_membership_access(
+    db: Session, *, user_id: str, email: str, requested_org_id: Optional[str]
+) -> Tuple[str, str]:
+    membership = _resolve_membership(db, user_id=user_id, email=email, requested_org_id=requested_org_id)
+    return membership.org_id, membership.role or "member"
+
+
 async def get_auth_context(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
     requested_org_id: Optional[str] = Header(None, alias="X-Org-Id"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
+    request: Request = None,
 ) -> AuthContext:
     # Local/test-only bypass: never enabled from generic production env flags.
     if is_auth_bypass_enabled():
-        return build_testing_auth_context()
+        auth = build_testing_auth_context()
+        remember_rate_limit_identity(request, auth)
+        return auth
 
     if not credentials or not credentials.credentials:
         raise HTTPException(
@@ -228,17 +240,26 @@ async def get_auth_context(
             detail="Invalid user payload from Supabase",
         )
 
-    membership = _resolve_membership(
-        db,
-        user_id=user_id,
-        email=email,
-        requested_org_id=requested_org_id,
-    )
+    # Membership resolution stays in one sync unit of work; run_sync drives it
+    # over the async connection so lookups never block the event loop.
+    try:
+        org_id, role = await db.run_sync(
+            _resolve_membership_access,
+            user_id=user_id,
+            email=email,
+            requested_org_id=requested_org_id,
+        )
+    finally:
+        # Hand the connection back before the handler runs, so routes on the
+        # sync session never hold a pooled connection from each pool at once.
+        await db.close()
 
-    return AuthContext(
+    auth = AuthContext(
         user_id=user_id,
         email=email,
-        org_id=membership.org_id,
-        role=membership.role or "member",
+        org_id=org_id,
+        role=role,
         access_token=credentials.credentials,
     )
+    remember_rate_limit_identity(request, auth)
+    return auth
@@ -10,6 +10,13 @@ class Settings(BaseSettings):
     environment: str = "development"
     
     database_url: str = "sqlite:///./specsharp.db"
+    # Connection pool / statement limits (pool sizes are ignored for SQLite)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout_seconds: float = 30.0
+    db_pool_recycle_seconds: int = 1800
+    db_pool_pre_ping: bool = True
+    db_statement_timeout_ms: int = 30000
     secret_key: str = ""  # Must be set via environment variable
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
@@ -98,7 +105,20 @@ class Settings(BaseSettings):
     # Redis settings for caching
     redis_url: str = "redis://localhost:6379"
     stripe_webhook_secret: Optional[str] = None
+
+    # Rate limiting: point at Redis so every worker shares one window
+    # (e.g. the REDIS_URL value); unset keeps per-process in-memory limits.
+    rate_limit_storage_uri: Optional[str] = None
+    rate_limit_storage_timeout_seconds: float = 0.25
     
+    # Background export jobs
+    export_artifact_dir: str = "./export_artifacts"
+    export_worker_processes: int = 1
+
+    # Comparable projects: optional JSON list of reference projects searched
+    # alongside each org's own (see app/v2/services/comparables.py).
+    comparables_reference_path: Optional[str] = None
+
     # Logging
     log_level: str = "INFO"
     
@@ -0,0 +1,163 @@
+"""Support for the preforked (gunicorn + uvicorn worker) deployment.
+
+The master imports the app once (``preload_app``), loads every read-only
+config structure, then freezes the GC so forked workers share those pages
+copy-on-write instead of each building and later dirtying its own copy.
+"""
+from __future__ import annotations
+
+import gc
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# Representative inputs that compile the NLP and engine regexes into the
+# module-level ``re`` cache before forking.
+WARMUP_DESCRIPTIONS = (
+    "50,000 sf class A office building in Nashville, TN",
+    "120-unit luxury apartments in Dallas, TX",
+    "200-key full service hotel in Austin, TX",
+    "75,000 sf surgical center in Denver, CO",
+    "250,000 sf distribution center with 40 loading docks in Memphis, TN",
+)
+
+
+@dataclass(frozen=True)
+class ProcessMemory:
+    pid: int
+    rss_kb: int
+    pss_kb: Optional[int] = None
+    shared_kb: Optional[int] = None
+    private_kb: Optional[int] = None
+
+    def describe(self) -> str:
+        parts = [f"pid={self.pid}", f"rss_mb={self.rss_kb / 1024:.1f}"]
+        if self.pss_kb is not None:
+            parts.append(f"pss_mb={self.pss_kb / 1024:.1f}")
+        if self.shared_kb is not None:
+            parts.append(f"shared_mb={self.shared_kb / 1024:.1f}")
+        if self.private_kb is not None:
+            parts.append(f"private_mb={self.private_kb / 1024:.1f}")
+        return " ".join(parts)
+
+
+def read_process_memory(pid: Optional[int] = None) -> Optional[ProcessMemory]:
+    """RSS (and PSS/shared/private where available) from /proc; None off Linux."""
+    pid = os.getpid() if pid is None else int(pid)
+    proc = Path("/proc") / str(pid)
+    fields = _read_kb_fields(proc / "smaps_rollup")
+    if fields:
+        shared = fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0)
+        private = fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0)
+        return ProcessMemory(
+            pid=pid,
+            rss_kb=fields.get("Rss", 0),
+            pss_kb=fields.get("Pss"),
+            shared_kb=shared,
+            private_kb=private,
+        )
+    status = _read_kb_fields(proc / "status")
+    if "VmRSS" in status:
+        return ProcessMemory(pid=pid, rss_kb=status["VmRSS"])
+    return None
+
+
+def child_pids(parent_pid: int) -> List[int]:
+    """Direct children of ``parent_pid`` (the gunicorn workers of a master)."""
+    children: List[int] = []
+    children_files = list((Path("/proc") / str(parent_pid) / "task").glob("*/children"))
+    for task_children in children_files:
+        try:
+            children.extend(int(pid) for pid in task_children.read_text().split())
+        except (OSError, ValueError):
+            continue
+    if not children_files:
+        # Kernels without CONFIG_PROC_CHILDREN: match the ppid field instead.
+        for stat_path in Path("/proc").glob("[0-9]*/stat"):
+            try:
+                fields = stat_path.read_text().rsplit(")", 1)[1].split()
+            except (OSError, IndexError):
+                continue
+            if len(fields) > 1 and fields[1] == str(parent_pid):
+                children.append(int(stat_path.parent.name))
+    return sorted(set(children))
+
+
+def worker_memory_report(master_pid: int) -> Dict[int, ProcessMemory]:
+    report: Dict[int, ProcessMemory] = {}
+    for pid in child_pids(master_pid):
+        memory = read_process_memory(pid)
+        if memory is not None:
+            report[pid] = memory
+    return report
+
+
+def warm_shared_state(descriptions: Iterable[str] = WARMUP_DESCRIPTIONS) -> Dict[str, int]:
+    """Load config registries and compile regexes so workers inherit them."""
+    import re
+
+    from app.services.nlp_service import nlp_service
+    from app.v2.config.master_config import MASTER_CONFIG
+    from app.v2.config.type_profiles import dealshield_content, dealshield_tiles, scope_items
+    from app.v2.engines.unified_engine import unified_engine  # noqa: F401  (builds the engine singleton)
+    from app.v2.services.special_feature_pricing import compile_master_config_special_feature_pricing_rules
+
+    profile_sources = (
+        *scope_items.SCOPE_ITEM_PROFILE_SOURCES,
+        *dealshield_tiles.DEALSHIELD_TILE_PROFILE_SOURCES,
+        *dealshield_content.DEALSHIELD_CONTENT_PROFILE_SOURCES,
+    )
+    # The engine reaches these outside the shared scope-item registry.
+    from app.v2.config.type_profiles.scope_items import educational, specialty  # noqa: F401
+
+    special_feature_rules = compile_master_config_special_feature_pricing_rules()
+
+    for description in descriptions:
+        try:
+            nlp_service.extract_project_details(description)
+        except Exception as exc:
+            logger.warning("[prefork][WARMUP] description parse failed exception_type=%s", exc.__class__.__name__)
+
+    return {
+        "building_types": len(MASTER_CONFIG),
+        "subtypes": sum(len(subtypes) for subtypes in MASTER_CONFIG.values() if isinstance(subtypes, dict)),
+        "profiles": sum(len(source) for source in profile_sources),
+        "special_feature_rules": special_feature_rules,
+        "compiled_regexes": len(getattr(re, "_cache", ())),
+    }
+
+
+def freeze_for_fork() -> int:
+    """Collect, then move every surviving object to the permanent generation.
+
+    Frozen objects are never traversed by the collector again, so the GC does
+    not write to (and un-share) the pages a forked worker inherited.
+    """
+    gc.collect()
+    gc.freeze()
+    return gc.get_freeze_count()
+
+
+def reset_after_fork() -> None:
+    """Drop database connections inherited from the master process."""
+    from app.db.database import reset_engines_after_fork
+
+    reset_engines_after_fork()
+
+
+def _read_kb_fields(path: Union[str, Path]) -> Dict[str, int]:
+    fields: Dict[str, int] = {}
+    try:
+        with open(path, "r", encoding="ascii") as handle:
+            for line in handle:
+                name, _, value = line.partition(":")
+                parts = value.split()
+                if len(parts) == 2 and parts[1] == "kB" and parts[0].isdigit():
+                    fields[name.strip()] = int(parts[0])
+    except OSError:
+        return {}
+    return fields
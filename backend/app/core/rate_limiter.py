@@ -1,5 +1,63 @@
+"""Request rate limiting shared by every worker process.
+
+With ``RATE_LIMIT_STORAGE_URI`` pointing at Redis, limits use the moving
+(sliding) window strategy, which ``limits`` evaluates in Redis as one atomic
+Lua script, so all workers and nodes draw from the same window. When Redis is
+unreachable slowapi falls back to per-process in-memory windows and probes
+the shared store again with backoff.
+"""
+from typing import Any, Dict, Optional
+
 from slowapi import Limiter
 from slowapi.util import get_remote_address
+from starlette.requests import Request
+
+from app.core.config import settings
+
+RATE_LIMIT_KEY_PREFIX = "specsharp-rl"
+RATE_LIMIT_STRATEGY = "moving-window"
+
+
+def remember_rate_limit_identity(request: Optional[Request], auth: Any) -> None:
+    """Expose the resolved AuthContext to ``rate_limit_key`` for this request."""
+    if request is not None:
+        request.state.auth_context = auth
+
+
+def rate_limit_key(request: Request) -> str:
+    # Route dependencies (including get_auth_context) resolve before slowapi
+    # checks the limit, so authenticated traffic is keyed per org member and
+    # users behind one NAT or proxy no longer share a bucket.
+    auth = getattr(request.state, "auth_context", None)
+    if auth is not None and getattr(auth, "org_id", None) and getattr(auth, "user_id", None):
+        return f"org:{auth.org_id}:user:{auth.user_id}"
+    return f"ip:{get_remote_address(request)}"
+
+
+def _storage_options(storage_uri: str) -> Dict[str, Any]:
+    if not storage_uri.startswith(("redis://", "rediss://", "redis+unix://")):
+        return {}
+    timeout = settings.rate_limit_storage_timeout_seconds
+    # Fail fast so an unreachable Redis degrades to local limits instead of
+    # stalling every rate-limited request.
+    return {"socket_connect_timeout": timeout, "socket_timeout": timeout}
+
+
+def build_limiter(
+    storage_uri: Optional[str] = None,
+    storage_options: Optional[Dict[str, Any]] = None,
+) -> Limiter:
+    uri = storage_uri or settings.rate_limit_storage_uri or "memory://"
+    options = _storage_options(uri)
+    options.update(storage_options or {})
+    return Limiter(
+        key_func=rate_limit_key,
+        storage_uri=uri,
+        storage_options=options,
+        strategy=RATE_LIMIT_STRATEGY,
+        in_memory_fallback_enabled=True,
+        key_prefix=RATE_LIMIT_KEY_PREFIX,
+    )
 
 
-limiter = Limiter(key_func=get_remote_address)
+limiter = build_limiter()
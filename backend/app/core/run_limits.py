@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import asdict, dataclass
+from types import SimpleNamespace
 from typing import Any, Iterable, Set
 
 from fastapi import HTTPException, status
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.core.auth_bypass import is_auth_bypass_enabled
@@ -88,8 +91,17 @@ def get_or_create_org_run_quota(
         bonus_runs=0,
         used_runs=0,
     )
-    db.add(quota)
-    db.flush()
+    try:
+        # Savepoint so a concurrent first run for the same org (unique org_id)
+        # only loses the insert, not the caller's transaction.
+        with db.begin_nested():
+            db.add(quota)
+            db.flush()
+    except IntegrityError:
+        existing = db.query(OrganizationRunQuota).filter(OrganizationRunQuota.org_id == org_id).first()
+        if existing is None:
+            raise
+        return existing
     return quota
 
 
@@ -140,46 +152,115 @@ def assert_run_available(db: Session, *, org_id: str, email: str) -> RunLimitSna
     if is_unlimited_user(email):
         return run_limit_snapshot_for(email, None)
 
-    quota = get_or_create_org_run_quota(db, org_id=org_id, for_update=True)
+    # Plain read: this is only a fail-fast check before the calculation. The
+    # authoritative check is the conditional update in consume_run.
+    quota = get_or_create_org_run_quota(db, org_id=org_id)
     snapshot = run_limit_snapshot_for(email, quota)
     if (snapshot.remaining_runs or 0) <= 0:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail={
-                "message": "Run limit reached. Call Cody to add more runs.",
-                "code": "run_limit_reached",
-                "remaining_runs": 0,
-            },
-        )
+        raise _run_limit_reached()
     return snapshot
 
 
 def consume_run(db: Session, *, org_id: str, email: str) -> RunLimitSnapshot:
+    """Reserve one run with a single conditional UPDATE.
+
+    The increment only applies while ``used_runs < included_runs + bonus_runs``, so
+    concurrent generates in one org never overdraw the quota and never wait on a
+    lock held across the engine calculation. Callers that fail after reserving
+    must hand the run back with ``release_run``.
+    """
     if is_run_limit_enforcement_bypassed():
         return bypass_run_limit_snapshot()
     if is_unlimited_user(email):
         return run_limit_snapshot_for(email, None)
 
-    quota = get_or_create_org_run_quota(db, org_id=org_id, for_update=True)
-    snapshot_before = run_limit_snapshot_for(email, quota)
-    if (snapshot_before.remaining_runs or 0) <= 0:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail={
-                "message": "Run limit reached. Call Cody to add more runs.",
-                "code": "run_limit_reached",
-                "remaining_runs": 0,
-            },
+    get_or_create_org_run_quota(db, org_id=org_id)
+    row = db.execute(
+        update(OrganizationRunQuota)
+        .where(
+            OrganizationRunQuota.org_id == org_id,
+            OrganizationRunQuota.used_runs
+            < OrganizationRunQuota.included_runs + OrganizationRunQuota.bonus_runs,
         )
-
-    quota.used_runs = _safe_non_negative(quota.used_runs) + 1
-    db.flush()
-    return run_limit_snapshot_for(email, quota)
+        .values(used_runs=OrganizationRunQuota.used_runs + 1)
+        .returning(
+            OrganizationRunQuota.included_runs,
+            OrganizationRunQuota.bonus_runs,
+            OrganizationRunQuota.used_runs,
+        )
+        .execution_options(synchronize_session=False)
+    ).first()
+    _expire_cached_quota(db, org_id)
+    if row is None:
+        raise _run_limit_reached()
+    return _snapshot_from_row(email, row)
+
+
+def release_run(db: Session, *, org_id: str, email: str) -> RunLimitSnapshot | None:
+    """Give back a run reserved by ``consume_run`` when the generate failed afterwards."""
+    if is_run_limit_enforcement_bypassed() or is_unlimited_user(email):
+        return None
+
+    row = db.execute(
+        update(OrganizationRunQuota)
+        .where(
+            OrganizationRunQuota.org_id == org_id,
+            OrganizationRunQuota.used_runs > 0,
+        )
+        .values(used_runs=OrganizationRunQuota.used_runs - 1)
+        .returning(
+            OrganizationRunQuota.included_runs,
+            OrganizationRunQuota.bonus_runs,
+            OrganizationRunQuota.used_runs,
+        )
+        .execution_options(synchronize_session=False)
+    ).first()
+    _expire_cached_quota(db, org_id)
+    if row is None:
+        return None
+    return _snapshot_from_row(email, row)
 
 
 def grant_bonus_runs(db: Session, *, org_id: str, add_runs: int) -> RunLimitSnapshot:
     normalized = _safe_non_negative(add_runs)
-    quota = get_or_create_org_run_quota(db, org_id=org_id, for_update=True)
-    quota.bonus_runs = _safe_non_negative(quota.bonus_runs) + normalized
-    db.flush()
-    return run_limit_snapshot_for("", quota)
+    get_or_create_org_run_quota(db, org_id=org_id)
+    row = db.execute(
+        update(OrganizationRunQuota)
+        .where(OrganizationRunQuota.org_id == org_id)
+        .values(bonus_runs=OrganizationRunQuota.bonus_runs + normalized)
+        .returning(
+            OrganizationRunQuota.included_runs,
+            OrganizationRunQuota.bonus_runs,
+            OrganizationRunQuota.used_runs,
+        )
+        .execution_options(synchronize_session=False)
+    ).first()
+    _expire_cached_quota(db, org_id)
+    return _snapshot_from_row("", row)
+
+
+def _run_limit_reached() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail={
+            "message": "Run limit reached. Call Cody to add more runs.",
+            "code": "run_limit_reached",
+            "remaining_runs": 0,
+        },
+    )
+
+
+def _snapshot_from_row(email: str, row: Any) -> RunLimitSnapshot:
+    included_runs, bonus_runs, used_runs = row
+    return run_limit_snapshot_for(
+        email,
+        SimpleNamespace(included_runs=included_runs, bonus_runs=bonus_runs, used_runs=used_runs),
+    )
+
+
+def _expire_cached_quota(db: Session, org_id: str) -> None:
+    # The UPDATE bypasses the identity map; drop any loaded copy so later reads
+    # in this session see the new counters.
+    for obj in list(db.identity_map.values()):
+        if isinstance(obj, OrganizationRunQuota) and obj.org_id == org_id:
+            db.expire(obj)
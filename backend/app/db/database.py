@@ -1,4 +1,8 @@
+from typing import Any, AsyncIterator, Dict, Optional
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
@@ -6,9 +10,33 @@ from app.core.config import settings
 
 SQLALCHEMY_DATABASE_URL = settings.database_url
 
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgres": "postgresql+asyncpg",
+}
+
+
+def _is_sqlite(url: str) -> bool:
+    return url.startswith("sqlite")
+
+
+def _pool_options(url: str) -> Dict[str, Any]:
+    if _is_sqlite(url):
+        return {}
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout_seconds,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+
+
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False} if SQLALCHEMY_DATABASE_URL.startswith("sqlite") else {}
+    connect_args={"check_same_thread": False} if _is_sqlite(SQLALCHEMY_DATABASE_URL) else {},
+    **_pool_options(SQLALCHEMY_DATABASE_URL),
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -21,4 +49,89 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+def async_database_url(url: str) -> str:
+    """Map the configured sync URL onto its async driver (aiosqlite / asyncpg)."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if "+" in parsed.drivername and parsed.drivername.split("+", 1)[1] in {"aiosqlite", "asyncpg"}:
+        return url
+    drivername = _ASYNC_DRIVERS.get(backend)
+    if drivername is None:
+        raise ValueError(f"No async driver configured for database backend '{backend}'")
+    parsed = parsed.set(drivername=drivername)
+    if drivername == "postgresql+asyncpg" and "sslmode" in parsed.query:
+        # asyncpg spells libpq's sslmode as ssl.
+        query = dict(parsed.query)
+        query["ssl"] = query.pop("sslmode")
+        parsed = parsed.set(query=query)
+    return parsed.render_as_string(hide_password=False)
+
+
+def _async_connect_args(url: str) -> Dict[str, Any]:
+    if _is_sqlite(url):
+        return {"check_same_thread": False}
+    if settings.db_statement_timeout_ms and settings.db_statement_timeout_ms > 0:
+        # Client-side timeout, so it also holds behind transaction-mode poolers
+        # that reject startup parameters such as statement_timeout.
+        return {"command_timeout": settings.db_statement_timeout_ms / 1000.0}
+    return {}
+
+
+def create_async_db_engine(url: Optional[str] = None) -> AsyncEngine:
+    async_url = async_database_url(url or SQLALCHEMY_DATABASE_URL)
+    return create_async_engine(
+        async_url,
+        connect_args=_async_connect_args(async_url),
+        **_pool_options(async_url),
+    )
+
+
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+
+
+def get_async_engine() -> AsyncEngine:
+    # Created on first use so importing the app never requires the async driver.
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_db_engine()
+    return _async_engine
+
+
+def get_async_sessionmaker() -> async_sessionmaker:
+    global _async_session_factory
+    if _async_session_factory is None:
+        _async_session_factory = async_sessionmaker(
+            bind=get_async_engine(),
+            autoflush=False,
+            # Handlers format ORM rows after commit; reloading expired attributes
+            # would need implicit IO outside an await.
+            expire_on_commit=False,
+        )
+    return _async_session_factory
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _async_session_factory = None
+
+
+def reset_engines_after_fork() -> None:
+    """Forget pooled connections inherited across fork without closing the parent's sockets."""
+    global _async_engine, _async_session_factory
+    engine.dispose(close=False)
+    if _async_engine is not None:
+        _async_engine.sync_engine.dispose(close=False)
+    _async_engine = None
+    _async_session_factory = None
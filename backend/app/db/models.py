@@ -7,8 +7,10 @@ from sqlalchemy import (
     Text,
     ForeignKey,
     Boolean,
+    Index,
     UniqueConstraint,
 )
+from sqlalchemy import DDL, event
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.db.database import Base
@@ -101,6 +103,10 @@ class Project(Base):
     floor_plans = relationship("FloorPlan", back_populates="project")
     markup_overrides = relationship("ProjectMarkupOverrides", back_populates="project", uselist=False)
     access = relationship("ProjectAccess", back_populates="project", uselist=False, cascade="all, delete-orphan")
+    summary = relationship("ProjectSummary", back_populates="project", uselist=False, cascade="all, delete-orphan")
+    search_document = relationship(
+        "ProjectSearchDocument", back_populates="project", uselist=False, cascade="all, delete-orphan"
+    )
     # scenarios = relationship("ProjectScenario", back_populates="project", cascade="all, delete-orphan")  # Commented out - ProjectScenario model removed
 
 
@@ -164,6 +170,86 @@ class ProjectAccess(Base):
     organization = relationship("Organization", back_populates="projects")
 
 
+class ProjectSummary(Base):
+    """Numeric key metrics per project, written with the payload for SQL portfolio roll-ups."""
+    __tablename__ = "project_summaries"
+
+    id = Column(Integer, primary_key=True, index=True)
+    project_id = Column(String, ForeignKey("projects.project_id"), nullable=False, unique=True, index=True)
+    org_id = Column(String, ForeignKey("organizations.id"), nullable=False, index=True)
+    building_type = Column(String, nullable=True)
+    subtype = Column(String, nullable=True)
+    square_footage = Column(Float, nullable=True)
+    total_cost = Column(Float, nullable=True)
+    cost_per_sf = Column(Float, nullable=True)
+    yield_on_cost = Column(Float, nullable=True)  # Fraction, e.g. 0.065
+    dscr = Column(Float, nullable=True)
+    decision_status = Column(String, nullable=True)  # GO / Needs Work / NO-GO / PENDING
+    regional_multiplier = Column(Float, nullable=True)
+    finish_level = Column(String, nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    project = relationship("Project", back_populates="summary")
+
+    __table_args__ = (
+        Index("ix_project_summaries_org_building_type", "org_id", "building_type"),
+    )
+
+
+class ProjectSearchDocument(Base):
+    """Searchable text and facet columns per project, written with the payload for project search."""
+    __tablename__ = "project_search_documents"
+
+    id = Column(Integer, primary_key=True, index=True)
+    project_id = Column(String, ForeignKey("projects.project_id"), nullable=False, unique=True, index=True)
+    org_id = Column(String, ForeignKey("organizations.id"), nullable=False, index=True)
+    building_type = Column(String, nullable=True)
+    subtype = Column(String, nullable=True)
+    project_class = Column(String, nullable=True)  # ground_up / addition / renovation / tenant_improvement
+    total_cost = Column(Float, nullable=True)
+    project_created_at = Column(DateTime(timezone=True), nullable=True)
+    document = Column(Text, nullable=False, default="")  # Name, description, location, type and subtype
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    project = relationship("Project", back_populates="search_document")
+
+    __table_args__ = (
+        Index("ix_project_search_documents_org_building_type", "org_id", "building_type"),
+        Index("ix_project_search_documents_org_created", "org_id", "project_created_at"),
+    )
+
+
+# Full-text indexes live outside the ORM: an external-content FTS5 table kept in
+# sync by triggers on SQLite, and a GIN expression index on Postgres.
+_SQLITE_PROJECT_SEARCH_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS project_search_fts USING fts5("
+    "document, content='project_search_documents', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    "CREATE TRIGGER IF NOT EXISTS project_search_documents_ai AFTER INSERT ON project_search_documents BEGIN "
+    "INSERT INTO project_search_fts(rowid, document) VALUES (new.id, new.document); END",
+    "CREATE TRIGGER IF NOT EXISTS project_search_documents_ad AFTER DELETE ON project_search_documents BEGIN "
+    "INSERT INTO project_search_fts(project_search_fts, rowid, document) VALUES ('delete', old.id, old.document); END",
+    "CREATE TRIGGER IF NOT EXISTS project_search_documents_au AFTER UPDATE OF document ON project_search_documents BEGIN "
+    "INSERT INTO project_search_fts(project_search_fts, rowid, document) VALUES ('delete', old.id, old.document); "
+    "INSERT INTO project_search_fts(rowid, document) VALUES (new.id, new.document); END",
+)
+for _statement in _SQLITE_PROJECT_SEARCH_DDL:
+    event.listen(ProjectSearchDocument.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(
+    ProjectSearchDocument.__table__,
+    "after_drop",
+    DDL("DROP TABLE IF EXISTS project_search_fts").execute_if(dialect="sqlite"),
+)
+event.listen(
+    ProjectSearchDocument.__table__,
+    "after_create",
+    DDL(
+        "CREATE INDEX IF NOT EXISTS ix_project_search_documents_tsv ON project_search_documents "
+        "USING gin (to_tsvector('english', document))"
+    ).execute_if(dialect="postgresql"),
+)
+
+
 class OrganizationRunQuota(Base):
     __tablename__ = "organization_run_quotas"
 
@@ -18,12 +18,19 @@ from app.core.environment import EnvironmentChecker
 from app.core.rate_limiter import limiter
 from app.v2.api.scope import router as v2_scope_router
 from app.v2.api.auth import router as v2_auth_router
-from app.db.database import engine, Base
+from app.v2.api.portfolio import router as v2_portfolio_router
+from app.db.database import engine, Base, dispose_async_engine
+from app.services.export_jobs import export_job_manager
+from app.v2.services.special_feature_pricing import compile_master_config_special_feature_pricing_rules
 
 logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Fail startup on a malformed special feature pricing rule
+    compiled_rule_count = compile_master_config_special_feature_pricing_rules()
+    logger.info(f"Compiled {compiled_rule_count} special feature pricing rules")
+
     # Create database tables
     Base.metadata.create_all(bind=engine)
 
@@ -43,6 +50,8 @@ async def lifespan(app: FastAPI):
         await FastAPICache.clear()
     except Exception:
         pass
+    export_job_manager.shutdown(wait=False)
+    await dispose_async_engine()
 
 
 # Disable API docs in production
@@ -115,6 +124,7 @@ async def add_security_headers(request: Request, call_next):
 # V2 API - unified_engine endpoints
 app.include_router(v2_scope_router, prefix="/api/v2", tags=["v2-api"])
 app.include_router(v2_auth_router, prefix="/api/v2", tags=["v2-auth"])
+app.include_router(v2_portfolio_router, prefix="/api/v2", tags=["v2-portfolio"])
 
 
 @app.on_event("startup")
@@ -1,11 +1,38 @@
-from .cost_service import cost_service, CostService
-from .nlp_service import nlp_service, NLPService
-from .climate_service import climate_service, ClimateService
-from .sketcher import floor_plan_generator, FloorPlanGenerator
+"""Service singletons, resolved on first attribute access.
+
+Importing a submodule such as ``app.services.nlp_service`` runs this package
+first; loading every service eagerly here would drag the pydantic scope
+models (climate/cost services) into every worker.
+"""
+from importlib import import_module
+
+_LAZY_EXPORTS = {
+    "cost_service": ".cost_service",
+    "CostService": ".cost_service",
+    "nlp_service": ".nlp_service",
+    "NLPService": ".nlp_service",
+    "climate_service": ".climate_service",
+    "ClimateService": ".climate_service",
+    "floor_plan_generator": ".sketcher",
+    "FloorPlanGenerator": ".sketcher",
+}
 
 __all__ = [
     "cost_service", "CostService",
-    "nlp_service", "NLPService", 
+    "nlp_service", "NLPService",
     "climate_service", "ClimateService",
     "floor_plan_generator", "FloorPlanGenerator"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
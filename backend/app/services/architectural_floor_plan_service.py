@@ -1,8 +1,9 @@
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 import math
 import uuid
 from dataclasses import dataclass, asdict
 from enum import Enum
+from app.services.floor_plan_layouts import floor_plan_layout_cache, program_key, svg_number, svg_text
 
 class WallType(str, Enum):
     EXTERIOR = "exterior"
@@ -21,12 +22,12 @@ class FixtureType(str, Enum):
     URINAL = "urinal"
     WATER_FOUNTAIN = "water_fountain"
 
-@dataclass
+@dataclass(slots=True)
 class Point:
     x: float
     y: float
 
-@dataclass
+@dataclass(slots=True)
 class Wall:
     id: str
     type: WallType
@@ -34,7 +35,7 @@ class Wall:
     end: Point
     thickness: float = 6.0  # inches
 
-@dataclass
+@dataclass(slots=True)
 class Door:
     id: str
     type: DoorType
@@ -44,21 +45,21 @@ class Door:
     swing_direction: str = "in"  # in, out, both
     swing_side: str = "left"  # left, right
 
-@dataclass
+@dataclass(slots=True)
 class Window:
     id: str
     position: Point
     width: float
     wall_id: str
 
-@dataclass
+@dataclass(slots=True)
 class Fixture:
     id: str
     type: FixtureType
     position: Point
     rotation: float = 0.0
 
-@dataclass
+@dataclass(slots=True)
 class DimensionLine:
     id: str
     start: Point
@@ -66,7 +67,7 @@ class DimensionLine:
     offset: float
     text: str
 
-@dataclass
+@dataclass(slots=True)
 class Space:
     id: str
     name: str
@@ -75,7 +76,7 @@ class Space:
     area: float
     height: float = 9.0
 
-@dataclass
+@dataclass(slots=True)
 class TradeZone:
     id: str
     trade: str
@@ -84,7 +85,7 @@ class TradeZone:
     equipment_id: Optional[str] = None
     description: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class ArchitecturalFloorPlan:
     building_width: float
     building_height: float
@@ -99,6 +100,24 @@ class ArchitecturalFloorPlan:
     units: str = "feet"
 
 
+SPACE_FILLS = {
+    "warehouse": "#F5F5F5",
+    "office": "#E3F2FD",
+    "lobby": "#E8F5E9",
+    "conference": "#F3E5F5",
+    "restroom": "#E0F2F1",
+    "kitchen": "#FFF3E0",
+    "dining": "#FFF8E1",
+    "bar": "#FBE9E7",
+}
+
+TRADE_ZONE_COLORS = {
+    "hvac": "#2196F3",
+    "electrical": "#FFC107",
+    "plumbing": "#4CAF50",
+}
+
+
 class ArchitecturalFloorPlanService:
     """Service for generating professional architectural floor plans"""
     
@@ -139,7 +158,25 @@ class ArchitecturalFloorPlanService:
         dimensions = self._calculate_optimal_dimensions(square_footage)
         width, height = dimensions
         
-        # Generate based on project type
+        # Layouts only depend on type, grid-rounded dimensions and program
+        layout_key = ("architectural", project_type, width, height, program_key(building_mix))
+        plan = floor_plan_layout_cache.get_or_build(
+            layout_key,
+            lambda: self._build_architectural_plan(project_type, width, height, building_mix)
+        )
+        
+        # Convert to dict and ensure proper orientation
+        plan_dict = self._floor_plan_to_dict(plan)
+        return self._ensure_landscape_orientation(plan_dict)
+    
+    def _build_architectural_plan(
+        self,
+        project_type: str,
+        width: float,
+        height: float,
+        building_mix: Optional[Dict[str, float]]
+    ) -> ArchitecturalFloorPlan:
+        """Generate the plan geometry for a layout cache miss"""
         if project_type == "mixed_use" and building_mix:
             plan = self._generate_mixed_use_architectural(width, height, building_mix)
         elif project_type == "commercial":
@@ -155,10 +192,7 @@ class ArchitecturalFloorPlanService:
             
         # Add trade zones
         plan.trade_zones = self._generate_trade_zones(plan)
-        
-        # Convert to dict and ensure proper orientation
-        plan_dict = self._floor_plan_to_dict(plan)
-        return self._ensure_landscape_orientation(plan_dict)
+        return plan
     
     def _calculate_optimal_dimensions(self, square_footage: float) -> Tuple[float, float]:
         """Calculate building dimensions for optimal aspect ratio"""
@@ -970,9 +1004,92 @@ class ArchitecturalFloorPlanService:
                         point["y"], plan_dict["building_width"] - point["x"]
         else:
             plan_dict["rotated"] = False
-        
+
         return plan_dict
-    
+
+    def iter_svg(self, plan_dict: Dict[str, Any]) -> Iterator[str]:
+        """Stream a plan from generate_architectural_plan as SVG, one element per chunk"""
+        width = plan_dict["building_width"]
+        height = plan_dict["building_height"]
+        margin = 30.0  # room for dimension lines drawn outside the building
+        yield (
+            f'<svg xmlns="http://www.w3.org/2000/svg" '
+            f'viewBox="{svg_number(-margin)} {svg_number(-margin)} '
+            f'{svg_number(width + 2 * margin)} {svg_number(height + 2 * margin)}" '
+            f'font-family="Helvetica, Arial, sans-serif">'
+        )
+
+        yield '<g class="spaces" stroke="none">'
+        for space in plan_dict["spaces"]:
+            points = " ".join(f'{svg_number(p["x"])},{svg_number(p["y"])}' for p in space["points"])
+            yield f'<polygon points="{points}" fill="{SPACE_FILLS.get(space["type"], "#FAFAFA")}"/>'
+            if space["points"]:
+                center_x = sum(p["x"] for p in space["points"]) / len(space["points"])
+                center_y = sum(p["y"] for p in space["points"]) / len(space["points"])
+                yield (
+                    f'<text x="{svg_number(center_x)}" y="{svg_number(center_y)}" font-size="3" '
+                    f'text-anchor="middle" fill="#333333">{svg_text(space["name"])}</text>'
+                )
+        yield '</g>'
+
+        yield '<g class="trade-zones" fill-opacity="0.15">'
+        for zone in plan_dict["trade_zones"]:
+            points = " ".join(f'{svg_number(p["x"])},{svg_number(p["y"])}' for p in zone["points"])
+            color = TRADE_ZONE_COLORS.get(zone["trade"], "#9E9E9E")
+            yield f'<polygon points="{points}" fill="{color}" stroke="{color}" stroke-width="0.25"/>'
+        yield '</g>'
+
+        yield '<g class="walls" stroke="#000000" stroke-linecap="square">'
+        for wall in plan_dict["walls"]:
+            yield (
+                f'<line x1="{svg_number(wall["start"]["x"])}" y1="{svg_number(wall["start"]["y"])}" '
+                f'x2="{svg_number(wall["end"]["x"])}" y2="{svg_number(wall["end"]["y"])}" '
+                f'stroke-width="{svg_number(wall["thickness"] / 12.0)}"/>'
+            )
+        yield '</g>'
+
+        yield '<g class="openings" stroke-width="0.25">'
+        for door in plan_dict["doors"]:
+            yield (
+                f'<circle cx="{svg_number(door["position"]["x"])}" cy="{svg_number(door["position"]["y"])}" '
+                f'r="{svg_number(door["width"] / 2)}" fill="none" stroke="#795548"/>'
+            )
+        for window in plan_dict["windows"]:
+            half = window["width"] / 2
+            yield (
+                f'<line x1="{svg_number(window["position"]["x"])}" y1="{svg_number(window["position"]["y"] - half)}" '
+                f'x2="{svg_number(window["position"]["x"])}" y2="{svg_number(window["position"]["y"] + half)}" '
+                f'stroke="#03A9F4"/>'
+            )
+        yield '</g>'
+
+        yield '<g class="fixtures" fill="#FFFFFF" stroke="#607D8B" stroke-width="0.2">'
+        for fixture in plan_dict["fixtures"]:
+            yield (
+                f'<rect x="{svg_number(fixture["position"]["x"] - 1)}" y="{svg_number(fixture["position"]["y"] - 1)}" '
+                f'width="2" height="2"/>'
+            )
+        yield '</g>'
+
+        yield '<g class="dimensions" stroke="#000000" stroke-width="0.2" font-size="4" text-anchor="middle">'
+        for dim in plan_dict["dimensions"]:
+            yield (
+                f'<line x1="{svg_number(dim["start"]["x"])}" y1="{svg_number(dim["start"]["y"])}" '
+                f'x2="{svg_number(dim["end"]["x"])}" y2="{svg_number(dim["end"]["y"])}"/>'
+            )
+            mid_x = (dim["start"]["x"] + dim["end"]["x"]) / 2
+            mid_y = (dim["start"]["y"] + dim["end"]["y"]) / 2
+            yield (
+                f'<text x="{svg_number(mid_x)}" y="{svg_number(mid_y - 1)}" stroke="none">'
+                f'{svg_text(dim["text"])}</text>'
+            )
+        yield '</g>'
+        yield '</svg>'
+
+    def render_svg(self, plan_dict: Dict[str, Any]) -> str:
+        """Whole-document form of iter_svg"""
+        return "".join(self.iter_svg(plan_dict))
+
     def _generate_commercial_architectural(self, width: float, height: float) -> ArchitecturalFloorPlan:
         """Generate commercial building plan"""
         # For now, reuse office logic
@@ -565,6 +565,66 @@ def _dealshield_render_content_sections(view_model: Dict[str, Any]) -> str:
     )
 
 
+# Static document fragments are built once at import; only section bodies vary per export.
+_DEALSHIELD_CSS = """    * { box-sizing: border-box; }
+    body { font-family: 'Helvetica Neue', Arial, sans-serif; font-size: 13px; line-height: 1.45; color: #111827; margin: 0; padding: 32px; }
+    header { display: block; }
+    header > * { display: block; }
+    h1 { display: block; margin: 0; font-size: 28px; line-height: 1.15; letter-spacing: 0.3px; }
+    section { margin-top: 28px; }
+    h2 { display: block; margin: 0 0 10px; font-size: 19px; line-height: 1.2; color: #1f2937; }
+    .subtitle { display: block; color: #4b5563; margin-top: 4px; font-size: 13px; line-height: 1.4; }
+    .meta { display: block; color: #6b7280; font-size: 12px; line-height: 1.35; margin-top: 4px; }
+    .table-wrap { margin-top: 22px; }
+    table { width: 100%; border-collapse: collapse; font-size: 12px; }
+    th, td { border: 1px solid #e5e7eb; padding: 7px 9px; text-align: left; }
+    th { background: #f8fafc; font-weight: 600; color: #111827; }
+    td.num { text-align: right; font-variant-numeric: tabular-nums; }
+    td.scenario { font-weight: 600; }
+    .scenario-label { font-weight: 600; }
+    .scenario-delta { margin-top: 2px; font-size: 10px; color: #64748b; font-weight: 500; }
+    .main-row-alt td { background: #f8fafc; }
+    .context-note { display: block; margin-top: 8px; color: #6b7280; font-size: 12px; line-height: 1.4; }
+    .provenance-note { display: block; margin-top: 6px; color: #6b7280; font-size: 12px; line-height: 1.4; }
+    .provenance-meta { display: block; margin-top: 4px; color: #4b5563; font-size: 12px; line-height: 1.35; }
+    .provenance-meta-label { color: #374151; display: inline-block; margin-bottom: 6px; }
+    .provenance-ref-list { display: flex; flex-wrap: wrap; gap: 6px; }
+    .ref-pill { display: inline-block; padding: 2px 8px; border-radius: 999px; border: 1px solid #e5e7eb; background: #f8fafc; color: #374151; font-size: 11px; font-family: Menlo, Monaco, Consolas, 'Liberation Mono', 'Courier New', monospace; line-height: 1.3; max-width: 100%; overflow-wrap: anywhere; }
+    .ref-pill-empty { font-family: 'Helvetica Neue', Arial, sans-serif; }
+    .provenance-table { font-size: 11px; }
+    .provenance-table th { font-size: 10px; }
+    .provenance-table td { padding: 6px 8px; }
+    .content-note { margin-top: 6px; color: #6b7280; font-size: 12px; }
+    .content-list { margin: 8px 0 0; padding-left: 20px; font-size: 12px; }
+    .content-list li { margin: 0 0 8px; }
+    .content-sublist { margin: 4px 0 0; padding-left: 18px; }
+    .content-subtle { color: #4b5563; font-size: 11px; margin-top: 2px; }
+    .content-label { font-weight: 600; color: #111827; }
+    .content-inline-muted { color: #9ca3af; font-size: 10px; font-weight: 500; font-family: Menlo, Monaco, Consolas, 'Liberation Mono', 'Courier New', monospace; }
+    .assumptions-block { margin-top: 8px; border: 1px solid #e5e7eb; background: #f8fafc; border-radius: 6px; padding: 8px 10px; }
+    .assumptions-title { font-size: 10px; text-transform: uppercase; letter-spacing: 0.6px; color: #6b7280; font-weight: 700; }
+    .assumptions-grid { margin-top: 6px; display: grid; grid-template-columns: repeat(2, minmax(0, 1fr)); gap: 4px 16px; font-size: 11px; color: #334155; }
+    .assumption-item { margin: 0; }
+    .assumption-label { font-weight: 600; color: #475569; }
+    .assumptions-disclosures { margin: 6px 0 0; padding-left: 18px; font-size: 11px; color: #475569; }
+    .assumptions-disclosures li { margin: 0 0 2px; }
+    .decision-summary-block { margin-top: 8px; border: 1px solid #e5e7eb; background: #f8fafc; border-radius: 6px; padding: 8px 10px; }
+    .decision-summary-title { font-size: 10px; text-transform: uppercase; letter-spacing: 0.6px; color: #6b7280; font-weight: 700; }
+    .decision-summary-grid { margin-top: 6px; display: grid; grid-template-columns: repeat(2, minmax(0, 1fr)); gap: 4px 16px; font-size: 11px; color: #334155; }
+    .decision-summary-item { margin: 0; }
+    .decision-summary-item-wide { grid-column: 1 / -1; }
+    .decision-summary-label { font-weight: 600; color: #475569; }
+    .decision-summary-note { margin-top: 6px; font-size: 11px; color: #475569; }
+    .construction-risk-block { margin-top: 8px; border: 1px solid #e5e7eb; background: #f8fafc; border-radius: 6px; padding: 10px 12px; }
+    .construction-risk-header { display: flex; justify-content: space-between; align-items: flex-start; gap: 12px; }
+    .construction-risk-title { font-size: 13px; font-weight: 700; color: #111827; }
+    .construction-risk-severity { white-space: nowrap; font-size: 10px; font-weight: 700; text-transform: uppercase; letter-spacing: 0.5px; color: #475569; }
+    .construction-risk-grid { margin-top: 8px; display: grid; grid-template-columns: repeat(3, minmax(0, 1fr)); gap: 8px 12px; font-size: 11px; line-height: 1.45; color: #334155; }
+    .construction-risk-item { margin: 0; }
+    .construction-risk-label { margin-bottom: 2px; font-size: 10px; font-weight: 700; text-transform: uppercase; letter-spacing: 0.6px; color: #6b7280; }
+"""
+
+
 def render_dealshield_html(view_model: Dict[str, Any]) -> str:
     profile_id = view_model.get("profile_id") or "unknown"
     context = view_model.get("context") if isinstance(view_model.get("context"), dict) else {}
@@ -802,63 +862,7 @@ def render_dealshield_html(view_model: Dict[str, Any]) -> str:
   <meta charset="utf-8" />
   <title>DealShield</title>
   <style>
-    * {{ box-sizing: border-box; }}
-    body {{ font-family: 'Helvetica Neue', Arial, sans-serif; font-size: 13px; line-height: 1.45; color: #111827; margin: 0; padding: 32px; }}
-    header {{ display: block; }}
-    header > * {{ display: block; }}
-    h1 {{ display: block; margin: 0; font-size: 28px; line-height: 1.15; letter-spacing: 0.3px; }}
-    section {{ margin-top: 28px; }}
-    h2 {{ display: block; margin: 0 0 10px; font-size: 19px; line-height: 1.2; color: #1f2937; }}
-    .subtitle {{ display: block; color: #4b5563; margin-top: 4px; font-size: 13px; line-height: 1.4; }}
-    .meta {{ display: block; color: #6b7280; font-size: 12px; line-height: 1.35; margin-top: 4px; }}
-    .table-wrap {{ margin-top: 22px; }}
-    table {{ width: 100%; border-collapse: collapse; font-size: 12px; }}
-    th, td {{ border: 1px solid #e5e7eb; padding: 7px 9px; text-align: left; }}
-    th {{ background: #f8fafc; font-weight: 600; color: #111827; }}
-    td.num {{ text-align: right; font-variant-numeric: tabular-nums; }}
-    td.scenario {{ font-weight: 600; }}
-    .scenario-label {{ font-weight: 600; }}
-    .scenario-delta {{ margin-top: 2px; font-size: 10px; color: #64748b; font-weight: 500; }}
-    .main-row-alt td {{ background: #f8fafc; }}
-    .context-note {{ display: block; margin-top: 8px; color: #6b7280; font-size: 12px; line-height: 1.4; }}
-    .provenance-note {{ display: block; margin-top: 6px; color: #6b7280; font-size: 12px; line-height: 1.4; }}
-    .provenance-meta {{ display: block; margin-top: 4px; color: #4b5563; font-size: 12px; line-height: 1.35; }}
-    .provenance-meta-label {{ color: #374151; display: inline-block; margin-bottom: 6px; }}
-    .provenance-ref-list {{ display: flex; flex-wrap: wrap; gap: 6px; }}
-    .ref-pill {{ display: inline-block; padding: 2px 8px; border-radius: 999px; border: 1px solid #e5e7eb; background: #f8fafc; color: #374151; font-size: 11px; font-family: Menlo, Monaco, Consolas, 'Liberation Mono', 'Courier New', monospace; line-height: 1.3; max-width: 100%; overflow-wrap: anywhere; }}
-    .ref-pill-empty {{ font-family: 'Helvetica Neue', Arial, sans-serif; }}
-    .provenance-table {{ font-size: 11px; }}
-    .provenance-table th {{ font-size: 10px; }}
-    .provenance-table td {{ padding: 6px 8px; }}
-    .content-note {{ margin-top: 6px; color: #6b7280; font-size: 12px; }}
-    .content-list {{ margin: 8px 0 0; padding-left: 20px; font-size: 12px; }}
-    .content-list li {{ margin: 0 0 8px; }}
-    .content-sublist {{ margin: 4px 0 0; padding-left: 18px; }}
-    .content-subtle {{ color: #4b5563; font-size: 11px; margin-top: 2px; }}
-    .content-label {{ font-weight: 600; color: #111827; }}
-    .content-inline-muted {{ color: #9ca3af; font-size: 10px; font-weight: 500; font-family: Menlo, Monaco, Consolas, 'Liberation Mono', 'Courier New', monospace; }}
-    .assumptions-block {{ margin-top: 8px; border: 1px solid #e5e7eb; background: #f8fafc; border-radius: 6px; padding: 8px 10px; }}
-    .assumptions-title {{ font-size: 10px; text-transform: uppercase; letter-spacing: 0.6px; color: #6b7280; font-weight: 700; }}
-    .assumptions-grid {{ margin-top: 6px; display: grid; grid-template-columns: repeat(2, minmax(0, 1fr)); gap: 4px 16px; font-size: 11px; color: #334155; }}
-    .assumption-item {{ margin: 0; }}
-    .assumption-label {{ font-weight: 600; color: #475569; }}
-    .assumptions-disclosures {{ margin: 6px 0 0; padding-left: 18px; font-size: 11px; color: #475569; }}
-    .assumptions-disclosures li {{ margin: 0 0 2px; }}
-    .decision-summary-block {{ margin-top: 8px; border: 1px solid #e5e7eb; background: #f8fafc; border-radius: 6px; padding: 8px 10px; }}
-    .decision-summary-title {{ font-size: 10px; text-transform: uppercase; letter-spacing: 0.6px; color: #6b7280; font-weight: 700; }}
-    .decision-summary-grid {{ margin-top: 6px; display: grid; grid-template-columns: repeat(2, minmax(0, 1fr)); gap: 4px 16px; font-size: 11px; color: #334155; }}
-    .decision-summary-item {{ margin: 0; }}
-    .decision-summary-item-wide {{ grid-column: 1 / -1; }}
-    .decision-summary-label {{ font-weight: 600; color: #475569; }}
-    .decision-summary-note {{ margin-top: 6px; font-size: 11px; color: #475569; }}
-    .construction-risk-block {{ margin-top: 8px; border: 1px solid #e5e7eb; background: #f8fafc; border-radius: 6px; padding: 10px 12px; }}
-    .construction-risk-header {{ display: flex; justify-content: space-between; align-items: flex-start; gap: 12px; }}
-    .construction-risk-title {{ font-size: 13px; font-weight: 700; color: #111827; }}
-    .construction-risk-severity {{ white-space: nowrap; font-size: 10px; font-weight: 700; text-transform: uppercase; letter-spacing: 0.5px; color: #475569; }}
-    .construction-risk-grid {{ margin-top: 8px; display: grid; grid-template-columns: repeat(3, minmax(0, 1fr)); gap: 8px 12px; font-size: 11px; line-height: 1.45; color: #334155; }}
-    .construction-risk-item {{ margin: 0; }}
-    .construction-risk-label {{ margin-bottom: 2px; font-size: 10px; font-weight: 700; text-transform: uppercase; letter-spacing: 0.6px; color: #6b7280; }}
-  </style>
+{_DEALSHIELD_CSS}  </style>
 </head>
 <body>
   <header>
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
 import html as html_module
 from typing import Any, Dict, List
 
@@ -44,7 +45,14 @@ def _sanitize_text(value: Any) -> str:
     return str(sanitized).strip()
 
 
+@lru_cache(maxsize=4096)
+def _escape_text(value: str) -> str:
+    return html_module.escape(_sanitize_text(value))
+
+
 def _escape(value: Any) -> str:
+    if isinstance(value, str):
+        return _escape_text(value)
     return html_module.escape(_sanitize_text(value))
 
 
@@ -2411,146 +2419,110 @@ def _render_provenance(section: Dict[str, Any]) -> str:
     )
 
 
-def render_decision_packet_html(packet: Dict[str, Any]) -> str:
-    cover_summary = _as_dict(packet.get("cover_summary"))
-    decision_banner = _as_dict(packet.get("decision_banner"))
-    key_metrics = _as_dict(packet.get("key_metrics"))
-    decision_insurance = _as_dict(packet.get("decision_insurance"))
-    decision_metrics_table = _as_dict(packet.get("decision_metrics_table"))
-    assumptions_not_modeled = _as_dict(packet.get("assumptions_not_modeled"))
-    economics_snapshot = _as_dict(packet.get("economics_snapshot"))
-    revenue_required = _as_dict(packet.get("revenue_required"))
-    construction_summary = _as_dict(packet.get("construction_summary"))
-    trade_distribution = _as_dict(packet.get("trade_distribution"))
-    cost_build_up = _as_dict(packet.get("cost_build_up"))
-    schedule_milestones = _as_dict(packet.get("schedule_milestones"))
-    trust_sections = _as_dict(packet.get("trust_sections"))
-    provenance = _as_dict(packet.get("provenance"))
-
-    metric_cards = [
-        _format_metric("Total Cost", _format_money(key_metrics.get("total_project_cost"))),
-        _format_metric("Yield on Cost", _format_percent(key_metrics.get("yield_on_cost"))),
-        _format_metric("DSCR", _format_ratio(key_metrics.get("dscr"))),
-        _format_metric("Annual Revenue", _format_money(key_metrics.get("annual_revenue"))),
-        _format_metric("Annual NOI", _format_money(key_metrics.get("annual_noi"))),
-    ]
-
-    trust_html = (
-        _render_most_likely_wrong(_as_list(trust_sections.get("most_likely_wrong")))
-        + _render_question_bank(_as_list(trust_sections.get("question_bank")))
-        + _render_red_flags_actions(_as_list(trust_sections.get("red_flags_actions")))
-    )
-
-    return f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="utf-8" />
-  <title>{_escape(cover_summary.get("project_name") or "SpecSharp Decision Packet")}</title>
-  <style>
-    * {{ box-sizing: border-box; }}
-    body {{
+# Static document fragments are built once at import; only section bodies vary per export.
+_DECISION_PACKET_CSS = """    * { box-sizing: border-box; }
+    body {
       margin: 0;
       font-family: "Liberation Sans", "DejaVu Sans", Arial, Helvetica, sans-serif;
       color: #0f172a;
       background: #f8fafc;
       line-height: 1.45;
-    }}
-    .page {{
+    }
+    .page {
       max-width: 980px;
       margin: 0 auto;
       padding: 34px 28px 24px;
       background: #ffffff;
-    }}
-    .page-break {{
+    }
+    .page-break {
       page-break-before: always;
-    }}
-    h1 {{
+    }
+    h1 {
       margin: 0 0 14px;
       font-size: 32px;
       line-height: 1.1;
       color: #0f172a;
-    }}
-    h2 {{
+    }
+    h2 {
       margin: 0 0 14px;
       font-size: 20px;
       line-height: 1.2;
       color: #0f172a;
-    }}
-    h3 {{
+    }
+    h3 {
       margin: 0 0 10px;
       font-size: 14px;
       color: #1e293b;
       text-transform: uppercase;
       letter-spacing: 0.03em;
-    }}
-    section {{
+    }
+    section {
       margin-bottom: 24px;
       padding: 18px 18px 16px;
       border: 1px solid #e2e8f0;
       border-radius: 14px;
       background: #ffffff;
-    }}
-    section > * + * {{
+    }
+    section > * + * {
       margin-top: 12px;
-    }}
-    section > h2 + * {{
+    }
+    section > h2 + * {
       margin-top: 0;
-    }}
-    .subsection {{
+    }
+    .subsection {
       margin-top: 16px;
-    }}
-    .subsection:first-of-type {{
+    }
+    .subsection:first-of-type {
       margin-top: 0;
-    }}
-    .subsection > * + * {{
+    }
+    .subsection > * + * {
       margin-top: 10px;
-    }}
-    .eyebrow {{
+    }
+    .eyebrow {
       font-size: 12px;
       font-weight: 700;
       letter-spacing: 0.08em;
       text-transform: uppercase;
       color: #475569;
       margin-bottom: 10px;
-    }}
-    .cover-grid {{
+    }
+    .cover-grid {
       display: grid;
       grid-template-columns: repeat(2, minmax(0, 1fr));
       gap: 12px 16px;
-    }}
-    .cover-row {{
+    }
+    .cover-row {
       display: flex;
       flex-direction: column;
       padding: 10px 12px;
       border-radius: 10px;
       background: #f8fafc;
       border: 1px solid #e2e8f0;
-    }}
-    .cover-label, .metric-label, .info-label {{
+    }
+    .cover-label, .metric-label, .info-label {
       font-size: 11px;
       font-weight: 700;
       letter-spacing: 0.05em;
       text-transform: uppercase;
       color: #64748b;
       line-height: 1.35;
-    }}
-    .cover-value, .metric-value, .info-value {{
+    }
+    .cover-value, .metric-value, .info-value {
       margin-top: 5px;
       font-size: 17px;
       font-weight: 700;
       color: #0f172a;
       line-height: 1.25;
-    }}
-    .decision-banner {{
+    }
+    .decision-banner {
       border-width: 2px;
       padding: 18px;
-    }}
-    .status-go {{ border-color: #16a34a; background: #f0fdf4; }}
-    .status-no-go {{ border-color: #dc2626; background: #fef2f2; }}
-    .status-needs-work {{ border-color: #d97706; background: #fffbeb; }}
-    .status-pending {{ border-color: #475569; background: #f8fafc; }}
-    .decision-status-chip {{
+    }
+    .status-go { border-color: #16a34a; background: #f0fdf4; }
+    .status-no-go { border-color: #dc2626; background: #fef2f2; }
+    .status-needs-work { border-color: #d97706; background: #fffbeb; }
+    .status-pending { border-color: #475569; background: #f8fafc; }
+    .decision-status-chip {
       display: inline-block;
       padding: 4px 10px;
       border-radius: 999px;
@@ -2561,19 +2533,19 @@ def render_decision_packet_html(packet: Dict[str, Any]) -> str:
       letter-spacing: 0.06em;
       text-transform: uppercase;
       margin-bottom: 10px;
-    }}
-    .decision-reason, .banner-detail, .banner-basis, .metric-detail, .subcard-detail, .list-detail, .content-subtle {{
+    }
+    .decision-reason, .banner-detail, .banner-basis, .metric-detail, .subcard-detail, .list-detail, .content-subtle {
       font-size: 11px;
       color: #475569;
       line-height: 1.55;
       margin-top: 0;
-    }}
-    .metric-grid {{
+    }
+    .metric-grid {
       display: grid;
       grid-template-columns: repeat(3, minmax(0, 1fr));
       gap: 12px;
-    }}
-    .metric-card, .info-item, .subcard {{
+    }
+    .metric-card, .info-item, .subcard {
       display: flex;
       flex-direction: column;
       gap: 6px;
@@ -2581,111 +2553,111 @@ def render_decision_packet_html(packet: Dict[str, Any]) -> str:
       border-radius: 12px;
       border: 1px solid #e2e8f0;
       background: #f8fafc;
-    }}
-    .subcard-grid {{
+    }
+    .subcard-grid {
       display: grid;
       grid-template-columns: repeat(2, minmax(0, 1fr));
       gap: 12px;
       margin-bottom: 14px;
-    }}
-    .subcard-title {{
+    }
+    .subcard-title {
       font-size: 11px;
       font-weight: 700;
       letter-spacing: 0.05em;
       text-transform: uppercase;
       color: #64748b;
       margin-bottom: 0;
-    }}
-    .subcard-value {{
+    }
+    .subcard-value {
       font-size: 17px;
       font-weight: 700;
       color: #0f172a;
       line-height: 1.25;
-    }}
-    .info-grid {{
+    }
+    .info-grid {
       display: grid;
       grid-template-columns: repeat(2, minmax(0, 1fr));
       gap: 12px;
-    }}
-    .two-column {{
+    }
+    .two-column {
       display: grid;
       grid-template-columns: 1fr 1fr;
       gap: 22px;
-    }}
-    table {{
+    }
+    table {
       width: 100%;
       border-collapse: collapse;
-    }}
-    th, td {{
+    }
+    th, td {
       border-bottom: 1px solid #e2e8f0;
       padding: 10px 12px;
       text-align: left;
       vertical-align: top;
       font-size: 12px;
       line-height: 1.45;
-    }}
-    th {{
+    }
+    th {
       font-size: 11px;
       letter-spacing: 0.04em;
       text-transform: uppercase;
       color: #475569;
       background: #f8fafc;
-    }}
-    .decision-table, .simple-table {{
+    }
+    .decision-table, .simple-table {
       margin-top: 6px;
-    }}
-    .decision-table th, .decision-table td {{
+    }
+    .decision-table th, .decision-table td {
       padding: 12px 14px;
-    }}
-    .decision-table thead th {{
+    }
+    .decision-table thead th {
       font-size: 10px;
       letter-spacing: 0.06em;
-    }}
-    .decision-table tbody tr:nth-child(even) {{
+    }
+    .decision-table tbody tr:nth-child(even) {
       background: #fbfdff;
-    }}
-    .simple-table thead th {{
+    }
+    .simple-table thead th {
       font-size: 10px;
       letter-spacing: 0.05em;
-    }}
-    .row-label {{
+    }
+    .row-label {
       white-space: nowrap;
       color: #0f172a;
-    }}
-    .bullet-list {{
+    }
+    .bullet-list {
       margin: 0;
       padding-left: 20px;
-    }}
-    .bullet-list.compact {{
+    }
+    .bullet-list.compact {
       margin-top: 6px;
-    }}
-    .bullet-list.nested {{
+    }
+    .bullet-list.nested {
       margin-top: 6px;
-    }}
-    .bullet-list li {{
+    }
+    .bullet-list li {
       margin-bottom: 8px;
       line-height: 1.5;
-    }}
-    .question-bank-groups {{
+    }
+    .question-bank-groups {
       display: grid;
       gap: 12px;
       margin-top: 12px;
-    }}
-    .question-bank-group {{
+    }
+    .question-bank-group {
       padding: 14px 16px;
       border-radius: 12px;
       border: 1px solid #e2e8f0;
       background: #f8fafc;
-    }}
-    .question-bank-group-title {{
+    }
+    .question-bank-group-title {
       margin: 0 0 8px;
       font-size: 13px;
       font-weight: 700;
       letter-spacing: 0.02em;
       text-transform: none;
       color: #0f172a;
-    }}
-    .note-block {{
+    }
+    .note-block {
       margin: 0;
       padding: 12px 14px;
       border-radius: 10px;
@@ -2694,36 +2666,77 @@ def render_decision_packet_html(packet: Dict[str, Any]) -> str:
       font-size: 12px;
       color: #334155;
       line-height: 1.55;
-    }}
-    .empty-note {{
+    }
+    .empty-note {
       font-size: 12px;
       color: #64748b;
-    }}
-    .schedule-section .schedule-overview {{
+    }
+    .schedule-section .schedule-overview {
       max-width: 280px;
-    }}
-    .schedule-layout {{
+    }
+    .schedule-layout {
       display: grid;
       grid-template-columns: 1fr 1fr;
       gap: 22px;
       align-items: start;
-    }}
-    .schedule-layout .subsection {{
+    }
+    .schedule-layout .subsection {
       margin-top: 0;
-    }}
+    }
     .schedule-table th:first-child,
-    .schedule-table td:first-child {{
+    .schedule-table td:first-child {
       width: 52%;
-    }}
-    .milestone-list {{
+    }
+    .milestone-list {
       display: grid;
       gap: 8px;
       padding-left: 20px;
-    }}
-    .milestone-list li {{
+    }
+    .milestone-list li {
       margin-bottom: 0;
-    }}
-  </style>
+    }
+"""
+
+
+
+def render_decision_packet_html(packet: Dict[str, Any]) -> str:
+    cover_summary = _as_dict(packet.get("cover_summary"))
+    decision_banner = _as_dict(packet.get("decision_banner"))
+    key_metrics = _as_dict(packet.get("key_metrics"))
+    decision_insurance = _as_dict(packet.get("decision_insurance"))
+    decision_metrics_table = _as_dict(packet.get("decision_metrics_table"))
+    assumptions_not_modeled = _as_dict(packet.get("assumptions_not_modeled"))
+    economics_snapshot = _as_dict(packet.get("economics_snapshot"))
+    revenue_required = _as_dict(packet.get("revenue_required"))
+    construction_summary = _as_dict(packet.get("construction_summary"))
+    trade_distribution = _as_dict(packet.get("trade_distribution"))
+    cost_build_up = _as_dict(packet.get("cost_build_up"))
+    schedule_milestones = _as_dict(packet.get("schedule_milestones"))
+    trust_sections = _as_dict(packet.get("trust_sections"))
+    provenance = _as_dict(packet.get("provenance"))
+
+    metric_cards = [
+        _format_metric("Total Cost", _format_money(key_metrics.get("total_project_cost"))),
+        _format_metric("Yield on Cost", _format_percent(key_metrics.get("yield_on_cost"))),
+        _format_metric("DSCR", _format_ratio(key_metrics.get("dscr"))),
+        _format_metric("Annual Revenue", _format_money(key_metrics.get("annual_revenue"))),
+        _format_metric("Annual NOI", _format_money(key_metrics.get("annual_noi"))),
+    ]
+
+    trust_html = (
+        _render_most_likely_wrong(_as_list(trust_sections.get("most_likely_wrong")))
+        + _render_question_bank(_as_list(trust_sections.get("question_bank")))
+        + _render_red_flags_actions(_as_list(trust_sections.get("red_flags_actions")))
+    )
+
+    return f"""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="utf-8" />
+  <title>{_escape(cover_summary.get("project_name") or "SpecSharp Decision Packet")}</title>
+  <style>
+{_DECISION_PACKET_CSS}  </style>
 </head>
 <body>
   <div class="page">
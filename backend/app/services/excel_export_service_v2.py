@@ -1,9 +1,14 @@
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 import io
+import os
+import queue
+import threading
 from datetime import datetime
 from openpyxl import Workbook
+from openpyxl.cell.cell import Cell
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side, NamedStyle
 from openpyxl.utils import get_column_letter
+from openpyxl.utils.cell import column_index_from_string, coordinate_from_string
 from openpyxl.worksheet.table import Table, TableStyleInfo
 from openpyxl.chart import PieChart, Reference, BarChart
 from openpyxl.chart.series import DataPoint
@@ -19,6 +24,199 @@ from app.utils.formatting import (
 from app.services.executive_summary_service import executive_summary_service
 
 
+EXCEL_STREAM_CHUNK_SIZE = 64 * 1024
+# Chunks buffered between the workbook writer thread and the response; bounds
+# memory when the client reads slower than the zip is produced.
+EXCEL_STREAM_MAX_PENDING_CHUNKS = 8
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+class _StreamingWorksheet:
+    """Row-buffering facade over an openpyxl write-only worksheet.
+    
+    Sheet builders keep addressing cells by coordinate; buffered rows are appended
+    to the underlying stream when the builder calls ``flush_before`` and can no
+    longer be touched afterwards. Sheet view and column dimensions are written with
+    the first row, so builders set them before streaming any rows.
+    """
+    
+    def __init__(self, ws):
+        self._ws = ws
+        self._rows: Dict[int, Dict[int, Cell]] = {}
+        self._next_row = 1
+    
+    @property
+    def title(self) -> str:
+        return self._ws.title
+    
+    @property
+    def sheet_view(self):
+        return self._ws.sheet_view
+    
+    @property
+    def column_dimensions(self):
+        return self._ws.column_dimensions
+    
+    @property
+    def row_dimensions(self):
+        return self._ws.row_dimensions
+    
+    @property
+    def page_margins(self):
+        return self._ws.page_margins
+    
+    @page_margins.setter
+    def page_margins(self, value):
+        self._ws.page_margins = value
+    
+    @property
+    def freeze_panes(self):
+        return self._ws.freeze_panes
+    
+    @freeze_panes.setter
+    def freeze_panes(self, value):
+        self._ws.freeze_panes = value
+    
+    def add_chart(self, chart, anchor=None):
+        self._ws.add_chart(chart, anchor)
+    
+    def merge_cells(self, range_string: str):
+        self._ws.merged_cells.add(range_string)
+    
+    def cell(self, row: int, column: int, value: Any = None) -> Cell:
+        if row < self._next_row:
+            raise ValueError(f"Row {row} of sheet '{self.title}' has already been streamed")
+        cells = self._rows.setdefault(row, {})
+        cell = cells.get(column)
+        if cell is None:
+            cell = Cell(self._ws, row=row, column=column)
+            cells[column] = cell
+        if value is not None:
+            cell.value = value
+        return cell
+    
+    def __getitem__(self, coordinate: str) -> Cell:
+        column_letter, row = coordinate_from_string(coordinate)
+        return self.cell(row=row, column=column_index_from_string(column_letter))
+    
+    def __setitem__(self, coordinate: str, value: Any):
+        self[coordinate].value = value
+    
+    def flush_before(self, row: int):
+        while self._next_row < row:
+            cells = self._rows.pop(self._next_row, None)
+            if cells:
+                self._ws.append([cells.get(col) for col in range(1, max(cells) + 1)])
+            else:
+                self._ws.append([])
+            self._next_row += 1
+    
+    def close(self):
+        if self._rows:
+            self.flush_before(max(self._rows) + 1)
+
+
+class _ChunkQueueWriter:
+    """File-like sink that hands fixed-size chunks of the xlsx zip to a queue."""
+    
+    def __init__(self, chunks: "queue.Queue", cancelled: threading.Event, chunk_size: int):
+        self._chunks = chunks
+        self._cancelled = cancelled
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+        self._aborted = False
+    
+    def write(self, data) -> int:
+        if self._aborted:
+            # zipfile still flushes its central directory when the archive is
+            # finalized; there is nobody left to read it.
+            return len(data)
+        self._buffer += data
+        while len(self._buffer) >= self._chunk_size:
+            self._put(bytes(self._buffer[:self._chunk_size]))
+            del self._buffer[:self._chunk_size]
+        return len(data)
+    
+    def flush(self):
+        pass
+    
+    def close(self):
+        if self._buffer:
+            self._put(bytes(self._buffer))
+            self._buffer.clear()
+    
+    def _put(self, item):
+        while True:
+            if self._cancelled.is_set():
+                self._aborted = True
+                raise RuntimeError("Excel stream was closed by the consumer")
+            try:
+                self._chunks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+
+_STREAM_DONE = object()
+
+
+def _discard_write_only_workbook(wb: Workbook):
+    """Close half-written write-only sheets and remove their temp files."""
+    for ws in wb.worksheets:
+        rows = getattr(ws, "_rows", None)
+        writer = getattr(ws, "_writer", None)
+        if writer is None:
+            continue
+        for close in (getattr(rows, "close", None), writer.close):
+            if close is None:
+                continue
+            try:
+                close()
+            except Exception:
+                pass
+        if os.path.exists(writer.out):
+            writer.cleanup()
+
+
+def _stream_workbook(wb: Workbook, chunk_size: int) -> Iterator[bytes]:
+    """Save ``wb`` on a writer thread and yield the zip bytes as they are produced."""
+    chunks: "queue.Queue" = queue.Queue(maxsize=EXCEL_STREAM_MAX_PENDING_CHUNKS)
+    cancelled = threading.Event()
+    sink = _ChunkQueueWriter(chunks, cancelled, max(int(chunk_size), 1))
+    
+    def _write():
+        try:
+            # The sink is not seekable, so zipfile writes data descriptors and
+            # never rewinds; every byte can be forwarded as soon as it is written.
+            wb.save(sink)
+            sink.close()
+            outcome = _STREAM_DONE
+        except BaseException as exc:
+            _discard_write_only_workbook(wb)
+            outcome = exc
+        try:
+            sink._put(outcome)
+        except RuntimeError:
+            pass
+    
+    def _iterate() -> Iterator[bytes]:
+        writer = threading.Thread(target=_write, name="excel-stream-writer", daemon=True)
+        writer.start()
+        try:
+            while True:
+                item = chunks.get()
+                if item is _STREAM_DONE:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            cancelled.set()
+            writer.join(timeout=1.0)
+    
+    return _iterate()
+
+
 class ProfessionalExcelExportService:
     """Service for generating premium Excel exports with professional formatting"""
     
@@ -119,6 +317,36 @@ class ProfessionalExcelExportService:
         # Remove default sheet
         wb.remove(wb.active)
         
+        self._populate_workbook(wb, project_data, client_name)
+        
+        # Save to BytesIO
+        output = io.BytesIO()
+        wb.save(output)
+        output.seek(0)
+        
+        return output
+    
+    def generate_professional_excel_stream(
+        self,
+        project_data: Dict,
+        client_name: str = None,
+        chunk_size: int = EXCEL_STREAM_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """Generate the same report with a write-only workbook, yielding xlsx bytes in chunks.
+        
+        Rows are flushed to openpyxl's per-sheet temp files as each sheet is built, and
+        the zip container is written straight into the returned iterator, so memory stays
+        flat regardless of how many scope items the project has.
+        """
+        wb = Workbook(write_only=True)
+        try:
+            self._populate_workbook(wb, project_data, client_name)
+        except Exception:
+            _discard_write_only_workbook(wb)
+            raise
+        return _stream_workbook(wb, chunk_size)
+    
+    def _populate_workbook(self, wb: Workbook, project_data: Dict, client_name: str = None):
         # Generate executive summary data
         executive_summary = executive_summary_service.generate_executive_summary(project_data)
         
@@ -134,17 +362,28 @@ class ProfessionalExcelExportService:
         wb.properties.creator = "SpecSharp Professional"
         wb.properties.company = "SpecSharp - Premium Construction Estimating"
         wb.properties.created = datetime.now()
-        
-        # Save to BytesIO
-        output = io.BytesIO()
-        wb.save(output)
-        output.seek(0)
-        
-        return output
+    
+    def _new_sheet(self, wb: Workbook, title: str, index: Optional[int] = None):
+        """Create a worksheet; write-only workbooks get a row-buffering facade."""
+        ws = wb.create_sheet(title, index)
+        if wb.write_only:
+            return _StreamingWorksheet(ws)
+        return ws
+    
+    @staticmethod
+    def _flush_rows(ws, row: int):
+        """Let a streaming sheet write out every row above ``row``."""
+        if isinstance(ws, _StreamingWorksheet):
+            ws.flush_before(row)
+    
+    @staticmethod
+    def _finish_sheet(ws):
+        if isinstance(ws, _StreamingWorksheet):
+            ws.close()
     
     def _create_cover_sheet(self, wb: Workbook, project_data: Dict, client_name: str):
         """Create professional cover sheet"""
-        ws = wb.create_sheet("Cover", 0)
+        ws = self._new_sheet(wb, "Cover", 0)
         
         # Set page margins for professional look
         ws.page_margins = PageMargins(
@@ -224,14 +463,24 @@ class ProfessionalExcelExportService:
         ws.row_dimensions[1].height = 30
         for row in range(2, 25):
             ws.row_dimensions[row].height = 25
+        
+        self._finish_sheet(ws)
     
     def _create_executive_dashboard(self, wb: Workbook, project_data: Dict, executive_summary: Dict):
         """Create executive dashboard with charts and key metrics"""
-        ws = wb.create_sheet("Executive Dashboard")
+        ws = self._new_sheet(wb, "Executive Dashboard")
         
         # Hide gridlines
         ws.sheet_view.showGridLines = False
         
+        # Adjust column widths (sheet layout is set before any rows are streamed)
+        column_widths = {'A': 20, 'B': 18, 'C': 15, 'D': 18, 'E': 12, 'F': 15, 'G': 15, 'H': 15}
+        for col, width in column_widths.items():
+            ws.column_dimensions[col].width = width
+        
+        # Freeze panes for scrolling
+        ws.freeze_panes = 'A5'
+        
         # Title
         ws.merge_cells('A1:H2')
         ws['A1'] = "Executive Dashboard"
@@ -329,6 +578,7 @@ class ProfessionalExcelExportService:
         
         for category in categories:
             table_row += 1
+            self._flush_rows(ws, table_row)
             ws[f'A{table_row}'] = category['name']
             ws[f'B{table_row}'] = category.get('base_subtotal', category['subtotal'])
             ws[f'C{table_row}'] = category.get('markup_details', {}).get('total_markup', 0)
@@ -362,11 +612,6 @@ class ProfessionalExcelExportService:
             cell.fill = self.styles['total_row']['fill']
             cell.border = self.styles['total_row']['border']
         
-        # Adjust column widths
-        column_widths = {'A': 20, 'B': 18, 'C': 15, 'D': 18, 'E': 12, 'F': 15, 'G': 15, 'H': 15}
-        for col, width in column_widths.items():
-            ws.column_dimensions[col].width = width
-        
         # Add SpecSharp branding at bottom
         branding_row = table_row + 3
         ws.merge_cells(f'A{branding_row}:H{branding_row}')
@@ -378,16 +623,26 @@ class ProfessionalExcelExportService:
         # Add clickable link
         ws[f'A{branding_row}'].hyperlink = "https://specsharp.ai?ref=excel"
         
-        # Freeze panes for scrolling
-        ws.freeze_panes = 'A5'
+        self._finish_sheet(ws)
     
     def _create_cost_breakdown_sheet(self, wb: Workbook, project_data: Dict):
         """Create detailed cost breakdown sheet"""
-        ws = wb.create_sheet("Cost Breakdown")
+        ws = self._new_sheet(wb, "Cost Breakdown")
         
         # Hide gridlines
         ws.sheet_view.showGridLines = False
         
+        # Adjust column widths
+        column_widths = {
+            'A': 18, 'B': 35, 'C': 12, 'D': 10, 
+            'E': 15, 'F': 18, 'G': 25, 'H': 15
+        }
+        for col, width in column_widths.items():
+            ws.column_dimensions[col].width = width
+        
+        # Freeze panes
+        ws.freeze_panes = 'A11'
+        
         # Title
         ws.merge_cells('A1:H2')
         ws['A1'] = "Detailed Cost Breakdown"
@@ -454,6 +709,7 @@ class ProfessionalExcelExportService:
             
             # Add systems
             for system in category.get('systems', []):
+                self._flush_rows(ws, row)
                 ws[f'B{row}'] = system['name']
                 ws[f'C{row}'] = system['quantity']
                 ws[f'D{row}'] = system['unit']
@@ -484,17 +740,8 @@ class ProfessionalExcelExportService:
             
             row += 2
         
-        # Adjust column widths
-        column_widths = {
-            'A': 18, 'B': 35, 'C': 12, 'D': 10, 
-            'E': 15, 'F': 18, 'G': 25, 'H': 15
-        }
-        for col, width in column_widths.items():
-            ws.column_dimensions[col].width = width
-        
-        # Freeze panes
-        ws.freeze_panes = 'A11'
-        
+        self._finish_sheet(ws)
+    
     def _add_cost_pie_chart(self, ws, project_data: Dict, start_row: int):
         """Add professional pie chart for cost distribution"""
         # Prepare data for chart
@@ -502,6 +749,8 @@ class ProfessionalExcelExportService:
         
         # Add data for chart (hidden)
         data_col = 10  # Column J
+        ws.column_dimensions[get_column_letter(data_col)].hidden = True
+        ws.column_dimensions[get_column_letter(data_col+1)].hidden = True
         ws.cell(row=start_row, column=data_col, value="Category")
         ws.cell(row=start_row, column=data_col+1, value="Amount")
         
@@ -533,10 +782,6 @@ class ProfessionalExcelExportService:
         pie.legend.position = 'r'
         
         ws.add_chart(pie, f'A{start_row}')
-        
-        # Hide data columns
-        ws.column_dimensions[get_column_letter(data_col)].hidden = True
-        ws.column_dimensions[get_column_letter(data_col+1)].hidden = True
     
     def _get_location_factor(self, project_data: Dict) -> str:
         """Get location factor for display"""
@@ -579,11 +824,16 @@ class ProfessionalExcelExportService:
     
     def _create_detailed_systems_sheet(self, wb: Workbook, project_data: Dict):
         """Create detailed systems breakdown with professional formatting"""
-        ws = wb.create_sheet("Detailed Systems")
+        ws = self._new_sheet(wb, "Detailed Systems")
         
         # Hide gridlines
         ws.sheet_view.showGridLines = False
         
+        # Adjust column widths
+        column_widths = {'A': 40, 'B': 12, 'C': 10, 'D': 15, 'E': 18, 'F': 25, 'G': 12}
+        for col, width in column_widths.items():
+            ws.column_dimensions[col].width = width
+        
         # Title
         ws.merge_cells('A1:G2')
         ws['A1'] = "Detailed Systems Breakdown"
@@ -616,6 +866,7 @@ class ProfessionalExcelExportService:
             
             # Add systems
             for system in category.get('systems', []):
+                self._flush_rows(ws, row)
                 ws[f'A{row}'] = system['name']
                 ws[f'B{row}'] = system['quantity']
                 ws[f'C{row}'] = system['unit']
@@ -649,14 +900,11 @@ class ProfessionalExcelExportService:
             
             row += 3
         
-        # Adjust column widths
-        column_widths = {'A': 40, 'B': 12, 'C': 10, 'D': 15, 'E': 18, 'F': 25, 'G': 12}
-        for col, width in column_widths.items():
-            ws.column_dimensions[col].width = width
+        self._finish_sheet(ws)
     
     def _create_trade_analysis_sheet(self, wb: Workbook, project_data: Dict):
         """Create trade analysis sheet with charts"""
-        ws = wb.create_sheet("Trade Analysis")
+        ws = self._new_sheet(wb, "Trade Analysis")
         
         # Hide gridlines
         ws.sheet_view.showGridLines = False
@@ -702,6 +950,7 @@ class ProfessionalExcelExportService:
         
         for category in project_data.get('categories', []):
             row += 1
+            self._flush_rows(ws, row)
             trade_name = category['name']
             base_cost = category.get('base_subtotal', category['subtotal'])
             markup = category.get('markup_details', {}).get('total_markup', 0)
@@ -728,14 +977,19 @@ class ProfessionalExcelExportService:
             if abs(variance) > 0.20:  # 20% variance
                 color = self.styles['highlight_negative']['fill'] if variance > 0 else self.styles['highlight_positive']['fill']
                 ws[f'E{row}'].fill = color
+        
+        self._finish_sheet(ws)
     
     def _create_assumptions_sheet(self, wb: Workbook, project_data: Dict):
         """Create assumptions and notes sheet"""
-        ws = wb.create_sheet("Assumptions & Notes")
+        ws = self._new_sheet(wb, "Assumptions & Notes")
         
         # Hide gridlines
         ws.sheet_view.showGridLines = False
         
+        # Adjust column widths
+        ws.column_dimensions['A'].width = 80
+        
         # Title
         ws.merge_cells('A1:F2')
         ws['A1'] = "Project Assumptions & Important Notes"
@@ -804,8 +1058,7 @@ class ProfessionalExcelExportService:
         )
         ws[f'A{row}'].alignment = Alignment(wrap_text=True, vertical="top")
         
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 80
+        self._finish_sheet(ws)
 
 
 # Export instance
@@ -0,0 +1,385 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from app.core.config import settings
+
+
+logger = logging.getLogger(__name__)
+
+EXPORT_KIND_DECISION_PACKET = "decision_packet"
+EXPORT_KIND_DEALSHIELD = "dealshield"
+EXPORT_KINDS = (EXPORT_KIND_DECISION_PACKET, EXPORT_KIND_DEALSHIELD)
+
+JOB_STATUS_QUEUED = "queued"
+JOB_STATUS_RUNNING = "running"
+JOB_STATUS_COMPLETED = "completed"
+JOB_STATUS_FAILED = "failed"
+
+# Bump when the HTML templates or Chromium render settings change so stored
+# artifacts rendered by an older pipeline are never served for the same input.
+EXPORT_RENDERER_VERSION = "1"
+MAX_TRACKED_JOBS = 500
+ARTIFACT_SUFFIX = ".pdf"
+JOB_RECORD_DIR = "jobs"
+# Backoff for re-reading a job record rendered by another worker process.
+WAIT_POLL_INITIAL_SECONDS = 0.05
+WAIT_POLL_MAX_SECONDS = 0.5
+
+
+class ExportJobError(RuntimeError):
+    """Raised when an export job cannot be submitted or its artifact read."""
+
+
+def export_artifact_key(kind: str, export_input: Dict[str, Any]) -> str:
+    """Content hash of the sanitized export input used as the artifact cache key."""
+    canonical = json.dumps(
+        export_input,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    digest = hashlib.sha256()
+    digest.update(f"{kind}:{EXPORT_RENDERER_VERSION}:".encode("utf-8"))
+    digest.update(canonical.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def render_export_artifact(kind: str, export_input: Dict[str, Any]) -> bytes:
+    """Render one export to PDF bytes. Runs inside the export worker process."""
+    from app.services.pdf_export_service import pdf_export_service
+
+    if kind == EXPORT_KIND_DEALSHIELD:
+        buffer = pdf_export_service.generate_dealshield_pdf(export_input)
+    elif kind == EXPORT_KIND_DECISION_PACKET:
+        buffer = pdf_export_service.generate_decision_packet_pdf(export_input)
+    else:
+        raise ExportJobError(f"Unsupported export kind: {kind}")
+    return buffer.getvalue()
+
+
+class FilesystemArtifactStore:
+    """Content-addressed artifact store backed by a local directory."""
+
+    def __init__(self, root: str | os.PathLike[str]):
+        self.root = Path(root)
+
+    def path_for(self, key: str) -> Path:
+        if not _is_hex_key(key):
+            raise ExportJobError("Invalid artifact key")
+        return self.root / key[:2] / f"{key}{ARTIFACT_SUFFIX}"
+
+    def job_path_for(self, job_id: str) -> Path:
+        if not _is_hex_key(job_id):
+            raise ExportJobError("Invalid job id")
+        return self.root / JOB_RECORD_DIR / f"{job_id}.json"
+
+    def exists(self, key: str) -> bool:
+        return self.path_for(key).is_file()
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self.path_for(key)
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, data: bytes) -> Path:
+        path = self.path_for(key)
+        _atomic_write(path, data)
+        return path
+
+    def put_job(self, job_id: str, record: Dict[str, Any]) -> None:
+        _atomic_write(self.job_path_for(job_id), json.dumps(record).encode("utf-8"))
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(self.job_path_for(job_id).read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return None
+
+
+def _is_hex_key(key: str) -> bool:
+    return bool(key) and all(ch in "0123456789abcdef" for ch in key)
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a sibling temp file and rename so readers never see a partial file.
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=path.suffix)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+@dataclass
+class ExportJob:
+    job_id: str
+    kind: str
+    org_id: str
+    project_id: str
+    artifact_key: str
+    filename: str
+    status: str = JOB_STATUS_QUEUED
+    cache_hit: bool = False
+    error: Optional[str] = None
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    finished_at: Optional[datetime] = None
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in (JOB_STATUS_COMPLETED, JOB_STATUS_FAILED)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "kind": self.kind,
+            "project_id": self.project_id,
+            "status": self.status,
+            "cache_hit": self.cache_hit,
+            "filename": self.filename,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+    def to_record(self) -> Dict[str, Any]:
+        return {**self.to_dict(), "org_id": self.org_id, "artifact_key": self.artifact_key}
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "ExportJob":
+        finished_at = record.get("finished_at")
+        return cls(
+            job_id=record["job_id"],
+            kind=record["kind"],
+            org_id=record["org_id"],
+            project_id=record["project_id"],
+            artifact_key=record["artifact_key"],
+            filename=record["filename"],
+            status=record["status"],
+            cache_hit=bool(record.get("cache_hit")),
+            error=record.get("error"),
+            created_at=datetime.fromisoformat(record["created_at"]),
+            finished_at=datetime.fromisoformat(finished_at) if finished_at else None,
+        )
+
+
+def _default_executor_factory() -> Executor:
+    # Spawn keeps the worker independent of the request process's threads and
+    # event loop; Chromium rendering then never competes with the API process.
+    return ProcessPoolExecutor(
+        max_workers=max(int(settings.export_worker_processes or 1), 1),
+        mp_context=get_context("spawn"),
+    )
+
+
+class ExportJobManager:
+    """Tracks export jobs, dispatches renders to a worker, and caches artifacts by content hash."""
+
+    def __init__(
+        self,
+        store: FilesystemArtifactStore,
+        *,
+        executor: Optional[Executor] = None,
+        executor_factory: Callable[[], Executor] = _default_executor_factory,
+        renderer: Callable[[str, Dict[str, Any]], bytes] = render_export_artifact,
+        max_tracked_jobs: int = MAX_TRACKED_JOBS,
+    ):
+        self.store = store
+        self._executor = executor
+        self._executor_factory = executor_factory
+        self._renderer = renderer
+        self._max_tracked_jobs = max_tracked_jobs
+        self._jobs: "OrderedDict[str, ExportJob]" = OrderedDict()
+        self._inflight: Dict[str, Future] = {}
+        self._lock = threading.RLock()
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = self._executor_factory()
+        return self._executor
+
+    def _track(self, job: ExportJob) -> None:
+        self._jobs[job.job_id] = job
+        while len(self._jobs) > self._max_tracked_jobs:
+            self._jobs.popitem(last=False)
+
+    def submit(
+        self,
+        kind: str,
+        export_input: Dict[str, Any],
+        *,
+        org_id: str,
+        project_id: str,
+        filename: str,
+    ) -> ExportJob:
+        if kind not in EXPORT_KINDS:
+            raise ExportJobError(f"Unsupported export kind: {kind}")
+
+        artifact_key = export_artifact_key(kind, export_input)
+        job = ExportJob(
+            job_id=uuid.uuid4().hex,
+            kind=kind,
+            org_id=str(org_id),
+            project_id=str(project_id),
+            artifact_key=artifact_key,
+            filename=filename,
+        )
+
+        with self._lock:
+            self._track(job)
+            if self.store.exists(artifact_key):
+                job.status = JOB_STATUS_COMPLETED
+                job.cache_hit = True
+                job.finished_at = datetime.utcnow()
+                self._persist(job)
+                return job
+
+            # Identical inputs already rendering share one worker task.
+            future = self._inflight.get(artifact_key)
+            if future is None:
+                future = self._get_executor().submit(self._renderer, kind, export_input)
+                self._inflight[artifact_key] = future
+                future.add_done_callback(
+                    lambda done, key=artifact_key: self._store_result(key, done)
+                )
+            job.status = JOB_STATUS_RUNNING
+            self._persist(job)
+
+        future.add_done_callback(lambda done, target=job: self._finish_job(target, done))
+        return job
+
+    def _store_result(self, artifact_key: str, future: Future) -> None:
+        try:
+            if not future.cancelled() and future.exception() is None:
+                self.store.put(artifact_key, future.result())
+        except Exception as exc:
+            logger.error("[export_jobs][STORE] artifact_key=%s exception_type=%s", artifact_key, exc.__class__.__name__)
+        finally:
+            with self._lock:
+                self._inflight.pop(artifact_key, None)
+
+    def _finish_job(self, job: ExportJob, future: Future) -> None:
+        exc = None if future.cancelled() else future.exception()
+        with self._lock:
+            if future.cancelled():
+                job.status = JOB_STATUS_FAILED
+                job.error = "Export was cancelled"
+            elif exc is not None:
+                logger.error(
+                    "[export_jobs][RENDER] job_id=%s kind=%s exception_type=%s",
+                    job.job_id,
+                    job.kind,
+                    exc.__class__.__name__,
+                )
+                job.status = JOB_STATUS_FAILED
+                job.error = "Export rendering failed"
+            elif not self.store.exists(job.artifact_key):
+                job.status = JOB_STATUS_FAILED
+                job.error = "Export artifact could not be stored"
+            else:
+                job.status = JOB_STATUS_COMPLETED
+            job.finished_at = datetime.utcnow()
+            self._persist(job)
+
+    def _persist(self, job: ExportJob) -> None:
+        # Job records live next to the artifacts so any worker process of a
+        # multi-worker deployment can answer status and download requests.
+        try:
+            self.store.put_job(job.job_id, job.to_record())
+        except Exception as exc:
+            logger.error("[export_jobs][PERSIST] job_id=%s exception_type=%s", job.job_id, exc.__class__.__name__)
+
+    def get(self, job_id: str, *, org_id: str) -> Optional[ExportJob]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            try:
+                record = self.store.get_job(job_id)
+                job = ExportJob.from_record(record) if record else None
+            except (ExportJobError, KeyError, TypeError, ValueError):
+                job = None
+        if job is None or job.org_id != str(org_id):
+            return None
+        return job
+
+    async def wait(self, job: ExportJob, timeout: float) -> ExportJob:
+        """Wait up to ``timeout`` seconds for a job to finish without blocking the event loop."""
+        if job.is_finished or timeout <= 0:
+            return job
+        with self._lock:
+            future = self._inflight.get(job.artifact_key)
+        if future is None:
+            return await self._wait_for_record(job, timeout)
+        try:
+            await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout=timeout)
+        except asyncio.TimeoutError:
+            return job
+        except Exception:
+            pass
+        # Done-callbacks run on the worker's result thread; give them a turn to land.
+        for _ in range(10):
+            if job.is_finished:
+                break
+            await asyncio.sleep(0.01)
+        return job
+
+    async def _wait_for_record(self, job: ExportJob, timeout: float) -> ExportJob:
+        # No local future: the render belongs to another worker process (or has
+        # already finished here), so follow the shared job record instead.
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = WAIT_POLL_INITIAL_SECONDS
+        while True:
+            job = self._reload(job)
+            remaining = deadline - loop.time()
+            if job.is_finished or remaining <= 0:
+                return job
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, WAIT_POLL_MAX_SECONDS)
+
+    def _reload(self, job: ExportJob) -> ExportJob:
+        try:
+            record = self.store.get_job(job.job_id)
+            return ExportJob.from_record(record) if record else job
+        except (ExportJobError, KeyError, TypeError, ValueError):
+            return job
+
+    def read_artifact(self, job: ExportJob) -> bytes:
+        if job.status != JOB_STATUS_COMPLETED:
+            raise ExportJobError("Export artifact is not ready")
+        data = self.store.get(job.artifact_key)
+        if data is None:
+            raise ExportJobError("Export artifact is missing from storage")
+        return data
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+
+
+export_job_manager = ExportJobManager(FilesystemArtifactStore(settings.export_artifact_dir))
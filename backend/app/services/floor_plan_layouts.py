@@ -0,0 +1,77 @@
+"""Layout cache and SVG helpers shared by the floor plan generators.
+
+A generated layout depends only on the building type, the grid-rounded
+building dimensions and the program (building mix or room list), so the
+generators build it once per key and only produce the per-request output
+(fresh dicts, a new plan id) from the cached geometry. SVG is written as a
+stream of small chunks, so a caller can send a large plan without holding
+the whole document in memory.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Mapping, Optional, Tuple, TypeVar
+from xml.sax.saxutils import escape
+
+MAX_CACHED_LAYOUTS = 256
+PROGRAM_SHARE_DIGITS = 4
+
+LayoutT = TypeVar("LayoutT")
+
+
+def program_key(building_mix: Optional[Mapping[str, float]]) -> Tuple[Tuple[str, float], ...]:
+    """Order-independent, hashable form of a building mix; zero shares drop out."""
+    if not building_mix:
+        return ()
+    return tuple(sorted(
+        (str(use), round(float(share), PROGRAM_SHARE_DIGITS))
+        for use, share in building_mix.items()
+        if share
+    ))
+
+
+class FloorPlanLayoutCache:
+    """Bounded LRU of generated layouts.
+
+    Cached layouts are shared between requests and must not be mutated;
+    callers convert them to fresh output structures instead.
+    """
+
+    def __init__(self, max_entries: int = MAX_CACHED_LAYOUTS):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, object]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_build(self, key: Hashable, build: Callable[[], LayoutT]) -> LayoutT:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]  # type: ignore[return-value]
+        layout = build()
+        with self._lock:
+            self._entries[key] = layout
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+        return layout
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+floor_plan_layout_cache = FloorPlanLayoutCache()
+
+
+def svg_number(value: float) -> str:
+    """Coordinate with at most two decimals and no trailing zeros."""
+    text = f"{value:.2f}".rstrip("0").rstrip(".")
+    return "0" if text == "-0" else text
+
+
+def svg_text(value: object) -> str:
+    return escape(str(value), {'"': "&quot;"})
@@ -3,6 +3,7 @@ import math
 import uuid
 from dataclasses import dataclass, asdict
 from enum import Enum
+from app.services.floor_plan_layouts import floor_plan_layout_cache, program_key
 
 class RoomType(str, Enum):
     OFFICE = "office"
@@ -24,17 +25,17 @@ class EquipmentType(str, Enum):
     PLUMBING = "plumbing"
     FIRE = "fire"
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     x: float
     y: float
 
-@dataclass
+@dataclass(slots=True)
 class Dimensions:
     width: float
     length: float
 
-@dataclass
+@dataclass(slots=True)
 class Room:
     id: str
     name: str
@@ -43,14 +44,14 @@ class Room:
     position: Position
     dimensions: Dimensions
     
-@dataclass
+@dataclass(slots=True)
 class Equipment:
     id: str
     type: EquipmentType
     name: str
     location: Any  # Can be string like "roof" or Position
 
-@dataclass
+@dataclass(slots=True)
 class BuildingArea:
     type: str
     dimensions: Dimensions
@@ -58,7 +59,7 @@ class BuildingArea:
     features: List[str]
     rooms: List[Room]
 
-@dataclass
+@dataclass(slots=True)
 class FloorPlan:
     building_dimensions: Dimensions
     areas: List[BuildingArea]
@@ -110,6 +111,22 @@ class FloorPlanService:
                 # Default fallback
                 building_mix = {project_type: 1.0} if project_type else {}
         
+        # Layouts only depend on type, grid-rounded dimensions and program
+        width, length = self._plan_dimensions(square_footage)
+        layout_key = ("floor_plan", project_type, width, length, program_key(building_mix))
+        floor_plan = floor_plan_layout_cache.get_or_build(
+            layout_key,
+            lambda: self._build_floor_plan(square_footage, project_type, building_mix)
+        )
+        return self._floor_plan_to_dict(floor_plan)
+    
+    def _build_floor_plan(
+        self,
+        square_footage: float,
+        project_type: str,
+        building_mix: Dict[str, float]
+    ) -> FloorPlan:
+        """Generate the plan geometry for a layout cache miss"""
         if project_type == "mixed_use" and building_mix:
             return self._generate_mixed_use_plan(square_footage, building_mix)
         elif project_type == "commercial":
@@ -119,21 +136,22 @@ class FloorPlanService:
         else:
             return self._generate_generic_plan(square_footage)
     
+    def _plan_dimensions(self, total_sqft: float) -> Tuple[float, float]:
+        """Grid-rounded width and length of a rectangular building"""
+        aspect_ratio = 2.0  # Length to width ratio
+        width = math.sqrt(total_sqft / aspect_ratio)
+        length = width * aspect_ratio
+        return self._round_to_grid(width), self._round_to_grid(length)
+    
     def _generate_mixed_use_plan(
         self, 
         total_sqft: float, 
         building_mix: Dict[str, float]
-    ) -> Dict[str, Any]:
+    ) -> FloorPlan:
         """Generate a mixed-use building floor plan"""
         
-        # Calculate dimensions assuming rectangular building
-        aspect_ratio = 2.0  # Length to width ratio
-        width = math.sqrt(total_sqft / aspect_ratio)
-        length = width * aspect_ratio
-        
-        # Round to grid
-        width = self._round_to_grid(width)
-        length = self._round_to_grid(length)
+        # Rectangular building rounded to the planning grid
+        width, length = self._plan_dimensions(total_sqft)
         
         areas = []
         equipment = []
@@ -178,7 +196,7 @@ class FloorPlanService:
             equipment=equipment
         )
         
-        return self._floor_plan_to_dict(floor_plan)
+        return floor_plan
     
     def _create_warehouse_area(
         self, 
@@ -455,19 +473,19 @@ class FloorPlanService:
         
         return equipment
     
-    def _generate_commercial_plan(self, square_footage: float) -> Dict[str, Any]:
+    def _generate_commercial_plan(self, square_footage: float) -> FloorPlan:
         """Generate a standard commercial building plan"""
         # Simplified implementation
         building_mix = {"office": 1.0}
         return self._generate_mixed_use_plan(square_footage, building_mix)
     
-    def _generate_industrial_plan(self, square_footage: float) -> Dict[str, Any]:
+    def _generate_industrial_plan(self, square_footage: float) -> FloorPlan:
         """Generate an industrial building plan"""
         # Simplified implementation
         building_mix = {"warehouse": 1.0}
         return self._generate_mixed_use_plan(square_footage, building_mix)
     
-    def _generate_generic_plan(self, square_footage: float) -> Dict[str, Any]:
+    def _generate_generic_plan(self, square_footage: float) -> FloorPlan:
         """Generate a generic building plan"""
         # Default to office
         return self._generate_commercial_plan(square_footage)
@@ -491,7 +509,7 @@ class FloorPlanService:
                         "length": area.dimensions.length
                     },
                     "position": {"x": area.position.x, "y": area.position.y},
-                    "features": area.features,
+                    "features": list(area.features),
                     "rooms": [
                         {
                             "id": room.id,
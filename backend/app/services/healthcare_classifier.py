@@ -1,11 +1,265 @@
 """
 Healthcare Facility Classification Service
 Detects facility type, equipment needs, and compliance requirements
+
+Every keyword list below is compiled once into a single keyword automaton.
+A description is scanned once and the scan yields every classification
+signal (facility type, hospital subtype, specialties, special spaces and
+the California seismic flag); the classification steps then only look up
+signals. Matching keeps the original plain-substring semantics, so short
+keywords such as 'er' or 'ca' still match inside longer words.
 """
 
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Sequence, Tuple
 import re
 
+Signal = Tuple[str, str]
+
+# Checked in order; the first facility type with a matching keyword wins.
+FACILITY_TYPE_KEYWORDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    # Hospital indicators (most complex first)
+    # Note: 'er' alone is too generic, need more context
+    ('hospital', ('hospital', 'medical center', 'trauma center', 'acute care', 'inpatient')),
+    # Surgical/Procedure Centers (check before imaging to catch ASCs)
+    ('ambulatory_surgery_center', ('surgery center', 'surgical center', 'asc', 'ambulatory surgery')),
+    # Imaging Centers
+    ('imaging_center', (
+        'imaging center', 'radiology', 'mri', 'ct scan', 'diagnostic imaging', 'x-ray center'
+    )),
+    # Emergency/Urgent Care
+    ('urgent_care', ('urgent care', 'walk-in clinic', 'express care', 'immediate care', 'emergency clinic')),
+    # Specialty Clinics
+    ('dialysis_center', ('dialysis', 'renal center', 'kidney center')),
+    ('cancer_center', (
+        'cancer center', 'cancer treatment', 'oncology', 'infusion center',
+        'chemotherapy', 'radiation therapy'
+    )),
+    ('birthing_center', (
+        'birth center', 'birthing center', 'maternity',
+        'obstetric', 'ob/gyn', 'womens health', "women's health"
+    )),
+    # Outpatient Clinics
+    ('community_health_center', ('health center', 'community health', 'fqhc', 'federally qualified', 'public health')),
+    ('dental_clinic', ('dental clinic', 'dental office', 'dentist', 'oral surgery', 'orthodontic')),
+    ('eye_clinic', ('eye clinic', 'ophthalmology', 'optometry', 'vision center', 'lasik')),
+    # Senior Care
+    ('skilled_nursing_facility', ('nursing home', 'skilled nursing', 'snf', 'long-term care', 'ltc')),
+    ('assisted_living', ('assisted living', 'senior living', 'memory care', 'alzheimer', 'dementia care')),
+    # Default medical office
+    ('medical_office', (
+        'medical office', 'doctor', 'physician office',
+        'clinic', 'medical building', 'mob', 'healthcare', 'health'
+    )),
+)
+
+# Refines 'hospital' in order; no match means a general hospital.
+HOSPITAL_SUBTYPE_KEYWORDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ('pediatric_hospital', ('children', 'pediatric')),
+    ('psychiatric_hospital', ('psychiatric', 'behavioral')),
+    ('rehabilitation_hospital', ('rehabilitation', 'rehab')),
+    ('critical_access_hospital', ('critical access',)),
+)
+
+SPECIALTY_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    'cardiology': ('cardiology', 'cardiac', 'heart center', 'cath lab'),
+    'orthopedics': ('orthopedic', 'ortho', 'sports medicine', 'joint replacement'),
+    'neurology': ('neurology', 'neuro', 'brain', 'spine center'),
+    'pediatrics': ('pediatric', 'children', 'kids'),
+    'surgery': ('surgery', 'surgical', 'operating', 'or suite'),
+    'emergency': ('emergency', 'trauma', 'er', 'ed'),
+    'intensive_care': ('icu', 'intensive care', 'critical care'),
+    'radiology': ('radiology', 'imaging', 'x-ray', 'mri', 'ct'),
+    'laboratory': ('lab', 'laboratory', 'pathology'),
+    'pharmacy': ('pharmacy', 'medication', 'drug'),
+    'rehabilitation': ('rehab', 'physical therapy', 'pt', 'occupational therapy'),
+    'mental_health': ('psychiatric', 'behavioral', 'mental health', 'psychology'),
+}
+
+SPECIAL_SPACE_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    'operating_room': (
+        'operating room', ' or ', 'surgery suite', 'surgical suite', 'surgical center', '4 ors', '6 ors', '8 ors'
+    ),
+    'emergency_dept': ('emergency department', 'emergency room'),
+    'icu': ('icu', 'intensive care', 'critical care unit'),
+    'clean_room': ('clean room', 'sterile processing', 'compounding'),
+    'isolation_room': ('isolation', 'negative pressure', 'airborne infection'),
+    'mri_suite': ('mri', 'magnetic resonance'),
+    'ct_suite': ('ct scan', 'cat scan', 'computed tomography'),
+    'xray_suite': ('x-ray', 'radiography', 'fluoroscopy'),
+    'cath_lab': ('cath lab', 'catheterization', 'angiography'),
+    'linear_accelerator': ('linear accelerator', 'radiation therapy', 'linac'),
+    'pharmacy': ('pharmacy', 'medication room', 'drug storage'),
+    'laboratory': ('laboratory', 'lab', 'pathology'),
+    'morgue': ('morgue', 'autopsy'),
+    'kitchen': ('kitchen', 'dietary', 'food service'),
+    'data_center': ('data center', 'server room', 'it room'),
+    'helicopter_pad': ('helipad', 'helicopter', 'rooftop landing'),
+}
+
+# California specific (OSHPD seismic review)
+OSHPD_LOCATION_KEYWORDS: Tuple[str, ...] = ('california', 'ca', 'los angeles', 'san francisco')
+
+RADIATION_SPACES = frozenset({'mri_suite', 'ct_suite', 'xray_suite', 'linear_accelerator'})
+
+FACILITY_COMPLEXITY: Dict[str, float] = {
+    'general_hospital': 1.3,
+    'pediatric_hospital': 1.35,
+    'psychiatric_hospital': 1.15,
+    'rehabilitation_hospital': 1.2,
+    'ambulatory_surgery_center': 1.25,
+    'imaging_center': 1.15,
+    'cancer_center': 1.3,
+    'urgent_care': 1.05,
+    'medical_office': 1.0,
+    'dental_clinic': 1.05,
+    'skilled_nursing_facility': 1.1,
+    'assisted_living': 1.0
+}
+
+SPACE_COMPLEXITY: Dict[str, float] = {
+    'operating_room': 0.15,
+    'emergency_dept': 0.1,
+    'icu': 0.12,
+    'clean_room': 0.15,
+    'mri_suite': 0.1,
+    'ct_suite': 0.08,
+    'cath_lab': 0.12,
+    'linear_accelerator': 0.2
+}
+
+BASE_COST_PER_SF: Dict[str, int] = {
+    'general_hospital': 450,
+    'pediatric_hospital': 475,
+    'psychiatric_hospital': 350,
+    'rehabilitation_hospital': 375,
+    'critical_access_hospital': 400,
+    'ambulatory_surgery_center': 425,
+    'imaging_center': 375,
+    'cancer_center': 450,
+    'dialysis_center': 325,
+    'birthing_center': 400,
+    'urgent_care': 325,
+    'community_health_center': 275,
+    'medical_office': 275,
+    'dental_clinic': 300,
+    'eye_clinic': 325,
+    'skilled_nursing_facility': 250,
+    'assisted_living': 225
+}
+
+EQUIPMENT_COST_PER_SF: Dict[str, int] = {
+    'general_hospital': 150,
+    'pediatric_hospital': 140,
+    'psychiatric_hospital': 30,
+    'rehabilitation_hospital': 60,
+    'ambulatory_surgery_center': 125,
+    'imaging_center': 200,  # High due to imaging equipment
+    'cancer_center': 175,   # Radiation therapy equipment
+    'dialysis_center': 80,
+    'urgent_care': 40,
+    'medical_office': 25,
+    'dental_clinic': 60,
+    'eye_clinic': 75,
+    'skilled_nursing_facility': 20,
+    'assisted_living': 10
+}
+
+# Equipment cost adders per specialty ($/SF)
+SPECIALTY_EQUIPMENT_ADDERS: Dict[str, int] = {
+    'radiology': 50,
+    'surgery': 75,
+    'laboratory': 30,
+}
+
+
+class KeywordAutomaton:
+    """
+    Finds every keyword contained in a text with one compiled regex scan.
+
+    The keywords are folded into a trie and rendered as a single pattern,
+    tried at every position behind a lookahead. At each position the
+    pattern yields the longest keyword starting there; every shorter
+    keyword starting there is one of its prefixes, so each keyword carries
+    the signals of all its prefix keywords.
+    """
+
+    def __init__(self, signals_by_keyword: Mapping[str, Iterable[Signal]]):
+        keywords = sorted(signals_by_keyword)
+        self._pattern = re.compile('(?=(' + self._trie_pattern(keywords) + '))')
+        self._signals: Dict[str, FrozenSet[Signal]] = {
+            keyword: frozenset(
+                signal
+                for prefix in keywords
+                if keyword.startswith(prefix)
+                for signal in signals_by_keyword[prefix]
+            )
+            for keyword in keywords
+        }
+
+    @staticmethod
+    def _trie_pattern(keywords: Sequence[str]) -> str:
+        trie: Dict[str, Dict] = {}
+        for keyword in keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[''] = {}
+
+        def render(node: Dict[str, Dict]) -> str:
+            branches = [re.escape(char) + render(child) for char, child in node.items() if char]
+            if not branches:
+                return ''
+            body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+            # Greedy optional: prefer the longer keyword, fall back to this one
+            return '(?:' + body + ')?' if '' in node else body
+
+        return render(trie)
+
+    def scan(self, text: str) -> FrozenSet[Signal]:
+        signals = self._signals
+        found: set = set()
+        for longest in set(self._pattern.findall(text)):
+            found |= signals[longest]
+        return frozenset(found)
+
+
+def _build_automaton() -> KeywordAutomaton:
+    signals_by_keyword: Dict[str, set] = {}
+
+    def add(keywords: Iterable[str], signal: Signal) -> None:
+        for keyword in keywords:
+            signals_by_keyword.setdefault(keyword, set()).add(signal)
+
+    for facility_type, keywords in FACILITY_TYPE_KEYWORDS:
+        add(keywords, ('facility', facility_type))
+    for hospital_type, keywords in HOSPITAL_SUBTYPE_KEYWORDS:
+        add(keywords, ('hospital', hospital_type))
+    for specialty, keywords in SPECIALTY_KEYWORDS.items():
+        add(keywords, ('specialty', specialty))
+    for space, keywords in SPECIAL_SPACE_KEYWORDS.items():
+        add(keywords, ('space', space))
+    add(OSHPD_LOCATION_KEYWORDS, ('location', 'oshpd'))
+    return KeywordAutomaton(signals_by_keyword)
+
+
+HEALTHCARE_KEYWORDS = _build_automaton()
+
+
+@lru_cache(maxsize=None)
+def base_cost_per_sf(facility_type: str) -> int:
+    """Base construction cost per square foot (excluding equipment)"""
+    return BASE_COST_PER_SF.get(facility_type, 275)
+
+
+@lru_cache(maxsize=1024)
+def equipment_cost_per_sf(facility_type: str, specialties: Tuple[str, ...]) -> int:
+    """Typical equipment cost per square foot, adjusted for specialties"""
+    return EQUIPMENT_COST_PER_SF.get(facility_type, 25) + sum(
+        SPECIALTY_EQUIPMENT_ADDERS.get(specialty, 0) for specialty in specialties
+    )
+
+
 class HealthcareFacilityClassifier:
     """
     Classifies healthcare facilities and identifies special requirements
@@ -15,20 +269,21 @@ class HealthcareFacilityClassifier:
         """
         Main classification method - returns facility type and requirements
         """
-        description_lower = description.lower()
+        # One scan yields every keyword signal used below
+        signals = HEALTHCARE_KEYWORDS.scan(description.lower())
         
         # Determine primary facility type
-        facility_type = self._identify_facility_type(description_lower)
+        facility_type = self._identify_facility_type(signals)
         
         # Identify specialties and departments
-        specialties = self._identify_specialties(description_lower)
+        specialties = self._identify_specialties(signals)
         
         # Identify special spaces
-        special_spaces = self._identify_special_spaces(description_lower)
+        special_spaces = self._identify_special_spaces(signals)
         
         # Determine compliance requirements
         compliance = self._identify_compliance_requirements(
-            facility_type, specialties, special_spaces, description_lower
+            facility_type, specialties, special_spaces, signals
         )
         
         # Identify medical equipment needs
@@ -52,166 +307,38 @@ class HealthcareFacilityClassifier:
             'equipment_cost_per_sf': self._get_equipment_cost(facility_type, specialties)
         }
     
-    def _identify_facility_type(self, description: str) -> str:
+    def _identify_facility_type(self, signals: FrozenSet[Signal]) -> str:
         """
         Identify primary healthcare facility type
         """
-        # Hospital indicators (most complex first)
-        # Note: 'er' alone is too generic, need more context
-        if any(term in description for term in [
-            'hospital', 'medical center', 'trauma center', 
-            'acute care', 'inpatient'
-        ]):
-            if 'children' in description or 'pediatric' in description:
-                return 'pediatric_hospital'
-            elif 'psychiatric' in description or 'behavioral' in description:
-                return 'psychiatric_hospital'
-            elif 'rehabilitation' in description or 'rehab' in description:
-                return 'rehabilitation_hospital'
-            elif 'critical access' in description:
-                return 'critical_access_hospital'
-            else:
-                return 'general_hospital'
-        
-        # Surgical/Procedure Centers (check before imaging to catch ASCs)
-        elif any(term in description for term in [
-            'surgery center', 'surgical center', 'asc', 
-            'ambulatory surgery'
-        ]):
-            return 'ambulatory_surgery_center'
-        
-        # Imaging Centers
-        elif any(term in description for term in [
-            'imaging center', 'radiology', 'mri', 'ct scan', 
-            'diagnostic imaging', 'x-ray center'
-        ]):
-            return 'imaging_center'
-        
-        # Emergency/Urgent Care
-        elif any(term in description for term in [
-            'urgent care', 'walk-in clinic', 'express care',
-            'immediate care', 'emergency clinic'
-        ]):
-            return 'urgent_care'
-        
-        # Specialty Clinics
-        elif any(term in description for term in [
-            'dialysis', 'renal center', 'kidney center'
-        ]):
-            return 'dialysis_center'
-        elif any(term in description for term in [
-            'cancer center', 'cancer treatment', 'oncology', 'infusion center',
-            'chemotherapy', 'radiation therapy'
-        ]):
-            return 'cancer_center'
-        elif any(term in description for term in [
-            'birth center', 'birthing center', 'maternity',
-            'obstetric', 'ob/gyn', 'womens health', "women's health"
-        ]):
-            return 'birthing_center'
-        
-        # Outpatient Clinics
-        elif any(term in description for term in [
-            'health center', 'community health', 'fqhc',
-            'federally qualified', 'public health'
-        ]):
-            return 'community_health_center'
-        elif any(term in description for term in [
-            'dental clinic', 'dental office', 'dentist',
-            'oral surgery', 'orthodontic'
-        ]):
-            return 'dental_clinic'
-        elif any(term in description for term in [
-            'eye clinic', 'ophthalmology', 'optometry',
-            'vision center', 'lasik'
-        ]):
-            return 'eye_clinic'
-        
-        # Senior Care
-        elif any(term in description for term in [
-            'nursing home', 'skilled nursing', 'snf',
-            'long-term care', 'ltc'
-        ]):
-            return 'skilled_nursing_facility'
-        elif any(term in description for term in [
-            'assisted living', 'senior living', 'memory care',
-            'alzheimer', 'dementia care'
-        ]):
-            return 'assisted_living'
-        
-        # Default medical office
-        elif any(term in description for term in [
-            'medical office', 'doctor', 'physician office',
-            'clinic', 'medical building', 'mob', 'healthcare',
-            'health'
-        ]):
-            return 'medical_office'
+        for facility_type, _ in FACILITY_TYPE_KEYWORDS:
+            if ('facility', facility_type) not in signals:
+                continue
+            if facility_type != 'hospital':
+                return facility_type
+            for hospital_type, _ in HOSPITAL_SUBTYPE_KEYWORDS:
+                if ('hospital', hospital_type) in signals:
+                    return hospital_type
+            return 'general_hospital'
         
         # If no healthcare terms found
-        else:
-            return 'unknown'
+        return 'unknown'
     
-    def _identify_specialties(self, description: str) -> List[str]:
+    def _identify_specialties(self, signals: FrozenSet[Signal]) -> List[str]:
         """
         Identify medical specialties mentioned
         """
-        specialties = []
-        
-        specialty_map = {
-            'cardiology': ['cardiology', 'cardiac', 'heart center', 'cath lab'],
-            'orthopedics': ['orthopedic', 'ortho', 'sports medicine', 'joint replacement'],
-            'neurology': ['neurology', 'neuro', 'brain', 'spine center'],
-            'pediatrics': ['pediatric', 'children', 'kids'],
-            'surgery': ['surgery', 'surgical', 'operating', 'or suite'],
-            'emergency': ['emergency', 'trauma', 'er', 'ed'],
-            'intensive_care': ['icu', 'intensive care', 'critical care'],
-            'radiology': ['radiology', 'imaging', 'x-ray', 'mri', 'ct'],
-            'laboratory': ['lab', 'laboratory', 'pathology'],
-            'pharmacy': ['pharmacy', 'medication', 'drug'],
-            'rehabilitation': ['rehab', 'physical therapy', 'pt', 'occupational therapy'],
-            'mental_health': ['psychiatric', 'behavioral', 'mental health', 'psychology']
-        }
-        
-        for specialty, keywords in specialty_map.items():
-            if any(keyword in description for keyword in keywords):
-                specialties.append(specialty)
-        
-        return specialties
+        return [specialty for specialty in SPECIALTY_KEYWORDS if ('specialty', specialty) in signals]
     
-    def _identify_special_spaces(self, description: str) -> List[str]:
+    def _identify_special_spaces(self, signals: FrozenSet[Signal]) -> List[str]:
         """
         Identify special spaces that affect construction costs
         """
-        special_spaces = []
-        
-        space_map = {
-            'operating_room': ['operating room', ' or ', 'surgery suite', 'surgical suite', 'surgical center', '4 ors', '6 ors', '8 ors'],
-            'emergency_dept': ['emergency department', 'emergency room'],
-            'icu': ['icu', 'intensive care', 'critical care unit'],
-            'clean_room': ['clean room', 'sterile processing', 'compounding'],
-            'isolation_room': ['isolation', 'negative pressure', 'airborne infection'],
-            'mri_suite': ['mri', 'magnetic resonance'],
-            'ct_suite': ['ct scan', 'cat scan', 'computed tomography'],
-            'xray_suite': ['x-ray', 'radiography', 'fluoroscopy'],
-            'cath_lab': ['cath lab', 'catheterization', 'angiography'],
-            'linear_accelerator': ['linear accelerator', 'radiation therapy', 'linac'],
-            'pharmacy': ['pharmacy', 'medication room', 'drug storage'],
-            'laboratory': ['laboratory', 'lab', 'pathology'],
-            'morgue': ['morgue', 'autopsy'],
-            'kitchen': ['kitchen', 'dietary', 'food service'],
-            'data_center': ['data center', 'server room', 'it room'],
-            'helicopter_pad': ['helipad', 'helicopter', 'rooftop landing']
-        }
-        
-        for space, keywords in space_map.items():
-            if any(keyword in description for keyword in keywords):
-                special_spaces.append(space)
-        
-        return special_spaces
+        return [space for space in SPECIAL_SPACE_KEYWORDS if ('space', space) in signals]
     
     def _identify_compliance_requirements(
         self, facility_type: str, specialties: List[str], 
-        special_spaces: List[str], description: str
+        special_spaces: List[str], signals: FrozenSet[Signal]
     ) -> Dict[str, bool]:
         """
         Identify regulatory and compliance requirements
@@ -248,8 +375,7 @@ class HealthcareFacilityClassifier:
             compliance['usp_797_800'] = True
         
         # Radiation requirements
-        if any(space in ['mri_suite', 'ct_suite', 'xray_suite', 'linear_accelerator'] 
-               for space in special_spaces):
+        if any(space in RADIATION_SPACES for space in special_spaces):
             compliance['radiation_shielding'] = True
         
         # MRI specific
@@ -257,7 +383,7 @@ class HealthcareFacilityClassifier:
             compliance['magnetic_shielding'] = True
         
         # California specific
-        if any(loc in description.lower() for loc in ['california', 'ca', 'los angeles', 'san francisco']):
+        if ('location', 'oshpd') in signals:
             compliance['oshpd_seismic'] = True
         
         return compliance
@@ -340,40 +466,12 @@ class HealthcareFacilityClassifier:
         """
         Calculate complexity multiplier based on requirements
         """
-        base_multiplier = 1.0
-        
         # Facility type complexity
-        facility_complexity = {
-            'general_hospital': 1.3,
-            'pediatric_hospital': 1.35,
-            'psychiatric_hospital': 1.15,
-            'rehabilitation_hospital': 1.2,
-            'ambulatory_surgery_center': 1.25,
-            'imaging_center': 1.15,
-            'cancer_center': 1.3,
-            'urgent_care': 1.05,
-            'medical_office': 1.0,
-            'dental_clinic': 1.05,
-            'skilled_nursing_facility': 1.1,
-            'assisted_living': 1.0
-        }
-        
-        base_multiplier = facility_complexity.get(facility_type, 1.0)
+        base_multiplier = FACILITY_COMPLEXITY.get(facility_type, 1.0)
         
         # Add complexity for special spaces
-        space_complexity = {
-            'operating_room': 0.15,
-            'emergency_dept': 0.1,
-            'icu': 0.12,
-            'clean_room': 0.15,
-            'mri_suite': 0.1,
-            'ct_suite': 0.08,
-            'cath_lab': 0.12,
-            'linear_accelerator': 0.2
-        }
-        
         for space in special_spaces:
-            base_multiplier += space_complexity.get(space, 0.05)
+            base_multiplier += SPACE_COMPLEXITY.get(space, 0.05)
         
         # Add complexity for compliance requirements
         compliance_count = sum(1 for req in compliance.values() if req)
@@ -388,60 +486,13 @@ class HealthcareFacilityClassifier:
         """
         Get base construction cost per square foot (excluding equipment)
         """
-        base_costs = {
-            'general_hospital': 450,
-            'pediatric_hospital': 475,
-            'psychiatric_hospital': 350,
-            'rehabilitation_hospital': 375,
-            'critical_access_hospital': 400,
-            'ambulatory_surgery_center': 425,
-            'imaging_center': 375,
-            'cancer_center': 450,
-            'dialysis_center': 325,
-            'birthing_center': 400,
-            'urgent_care': 325,
-            'community_health_center': 275,
-            'medical_office': 275,
-            'dental_clinic': 300,
-            'eye_clinic': 325,
-            'skilled_nursing_facility': 250,
-            'assisted_living': 225
-        }
-        
-        return base_costs.get(facility_type, 275)
+        return base_cost_per_sf(facility_type)
     
     def _get_equipment_cost(self, facility_type: str, specialties: List[str]) -> int:
         """
         Get typical equipment cost per square foot
         """
-        equipment_costs = {
-            'general_hospital': 150,
-            'pediatric_hospital': 140,
-            'psychiatric_hospital': 30,
-            'rehabilitation_hospital': 60,
-            'ambulatory_surgery_center': 125,
-            'imaging_center': 200,  # High due to imaging equipment
-            'cancer_center': 175,   # Radiation therapy equipment
-            'dialysis_center': 80,
-            'urgent_care': 40,
-            'medical_office': 25,
-            'dental_clinic': 60,
-            'eye_clinic': 75,
-            'skilled_nursing_facility': 20,
-            'assisted_living': 10
-        }
-        
-        base_equipment = equipment_costs.get(facility_type, 25)
-        
-        # Adjust for specialties
-        if 'radiology' in specialties:
-            base_equipment += 50
-        if 'surgery' in specialties:
-            base_equipment += 75
-        if 'laboratory' in specialties:
-            base_equipment += 30
-        
-        return base_equipment
+        return equipment_cost_per_sf(facility_type, tuple(specialties))
 
 
 # Singleton instance
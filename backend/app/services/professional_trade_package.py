@@ -1,6 +1,5 @@
 from typing import Dict, List, Optional, Any, Tuple
 import io
-import base64
 from datetime import datetime
 import json
 import csv
@@ -13,13 +12,12 @@ from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_CENTER, TA_RIGHT, TA_LEFT, TA_JUSTIFY
 from reportlab.pdfgen import canvas
 from reportlab.lib.utils import ImageReader
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.patches import Rectangle, FancyBboxPatch, Circle, Arc
-from matplotlib.lines import Line2D
-import numpy as np
-from PIL import Image as PILImage, ImageDraw, ImageFont
 from app.utils.building_type_display import get_display_building_type
+from app.services.trade_schematics import (
+    DEFAULT_SQUARE_FOOTAGE,
+    electrical_one_line_png,
+    trade_schematic_data_url,
+)
 
 
 class ProfessionalTradePackageService:
@@ -477,14 +475,12 @@ class ProfessionalTradePackageService:
         elements.append(Paragraph("Electrical One-Line Diagram", styles['DocumentTitle']))
         elements.append(Spacer(1, 0.3*inch))
         
-        # Generate the electrical diagram
-        diagram_image = self._create_electrical_one_line_diagram(project_data)
-        
-        # Convert base64 to Image for ReportLab
-        if diagram_image.startswith('data:image/png;base64,'):
-            image_data = base64.b64decode(diagram_image.split(',')[1])
-            img = Image(io.BytesIO(image_data), width=6.5*inch, height=5*inch)
-            elements.append(img)
+        # One-line diagram PNG, cached per project name and service size
+        request_data = project_data.get('request_data', {})
+        diagram_png = electrical_one_line_png(
+            project_data.get('project_name'), request_data.get('square_footage', DEFAULT_SQUARE_FOOTAGE)
+        )
+        elements.append(Image(io.BytesIO(diagram_png), width=6.5*inch, height=6.175*inch))
         
         elements.append(Spacer(1, 0.3*inch))
         
@@ -839,288 +835,8 @@ class ProfessionalTradePackageService:
     
     def create_improved_schematic(self, floor_plan: Dict, trade: str, 
                                  request_data: Dict) -> str:
-        """Create improved, clearer trade schematics"""
-        print(f"[DEBUG] create_improved_schematic called with trade: {trade}, type: {type(trade)}")
-        if trade is None:
-            raise ValueError("Trade parameter cannot be None")
-        
-        # Debug request_data
-        print(f"[DEBUG] request_data: {request_data}")
-        print(f"[DEBUG] square_footage from request_data: {request_data.get('square_footage')}")
-        
-        fig, ax = plt.subplots(1, 1, figsize=(11, 8.5))
-        
-        # Get building dimensions
-        square_footage = request_data.get('square_footage', 10000)
-        if square_footage <= 0:
-            square_footage = 10000  # Default to 10,000 if invalid
-        aspect_ratio = 1.5
-        width = np.sqrt(square_footage / aspect_ratio)
-        height = width * aspect_ratio
-        
-        # Scale to fit page with margins
-        # Prevent division by zero
-        width_ratio = max(width / 100, 0.01)
-        height_ratio = max(height / 100, 0.01)
-        scale = min(9 / width_ratio, 6.5 / height_ratio)
-        width_scaled = width * scale / 100
-        height_scaled = height * scale / 100
-        
-        # Center the building
-        x_offset = (11 - width_scaled) / 2
-        y_offset = (8.5 - height_scaled) / 2
-        
-        # Draw building outline
-        building = FancyBboxPatch(
-            (x_offset, y_offset), width_scaled, height_scaled,
-            boxstyle="round,pad=0.1",
-            linewidth=2, edgecolor='black',
-            facecolor='white', alpha=0.9
-        )
-        ax.add_patch(building)
-        
-        # Add trade-specific elements
-        if trade.lower() == 'electrical':
-            self._add_electrical_schematic(ax, x_offset, y_offset, width_scaled, height_scaled)
-        elif trade.lower() in ['mechanical', 'hvac']:
-            self._add_mechanical_schematic(ax, x_offset, y_offset, width_scaled, height_scaled)
-        elif trade.lower() == 'plumbing':
-            self._add_plumbing_schematic(ax, x_offset, y_offset, width_scaled, height_scaled)
-        
-        # Add title and legend
-        ax.text(5.5, 7.8, f"{self.trade_display_names.get(trade.lower(), trade)} Schematic",
-                fontsize=16, ha='center', weight='bold')
-        
-        self._add_legend(ax, trade)
-        
-        # Add scale
-        ax.text(x_offset, y_offset - 0.3, f"Scale: 1/8\" = 1'-0\"", fontsize=10)
-        
-        # Configure plot
-        ax.set_xlim(0, 11)
-        ax.set_ylim(0, 8.5)
-        ax.set_aspect('equal')
-        ax.axis('off')
-        
-        # Save to buffer
-        buffer = io.BytesIO()
-        plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight', 
-                   facecolor='white', edgecolor='none')
-        plt.close()
-        
-        # Convert to base64
-        buffer.seek(0)
-        image_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
-        return f"data:image/png;base64,{image_base64}"
-    
-    def _add_electrical_schematic(self, ax, x, y, w, h):
-        """Add electrical schematic elements"""
-        # Main panel
-        panel = Rectangle((x + 0.2, y + h - 0.6), 0.3, 0.5,
-                         facecolor='yellow', edgecolor='black', linewidth=2)
-        ax.add_patch(panel)
-        ax.text(x + 0.35, y + h - 0.35, 'MDP', ha='center', va='center', fontsize=8, weight='bold')
-        
-        # Distribution lines
-        for i in range(3):
-            y_pos = y + h * (0.7 - i * 0.25)
-            ax.plot([x + 0.5, x + w - 0.5], [y_pos, y_pos], 'k-', linewidth=1.5)
-            ax.plot([x + w * 0.3, x + w * 0.3], [y_pos, y_pos - 0.2], 'k-', linewidth=1)
-            ax.plot([x + w * 0.7, x + w * 0.7], [y_pos, y_pos - 0.2], 'k-', linewidth=1)
-            
-            # Panels
-            panel = Rectangle((x + w * 0.3 - 0.1, y_pos - 0.3), 0.2, 0.2,
-                            facecolor='yellow', edgecolor='black')
-            ax.add_patch(panel)
-            ax.text(x + w * 0.3, y_pos - 0.2, f'P{i+1}', ha='center', va='center', fontsize=6)
-    
-    def _add_mechanical_schematic(self, ax, x, y, w, h):
-        """Add mechanical/HVAC schematic elements"""
-        # RTUs on roof
-        for i in range(2):
-            x_pos = x + w * (0.3 + i * 0.4)
-            rtu = Rectangle((x_pos - 0.15, y + h - 0.3), 0.3, 0.25,
-                           facecolor='orange', edgecolor='black', linewidth=2)
-            ax.add_patch(rtu)
-            ax.text(x_pos, y + h - 0.175, f'RTU-{i+1}', ha='center', va='center', fontsize=6, weight='bold')
-            
-            # Ductwork
-            ax.plot([x_pos, x_pos], [y + h - 0.3, y + h * 0.7], 'b-', linewidth=3)
-            ax.plot([x_pos, x + w * 0.2], [y + h * 0.7, y + h * 0.7], 'b-', linewidth=3)
-            ax.plot([x_pos, x + w * 0.8], [y + h * 0.7, y + h * 0.7], 'b-', linewidth=3)
-    
-    def _add_plumbing_schematic(self, ax, x, y, w, h):
-        """Add plumbing schematic elements"""
-        # Water heater
-        wh = Circle((x + 0.3, y + 0.3), 0.15, facecolor='lightblue', edgecolor='black', linewidth=2)
-        ax.add_patch(wh)
-        ax.text(x + 0.3, y + 0.3, 'WH', ha='center', va='center', fontsize=6, weight='bold')
-        
-        # Main water line
-        ax.plot([x + 0.45, x + w - 0.2], [y + 0.3, y + 0.3], 'b-', linewidth=2)
-        
-        # Risers
-        for i in range(2):
-            x_pos = x + w * (0.3 + i * 0.4)
-            ax.plot([x_pos, x_pos], [y + 0.3, y + h - 0.3], 'b-', linewidth=1.5)
-            ax.plot([x_pos - 0.1, x_pos + 0.1], [y + h * 0.5, y + h * 0.5], 'b-', linewidth=1)
-    
-    def _add_legend(self, ax, trade):
-        """Add legend for symbols"""
-        legend_items = {
-            'electrical': [
-                ('yellow', 'Electrical Panel'),
-                ('black line', 'Power Distribution'),
-            ],
-            'mechanical': [
-                ('orange', 'HVAC Equipment'),
-                ('blue line', 'Ductwork'),
-            ],
-            'plumbing': [
-                ('blue', 'Water Lines'),
-                ('lightblue', 'Equipment'),
-            ]
-        }
-        
-        items = legend_items.get(trade.lower(), [])
-        if items:
-            legend_elements = []
-            for color, label in items:
-                if 'line' in color:
-                    element = Line2D([0], [0], color=color.split()[0], linewidth=2, label=label)
-                else:
-                    element = Rectangle((0, 0), 1, 1, facecolor=color, edgecolor='black', label=label)
-                legend_elements.append(element)
-            
-            ax.legend(handles=legend_elements, loc='lower right', frameon=True, 
-                     fancybox=True, shadow=True)
-    
-    def _create_electrical_one_line_diagram(self, project_data: Dict) -> str:
-        """Create a professional electrical one-line diagram"""
-        fig, ax = plt.subplots(1, 1, figsize=(10, 8), facecolor='white')
-        
-        # Get project details
-        request_data = project_data.get('request_data', {})
-        square_footage = request_data.get('square_footage', 10000)
-        
-        # Calculate electrical loads
-        lighting_load = square_footage * 2.0  # 2W/sqft for lighting
-        receptacle_load = square_footage * 1.5  # 1.5W/sqft for receptacles
-        hvac_load = square_footage * 5.0  # 5W/sqft for HVAC
-        total_load = lighting_load + receptacle_load + hvac_load
-        
-        # Main service calculation
-        voltage = 480  # 480V 3-phase service
-        if total_load > 0:
-            main_amps = int(total_load / (voltage * 1.732 * 0.8) / 100) * 100 + 200  # Round up to nearest 100A
-        else:
-            main_amps = 400  # Default minimum service
-        
-        # Draw utility connection
-        ax.text(5, 9.5, 'UTILITY SERVICE', ha='center', fontsize=12, weight='bold')
-        ax.plot([5, 5], [9.3, 8.8], 'k-', linewidth=3)
-        
-        # Main disconnect
-        main_disc = FancyBboxPatch((4.3, 8.3), 1.4, 0.5,
-                                  boxstyle="round,pad=0.05",
-                                  facecolor='red', edgecolor='black', linewidth=2)
-        ax.add_patch(main_disc)
-        ax.text(5, 8.55, f'{main_amps}A', ha='center', va='center', fontsize=10, weight='bold', color='white')
-        ax.text(6, 8.55, 'MAIN\nDISC', ha='left', va='center', fontsize=8)
-        
-        # Connection to main panel
-        ax.plot([5, 5], [8.3, 7.5], 'k-', linewidth=3)
-        
-        # Main distribution panel
-        mdp = FancyBboxPatch((3.5, 6.5), 3, 1,
-                           boxstyle="round,pad=0.05",
-                           facecolor='yellow', edgecolor='black', linewidth=2)
-        ax.add_patch(mdp)
-        ax.text(5, 7, 'MAIN DISTRIBUTION PANEL', ha='center', va='center', fontsize=11, weight='bold')
-        ax.text(5, 6.7, f'480/277V, 3Ø, 4W, {main_amps}A', ha='center', va='center', fontsize=9)
-        
-        # Panel feeders
-        panels = [
-            {'name': 'LP-1', 'amps': 225, 'desc': 'Lighting Panel 1', 'x': 1.5},
-            {'name': 'LP-2', 'amps': 225, 'desc': 'Lighting Panel 2', 'x': 3},
-            {'name': 'PP-1', 'amps': 400, 'desc': 'Power Panel 1', 'x': 5},
-            {'name': 'PP-2', 'amps': 400, 'desc': 'Power Panel 2', 'x': 7},
-            {'name': 'HVAC', 'amps': 600, 'desc': 'HVAC Panel', 'x': 8.5}
-        ]
-        
-        y_pos = 5.5
-        for panel in panels:
-            # Feeder line
-            ax.plot([5, panel['x']], [6.5, y_pos + 0.5], 'k-', linewidth=2)
-            ax.plot([panel['x'], panel['x']], [y_pos + 0.5, y_pos], 'k-', linewidth=2)
-            
-            # Circuit breaker symbol
-            cb = Circle((panel['x'], y_pos + 0.25), 0.1, facecolor='white', edgecolor='black', linewidth=2)
-            ax.add_patch(cb)
-            ax.text(panel['x'] + 0.2, y_pos + 0.25, f"{panel['amps']}A", fontsize=8, va='center')
-            
-            # Panel box
-            panel_box = FancyBboxPatch((panel['x'] - 0.4, y_pos - 0.7), 0.8, 0.7,
-                                     boxstyle="round,pad=0.02",
-                                     facecolor='lightgoldenrodyellow', edgecolor='black', linewidth=1.5)
-            ax.add_patch(panel_box)
-            ax.text(panel['x'], y_pos - 0.35, panel['name'], ha='center', va='center', fontsize=9, weight='bold')
-            ax.text(panel['x'], y_pos - 0.9, panel['desc'], ha='center', va='top', fontsize=7)
-        
-        # Add transformer for step-down
-        y_trans = 4
-        # Transformer symbol
-        ax.plot([1.5, 1.5], [5, y_trans + 0.5], 'k-', linewidth=1.5)
-        trans = Circle((1.5, y_trans), 0.3, facecolor='none', edgecolor='black', linewidth=2)
-        ax.add_patch(trans)
-        ax.text(1.5, y_trans, 'T1', ha='center', va='center', fontsize=8, weight='bold')
-        ax.text(0.5, y_trans, '480V→120/208V\n75kVA', ha='right', va='center', fontsize=7)
-        
-        # Emergency panel
-        ax.plot([1.5, 1.5], [y_trans - 0.3, 3], 'r-', linewidth=2)
-        em_panel = FancyBboxPatch((1.1, 2.3), 0.8, 0.7,
-                                boxstyle="round,pad=0.02",
-                                facecolor='lightcoral', edgecolor='red', linewidth=2)
-        ax.add_patch(em_panel)
-        ax.text(1.5, 2.65, 'EM', ha='center', va='center', fontsize=9, weight='bold')
-        ax.text(1.5, 2.1, 'Emergency\nPanel', ha='center', va='top', fontsize=7)
-        
-        # Add ground symbol
-        ax.plot([5, 5], [6.5, 6.3], 'g-', linewidth=2)
-        ax.plot([4.7, 5.3], [6.3, 6.3], 'g-', linewidth=2)
-        ax.plot([4.8, 5.2], [6.2, 6.2], 'g-', linewidth=2)
-        ax.plot([4.9, 5.1], [6.1, 6.1], 'g-', linewidth=2)
-        
-        # Add title and notes
-        ax.text(5, 10.3, 'ELECTRICAL ONE-LINE DIAGRAM', ha='center', fontsize=14, weight='bold')
-        ax.text(5, 10, f'{project_data.get("project_name", "Project")}', ha='center', fontsize=10)
-        
-        # Add legend
-        legend_elements = [
-            Line2D([0], [0], color='black', linewidth=3, label='Power Distribution'),
-            Line2D([0], [0], color='red', linewidth=2, label='Emergency Power'),
-            Line2D([0], [0], color='green', linewidth=2, label='Ground'),
-            Rectangle((0, 0), 1, 1, facecolor='yellow', edgecolor='black', label='Distribution Panel'),
-            Rectangle((0, 0), 1, 1, facecolor='lightcoral', edgecolor='red', label='Emergency Panel'),
-            Circle((0, 0), 1, facecolor='white', edgecolor='black', label='Circuit Breaker')
-        ]
-        ax.legend(handles=legend_elements, loc='lower center', ncol=3, frameon=True, fontsize=8)
-        
-        # Set limits and remove axes
-        ax.set_xlim(0, 10)
-        ax.set_ylim(1.5, 10.5)
-        ax.axis('off')
-        
-        # Save to buffer
-        buffer = io.BytesIO()
-        plt.savefig(buffer, format='png', dpi=150, bbox_inches='tight', 
-                   facecolor='white', edgecolor='none')
-        plt.close()
-        
-        # Convert to base64
-        buffer.seek(0)
-        image_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
-        return f"data:image/png;base64,{image_base64}"
+        """Create the trade schematic as a cached SVG data URL"""
+        return trade_schematic_data_url(trade, request_data)
 
 
 # Create service instance
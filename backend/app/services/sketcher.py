@@ -1,24 +1,22 @@
-import os
-
-if os.getenv("DISABLE_FLOOR_PLAN_SKETCHER", "false").lower() == "true":
-    HAS_MATPLOTLIB = False
-    np = None
-else:
-    try:
-        import matplotlib.pyplot as plt
-        import matplotlib.patches as patches
-        from matplotlib.patches import Rectangle
-        import numpy as np
-        HAS_MATPLOTLIB = True
-    except ImportError:
-        HAS_MATPLOTLIB = False
-        np = None
-from typing import List, Tuple, Dict, Optional
+from typing import Iterator, List, Tuple, Dict, Optional
 import uuid
-import io
-import base64
 import math
 from app.models.floor_plan import FloorPlanRequest, FloorPlanResponse, Room, RoomType
+from app.services.floor_plan_layouts import floor_plan_layout_cache, svg_number, svg_text
+
+SVG_SCALE = 2  # pixels per foot
+
+ROOM_COLORS = {
+    RoomType.OFFICE: '#E3F2FD',
+    RoomType.CONFERENCE: '#F3E5F5',
+    RoomType.BATHROOM: '#E0F2F1',
+    RoomType.KITCHEN: '#FFF3E0',
+    RoomType.STORAGE: '#F5F5F5',
+    RoomType.LOBBY: '#E8F5E9',
+    RoomType.CORRIDOR: '#EEEEEE',
+    RoomType.MECHANICAL: '#FFEBEE',
+    RoomType.RESIDENTIAL: '#E1F5FE',
+}
 
 
 class FloorPlanGenerator:
@@ -37,21 +35,39 @@ class FloorPlanGenerator:
     def generate(self, request: FloorPlanRequest) -> FloorPlanResponse:
         floor_plan_id = str(uuid.uuid4())[:8]
         
-        building_dimensions = self._calculate_building_dimensions(
-            request.square_footage, request.shape
+        layout_key = (
+            "sketch",
+            getattr(request, 'project_type', 'commercial'),
+            request.shape,
+            request.square_footage,
+            request.num_rooms,
+            tuple(request.room_types) if request.room_types else None,
+        )
+        rooms, svg_data = floor_plan_layout_cache.get_or_build(
+            layout_key, lambda: self._build_layout(request)
         )
         
-        rooms = self._generate_rooms(request, building_dimensions)
-        
-        svg_data = self._generate_svg(rooms, building_dimensions)
-        
+        usable_area = sum(room.area for room in rooms)
         return FloorPlanResponse(
             id=floor_plan_id,
             total_area=request.square_footage,
-            rooms=rooms,
+            # Cached rooms are shared between requests; hand out copies.
+            rooms=[room.model_copy() for room in rooms],
+            efficiency_ratio=min(1.0, round(usable_area / request.square_footage, 2)),
             svg_data=svg_data
         )
     
+    def _build_layout(self, request: FloorPlanRequest) -> Tuple[Tuple[Room, ...], str]:
+        building_dimensions = self._calculate_building_dimensions(
+            request.square_footage, request.shape
+        )
+        
+        rooms = self._generate_rooms(request, building_dimensions)
+        
+        svg_data = "".join(self.iter_svg(rooms, building_dimensions))
+        
+        return tuple(rooms), svg_data
+    
     def _calculate_building_dimensions(
         self, 
         square_footage: float, 
@@ -219,103 +235,35 @@ class FloorPlanGenerator:
             location=(width / 2 - corridor_width / 2, height * 0.1)
         )
     
-    def _generate_svg(
-        self, 
-        rooms: List[Room], 
-        building_dimensions: Tuple[float, float]
-    ) -> str:
-        if not HAS_MATPLOTLIB:
-            # Return a simple SVG without matplotlib
-            return self._generate_simple_svg(rooms, building_dimensions)
-        
-        fig, ax = plt.subplots(1, 1, figsize=(12, 8))
-        
-        width, height = building_dimensions
-        building_rect = Rectangle((0, 0), width, height, 
-                                linewidth=2, edgecolor='black', 
-                                facecolor='white')
-        ax.add_patch(building_rect)
-        
-        colors = {
-            RoomType.OFFICE: '#E3F2FD',
-            RoomType.CONFERENCE: '#F3E5F5',
-            RoomType.BATHROOM: '#E0F2F1',
-            RoomType.KITCHEN: '#FFF3E0',
-            RoomType.STORAGE: '#F5F5F5',
-            RoomType.LOBBY: '#E8F5E9',
-            RoomType.CORRIDOR: '#EEEEEE',
-            RoomType.MECHANICAL: '#FFEBEE',
-            RoomType.RESIDENTIAL: '#E1F5FE',
-        }
-        
-        for room in rooms:
-            x, y = room.location
-            w, h = room.dimensions
-            color = colors.get(room.type, '#FFFFFF')
-            
-            room_rect = Rectangle((x, y), w, h,
-                                linewidth=1, edgecolor='gray',
-                                facecolor=color, alpha=0.7)
-            ax.add_patch(room_rect)
-            
-            ax.text(x + w/2, y + h/2, f"{room.name}\n{room.area:.0f} sqft",
-                   ha='center', va='center', fontsize=8, wrap=True)
-        
-        ax.set_xlim(0, width)
-        ax.set_ylim(0, height)
-        ax.set_aspect('equal')
-        ax.set_xlabel('Width (feet)')
-        ax.set_ylabel('Height (feet)')
-        ax.set_title(f'Floor Plan - Total Area: {sum(r.area for r in rooms):.0f} sqft')
-        
-        ax.grid(True, alpha=0.3)
-        
-        buffer = io.BytesIO()
-        plt.savefig(buffer, format='svg', bbox_inches='tight')
-        buffer.seek(0)
-        svg_data = buffer.getvalue().decode('utf-8')
-        
-        plt.close()
-        
-        return svg_data
-    
-    def _generate_simple_svg(
+    def iter_svg(
         self,
         rooms: List[Room],
         building_dimensions: Tuple[float, float]
-    ) -> str:
+    ) -> Iterator[str]:
+        """Stream the plan as SVG, one element per chunk"""
         width, height = building_dimensions
-        scale = 2  # pixels per foot
-        
-        svg = f'''<svg width="{width * scale}" height="{height * scale}" xmlns="http://www.w3.org/2000/svg">
-        <rect x="0" y="0" width="{width * scale}" height="{height * scale}" 
-              fill="white" stroke="black" stroke-width="2"/>'''
         
-        colors = {
-            RoomType.OFFICE: '#E3F2FD',
-            RoomType.CONFERENCE: '#F3E5F5',
-            RoomType.BATHROOM: '#E0F2F1',
-            RoomType.KITCHEN: '#FFF3E0',
-            RoomType.STORAGE: '#F5F5F5',
-            RoomType.LOBBY: '#E8F5E9',
-            RoomType.CORRIDOR: '#EEEEEE',
-            RoomType.MECHANICAL: '#FFEBEE',
-            RoomType.RESIDENTIAL: '#E1F5FE',
-        }
+        yield (
+            f'<svg width="{svg_number(width * SVG_SCALE)}" height="{svg_number(height * SVG_SCALE)}" '
+            f'xmlns="http://www.w3.org/2000/svg">'
+            f'<rect x="0" y="0" width="{svg_number(width * SVG_SCALE)}" height="{svg_number(height * SVG_SCALE)}" '
+            f'fill="white" stroke="black" stroke-width="2"/>'
+        )
         
         for room in rooms:
             x, y = room.location
             w, h = room.dimensions
-            color = colors.get(room.type, '#FFFFFF')
+            color = ROOM_COLORS.get(room.type, '#FFFFFF')
             
-            svg += f'''
-        <rect x="{x * scale}" y="{y * scale}" width="{w * scale}" height="{h * scale}"
-              fill="{color}" stroke="gray" stroke-width="1" opacity="0.7"/>
-        <text x="{(x + w/2) * scale}" y="{(y + h/2) * scale}" 
-              text-anchor="middle" font-size="12">{room.name}</text>'''
+            yield (
+                f'<rect x="{svg_number(x * SVG_SCALE)}" y="{svg_number(y * SVG_SCALE)}" '
+                f'width="{svg_number(w * SVG_SCALE)}" height="{svg_number(h * SVG_SCALE)}" '
+                f'fill="{color}" stroke="gray" stroke-width="1" opacity="0.7"/>'
+                f'<text x="{svg_number((x + w / 2) * SVG_SCALE)}" y="{svg_number((y + h / 2) * SVG_SCALE)}" '
+                f'text-anchor="middle" font-size="12">{svg_text(room.name)}</text>'
+            )
         
-        svg += '</svg>'
-        return svg
+        yield '</svg>'
 
 
 floor_plan_generator = FloorPlanGenerator()
@@ -11,13 +11,11 @@ from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph,
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_CENTER, TA_RIGHT
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
 from PIL import Image as PILImage
 from app.utils.building_type_display import get_display_building_type
-import numpy as np
 from app.services.detailed_trade_service import detailed_trade_service
 from app.services.professional_trade_package import professional_trade_package_service
+from app.services.trade_schematics import trade_schematic_data_url, trade_schematic_png
 from app.services.restaurant_finishes_items import get_restaurant_finishes_items, is_restaurant_project
 from app.services.restaurant_mechanical_items import get_restaurant_mechanical_items
 from app.services.restaurant_structural_items import get_restaurant_structural_items
@@ -307,137 +305,7 @@ class TradePackageService:
     
     def _generate_trade_schematic(self, floor_plan: Dict, trade: str, request_data: Dict) -> str:
         """Generate a trade-specific schematic showing relevant elements"""
-        
-        fig, ax = plt.subplots(1, 1, figsize=(10, 8))
-        
-        # Get building dimensions
-        square_footage = request_data.get('square_footage', 10000)
-        aspect_ratio = 1.5  # Default aspect ratio
-        
-        # Calculate dimensions
-        width = np.sqrt(square_footage * aspect_ratio)
-        height = square_footage / width
-        
-        # Draw building outline
-        building = patches.Rectangle((0, 0), width, height, 
-                                   linewidth=2, edgecolor='black', 
-                                   facecolor='white', alpha=0.8)
-        ax.add_patch(building)
-        
-        # Add trade-specific elements
-        if trade.lower() == 'electrical':
-            self._add_electrical_elements(ax, width, height)
-        elif trade.lower() == 'plumbing':
-            self._add_plumbing_elements(ax, width, height, request_data)
-        elif trade.lower() == 'hvac':
-            self._add_hvac_elements(ax, width, height)
-        elif trade.lower() == 'structural':
-            self._add_structural_elements(ax, width, height)
-        else:  # general
-            self._add_all_elements(ax, width, height, request_data)
-        
-        # Add title and labels
-        ax.set_xlim(-width*0.1, width*1.1)
-        ax.set_ylim(-height*0.1, height*1.1)
-        ax.set_aspect('equal')
-        ax.set_title(f'{trade.upper()} Layout - {request_data.get("project_name", "Project")}', 
-                    fontsize=16, fontweight='bold')
-        
-        # Add dimensions
-        ax.text(width/2, -height*0.05, f'{width:.0f} ft', 
-                ha='center', va='top', fontsize=10)
-        ax.text(-width*0.05, height/2, f'{height:.0f} ft', 
-                ha='right', va='center', fontsize=10, rotation=90)
-        
-        # Remove axes
-        ax.set_xticks([])
-        ax.set_yticks([])
-        
-        # Save to base64
-        buffer = io.BytesIO()
-        plt.savefig(buffer, format='png', bbox_inches='tight', dpi=150)
-        buffer.seek(0)
-        image_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
-        plt.close()
-        
-        return f"data:image/png;base64,{image_base64}"
-    
-    def _add_electrical_elements(self, ax, width, height):
-        """Add electrical elements to the schematic"""
-        # Main electrical panel
-        panel = patches.Rectangle((width*0.05, height*0.05), width*0.1, height*0.1,
-                                linewidth=2, edgecolor='gold', facecolor='yellow', alpha=0.7)
-        ax.add_patch(panel)
-        ax.text(width*0.1, height*0.1, 'Main\nPanel', ha='center', va='center', fontsize=8)
-        
-        # Distribution points
-        for i in range(3):
-            for j in range(3):
-                x = width * (0.2 + i * 0.3)
-                y = height * (0.2 + j * 0.3)
-                circle = patches.Circle((x, y), width*0.02, 
-                                      edgecolor='gold', facecolor='yellow', alpha=0.5)
-                ax.add_patch(circle)
-                ax.text(x, y, 'JB', ha='center', va='center', fontsize=6)
-    
-    def _add_plumbing_elements(self, ax, width, height, request_data):
-        """Add plumbing elements to the schematic"""
-        # Water main entry
-        main = patches.Rectangle((0, height*0.45), width*0.05, height*0.1,
-                               linewidth=2, edgecolor='blue', facecolor='lightblue', alpha=0.7)
-        ax.add_patch(main)
-        ax.text(width*0.025, height*0.5, 'Water\nMain', ha='center', va='center', fontsize=8)
-        
-        # Bathrooms (based on building type)
-        num_bathrooms = 2 if request_data.get('square_footage', 10000) < 20000 else 4
-        for i in range(num_bathrooms):
-            x = width * (0.2 + (i % 2) * 0.6)
-            y = height * (0.2 + (i // 2) * 0.6)
-            bathroom = patches.Rectangle((x, y), width*0.15, height*0.1,
-                                       linewidth=1, edgecolor='blue', facecolor='lightblue', alpha=0.5)
-            ax.add_patch(bathroom)
-            ax.text(x + width*0.075, y + height*0.05, f'Bath {i+1}', 
-                   ha='center', va='center', fontsize=8)
-    
-    def _add_hvac_elements(self, ax, width, height):
-        """Add HVAC elements to the schematic"""
-        # Rooftop units
-        for i in range(2):
-            x = width * (0.25 + i * 0.5)
-            y = height * 0.9
-            rtu = patches.Rectangle((x - width*0.1, y - height*0.05), width*0.2, height*0.1,
-                                  linewidth=2, edgecolor='red', facecolor='orange', alpha=0.7)
-            ax.add_patch(rtu)
-            ax.text(x, y, f'RTU-{i+1}', ha='center', va='center', fontsize=10, fontweight='bold')
-        
-        # Ductwork representation
-        for i in range(3):
-            y = height * (0.2 + i * 0.3)
-            line = plt.Line2D([width*0.1, width*0.9], [y, y], 
-                            linewidth=3, color='orange', alpha=0.5)
-            ax.add_line(line)
-    
-    def _add_structural_elements(self, ax, width, height):
-        """Add structural elements to the schematic"""
-        # Column grid
-        cols = 5
-        rows = 4
-        for i in range(cols):
-            for j in range(rows):
-                x = width * (0.1 + i * 0.8 / (cols - 1))
-                y = height * (0.1 + j * 0.8 / (rows - 1))
-                column = patches.Rectangle((x - width*0.02, y - height*0.02), 
-                                         width*0.04, height*0.04,
-                                         linewidth=1, edgecolor='gray', facecolor='darkgray')
-                ax.add_patch(column)
-                ax.text(x, y, f'{chr(65+i)}{j+1}', ha='center', va='center', fontsize=6)
-    
-    def _add_all_elements(self, ax, width, height, request_data):
-        """Add all trade elements for general contractor view"""
-        self._add_structural_elements(ax, width, height)
-        self._add_electrical_elements(ax, width, height)
-        self._add_plumbing_elements(ax, width, height, request_data)
-        self._add_hvac_elements(ax, width, height)
+        return trade_schematic_data_url(trade, request_data)
     
     def _generate_pdf_document(self, filtered_data: Dict, trade: str, 
                               project_data: Dict, schematic_image: str) -> io.BytesIO:
@@ -544,11 +412,14 @@ class TradePackageService:
         elements.append(Paragraph(f"{trade.upper()} LAYOUT SCHEMATIC", heading_style))
         elements.append(Spacer(1, 0.2*inch))
         
-        # Convert base64 image to PIL Image for inclusion in PDF
+        # ReportLab needs a raster image; SVG schematics are rasterized (and cached) only here
         if schematic_image.startswith('data:image/png;base64,'):
             image_data = base64.b64decode(schematic_image.split(',')[1])
             image_buffer = io.BytesIO(image_data)
             elements.append(Image(image_buffer, width=6*inch, height=4.5*inch))
+        elif schematic_image.startswith('data:image/svg+xml'):
+            image_data = trade_schematic_png(trade, project_data.get('request_data', {}))
+            elements.append(Image(io.BytesIO(image_data), width=6*inch, height=4.5*inch))
         
         # Build PDF
         doc.build(elements)
@@ -0,0 +1,497 @@
+"""Vector trade schematics for trade packages.
+
+A schematic is a short list of shape primitives (building outline plus the
+trade's panels, units, risers or column grid) laid out on an 11 x 8.5 in
+sheet in hundredths of an inch. The same primitives are written out as SVG
+for the API and rasterized with Pillow only when a PDF needs a PNG.
+
+The geometry depends only on the trade and the building size rounded to
+``SQUARE_FOOTAGE_BUCKET``, so it is built once per key. The title, subtitle
+and dimension labels are drawn over it from the project's own name and
+square footage, so they always read the real values.
+"""
+from __future__ import annotations
+
+import base64
+import io
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from PIL import Image as PILImage, ImageDraw, ImageFont
+
+from app.utils.building_type_display import get_display_building_type
+
+SHEET_WIDTH = 1100
+SHEET_HEIGHT = 850
+SQUARE_FOOTAGE_BUCKET = 500
+DEFAULT_SQUARE_FOOTAGE = 10000
+BUILDING_ASPECT_RATIO = 1.5
+PNG_DPI = 150
+SCHEMATIC_CACHE_SIZE = 256
+
+# Drawing area for the building outline, leaving room for the title and legend.
+_OUTLINE_BOX = (100, 140, 900, 560)
+
+TRADE_ALIASES = {'hvac': 'mechanical'}
+
+TRADE_DISPLAY_NAMES = {
+    'electrical': 'Electrical',
+    'plumbing': 'Plumbing',
+    'mechanical': 'Mechanical (HVAC)',
+    'structural': 'Structural',
+    'finishes': 'Finishes',
+    'general': 'General Contractor',
+}
+
+_LEGENDS = {
+    'electrical': [('rect', '#FFFF00', 'Electrical Panel'), ('line', '#000000', 'Power Distribution')],
+    'mechanical': [('rect', '#FFA500', 'HVAC Equipment'), ('line', '#0000FF', 'Ductwork')],
+    'plumbing': [('line', '#0000FF', 'Water Lines'), ('rect', '#ADD8E6', 'Equipment / Restrooms')],
+    'structural': [('rect', '#A9A9A9', 'Column')],
+}
+
+
+@dataclass(frozen=True)
+class SchematicKey:
+    trade: str
+    square_footage: int
+
+
+@dataclass(frozen=True)
+class SchematicLabels:
+    project_name: str
+    square_footage: float
+    building_label: str
+
+
+# Shapes are plain tuples so they hash cheaply and stay immutable in the cache:
+#   ('rect', x, y, w, h, fill, stroke, stroke_width, corner_radius)
+#   ('circle', cx, cy, r, fill, stroke, stroke_width)
+#   ('line', x1, y1, x2, y2, stroke, stroke_width)
+#   ('text', x, y, text, size, anchor, bold, color)
+Shape = Tuple[Any, ...]
+
+
+def _square_footage(request_data: Dict[str, Any]) -> float:
+    square_footage = request_data.get('square_footage')
+    if isinstance(square_footage, bool) or not isinstance(square_footage, (int, float)) or square_footage <= 0:
+        return DEFAULT_SQUARE_FOOTAGE
+    return square_footage
+
+
+def schematic_key(trade: str, request_data: Optional[Dict[str, Any]]) -> SchematicKey:
+    if trade is None:
+        raise ValueError("Trade parameter cannot be None")
+    request_data = request_data or {}
+    trade_key = trade.strip().lower().replace('-', '_')
+    trade_key = TRADE_ALIASES.get(trade_key, trade_key)
+
+    square_footage = _square_footage(request_data)
+    bucketed = max(SQUARE_FOOTAGE_BUCKET, int(round(square_footage / SQUARE_FOOTAGE_BUCKET)) * SQUARE_FOOTAGE_BUCKET)
+    return SchematicKey(trade=trade_key, square_footage=bucketed)
+
+
+def schematic_labels(request_data: Optional[Dict[str, Any]]) -> SchematicLabels:
+    request_data = request_data or {}
+    return SchematicLabels(
+        project_name=str(request_data.get('project_name') or ''),
+        square_footage=_square_footage(request_data),
+        building_label=get_display_building_type(request_data) if request_data else '',
+    )
+
+
+def trade_schematic_svg(trade: str, request_data: Optional[Dict[str, Any]]) -> str:
+    return _render_svg(schematic_key(trade, request_data), schematic_labels(request_data))
+
+
+def trade_schematic_data_url(trade: str, request_data: Optional[Dict[str, Any]]) -> str:
+    """Base64 ``data:`` URL of the SVG, the shape trade package responses already use."""
+    return _render_data_url(schematic_key(trade, request_data), schematic_labels(request_data))
+
+
+def trade_schematic_png(trade: str, request_data: Optional[Dict[str, Any]], dpi: int = PNG_DPI) -> bytes:
+    return _render_png(schematic_key(trade, request_data), schematic_labels(request_data), dpi)
+
+
+def _building_dimensions(square_footage: float) -> Tuple[float, float]:
+    width_ft = math.sqrt(square_footage * BUILDING_ASPECT_RATIO)
+    return width_ft, square_footage / width_ft
+
+
+def _outline(key: SchematicKey) -> Tuple[float, float, float, float]:
+    width_ft, depth_ft = _building_dimensions(key.square_footage)
+    box_x, box_y, box_w, box_h = _OUTLINE_BOX
+    scale = min(box_w / width_ft, box_h / depth_ft)
+    w = width_ft * scale
+    h = depth_ft * scale
+    return box_x + (box_w - w) / 2, box_y + (box_h - h) / 2, w, h
+
+
+@lru_cache(maxsize=SCHEMATIC_CACHE_SIZE)
+def _shapes(key: SchematicKey) -> Tuple[Shape, ...]:
+    x, y, w, h = _outline(key)
+    shapes: List[Shape] = [
+        ('rect', 0, 0, SHEET_WIDTH, SHEET_HEIGHT, '#FFFFFF', None, 0, 0),
+        ('rect', x, y, w, h, '#FFFFFF', '#000000', 3, 10),
+    ]
+
+    trades = ('structural', 'electrical', 'plumbing', 'mechanical') if key.trade == 'general' else (key.trade,)
+    for trade in trades:
+        builder = _TRADE_ELEMENTS.get(trade)
+        if builder is not None:
+            shapes.extend(builder(x, y, w, h, key))
+
+    shapes.extend(_legend(trades))
+    shapes.append(('text', x, y + h + 60, "Schematic only - not to scale", 12, 'start', False, '#000000'))
+    return tuple(shapes)
+
+
+def _label_shapes(key: SchematicKey, labels: SchematicLabels) -> Tuple[Shape, ...]:
+    """Title, subtitle and dimensions, drawn from the real project values rather than the cache key."""
+    x, y, w, h = _outline(key)
+    width_ft, depth_ft = _building_dimensions(labels.square_footage)
+
+    title = f"{TRADE_DISPLAY_NAMES.get(key.trade, key.trade.replace('_', ' ').title())} Schematic"
+    if labels.project_name:
+        title = f"{title} - {labels.project_name}"
+    subtitle = f"{labels.square_footage:,.0f} SF"
+    if labels.building_label:
+        subtitle = f"{labels.building_label} - {subtitle}"
+
+    return (
+        ('text', SHEET_WIDTH / 2, 70, title, 28, 'middle', True, '#000000'),
+        ('text', SHEET_WIDTH / 2, 105, subtitle, 16, 'middle', False, '#000000'),
+        ('text', x + w / 2, y + h + 28, f"{width_ft:.0f} ft", 14, 'middle', False, '#000000'),
+        ('text', x - 12, y + h / 2, f"{depth_ft:.0f} ft", 14, 'end', False, '#000000'),
+    )
+
+
+def _electrical(x: float, y: float, w: float, h: float, key: SchematicKey) -> List[Shape]:
+    shapes: List[Shape] = [
+        ('rect', x + 20, y + 15, 40, 60, '#FFFF00', '#000000', 2, 0),
+        ('text', x + 40, y + 50, 'MDP', 11, 'middle', True, '#000000'),
+    ]
+    for index in range(3):
+        line_y = y + h * (0.3 + index * 0.25)
+        shapes.append(('line', x + 60, line_y, x + w - 40, line_y, '#000000', 2))
+        for fraction in (0.2, 0.6):
+            drop_x = x + w * fraction
+            shapes.append(('line', drop_x, line_y, drop_x, line_y + 20, '#000000', 1))
+        panel_x = x + w * 0.2
+        shapes.append(('rect', panel_x - 12, line_y + 20, 24, 24, '#FFFF00', '#000000', 1, 0))
+        shapes.append(('text', panel_x, line_y + 36, f'P{index + 1}', 9, 'middle', False, '#000000'))
+    return shapes
+
+
+def _mechanical(x: float, y: float, w: float, h: float, key: SchematicKey) -> List[Shape]:
+    shapes: List[Shape] = []
+    duct_y = y + h * 0.3
+    shapes.append(('line', x + w * 0.15, duct_y, x + w * 0.85, duct_y, '#0000FF', 4))
+    for index in range(2):
+        unit_x = x + w * (0.3 + index * 0.4)
+        shapes.append(('line', unit_x, y + 40, unit_x, duct_y, '#0000FF', 4))
+        shapes.append(('rect', unit_x - 30, y + 10, 60, 30, '#FFA500', '#000000', 2, 0))
+        shapes.append(('text', unit_x, y + 30, f'RTU-{index + 1}', 10, 'middle', True, '#000000'))
+        for branch in range(2):
+            branch_y = y + h * (0.5 + branch * 0.25)
+            shapes.append(('line', unit_x, duct_y, unit_x, branch_y, '#0000FF', 2))
+            shapes.append(('line', unit_x - w * 0.12, branch_y, unit_x + w * 0.12, branch_y, '#0000FF', 2))
+    return shapes
+
+
+def _plumbing(x: float, y: float, w: float, h: float, key: SchematicKey) -> List[Shape]:
+    main_y = y + h - 30
+    shapes: List[Shape] = [
+        ('line', x + 45, main_y, x + w - 20, main_y, '#0000FF', 3),
+        ('circle', x + 30, main_y, 15, '#ADD8E6', '#000000', 2),
+        ('text', x + 30, main_y + 4, 'WH', 9, 'middle', True, '#000000'),
+    ]
+    restroom_count = 2 if key.square_footage < 20000 else 4
+    for index in range(restroom_count):
+        column = index % 2
+        row = index // 2
+        riser_x = x + w * (0.4 + column * 0.4)
+        room_y = y + h * (0.15 + row * 0.35)
+        if row == 0:
+            shapes.append(('line', riser_x, main_y, riser_x, y + 30, '#0000FF', 2))
+        shapes.append(('rect', riser_x + 8, room_y, w * 0.14, h * 0.12, '#ADD8E6', '#0000FF', 1, 0))
+        shapes.append(('text', riser_x + 8 + w * 0.07, room_y + h * 0.06 + 4, f'Restroom {index + 1}', 9, 'middle', False, '#000000'))
+    return shapes
+
+
+def _structural(x: float, y: float, w: float, h: float, key: SchematicKey) -> List[Shape]:
+    shapes: List[Shape] = []
+    columns, rows = 5, 4
+    for column in range(columns):
+        for row in range(rows):
+            column_x = x + w * (0.1 + column * 0.8 / (columns - 1))
+            column_y = y + h * (0.1 + row * 0.8 / (rows - 1))
+            shapes.append(('rect', column_x - 9, column_y - 9, 18, 18, '#A9A9A9', '#808080', 1, 0))
+            shapes.append(('text', column_x, column_y + 22, f'{chr(65 + column)}{row + 1}', 8, 'middle', False, '#000000'))
+    return shapes
+
+
+_TRADE_ELEMENTS = {
+    'electrical': _electrical,
+    'mechanical': _mechanical,
+    'plumbing': _plumbing,
+    'structural': _structural,
+}
+
+
+def _legend(trades: Tuple[str, ...]) -> List[Shape]:
+    entries = [entry for trade in trades for entry in _LEGENDS.get(trade, [])]
+    shapes: List[Shape] = []
+    x = SHEET_WIDTH - 40 - 190 * min(len(entries), 4)
+    for index, (kind, color, label) in enumerate(entries):
+        entry_x = x + 190 * (index % 4)
+        entry_y = 770 + 26 * (index // 4)
+        if kind == 'line':
+            shapes.append(('line', entry_x, entry_y, entry_x + 24, entry_y, color, 3))
+        else:
+            shapes.append(('rect', entry_x, entry_y - 8, 24, 16, color, '#000000', 1, 0))
+        shapes.append(('text', entry_x + 32, entry_y + 5, label, 12, 'start', False, '#000000'))
+    return shapes
+
+
+def _number(value: float) -> str:
+    return f"{value:.1f}".rstrip('0').rstrip('.')
+
+
+def _svg_open(width: int, height: int) -> str:
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
+        f'width="{width}" height="{height}" font-family="Helvetica, Arial, sans-serif">'
+    )
+
+
+def _svg_elements(shapes: Tuple[Shape, ...]) -> str:
+    parts: List[str] = []
+    for shape in shapes:
+        kind = shape[0]
+        if kind == 'rect':
+            _, x, y, w, h, fill, stroke, stroke_width, radius = shape
+            stroke_attr = f' stroke="{stroke}" stroke-width="{stroke_width}"' if stroke else ''
+            radius_attr = f' rx="{radius}"' if radius else ''
+            parts.append(
+                f'<rect x="{_number(x)}" y="{_number(y)}" width="{_number(w)}" height="{_number(h)}" '
+                f'fill="{fill}"{stroke_attr}{radius_attr}/>'
+            )
+        elif kind == 'circle':
+            _, cx, cy, r, fill, stroke, stroke_width = shape
+            parts.append(
+                f'<circle cx="{_number(cx)}" cy="{_number(cy)}" r="{_number(r)}" fill="{fill}" '
+                f'stroke="{stroke}" stroke-width="{stroke_width}"/>'
+            )
+        elif kind == 'line':
+            _, x1, y1, x2, y2, stroke, stroke_width = shape
+            parts.append(
+                f'<line x1="{_number(x1)}" y1="{_number(y1)}" x2="{_number(x2)}" y2="{_number(y2)}" '
+                f'stroke="{stroke}" stroke-width="{stroke_width}"/>'
+            )
+        else:
+            _, x, y, text, size, anchor, bold, color = shape
+            weight_attr = ' font-weight="bold"' if bold else ''
+            parts.append(
+                f'<text x="{_number(x)}" y="{_number(y)}" font-size="{size}" text-anchor="{anchor}" '
+                f'fill="{color}"{weight_attr}>{escape(text)}</text>'
+            )
+    return ''.join(parts)
+
+
+@lru_cache(maxsize=64)
+def _font(size: int) -> ImageFont.ImageFont:
+    return ImageFont.load_default(size=size)
+
+
+_PIL_ANCHORS = {'start': 'ls', 'middle': 'ms', 'end': 'rs'}
+
+
+def _draw(image: PILImage.Image, shapes: Tuple[Shape, ...], dpi: int) -> None:
+    scale = dpi / 100.0
+    draw = ImageDraw.Draw(image)
+    for shape in shapes:
+        kind = shape[0]
+        if kind == 'rect':
+            _, x, y, w, h, fill, stroke, stroke_width, radius = shape
+            box = [x * scale, y * scale, (x + w) * scale, (y + h) * scale]
+            outline_width = max(1, round(stroke_width * scale)) if stroke else 0
+            draw.rounded_rectangle(box, radius=radius * scale, fill=fill, outline=stroke, width=outline_width)
+        elif kind == 'circle':
+            _, cx, cy, r, fill, stroke, stroke_width = shape
+            box = [(cx - r) * scale, (cy - r) * scale, (cx + r) * scale, (cy + r) * scale]
+            draw.ellipse(box, fill=fill, outline=stroke, width=max(1, round(stroke_width * scale)))
+        elif kind == 'line':
+            _, x1, y1, x2, y2, stroke, stroke_width = shape
+            draw.line([x1 * scale, y1 * scale, x2 * scale, y2 * scale], fill=stroke, width=max(1, round(stroke_width * scale)))
+        else:
+            _, x, y, text, size, anchor, bold, color = shape
+            # The default font has no bold face; a 1px stroke stands in for it.
+            draw.text((x * scale, y * scale), text, fill=color, font=_font(round(size * scale)),
+                      anchor=_PIL_ANCHORS[anchor], stroke_width=1 if bold else 0, stroke_fill=color)
+
+
+def _blank(width: int, height: int, dpi: int) -> PILImage.Image:
+    scale = dpi / 100.0
+    return PILImage.new('RGB', (round(width * scale), round(height * scale)), '#FFFFFF')
+
+
+def _png_bytes(image: PILImage.Image) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG', compress_level=1)
+    return buffer.getvalue()
+
+
+def _png(shapes: Tuple[Shape, ...], width: int, height: int, dpi: int) -> bytes:
+    image = _blank(width, height, dpi)
+    _draw(image, shapes, dpi)
+    return _png_bytes(image)
+
+
+# Geometry is cached per key; the labels are layered on top per project.
+@lru_cache(maxsize=SCHEMATIC_CACHE_SIZE)
+def _geometry_svg(key: SchematicKey) -> str:
+    return _svg_elements(_shapes(key))
+
+
+@lru_cache(maxsize=SCHEMATIC_CACHE_SIZE)
+def _geometry_image(key: SchematicKey, dpi: int) -> PILImage.Image:
+    image = _blank(SHEET_WIDTH, SHEET_HEIGHT, dpi)
+    _draw(image, _shapes(key), dpi)
+    return image
+
+
+@lru_cache(maxsize=SCHEMATIC_CACHE_SIZE)
+def _render_svg(key: SchematicKey, labels: SchematicLabels) -> str:
+    return (
+        _svg_open(SHEET_WIDTH, SHEET_HEIGHT)
+        + _geometry_svg(key)
+        + _svg_elements(_label_shapes(key, labels))
+        + '</svg>'
+    )
+
+
+@lru_cache(maxsize=SCHEMATIC_CACHE_SIZE)
+def _render_data_url(key: SchematicKey, labels: SchematicLabels) -> str:
+    encoded = base64.b64encode(_render_svg(key, labels).encode('utf-8')).decode('ascii')
+    return f"data:image/svg+xml;base64,{encoded}"
+
+
+@lru_cache(maxsize=SCHEMATIC_CACHE_SIZE)
+def _render_png(key: SchematicKey, labels: SchematicLabels, dpi: int) -> bytes:
+    image = _geometry_image(key, dpi).copy()
+    _draw(image, _label_shapes(key, labels), dpi)
+    return _png_bytes(image)
+
+
+# Electrical one-line diagram for the electrical package PDF. Sheet units are
+# the same hundredths of an inch; the layout follows the old matplotlib figure.
+ONE_LINE_WIDTH = 1000
+ONE_LINE_HEIGHT = 950
+ONE_LINE_SERVICE_VOLTAGE = 480
+ONE_LINE_WATTS_PER_SF = 2.0 + 1.5 + 5.0  # lighting + receptacles + HVAC
+
+_ONE_LINE_PANELS = (
+    ('LP-1', 225, 'Lighting Panel 1', 150),
+    ('LP-2', 225, 'Lighting Panel 2', 300),
+    ('PP-1', 400, 'Power Panel 1', 500),
+    ('PP-2', 400, 'Power Panel 2', 700),
+    ('HVAC', 600, 'HVAC Panel', 850),
+)
+
+
+def main_service_amps(square_footage: float) -> int:
+    total_load = square_footage * ONE_LINE_WATTS_PER_SF
+    if total_load <= 0:
+        return 400
+    # Rounded down to 100A, plus 200A of headroom.
+    return int(total_load / (ONE_LINE_SERVICE_VOLTAGE * 1.732 * 0.8) / 100) * 100 + 200
+
+
+def electrical_one_line_png(project_name: Optional[str], square_footage: Any, dpi: int = PNG_DPI) -> bytes:
+    if isinstance(square_footage, bool) or not isinstance(square_footage, (int, float)):
+        square_footage = DEFAULT_SQUARE_FOOTAGE
+    return _render_one_line_png(project_name or 'Project', main_service_amps(square_footage), dpi)
+
+
+@lru_cache(maxsize=SCHEMATIC_CACHE_SIZE)
+def _one_line_shapes(project_name: str, main_amps: int) -> Tuple[Shape, ...]:
+    black, red, green = '#000000', '#FF0000', '#008000'
+    shapes: List[Shape] = [
+        ('text', 500, 40, 'ELECTRICAL ONE-LINE DIAGRAM', 22, 'middle', True, black),
+        ('text', 500, 70, project_name, 15, 'middle', False, black),
+        ('text', 500, 110, 'UTILITY SERVICE', 18, 'middle', True, black),
+        ('line', 500, 120, 500, 170, black, 4),
+        ('rect', 430, 170, 140, 50, '#FF0000', black, 2, 6),
+        ('text', 500, 201, f'{main_amps}A', 15, 'middle', True, '#FFFFFF'),
+        ('text', 600, 192, 'MAIN', 12, 'start', False, black),
+        ('text', 600, 208, 'DISC', 12, 'start', False, black),
+        ('line', 500, 220, 500, 300, black, 4),
+        ('rect', 350, 300, 300, 100, '#FFFF00', black, 2, 6),
+        ('text', 500, 345, 'MAIN DISTRIBUTION PANEL', 16, 'middle', True, black),
+        ('text', 500, 375, f'480/277V, 3PH, 4W, {main_amps}A', 13, 'middle', False, black),
+        # Ground symbol off the side of the MDP.
+        ('line', 650, 350, 720, 350, green, 3),
+        ('line', 720, 350, 720, 375, green, 3),
+        ('line', 690, 375, 750, 375, green, 3),
+        ('line', 700, 385, 740, 385, green, 3),
+        ('line', 710, 395, 730, 395, green, 3),
+    ]
+    panel_top = 500
+    for name, amps, description, panel_x in _ONE_LINE_PANELS:
+        shapes.extend([
+            ('line', 500, 400, panel_x, panel_top - 50, black, 3),
+            ('line', panel_x, panel_top - 50, panel_x, panel_top, black, 3),
+            ('circle', panel_x, panel_top - 25, 10, '#FFFFFF', black, 2),
+            ('text', panel_x + 20, panel_top - 20, f'{amps}A', 12, 'start', False, black),
+            ('rect', panel_x - 40, panel_top, 80, 70, '#FAFAD2', black, 2, 4),
+            ('text', panel_x, panel_top + 40, name, 13, 'middle', True, black),
+            ('text', panel_x, panel_top + 92, description, 11, 'middle', False, black),
+        ])
+    shapes.extend([
+        # Step-down transformer feeding the emergency panel.
+        ('line', 150, panel_top + 100, 150, 620, black, 2),
+        ('circle', 150, 650, 30, '#FFFFFF', black, 2),
+        ('text', 150, 655, 'T1', 12, 'middle', True, black),
+        ('text', 105, 645, '480V-120/208V', 11, 'end', False, black),
+        ('text', 105, 662, '75kVA', 11, 'end', False, black),
+        ('line', 150, 680, 150, 750, red, 3),
+        ('rect', 110, 750, 80, 70, '#F08080', red, 2, 4),
+        ('text', 150, 790, 'EM', 13, 'middle', True, black),
+        ('text', 150, 842, 'Emergency Panel', 11, 'middle', False, black),
+    ])
+    legend = (
+        ('line', black, 'Power Distribution'),
+        ('line', red, 'Emergency Power'),
+        ('line', green, 'Ground'),
+        ('rect', '#FFFF00', 'Distribution Panel'),
+        ('rect', '#F08080', 'Emergency Panel'),
+        ('circle', '#FFFFFF', 'Circuit Breaker'),
+    )
+    for index, (kind, color, label) in enumerate(legend):
+        entry_x = 230 + 230 * (index % 3)
+        entry_y = 880 + 30 * (index // 3)
+        if kind == 'line':
+            shapes.append(('line', entry_x, entry_y, entry_x + 24, entry_y, color, 3))
+        elif kind == 'rect':
+            shapes.append(('rect', entry_x, entry_y - 8, 24, 16, color, black, 1, 0))
+        else:
+            shapes.append(('circle', entry_x + 12, entry_y, 8, color, black, 2))
+        shapes.append(('text', entry_x + 32, entry_y + 5, label, 12, 'start', False, black))
+    return tuple(shapes)
+
+
+@lru_cache(maxsize=SCHEMATIC_CACHE_SIZE)
+def _render_one_line_png(project_name: str, main_amps: int, dpi: int) -> bytes:
+    return _png(_one_line_shapes(project_name, main_amps), ONE_LINE_WIDTH, ONE_LINE_HEIGHT, dpi)
+
+
+def clear_schematic_caches() -> None:
+    for cached in (
+        _shapes, _geometry_svg, _geometry_image, _render_svg, _render_data_url, _render_png,
+        _one_line_shapes, _render_one_line_png,
+    ):
+        cached.cache_clear()
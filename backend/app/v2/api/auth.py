@@ -1,7 +1,7 @@
 from datetime import datetime, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.auth import (
     AuthContext,
@@ -11,7 +11,7 @@ from app.core.auth import (
 )
 from app.core.rate_limiter import limiter
 from app.core.run_limits import get_effective_run_limit_snapshot
-from app.db.database import get_db
+from app.db.database import get_async_db
 
 
 router = APIRouter(prefix="/auth", tags=["v2-auth"])
@@ -47,9 +47,13 @@ async def create_testing_session(request: Request):
 async def get_auth_me(
     request: Request,
     auth: AuthContext = Depends(get_auth_context),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    run_limits = get_effective_run_limit_snapshot(db, org_id=auth.org_id, email=auth.email)
+    run_limits = await db.run_sync(
+        get_effective_run_limit_snapshot,
+        org_id=auth.org_id,
+        email=auth.email,
+    )
     return {
         "success": True,
         "data": {
@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.auth import AuthContext, get_auth_context
+from app.core.rate_limiter import limiter
+from app.db.database import get_async_db
+from app.v2.services.portfolio_summary import portfolio_summary
+
+
+router = APIRouter(prefix="/portfolio", tags=["v2-portfolio"])
+
+
+@router.get("/summary")
+@limiter.limit("60/minute")
+async def get_portfolio_summary(
+    request: Request,
+    auth: AuthContext = Depends(get_auth_context),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Org pipeline roll-ups answered by SQL aggregates over project summary rows."""
+    summary = await db.run_sync(portfolio_summary, auth.org_id)
+    return {
+        "success": True,
+        "data": summary,
+    }
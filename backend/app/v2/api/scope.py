@@ -4,12 +4,15 @@ Clean API endpoint that uses the new system
 
 import os
 import json
+import asyncio
 from fastapi import APIRouter, HTTPException, Query, Depends, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, ConfigDict, AliasChoices
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 import uuid
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.v2.engines.unified_engine import (
     unified_engine,
@@ -33,10 +36,19 @@ from app.core.building_taxonomy import normalize_building_type, validate_buildin
 from app.core.auth import AuthContext, get_auth_context
 from app.core.config import settings
 from app.core.rate_limiter import limiter
-from app.core.run_limits import assert_run_available, consume_run
-from app.db.models import Project, ProjectAccess
-from app.db.database import get_db
+from app.core.run_limits import assert_run_available, consume_run, release_run
+from app.db.models import Project, ProjectAccess, ProjectSearchDocument, ProjectSummary
+from app.db.database import get_async_db, get_db
 from app.services.pdf_export_service import pdf_export_service
+from app.services.excel_export_service_v2 import XLSX_MEDIA_TYPE, excel_export_service_v2
+from app.services.export_jobs import (
+    EXPORT_KIND_DEALSHIELD,
+    EXPORT_KIND_DECISION_PACKET,
+    JOB_STATUS_COMPLETED,
+    JOB_STATUS_FAILED,
+    ExportJobError,
+    export_job_manager,
+)
 from app.services.decision_packet_export import (
     compose_decision_packet_input,
     hydrate_project_payload_for_packet,
@@ -46,6 +58,21 @@ from app.v2.services.dealshield_scenarios import (
     DealShieldScenarioError,
     refresh_dealshield_scenarios_payload,
 )
+from app.v2.services.project_repricing import engine_kwargs_from_parsed_input, stamp_pricing_fingerprint
+from app.v2.services.portfolio_summary import project_summary_values, upsert_project_summary
+from app.v2.services.comparables import comparables_registry
+from app.v2.services.monthly_pro_forma import build_dealshield_pro_forma
+from app.v2.services.project_search import (
+    DEFAULT_SEARCH_LIMIT,
+    project_search_values,
+    search_projects,
+    upsert_project_search_document,
+)
+from app.v2.services.dealshield_preview import (
+    build_preview_base,
+    dealshield_preview_cache,
+    preview_dealshield_controls,
+)
 from app.config.regional_multipliers import _location_has_explicit_state
 import logging
 
@@ -67,6 +94,8 @@ GENERATE_ERROR_MESSAGE = "We couldn't generate this decision packet. Please try
 PROJECT_EXPORT_PREP_ERROR_MESSAGE = "We couldn't prepare this project for export. Please try again."
 DEALSHIELD_EXPORT_PREP_ERROR_MESSAGE = "We couldn't prepare DealShield for export. Please try again."
 OWNER_VIEW_ERROR_MESSAGE = "We couldn't load the owner view for this project right now."
+EXPORT_JOB_ERROR_MESSAGE = "We couldn't export this project right now. Please try again."
+EXPORT_JOB_MAX_WAIT_SECONDS = 30
 
 
 def _get_request_id(request: Optional[Request]) -> str:
@@ -429,6 +458,11 @@ class DealShieldControlsUpdateRequest(BaseModel):
     anchor_annual_revenue: Optional[float] = Field(None, description="Optional revenue anchor value")
     use_revenue_anchor: bool = Field(False, description="Whether to apply revenue anchor")
 
+class ExportJobRequest(BaseModel):
+    """Request for a background PDF export."""
+    kind: str = Field(EXPORT_KIND_DECISION_PACKET, description="Export kind (decision_packet, dealshield)")
+    client_name: Optional[str] = Field(None, description="Client name shown on the decision packet cover")
+
 class ProjectResponse(BaseModel):
     """Standard project response"""
     success: bool
@@ -882,26 +916,41 @@ def _get_scoped_project(db: Session, project_id: str, auth: AuthContext) -> Opti
     return project
 
 
+def _scoped_projects_statement(auth: AuthContext):
+    return (
+        select(Project)
+        .join(ProjectAccess, ProjectAccess.project_id == Project.project_id)
+        .where(ProjectAccess.org_id == auth.org_id)
+    )
+
+
+async def _get_scoped_project_async(db: AsyncSession, project_id: str, auth: AuthContext) -> Optional[Project]:
+    """Async twin of ``_get_scoped_project`` for handlers on the async session."""
+    statement = _scoped_projects_statement(auth)
+    project = (await db.scalars(statement.where(Project.project_id == project_id).limit(1))).first()
+    if not project and project_id.isdigit():
+        project = (await db.scalars(statement.where(Project.id == int(project_id)).limit(1))).first()
+    return project
+
+
 @router.get("/scope/projects")
 async def get_all_projects(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     auth: AuthContext = Depends(get_auth_context),
 ):
     try:
-        _assign_unscoped_projects_for_dev(db, auth)
+        await db.run_sync(_assign_unscoped_projects_for_dev, auth)
         projects = (
-            db.query(Project)
-            .join(ProjectAccess, ProjectAccess.project_id == Project.project_id)
-            .filter(ProjectAccess.org_id == auth.org_id)
-            .order_by(Project.created_at.desc())
-            .all()
-        )
+            await db.scalars(
+                _scoped_projects_statement(auth).order_by(Project.created_at.desc())
+            )
+        ).all()
         
         # Format each project using the improved format_project_response
         formatted_projects = []
         for p in projects:
             try:
-                formatted_projects.append(format_project_response(p))
+                formatted_projects.append(ProjectRequestContext(p).project_response())
             except Exception as format_error:
                 _log_route_exception(
                     "scope.projects.format_project",
@@ -918,14 +967,50 @@ async def get_all_projects(
         # Return empty array instead of raising error
         return []
 
+@router.get("/scope/projects/search", response_model=ProjectResponse)
+@limiter.limit("120/minute")
+async def search_org_projects(
+    request: Request,
+    q: Optional[str] = Query(None, max_length=200),
+    building_type: Optional[List[str]] = Query(None),
+    project_class: Optional[List[str]] = Query(None),
+    cost_band: Optional[List[str]] = Query(None),
+    created_from: Optional[datetime] = Query(None),
+    created_to: Optional[datetime] = Query(None),
+    limit: int = Query(DEFAULT_SEARCH_LIMIT, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    db: AsyncSession = Depends(get_async_db),
+    auth: AuthContext = Depends(get_auth_context),
+):
+    """Full-text search over the org's projects with type, class, date and cost band facets."""
+    try:
+        results = await db.run_sync(
+            lambda sync_db: search_projects(
+                sync_db,
+                auth.org_id,
+                q,
+                building_types=building_type or (),
+                project_classes=project_class or (),
+                cost_bands=cost_band or (),
+                created_from=created_from,
+                created_to=created_to,
+                limit=limit,
+                offset=offset,
+            )
+        )
+    except ValueError as exc:
+        return ProjectResponse(success=False, data={}, errors=[str(exc)])
+    return ProjectResponse(success=True, data=results)
+
+
 @router.get("/scope/projects/{project_id}")
 async def get_single_project(
     project_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     auth: AuthContext = Depends(get_auth_context),
 ):
     """Get a single project by ID scoped to current org."""
-    project = _get_scoped_project(db, project_id, auth)
+    project = await _get_scoped_project_async(db, project_id, auth)
     
     if not project:
         return ProjectResponse(
@@ -934,7 +1019,10 @@ async def get_single_project(
             errors=["Project not found"]
         )
     
-    formatted = format_project_response(project)
+    context = ProjectRequestContext(project, project_id)
+    formatted = context.project_response()
+    if isinstance(formatted, dict):
+        formatted["comparables"] = await db.run_sync(_project_comparables, auth, project, context.payload())
     return ProjectResponse(
         success=True,
         data=formatted,
@@ -942,6 +1030,21 @@ async def get_single_project(
     )
 
 
+def _project_comparables(db: Session, auth: Any, project: Project, payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Comparable projects for the project views; an index failure never fails the view."""
+    try:
+        return comparables_registry.similar_projects(
+            db,
+            getattr(auth, "org_id", None),
+            project.project_id,
+            project.name,
+            payload,
+        )
+    except Exception as exc:
+        _log_route_exception("scope.comparables", exc, None, project_id=getattr(project, "project_id", None))
+        return []
+
+
 def _normalize_dealshield_controls_payload(raw_controls: Dict[str, Any]) -> Dict[str, Any]:
     allowed_stress_bands = {10, 7, 5, 3}
     raw_band = raw_controls.get("stress_band_pct")
@@ -998,6 +1101,22 @@ def _resolve_dealshield_building_context(
     return building_type, subtype
 
 
+def _resolve_dealshield_building_config(project: Project, payload: Dict[str, Any]) -> Any:
+    building_type, subtype = _resolve_dealshield_building_context(project, payload)
+    if not building_type or not subtype:
+        raise ValueError("Unable to resolve building type/subtype for DealShield scenario rebuild")
+
+    canonical_type, canonical_subtype = validate_building_type(building_type, subtype)
+    subtype_key = canonical_subtype or subtype
+    building_type_enum = BuildingType(canonical_type)
+    building_config = MASTER_CONFIG.get(building_type_enum, {}).get(subtype_key)
+    if building_config is None:
+        raise ValueError(
+            f"Unable to resolve building config for DealShield scenario rebuild ({canonical_type}/{subtype_key})"
+        )
+    return building_config
+
+
 def _refresh_dealshield_payload_for_project(
     project: Project,
     payload: Dict[str, Any],
@@ -1036,7 +1155,7 @@ async def update_dealshield_controls(
         )
 
     try:
-        payload = _resolve_project_payload(project)
+        payload = ProjectRequestContext(project, project_id).payload()
         if not isinstance(payload, dict):
             payload = {}
 
@@ -1050,18 +1169,7 @@ async def update_dealshield_controls(
                 DealShieldScenarioError,
             )
 
-            building_type, subtype = _resolve_dealshield_building_context(project, payload)
-            if not building_type or not subtype:
-                raise ValueError("Unable to resolve building type/subtype for DealShield scenario rebuild")
-
-            canonical_type, canonical_subtype = validate_building_type(building_type, subtype)
-            subtype_key = canonical_subtype or subtype
-            building_type_enum = BuildingType(canonical_type)
-            building_config = MASTER_CONFIG.get(building_type_enum, {}).get(subtype_key)
-            if building_config is None:
-                raise ValueError(
-                    f"Unable to resolve building config for DealShield scenario rebuild ({canonical_type}/{subtype_key})"
-                )
+            building_config = _resolve_dealshield_building_config(project, payload)
 
             try:
                 payload["dealshield_scenarios"] = build_dealshield_scenarios(
@@ -1073,6 +1181,8 @@ async def update_dealshield_controls(
                 raise ValueError(str(exc)) from exc
 
         project.calculation_data = json.dumps(payload)
+        upsert_project_summary(db, project, auth.org_id, payload)
+        upsert_project_search_document(db, project, auth.org_id, payload)
         db.commit()
         db.refresh(project)
     except Exception as exc:
@@ -1098,6 +1208,79 @@ async def update_dealshield_controls(
     )
 
 
+def _get_dealshield_preview_base(project: Project, project_id: str):
+    """Cached preview inputs for the project's stored payload; None without a DealShield profile."""
+    resolved_project_id = getattr(project, "project_id", None) or project_id
+    # Keyed on the stored blobs, so a saved controls update (or any re-run) gets a fresh base.
+    cache_key = (
+        resolved_project_id,
+        hash((
+            getattr(project, "calculation_data", None),
+            getattr(project, "scope_data", None),
+            getattr(project, "cost_data", None),
+        )),
+    )
+    base = dealshield_preview_cache.get(cache_key)
+    if base is not None:
+        return base
+
+    context = ProjectRequestContext(project, project_id)
+    profile_id = context.dealshield_profile_id()
+    if profile_id is None:
+        return None
+    payload = context.payload()
+    base = build_preview_base(
+        resolved_project_id,
+        payload,
+        _resolve_dealshield_building_config(project, payload),
+        get_dealshield_profile(profile_id),
+    )
+    dealshield_preview_cache.put(cache_key, base)
+    return base
+
+
+@router.post("/scope/projects/{project_id}/dealshield/controls/preview", response_model=ProjectResponse)
+async def preview_dealshield_controls_view(
+    project_id: str,
+    request: DealShieldControlsUpdateRequest,
+    db: Session = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
+):
+    """Rebuild the DealShield view for unsaved controls without touching the stored project."""
+    project = _get_scoped_project(db, project_id, auth)
+
+    if not project:
+        return ProjectResponse(
+            success=False,
+            data={},
+            errors=["Project not found"],
+        )
+
+    try:
+        base = _get_dealshield_preview_base(project, project_id)
+        if base is None:
+            return ProjectResponse(
+                success=False,
+                data={},
+                errors=["DealShield not available for this project"]
+            )
+        controls = _normalize_dealshield_controls_payload(request.model_dump())
+        view_model = preview_dealshield_controls(base, controls, unified_engine)
+    except Exception as exc:
+        _log_route_exception(
+            "scope.dealshield.controls_preview",
+            exc,
+            None,
+            project_id=project_id,
+        )
+        return _project_response_error(DEALSHIELD_VIEW_ERROR_MESSAGE)
+
+    return ProjectResponse(
+        success=True,
+        data=sanitize_client_text(view_model)
+    )
+
+
 @router.get("/scope/projects/{project_id}/dealshield", response_model=ProjectResponse)
 async def get_dealshield_view(
     project_id: str,
@@ -1114,9 +1297,8 @@ async def get_dealshield_view(
             errors=["Project not found"]
         )
 
-    payload = _resolve_project_payload(project)
-    profile_id = payload.get("dealshield_tile_profile")
-    if not isinstance(profile_id, str) or not profile_id.strip():
+    context = ProjectRequestContext(project, project_id)
+    if context.dealshield_profile_id() is None:
         return ProjectResponse(
             success=False,
             data={},
@@ -1124,8 +1306,8 @@ async def get_dealshield_view(
         )
 
     try:
-        payload = _refresh_dealshield_payload_for_project(project, payload)
-        profile = get_dealshield_profile(profile_id)
+        context.dealshield_payload()
+        context.dealshield_profile()
     except Exception as exc:
         _log_route_exception(
             "scope.dealshield.view.refresh",
@@ -1136,7 +1318,7 @@ async def get_dealshield_view(
         return _project_response_error(DEALSHIELD_VIEW_ERROR_MESSAGE)
 
     try:
-        view_model = build_dealshield_view_model(project.project_id or project_id, payload, profile)
+        view_model = context.dealshield_view_model()
     except DealShieldResolutionError as exc:
         _log_route_exception(
             "scope.dealshield.view.resolve",
@@ -1145,6 +1327,9 @@ async def get_dealshield_view(
             project_id=project_id,
         )
         return _project_response_error(DEALSHIELD_VIEW_ERROR_MESSAGE)
+    # An index rebuild queries the org's summary rows; keep it off the event loop.
+    comparables = await asyncio.to_thread(_project_comparables, db, auth, project, context.payload())
+    view_model = {**view_model, "pro_forma": context.dealshield_pro_forma(), "comparables": comparables}
 
     return ProjectResponse(
         success=True,
@@ -1154,11 +1339,11 @@ async def get_dealshield_view(
 @router.delete("/scope/projects/{project_id}")
 async def delete_project(
     project_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     auth: AuthContext = Depends(get_auth_context),
 ):
     """Delete a project scoped to current org."""
-    project = _get_scoped_project(db, project_id, auth)
+    project = await _get_scoped_project_async(db, project_id, auth)
     if not project:
         return ProjectResponse(
             success=False,
@@ -1166,8 +1351,10 @@ async def delete_project(
             errors=["Project not found"]
         )
     
-    db.delete(project)
-    db.commit()
+    stored_project_id = project.project_id
+    await db.delete(project)
+    await db.commit()
+    comparables_registry.record_project_delete(auth.org_id, stored_project_id)
     
     return ProjectResponse(
         success=True,
@@ -1179,12 +1366,15 @@ async def delete_project(
 async def generate_scope(
     request: Request,
     payload: AnalyzeRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     auth: AuthContext = Depends(get_auth_context),
 ):
     """Generate scope and save to database using V2 engine"""
     try:
-        assert_run_available(db, org_id=auth.org_id, email=auth.email)
+        # Fail fast on an exhausted quota, then end the read transaction so no
+        # row stays locked while the engine runs.
+        await db.run_sync(assert_run_available, org_id=auth.org_id, email=auth.email)
+        await db.commit()
 
         # Parse the description using NLP
         parsed = nlp_service.extract_project_details(payload.description)
@@ -1288,23 +1478,13 @@ async def generate_scope(
             getattr(payload, "project_class", None),
         )
 
-        result = unified_engine.calculate_project(
-            building_type=building_type_enum,
-            subtype=parsed.get('subtype'),
-            square_footage=parsed.get('square_footage', 10000),
-            location=parsed.get('location', 'Nashville, TN'),
-            project_class=project_class_enum,
-            floors=parsed.get('floors', 1),
-            ownership_type=OwnershipType(parsed.get('ownership_type', 'for_profit')),
-            finish_level=finish_level_value,
-            finish_level_source=finish_level_source,
-            special_features=parsed.get('special_features', []),
-            parsed_input_overrides={
-                **parsed,
-                **({"unit_count": payload.unit_count} if payload.unit_count is not None else {}),
-                **({"key_count": payload.key_count} if payload.key_count is not None else {}),
-            },
-        )
+        # Explicit counts live in parsed_input so a later re-pricing sees the same inputs.
+        if payload.unit_count is not None:
+            parsed['unit_count'] = payload.unit_count
+        if payload.key_count is not None:
+            parsed['key_count'] = payload.key_count
+
+        result = unified_engine.calculate_project(**engine_kwargs_from_parsed_input(parsed))
 
         # Embed request metadata into stored result so downstream consumers can hydrate it
         if isinstance(result, dict):
@@ -1327,6 +1507,7 @@ async def generate_scope(
             result["parsed_input"]["project_classification"] = project_class_str
             result["parsed_input"]["project_class"] = project_class_str
             result["project_classification"] = project_class_str
+            stamp_pricing_fingerprint(result)
         
         # Generate unique project ID
         project_id = f"proj_{int(datetime.utcnow().timestamp())}_{uuid.uuid4().hex[:8]}"
@@ -1394,22 +1575,39 @@ async def generate_scope(
             updated_at=datetime.utcnow()
         )
         
+        summary_values = project_summary_values(project_id, result if isinstance(result, dict) else {})
+        search_values = project_search_values(project, result if isinstance(result, dict) else {})
+
+        # Reserve the run with one conditional update and commit it right away;
+        # concurrent generates in the org only contend for that single statement.
+        run_limit_snapshot = await db.run_sync(consume_run, org_id=auth.org_id, email=auth.email)
+        await db.commit()
+
         # Save to database
-        db.add(project)
-        db.flush()
-        db.add(
-            ProjectAccess(
-                project_id=project_id,
-                org_id=auth.org_id,
-                owner_user_id=auth.user_id,
+        try:
+            db.add(project)
+            await db.flush()
+            db.add(
+                ProjectAccess(
+                    project_id=project_id,
+                    org_id=auth.org_id,
+                    owner_user_id=auth.user_id,
+                )
             )
+            db.add(ProjectSummary(project_id=project_id, org_id=auth.org_id, **summary_values))
+            db.add(ProjectSearchDocument(project_id=project_id, org_id=auth.org_id, **search_values))
+            await db.commit()
+        except Exception:
+            await db.rollback()
+            await _release_reserved_run(db, auth, request)
+            raise
+        await db.refresh(project)
+        comparables_registry.record_project_write(
+            auth.org_id, project_id, project.name, result if isinstance(result, dict) else {}
         )
-        run_limit_snapshot = consume_run(db, org_id=auth.org_id, email=auth.email)
-        db.commit()
-        db.refresh(project)
         
         # Return formatted response
-        formatted = format_project_response(project)
+        formatted = ProjectRequestContext(project, project_id).project_response()
         if isinstance(formatted, dict):
             formatted["run_limits"] = run_limit_snapshot.to_dict()
         return ProjectResponse(
@@ -1419,7 +1617,7 @@ async def generate_scope(
         )
         
     except HTTPException:
-        db.rollback()
+        await db.rollback()
         raise
     except Exception as e:
         _log_route_exception(
@@ -1429,9 +1627,19 @@ async def generate_scope(
             project_class=getattr(payload, "project_class", None)
             or getattr(payload, "project_classification", None),
         )
-        db.rollback()
+        await db.rollback()
         return _project_response_error(GENERATE_ERROR_MESSAGE)
 
+async def _release_reserved_run(db: AsyncSession, auth: AuthContext, request: Optional[Request]) -> None:
+    """Compensate a run reserved by ``consume_run`` when the project could not be saved."""
+    try:
+        await db.run_sync(release_run, org_id=auth.org_id, email=auth.email)
+        await db.commit()
+    except Exception as exc:
+        await db.rollback()
+        _log_route_exception("scope.generate.release_run", exc, request, org_id=auth.org_id)
+
+
 async def _get_owner_view_impl(project_id: str, db: Session, auth: AuthContext):
     """Implementation of owner view logic"""
     if not project_id:
@@ -1450,7 +1658,7 @@ async def _get_owner_view_impl(project_id: str, db: Session, auth: AuthContext):
         )
     
     # Process the owner view data
-    return await _process_owner_view_data(project)
+    return await _process_owner_view_data(ProjectRequestContext(project, project_id))
 
 @router.post("/scope/projects/{project_id}/owner-view")
 async def get_owner_view_by_id(
@@ -1480,34 +1688,27 @@ async def get_owner_view(
     project_id = request.get('project_id')
     return await _get_owner_view_impl(project_id, db, auth)
 
-@router.get("/pdf/project/{project_id}/pdf")
-async def export_project_pdf(
+def _prepare_decision_packet_export(
+    context: "ProjectRequestContext",
     project_id: str,
-    client_name: Optional[str] = Query(None, alias="client_name"),
-    db: Session = Depends(get_db),
-    auth: AuthContext = Depends(get_auth_context),
-):
-    """Generate a PDF report for a project."""
-    project = _get_scoped_project(db, project_id, auth)
-
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    project_payload = hydrate_project_payload_for_packet(project, format_project_response(project))
+    client_name: Optional[str],
+    route_name: str,
+) -> tuple[Dict[str, Any], str]:
+    """Compose the customer-safe decision packet and its download filename."""
+    project = context.project
+    project_payload = hydrate_project_payload_for_packet(project, context.project_response())
     project_name = project_payload.get('project_name') or project_payload.get('name') or f"project_{project_id}"
     project_payload['project_name'] = project_name
 
-    payload = _resolve_project_payload(project)
-    profile_id = payload.get("dealshield_tile_profile")
-    if not isinstance(profile_id, str) or not profile_id.strip():
+    if context.dealshield_profile_id() is None:
         raise HTTPException(status_code=400, detail="DealShield not available for this project")
 
     try:
-        payload = _refresh_dealshield_payload_for_project(project, payload)
-        profile = get_dealshield_profile(profile_id)
+        payload = context.dealshield_payload()
+        context.dealshield_profile()
     except Exception as exc:
         _log_route_exception(
-            "scope.project_pdf.refresh",
+            f"{route_name}.refresh",
             exc,
             None,
             project_id=project_id,
@@ -1515,10 +1716,10 @@ async def export_project_pdf(
         raise HTTPException(status_code=400, detail=PROJECT_EXPORT_PREP_ERROR_MESSAGE) from exc
 
     try:
-        canonical_dealshield_view_model = build_dealshield_view_model(project.project_id or project_id, payload, profile)
+        canonical_dealshield_view_model = context.dealshield_view_model()
     except DealShieldResolutionError as exc:
         _log_route_exception(
-            "scope.project_pdf.resolve_dealshield",
+            f"{route_name}.resolve_dealshield",
             exc,
             None,
             project_id=project_id,
@@ -1534,21 +1735,89 @@ async def export_project_pdf(
     )
     packet = sanitize_decision_packet_export(packet)
 
+    return packet, _export_filename(project_name, "pdf")
+
+
+def _export_filename(project_name: str, extension: str) -> str:
+    safe_name = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in project_name).strip() or "SpecSharp_Project"
+    return f"{safe_name.replace(' ', '_')}_{datetime.utcnow().strftime('%Y%m%d')}.{extension}"
+
+
+def _prepare_excel_export(context: "ProjectRequestContext", project_id: str) -> tuple[Dict[str, Any], str]:
+    """Shape the stored project into the trade/system categories the Excel report expects."""
+    project_payload = hydrate_project_payload_for_packet(context.project, context.project_response())
+    project_name = project_payload.get('project_name') or project_payload.get('name') or f"project_{project_id}"
+
+    categories = []
+    for scope_item in project_payload.get('scope_items') or []:
+        if not isinstance(scope_item, dict):
+            continue
+        systems = []
+        for system in scope_item.get('systems') or []:
+            if not isinstance(system, dict):
+                continue
+            systems.append({
+                'name': system.get('name') or 'System',
+                'quantity': system.get('quantity') or 0,
+                'unit': system.get('unit') or '',
+                'unit_cost': system.get('unit_cost') or 0,
+                'total_cost': system.get('total_cost') or 0,
+                'confidence_score': system.get('confidence_score', 95),
+            })
+        categories.append({
+            'name': str(scope_item.get('trade') or 'General'),
+            'subtotal': sum(system['total_cost'] for system in systems),
+            'systems': systems,
+        })
+
+    project_data = {
+        **project_payload,
+        'project_name': project_name,
+        'total_cost': project_payload.get('total_cost') or 0,
+        'cost_per_sqft': project_payload.get('cost_per_sqft') or 0,
+        'subtotal': project_payload.get('subtotal') or 0,
+        'categories': categories,
+    }
+    return project_data, _export_filename(project_name, "xlsx")
+
+
+def _prepare_dealshield_export(
+    context: "ProjectRequestContext",
+    project_id: str,
+    route_name: str,
+) -> tuple[Dict[str, Any], str]:
+    """Build the DealShield view model rendered into the DealShield PDF and its filename."""
+    if context.dealshield_profile_id() is None:
+        raise HTTPException(status_code=400, detail="DealShield not available for this project")
+
     try:
-        pdf_buffer = pdf_export_service.generate_decision_packet_pdf(packet)
+        context.dealshield_payload()
+        context.dealshield_profile()
     except Exception as exc:
         _log_route_exception(
-            "scope.project_pdf.generate",
+            f"{route_name}.refresh",
             exc,
             None,
             project_id=project_id,
         )
-        raise HTTPException(status_code=500, detail="Failed to generate PDF report")
+        raise HTTPException(status_code=400, detail=DEALSHIELD_EXPORT_PREP_ERROR_MESSAGE) from exc
+
+    try:
+        view_model = context.dealshield_view_model()
+    except DealShieldResolutionError as exc:
+        _log_route_exception(
+            f"{route_name}.resolve",
+            exc,
+            None,
+            project_id=project_id,
+        )
+        raise HTTPException(status_code=400, detail=DEALSHIELD_EXPORT_PREP_ERROR_MESSAGE) from exc
+
+    filename = f"DealShield_{datetime.utcnow().strftime('%Y%m%d')}.pdf"
+    return view_model, filename
 
-    safe_name = "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in project_name).strip() or "SpecSharp_Project"
-    filename = f"{safe_name.replace(' ', '_')}_{datetime.utcnow().strftime('%Y%m%d')}.pdf"
-    pdf_bytes = pdf_buffer.getvalue()
 
+def _pdf_download_response(pdf_bytes: bytes, filename: str) -> StreamingResponse:
     return StreamingResponse(
         iter([pdf_bytes]),
         media_type="application/pdf",
@@ -1556,45 +1825,107 @@ async def export_project_pdf(
     )
 
 
-@router.get("/scope/projects/{project_id}/dealshield/pdf")
-async def export_dealshield_pdf(
+@router.get("/pdf/project/{project_id}/pdf")
+async def export_project_pdf(
     project_id: str,
+    client_name: Optional[str] = Query(None, alias="client_name"),
     db: Session = Depends(get_db),
     auth: AuthContext = Depends(get_auth_context),
 ):
-    """Generate a DealShield PDF report for a project."""
+    """Generate a PDF report for a project."""
     project = _get_scoped_project(db, project_id, auth)
 
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    payload = _resolve_project_payload(project)
-    profile_id = payload.get("dealshield_tile_profile")
-    if not isinstance(profile_id, str) or not profile_id.strip():
-        raise HTTPException(status_code=400, detail="DealShield not available for this project")
+    packet, filename = _prepare_decision_packet_export(
+        ProjectRequestContext(project, project_id),
+        project_id,
+        client_name,
+        "scope.project_pdf",
+    )
 
     try:
-        payload = _refresh_dealshield_payload_for_project(project, payload)
-        profile = get_dealshield_profile(profile_id)
+        pdf_buffer = pdf_export_service.generate_decision_packet_pdf(packet)
     except Exception as exc:
         _log_route_exception(
-            "scope.dealshield_pdf.refresh",
+            "scope.project_pdf.generate",
             exc,
             None,
             project_id=project_id,
         )
-        raise HTTPException(status_code=400, detail=DEALSHIELD_EXPORT_PREP_ERROR_MESSAGE) from exc
+        raise HTTPException(status_code=500, detail="Failed to generate PDF report")
+
+    return _pdf_download_response(pdf_buffer.getvalue(), filename)
+
+
+@router.get("/excel/project/{project_id}/excel-pro")
+async def export_project_excel(
+    project_id: str,
+    client_name: Optional[str] = Query(None, alias="client_name"),
+    db: Session = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
+):
+    """Stream the professional Excel report for a project.
+
+    Sheets are built with a write-only workbook off the event loop; the xlsx bytes
+    are then streamed to the client while the zip container is being written.
+    """
+    project = _get_scoped_project(db, project_id, auth)
+
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
 
     try:
-        view_model = build_dealshield_view_model(project.project_id or project_id, payload, profile)
-    except DealShieldResolutionError as exc:
+        project_data, filename = _prepare_excel_export(ProjectRequestContext(project, project_id), project_id)
+    except Exception as exc:
         _log_route_exception(
-            "scope.dealshield_pdf.resolve",
+            "scope.project_excel.prepare",
             exc,
             None,
             project_id=project_id,
         )
-        raise HTTPException(status_code=400, detail=DEALSHIELD_EXPORT_PREP_ERROR_MESSAGE) from exc
+        raise HTTPException(status_code=400, detail=PROJECT_EXPORT_PREP_ERROR_MESSAGE) from exc
+
+    try:
+        chunks = await asyncio.to_thread(
+            excel_export_service_v2.generate_professional_excel_stream,
+            project_data,
+            client_name,
+        )
+    except Exception as exc:
+        _log_route_exception(
+            "scope.project_excel.generate",
+            exc,
+            None,
+            project_id=project_id,
+        )
+        raise HTTPException(status_code=500, detail="Failed to generate Excel report") from exc
+
+    return StreamingResponse(
+        chunks,
+        media_type=XLSX_MEDIA_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@router.get("/scope/projects/{project_id}/dealshield/pdf")
+async def export_dealshield_pdf(
+    project_id: str,
+    db: Session = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
+):
+    """Generate a DealShield PDF report for a project."""
+    project = _get_scoped_project(db, project_id, auth)
+
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    view_model, filename = _prepare_dealshield_export(
+        ProjectRequestContext(project, project_id),
+        project_id,
+        "scope.dealshield_pdf",
+    )
 
     try:
         pdf_buffer = pdf_export_service.generate_dealshield_pdf(view_model)
@@ -1607,35 +1938,121 @@ async def export_dealshield_pdf(
         )
         raise HTTPException(status_code=500, detail="Failed to generate DealShield PDF report") from exc
 
-    filename = f"DealShield_{datetime.utcnow().strftime('%Y%m%d')}.pdf"
-    pdf_bytes = pdf_buffer.getvalue()
+    return _pdf_download_response(pdf_buffer.getvalue(), filename)
 
-    return StreamingResponse(
-        iter([pdf_bytes]),
-        media_type="application/pdf",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
-    )
+
+@router.post("/scope/projects/{project_id}/exports", response_model=ProjectResponse)
+@limiter.limit("20/minute")
+async def submit_export_job(
+    request: Request,
+    project_id: str,
+    payload: ExportJobRequest,
+    db: Session = Depends(get_db),
+    auth: AuthContext = Depends(get_auth_context),
+):
+    """Queue a PDF export for background rendering and return its job id.
+
+    The packet is composed and sanitized here; rendering runs in the export worker
+    process. Unchanged projects resolve immediately from the artifact store.
+    """
+    project = _get_scoped_project(db, project_id, auth)
+
+    if not project:
+        return ProjectResponse(
+            success=False,
+            data={},
+            errors=["Project not found"]
+        )
+
+    context = ProjectRequestContext(project, project_id)
+    if payload.kind == EXPORT_KIND_DEALSHIELD:
+        export_input, filename = _prepare_dealshield_export(context, project_id, "scope.export_job.dealshield")
+    elif payload.kind == EXPORT_KIND_DECISION_PACKET:
+        export_input, filename = _prepare_decision_packet_export(
+            context,
+            project_id,
+            payload.client_name,
+            "scope.export_job.decision_packet",
+        )
+    else:
+        return _project_response_error(EXPORT_JOB_ERROR_MESSAGE)
+
+    try:
+        job = export_job_manager.submit(
+            payload.kind,
+            export_input,
+            org_id=auth.org_id,
+            project_id=project.project_id or project_id,
+            filename=filename,
+        )
+    except Exception as exc:
+        _log_route_exception("scope.export_job.submit", exc, request, project_id=project_id)
+        return _project_response_error(EXPORT_JOB_ERROR_MESSAGE)
+
+    return ProjectResponse(success=True, data=job.to_dict())
+
+
+@router.get("/scope/exports/{job_id}", response_model=ProjectResponse)
+async def get_export_job(
+    job_id: str,
+    wait: float = Query(0, ge=0, le=EXPORT_JOB_MAX_WAIT_SECONDS, description="Seconds to wait for completion"),
+    auth: AuthContext = Depends(get_auth_context),
+):
+    """Poll an export job; pass ``wait`` to hold the request open until it finishes."""
+    job = export_job_manager.get(job_id, org_id=auth.org_id)
+    if job is None:
+        return ProjectResponse(
+            success=False,
+            data={},
+            errors=["Export job not found"]
+        )
+
+    job = await export_job_manager.wait(job, timeout=wait)
+    return ProjectResponse(success=True, data=job.to_dict())
+
+
+@router.get("/scope/exports/{job_id}/download")
+async def download_export_job(
+    job_id: str,
+    auth: AuthContext = Depends(get_auth_context),
+):
+    """Download the rendered PDF for a completed export job."""
+    job = export_job_manager.get(job_id, org_id=auth.org_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Export job not found")
+    if job.status == JOB_STATUS_FAILED:
+        raise HTTPException(status_code=500, detail=EXPORT_JOB_ERROR_MESSAGE)
+    if job.status != JOB_STATUS_COMPLETED:
+        raise HTTPException(status_code=409, detail="Export is still rendering")
+
+    try:
+        pdf_bytes = export_job_manager.read_artifact(job)
+    except ExportJobError as exc:
+        _log_route_exception("scope.export_job.download", exc, None, job_id=job_id)
+        raise HTTPException(status_code=500, detail=EXPORT_JOB_ERROR_MESSAGE) from exc
+
+    return _pdf_download_response(pdf_bytes, job.filename)
 
 # Process owner view data for a project
-async def _process_owner_view_data(project):
+async def _process_owner_view_data(context: "ProjectRequestContext"):
     """Process and return owner view data for a project"""
+    project = context.project
     # Use unified_engine for owner view calculations
     try:
         # Parse stored calculation data - check all possible sources
-        import json
         calculation_data = {}
         
         # First try calculation_data column (V2 projects)
         if hasattr(project, 'calculation_data') and project.calculation_data:
             try:
-                calculation_data = json.loads(project.calculation_data) if isinstance(project.calculation_data, str) else project.calculation_data
+                calculation_data = context.stored_json('calculation_data')
             except:
                 pass
         
         # Fall back to scope_data or cost_data (legacy projects)
         if not calculation_data:
-            scope_data = json.loads(project.scope_data) if project.scope_data else {}
-            cost_data = json.loads(project.cost_data) if project.cost_data else {}
+            scope_data = context.stored_json('scope_data') if project.scope_data else {}
+            cost_data = context.stored_json('cost_data') if project.cost_data else {}
             calculation_data = cost_data if cost_data else scope_data
         
         # Extract ownership and revenue data from V2 structure
@@ -1728,8 +2145,86 @@ async def _process_owner_view_data(project):
         return _project_response_error(OWNER_VIEW_ERROR_MESSAGE)
 
 
-def _resolve_project_payload(project: Project) -> Dict[str, Any]:
-    project_payload = format_project_response(project)
+class ProjectRequestContext:
+    """
+    Derived views of one stored project, built at most once per request.
+
+    The stored JSON is parsed once and the formatted response, the resolved
+    calculation payload and the DealShield payload/profile/view model are
+    memoized, so an endpoint (or an export that needs several views) never
+    re-parses the blob or re-runs financing/DealShield derivation. Views share
+    the parsed payload and must not outlive the request.
+    """
+
+    def __init__(self, project: Project, project_id: Optional[str] = None):
+        self.project = project
+        self.project_id = getattr(project, "project_id", None) or project_id
+        self._views: Dict[str, Any] = {}
+        self._stored_json: Dict[str, Any] = {}
+
+    def _memoized(self, name: str, build):
+        if name not in self._views:
+            self._views[name] = build()
+        return self._views[name]
+
+    def stored_json(self, column: str) -> Any:
+        """Parsed value of a JSON text column (calculation_data, scope_data, cost_data)."""
+        if column not in self._stored_json:
+            raw = getattr(self.project, column, None)
+            self._stored_json[column] = json.loads(raw) if isinstance(raw, str) else raw
+        return self._stored_json[column]
+
+    def project_response(self) -> Dict[str, Any]:
+        """Formatted project; a shallow copy so callers may add top-level keys."""
+        formatted = self._memoized("project_response", lambda: format_project_response(self.project))
+        return dict(formatted) if isinstance(formatted, dict) else formatted
+
+    def payload(self) -> Dict[str, Any]:
+        return self._memoized(
+            "payload",
+            lambda: _project_payload_from_response(
+                self._memoized("project_response", lambda: format_project_response(self.project))
+            ),
+        )
+
+    def dealshield_profile_id(self) -> Optional[str]:
+        profile_id = self.payload().get("dealshield_tile_profile")
+        if not isinstance(profile_id, str) or not profile_id.strip():
+            return None
+        return profile_id
+
+    def dealshield_payload(self) -> Dict[str, Any]:
+        """Payload with DealShield scenarios rebuilt against the current engine."""
+        # The refresh writes into the payload; keep the formatted response as stored.
+        return self._memoized(
+            "dealshield_payload",
+            lambda: _refresh_dealshield_payload_for_project(self.project, dict(self.payload())),
+        )
+
+    def dealshield_profile(self) -> Dict[str, Any]:
+        return self._memoized("dealshield_profile", lambda: get_dealshield_profile(self.dealshield_profile_id()))
+
+    def dealshield_view_model(self) -> Dict[str, Any]:
+        return self._memoized(
+            "dealshield_view_model",
+            lambda: build_dealshield_view_model(
+                self.project_id,
+                self.dealshield_payload(),
+                self.dealshield_profile(),
+            ),
+        )
+
+    def dealshield_pro_forma(self) -> Optional[Dict[str, Any]]:
+        return self._memoized(
+            "dealshield_pro_forma",
+            lambda: build_dealshield_pro_forma(
+                self.dealshield_payload().get("dealshield_scenarios"),
+                unified_engine,
+            ),
+        )
+
+
+def _project_payload_from_response(project_payload: Dict[str, Any]) -> Dict[str, Any]:
     calculation_data = project_payload.get("calculation_data")
     if isinstance(calculation_data, dict) and calculation_data:
         return calculation_data
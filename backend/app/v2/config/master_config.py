@@ -18,7 +18,7 @@ from collections import defaultdict
 from enum import Enum
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple, Any, Callable, Literal, TypedDict, Union
-from app.config.regional_multipliers import resolve_location_context
+from app.config.regional_multipliers import lookup_location_context
 
 # ============================================================================
 # ENUMS
@@ -944,7 +944,7 @@ def get_soft_costs(building_type: BuildingType, subtype: str) -> Optional[SoftCo
 def get_regional_multiplier(building_type: BuildingType, subtype: str, city: str,
                             warning_callback: Optional[Callable[[], None]] = None) -> float:
     """Get regional cost multiplier for a city."""
-    context = resolve_location_context(city or "")
+    context = lookup_location_context(city or "")
     state = context.get("state")
     if not state and warning_callback:
         warning_callback()
@@ -1043,7 +1043,7 @@ def get_market_factor(location: str, warning_callback: Optional[Callable[[], Non
         return 1.0
 
     normalized = location.strip()
-    context = resolve_location_context(normalized)
+    context = lookup_location_context(normalized)
     state = context.get("state")
     if not state and warning_callback:
         warning_callback()
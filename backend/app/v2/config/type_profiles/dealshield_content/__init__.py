@@ -1,43 +1,41 @@
 """DealShield content registry (config-owned)."""
 
+from importlib import import_module
 from typing import Any, Dict
 
-from . import civic
-from . import educational
-from . import healthcare
-from . import hospitality
-from . import industrial
-from . import mixed_use
-from . import multifamily
-from . import office
-from . import parking
-from . import recreation
-from . import retail
-from . import restaurant
-
-CIVIC_CONTENT_PROFILE_ALIASES: dict[str, dict] = {
-    "civic_baseline_v1": {
-        **civic.DEALSHIELD_CONTENT_PROFILES["civic_library_v1"],
-        "profile_id": "civic_baseline_v1",
-    },
+from app.v2.config.type_profiles.profile_registry import LazyProfileRegistry
+
+# Explicit aggregation for determinism (no filesystem scanning); per-type
+# modules are imported on first lookup.
+_REGISTRY = LazyProfileRegistry(
+    __name__,
+    (
+        "industrial",
+        "healthcare",
+        "restaurant",
+        "hospitality",
+        "mixed_use",
+        "multifamily",
+        "office",
+        "parking",
+        "retail",
+        "educational",
+        "civic",
+        "recreation",
+    ),
+    "DEALSHIELD_CONTENT_PROFILES",
+)
+
+_CIVIC_ALIAS_TARGETS = {
+    "civic_baseline_v1": "civic_library_v1",
 }
 
-# Explicit aggregation for determinism (no filesystem scanning).
-DEALSHIELD_CONTENT_PROFILE_SOURCES: list[dict] = [
-    industrial.DEALSHIELD_CONTENT_PROFILES,
-    healthcare.DEALSHIELD_CONTENT_PROFILES,
-    restaurant.DEALSHIELD_CONTENT_PROFILES,
-    hospitality.DEALSHIELD_CONTENT_PROFILES,
-    mixed_use.DEALSHIELD_CONTENT_PROFILES,
-    multifamily.DEALSHIELD_CONTENT_PROFILES,
-    office.DEALSHIELD_CONTENT_PROFILES,
-    parking.DEALSHIELD_CONTENT_PROFILES,
-    retail.DEALSHIELD_CONTENT_PROFILES,
-    educational.DEALSHIELD_CONTENT_PROFILES,
-    civic.DEALSHIELD_CONTENT_PROFILES,
-    recreation.DEALSHIELD_CONTENT_PROFILES,
-    CIVIC_CONTENT_PROFILE_ALIASES,
-]
+
+def _civic_content_alias(alias: str) -> Dict[str, Any]:
+    return {
+        **_REGISTRY.profiles("civic")[_CIVIC_ALIAS_TARGETS[alias]],
+        "profile_id": alias,
+    }
 
 
 def get_dealshield_content_profile(profile_id: str) -> Dict[str, Any]:
@@ -45,17 +43,29 @@ def get_dealshield_content_profile(profile_id: str) -> Dict[str, Any]:
         raise ValueError("profile_id required")
     pid = profile_id.strip()
 
-    sources = globals().get("DEALSHIELD_CONTENT_PROFILE_SOURCES")
-    if not isinstance(sources, list) or not sources:
-        raise RuntimeError("DEALSHIELD_CONTENT_PROFILE_SOURCES missing/empty")
+    if pid in _CIVIC_ALIAS_TARGETS:
+        profile = __getattr__("CIVIC_CONTENT_PROFILE_ALIASES")[pid]
+    else:
+        profile = _REGISTRY.find_profile(pid)
+    if profile is None:
+        raise KeyError(f"DealShield content profile not found: {pid}")
+    if not isinstance(profile, dict):
+        raise TypeError(f"DealShield content profile must be dict for {pid}")
+    if "profile_id" not in profile:
+        profile = {**profile, "profile_id": pid}
+    return profile
 
-    for src in sources:
-        if isinstance(src, dict) and pid in src:
-            profile = src[pid]
-            if not isinstance(profile, dict):
-                raise TypeError(f"DealShield content profile must be dict for {pid}")
-            if "profile_id" not in profile:
-                profile = {**profile, "profile_id": pid}
-            return profile
 
-    raise KeyError(f"DealShield content profile not found: {pid}")
+def __getattr__(name):
+    if name in globals():
+        return globals()[name]
+    if name == "CIVIC_CONTENT_PROFILE_ALIASES":
+        value = {alias: _civic_content_alias(alias) for alias in _CIVIC_ALIAS_TARGETS}
+    elif name == "DEALSHIELD_CONTENT_PROFILE_SOURCES":
+        value = [*_REGISTRY.profile_sources(), __getattr__("CIVIC_CONTENT_PROFILE_ALIASES")]
+    elif name in _REGISTRY.module_names:
+        return import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
@@ -1,75 +1,70 @@
 """DealShield tile registry (config-owned)."""
 
-from . import civic
-from . import educational
-from . import healthcare
-from . import hospitality
-from . import industrial
-from . import mixed_use
-from . import multifamily
-from . import office
-from . import parking
-from . import recreation
-from . import restaurant
-from . import retail
-from . import specialty
+from importlib import import_module
+from typing import Any, Dict
 
-CIVIC_TILE_PROFILE_ALIASES: dict[str, dict] = {
-    "civic_baseline_v1": civic.DEALSHIELD_TILE_PROFILES["civic_library_v1"],
-}
+from app.v2.config.type_profiles.profile_registry import LazyProfileRegistry
 
-# Explicit aggregation for determinism (no filesystem scanning).
-DEALSHIELD_TILE_PROFILE_SOURCES: list[dict] = [
-    CIVIC_TILE_PROFILE_ALIASES,
-    industrial.DEALSHIELD_TILE_PROFILES,
-    healthcare.DEALSHIELD_TILE_PROFILES,
-    restaurant.DEALSHIELD_TILE_PROFILES,
-    hospitality.DEALSHIELD_TILE_PROFILES,
-    civic.DEALSHIELD_TILE_PROFILES,
-    educational.DEALSHIELD_TILE_PROFILES,
-    mixed_use.DEALSHIELD_TILE_PROFILES,
-    multifamily.DEALSHIELD_TILE_PROFILES,
-    office.DEALSHIELD_TILE_PROFILES,
-    parking.DEALSHIELD_TILE_PROFILES,
-    recreation.DEALSHIELD_TILE_PROFILES,
-    retail.DEALSHIELD_TILE_PROFILES,
-    specialty.DEALSHIELD_TILE_PROFILES,
-]
+# Explicit aggregation for determinism (no filesystem scanning); per-type
+# modules are imported on first lookup.
+_REGISTRY = LazyProfileRegistry(
+    __name__,
+    (
+        "industrial",
+        "healthcare",
+        "restaurant",
+        "hospitality",
+        "civic",
+        "educational",
+        "mixed_use",
+        "multifamily",
+        "office",
+        "parking",
+        "recreation",
+        "retail",
+        "specialty",
+    ),
+    "DEALSHIELD_TILE_PROFILES",
+    "DEALSHIELD_TILE_DEFAULTS",
+)
 
-DEALSHIELD_TILE_DEFAULT_SOURCES: list[dict] = [
-    industrial.DEALSHIELD_TILE_DEFAULTS,
-    healthcare.DEALSHIELD_TILE_DEFAULTS,
-    restaurant.DEALSHIELD_TILE_DEFAULTS,
-    hospitality.DEALSHIELD_TILE_DEFAULTS,
-    civic.DEALSHIELD_TILE_DEFAULTS,
-    educational.DEALSHIELD_TILE_DEFAULTS,
-    mixed_use.DEALSHIELD_TILE_DEFAULTS,
-    multifamily.DEALSHIELD_TILE_DEFAULTS,
-    office.DEALSHIELD_TILE_DEFAULTS,
-    parking.DEALSHIELD_TILE_DEFAULTS,
-    recreation.DEALSHIELD_TILE_DEFAULTS,
-    retail.DEALSHIELD_TILE_DEFAULTS,
-    specialty.DEALSHIELD_TILE_DEFAULTS,
-]
+_CIVIC_ALIAS_TARGETS = {
+    "civic_baseline_v1": "civic_library_v1",
+}
 
-from typing import Any, Dict
 
 def get_dealshield_profile(profile_id: str) -> Dict[str, Any]:
     if not isinstance(profile_id, str) or not profile_id.strip():
         raise ValueError("profile_id required")
     pid = profile_id.strip()
 
-    sources = globals().get("DEALSHIELD_TILE_PROFILE_SOURCES")
-    if not isinstance(sources, list) or not sources:
-        raise RuntimeError("DEALSHIELD_TILE_PROFILE_SOURCES missing/empty")
+    alias_target = _CIVIC_ALIAS_TARGETS.get(pid)
+    if alias_target is not None:
+        prof = _REGISTRY.profiles("civic").get(alias_target)
+    else:
+        prof = _REGISTRY.find_profile(pid)
+    if prof is None:
+        raise KeyError(f"DealShield profile not found: {pid}")
+    if not isinstance(prof, dict):
+        raise TypeError(f"DealShield profile must be dict for {pid}")
+    if "profile_id" not in prof:
+        prof = {**prof, "profile_id": pid}
+    return prof
 
-    for src in sources:
-        if isinstance(src, dict) and pid in src:
-            prof = src[pid]
-            if not isinstance(prof, dict):
-                raise TypeError(f"DealShield profile must be dict for {pid}")
-            if "profile_id" not in prof:
-                prof = {**prof, "profile_id": pid}
-            return prof
 
-    raise KeyError(f"DealShield profile not found: {pid}")
+def __getattr__(name):
+    if name in globals():
+        return globals()[name]
+    if name == "CIVIC_TILE_PROFILE_ALIASES":
+        civic_profiles = _REGISTRY.profiles("civic")
+        value = {alias: civic_profiles[target] for alias, target in _CIVIC_ALIAS_TARGETS.items()}
+    elif name == "DEALSHIELD_TILE_PROFILE_SOURCES":
+        value = [__getattr__("CIVIC_TILE_PROFILE_ALIASES"), *_REGISTRY.profile_sources()]
+    elif name == "DEALSHIELD_TILE_DEFAULT_SOURCES":
+        value = _REGISTRY.default_sources()
+    elif name in _REGISTRY.module_names:
+        return import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
@@ -0,0 +1,172 @@
+"""Lazy, per-building-type loading for the type-profile registries.
+
+The scope-item, DealShield tile and DealShield content registries each
+aggregate one module per building type. Profile ids are namespaced by that
+module (``office_class_a_structural_v1`` lives in ``office``), so a lookup only
+has to import the module that owns the id instead of the whole package.
+
+Workers can additionally load every registry from a prebuilt marshal snapshot
+(``SPECSHARP_PROFILE_SNAPSHOT``) in a single read. The snapshot records a
+fingerprint of the registry sources and is ignored once any of them change.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import marshal
+import os
+from importlib import import_module
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PROFILE_SNAPSHOT_ENV = "SPECSHARP_PROFILE_SNAPSHOT"
+SNAPSHOT_FORMAT_VERSION = 1
+
+_TYPE_PROFILES_DIR = Path(__file__).resolve().parent
+_REGISTRIES: Dict[str, "LazyProfileRegistry"] = {}
+_snapshot_state: Dict[str, Any] = {"loaded": False, "registries": None}
+
+
+class LazyProfileRegistry:
+    """One registry package whose per-type modules are imported on demand."""
+
+    def __init__(
+        self,
+        package: str,
+        module_names: Iterable[str],
+        profiles_attr: str,
+        defaults_attr: Optional[str] = None,
+    ):
+        self.package = package
+        self.name = package.rsplit(".", 1)[-1]
+        self.module_names: Tuple[str, ...] = tuple(module_names)
+        self.profiles_attr = profiles_attr
+        self.defaults_attr = defaults_attr
+        # Longest first so a module name that prefixes another cannot shadow it.
+        self._prefixes = sorted(self.module_names, key=len, reverse=True)
+        _REGISTRIES[self.name] = self
+
+    def module(self, module_name: str):
+        return import_module(f"{self.package}.{module_name}")
+
+    def profiles(self, module_name: str) -> Dict[str, Any]:
+        cached = _snapshot_section(self.name, module_name)
+        if cached is not None:
+            return cached["profiles"]
+        return getattr(self.module(module_name), self.profiles_attr)
+
+    def defaults(self, module_name: str) -> Dict[str, Any]:
+        cached = _snapshot_section(self.name, module_name)
+        if cached is not None:
+            return cached["defaults"]
+        return getattr(self.module(module_name), self.defaults_attr)
+
+    def owner_of(self, profile_id: str) -> Optional[str]:
+        for module_name in self._prefixes:
+            if profile_id.startswith(f"{module_name}_"):
+                return module_name
+        return None
+
+    def find_profile(self, profile_id: str) -> Optional[Dict[str, Any]]:
+        owner = self.owner_of(profile_id)
+        if owner is not None:
+            profile = self.profiles(owner).get(profile_id)
+            if profile is not None:
+                return profile
+        # Ids outside the naming convention still resolve, at full-load cost.
+        for module_name in self.module_names:
+            if module_name == owner:
+                continue
+            profile = self.profiles(module_name).get(profile_id)
+            if profile is not None:
+                return profile
+        return None
+
+    def profile_sources(self, order: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        return [self.profiles(module_name) for module_name in (order or self.module_names)]
+
+    def default_sources(self, order: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        return [self.defaults(module_name) for module_name in (order or self.module_names)]
+
+
+def profile_source_fingerprint() -> str:
+    """Digest of every registry source file; any edit invalidates a snapshot."""
+    digest = hashlib.sha256()
+    for registry_name in sorted(_REGISTRIES):
+        for path in sorted((_TYPE_PROFILES_DIR / registry_name).glob("*.py")):
+            digest.update(path.name.encode("utf-8"))
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def build_profile_snapshot(path: str) -> Dict[str, int]:
+    """Import every registry module and marshal their profiles to ``path``."""
+    _import_registry_packages()
+    registries: Dict[str, Dict[str, Any]] = {}
+    counts: Dict[str, int] = {}
+    for registry_name, registry in sorted(_REGISTRIES.items()):
+        sections = {}
+        for module_name in registry.module_names:
+            module = registry.module(module_name)
+            sections[module_name] = {
+                "profiles": getattr(module, registry.profiles_attr),
+                "defaults": getattr(module, registry.defaults_attr) if registry.defaults_attr else {},
+            }
+        registries[registry_name] = sections
+        counts[registry_name] = sum(len(section["profiles"]) for section in sections.values())
+
+    payload = marshal.dumps(
+        {
+            "format": SNAPSHOT_FORMAT_VERSION,
+            "fingerprint": profile_source_fingerprint(),
+            "registries": registries,
+        }
+    )
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = target.with_name(f".tmp-{target.name}")
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, target)
+    return counts
+
+
+def load_profile_snapshot(path: str) -> Optional[Dict[str, Any]]:
+    """Return the snapshot registries, or None when missing, stale or unreadable."""
+    try:
+        payload = marshal.loads(Path(path).read_bytes())
+    except (OSError, EOFError, ValueError, TypeError) as exc:
+        logger.warning("Ignoring profile snapshot %s: %s", path, exc)
+        return None
+    if not isinstance(payload, dict) or payload.get("format") != SNAPSHOT_FORMAT_VERSION:
+        logger.warning("Ignoring profile snapshot %s: unsupported format", path)
+        return None
+    _import_registry_packages()
+    if payload.get("fingerprint") != profile_source_fingerprint():
+        logger.warning("Ignoring profile snapshot %s: type profile sources changed", path)
+        return None
+    return payload.get("registries")
+
+
+def reset_profile_snapshot() -> None:
+    _snapshot_state["loaded"] = False
+    _snapshot_state["registries"] = None
+
+
+def _snapshot_section(registry_name: str, module_name: str) -> Optional[Dict[str, Any]]:
+    if not _snapshot_state["loaded"]:
+        _snapshot_state["loaded"] = True
+        path = os.getenv(PROFILE_SNAPSHOT_ENV, "").strip()
+        _snapshot_state["registries"] = load_profile_snapshot(path) if path else None
+    registries = _snapshot_state["registries"]
+    if not registries:
+        return None
+    return registries.get(registry_name, {}).get(module_name)
+
+
+def _import_registry_packages() -> None:
+    # Registries are created by their package __init__; the fingerprint and the
+    # snapshot builder need all three registered.
+    for registry_name in ("dealshield_content", "dealshield_tiles", "scope_items"):
+        import_module(f"{__package__}.{registry_name}")
@@ -1,44 +1,60 @@
-from . import civic
-from . import industrial
-from . import healthcare
-from . import hospitality
-from . import mixed_use
-from . import multifamily
-from . import office
-from . import parking
-from . import recreation
-from . import retail
-from . import restaurant
-
-CIVIC_SCOPE_ITEM_PROFILE_ALIASES = {
-    "civic_baseline_structural_v1": civic.SCOPE_ITEM_PROFILES["civic_library_structural_v1"],
+"""Scope-item profile registry (config-owned).
+
+Per-type modules load on first use; see ``profile_registry``. The aggregated
+``SCOPE_ITEM_PROFILE_SOURCES`` / ``SCOPE_ITEM_DEFAULT_SOURCES`` lists are still
+available and import every type the first time they are read.
+"""
+from importlib import import_module
+from typing import Any, Dict, Optional
+
+from app.v2.config.type_profiles.profile_registry import LazyProfileRegistry
+
+# Explicit aggregation for determinism (no filesystem scanning).
+_REGISTRY = LazyProfileRegistry(
+    __name__,
+    (
+        "civic",
+        "industrial",
+        "healthcare",
+        "hospitality",
+        "mixed_use",
+        "multifamily",
+        "office",
+        "parking",
+        "recreation",
+        "retail",
+        "restaurant",
+    ),
+    "SCOPE_ITEM_PROFILES",
+    "SCOPE_ITEM_DEFAULTS",
+)
+
+_CIVIC_ALIAS_TARGETS = {
+    "civic_baseline_structural_v1": "civic_library_structural_v1",
 }
 
-SCOPE_ITEM_PROFILE_SOURCES = [
-    CIVIC_SCOPE_ITEM_PROFILE_ALIASES,
-    civic.SCOPE_ITEM_PROFILES,
-    industrial.SCOPE_ITEM_PROFILES,
-    healthcare.SCOPE_ITEM_PROFILES,
-    hospitality.SCOPE_ITEM_PROFILES,
-    mixed_use.SCOPE_ITEM_PROFILES,
-    multifamily.SCOPE_ITEM_PROFILES,
-    office.SCOPE_ITEM_PROFILES,
-    parking.SCOPE_ITEM_PROFILES,
-    recreation.SCOPE_ITEM_PROFILES,
-    retail.SCOPE_ITEM_PROFILES,
-    restaurant.SCOPE_ITEM_PROFILES,
-]
-
-SCOPE_ITEM_DEFAULT_SOURCES = [
-    civic.SCOPE_ITEM_DEFAULTS,
-    industrial.SCOPE_ITEM_DEFAULTS,
-    healthcare.SCOPE_ITEM_DEFAULTS,
-    hospitality.SCOPE_ITEM_DEFAULTS,
-    mixed_use.SCOPE_ITEM_DEFAULTS,
-    multifamily.SCOPE_ITEM_DEFAULTS,
-    office.SCOPE_ITEM_DEFAULTS,
-    parking.SCOPE_ITEM_DEFAULTS,
-    recreation.SCOPE_ITEM_DEFAULTS,
-    retail.SCOPE_ITEM_DEFAULTS,
-    restaurant.SCOPE_ITEM_DEFAULTS,
-]
+
+def get_scope_item_profile(profile_id: str) -> Optional[Dict[str, Any]]:
+    """Resolve a shared scope-item profile, importing only its building type."""
+    alias_target = _CIVIC_ALIAS_TARGETS.get(profile_id)
+    if alias_target is not None:
+        return _REGISTRY.profiles("civic")[alias_target]
+    return _REGISTRY.find_profile(profile_id)
+
+
+def __getattr__(name):
+    if name in globals():
+        return globals()[name]
+    if name == "CIVIC_SCOPE_ITEM_PROFILE_ALIASES":
+        civic_profiles = _REGISTRY.profiles("civic")
+        value = {alias: civic_profiles[target] for alias, target in _CIVIC_ALIAS_TARGETS.items()}
+    elif name == "SCOPE_ITEM_PROFILE_SOURCES":
+        value = [__getattr__("CIVIC_SCOPE_ITEM_PROFILE_ALIASES"), *_REGISTRY.profile_sources()]
+    elif name == "SCOPE_ITEM_DEFAULT_SOURCES":
+        value = _REGISTRY.default_sources()
+    elif name in _REGISTRY.module_names:
+        return import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
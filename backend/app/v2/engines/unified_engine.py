@@ -5,7 +5,7 @@ clean_scope_engine.py, owner_view_engine.py, engine_selector.py
 """
 
 from datetime import datetime, date
-from app.config.regional_multipliers import resolve_location_context
+from app.config.regional_multipliers import lookup_location_context, resolve_location_context
 from app.v2.config.master_config import (
     MASTER_CONFIG,
     BuildingType,
@@ -38,7 +38,13 @@ from app.v2.services.special_feature_pricing import (
     serialize_applied_special_feature_pricing,
     serialize_resolved_special_feature_pricing_rule_preview,
 )
+from app.v2.services.construction_draws import apply_construction_draws
 from app.v2.services.construction_risk_drivers import build_construction_risk_drivers
+from app.v2.services.scope_item_columns import (
+    CompiledScopeItemProfile,
+    build_profile_systems,
+    compile_scope_item_profile,
+)
 from app.services.nlp_service import NLPService
 # from app.v2.services.financial_analyzer import FinancialAnalyzer  # TODO: Implement this
 from typing import Optional, Dict, Any, Iterable, List, Tuple
@@ -923,6 +929,8 @@ class UnifiedEngine:
         self.config = MASTER_CONFIG
         self.calculation_trace = []  # Track every calculation for debugging
         self._nlp_service = NLPService()
+        # (profile_id, building_type, id(overrides)) -> (source profile, overrides, compiled)
+        self._compiled_scope_item_profiles: Dict[Tuple[str, str, int], Tuple[Any, Any, CompiledScopeItemProfile]] = {}
         # self.financial_analyzer = FinancialAnalyzer()  # TODO: Add financial analyzer
         
     def calculate_project(self, 
@@ -2072,6 +2080,7 @@ class UnifiedEngine:
 
         if financing_assumptions:
             result['financing_assumptions'] = financing_assumptions
+        apply_construction_draws(result, (building_config.ownership_types or {}).get(ownership_type))
 
         profile_id = getattr(building_config, "dealshield_tile_profile", None)
         if isinstance(profile_id, str) and profile_id.strip():
@@ -4162,8 +4171,15 @@ class UnifiedEngine:
         )
 
     def _load_scope_item_profile(self, profile_id: str, building_type: BuildingType) -> Optional[Dict[str, Any]]:
+        profile = self._find_scope_item_profile(profile_id, building_type)
+        return deepcopy(profile) if profile is not None else None
+
+    def _find_scope_item_profile(self, profile_id: str, building_type: BuildingType) -> Optional[Dict[str, Any]]:
+        profile = scope_items.get_scope_item_profile(profile_id)
+        if isinstance(profile, dict):
+            return profile
+
         profile_sources: List[Dict[str, Dict[str, Any]]] = []
-        profile_sources.extend(scope_items.SCOPE_ITEM_PROFILE_SOURCES)
         if building_type == BuildingType.EDUCATIONAL:
             try:
                 from app.v2.config.type_profiles.scope_items import educational as educational_scope_items
@@ -4189,9 +4205,27 @@ class UnifiedEngine:
         for source in profile_sources:
             profile = source.get(profile_id)
             if isinstance(profile, dict):
-                return deepcopy(profile)
+                return profile
         return None
 
+    def _get_compiled_scope_item_profile(
+        self,
+        profile_id: str,
+        building_type: BuildingType,
+        profile_overrides: Optional[Dict[str, Any]],
+    ) -> Optional[CompiledScopeItemProfile]:
+        source = self._find_scope_item_profile(profile_id, building_type)
+        if source is None:
+            return None
+        cache_key = (profile_id, building_type.value, id(profile_overrides))
+        cached = self._compiled_scope_item_profiles.get(cache_key)
+        if cached is not None and cached[0] is source and cached[1] is profile_overrides:
+            return cached[2]
+        profile = self._apply_scope_item_overrides(deepcopy(source), profile_overrides)
+        compiled = compile_scope_item_profile(profile_id, profile)
+        self._compiled_scope_item_profiles[cache_key] = (source, profile_overrides, compiled)
+        return compiled
+
     def _resolve_scope_item_defaults(self, default_key: str) -> Dict[str, Any]:
         default_sources: List[Dict[str, Any]] = []
         default_sources.extend(scope_items.SCOPE_ITEM_DEFAULT_SOURCES)
@@ -4370,113 +4404,6 @@ class UnifiedEngine:
 
         return systems
 
-    def _build_scope_items_for_trade_profile(
-        self,
-        trade_profile: Dict[str, Any],
-        trades: Dict[str, float],
-        square_footage: float,
-        override_sources: List[Dict[str, Any]],
-        profile_id: str,
-    ) -> Optional[Dict[str, Any]]:
-        trade_key = str(trade_profile.get("trade_key") or "").strip().lower()
-        if not trade_key:
-            return None
-
-        trade_total = float(trades.get(trade_key, 0.0) or 0.0)
-        if trade_total <= 0:
-            return None
-
-        items = trade_profile.get("items")
-        if not isinstance(items, list) or not items:
-            return None
-
-        quantity_by_key: Dict[str, Any] = {}
-        ordered_items: List[Dict[str, Any]] = []
-        for item in items:
-            if not isinstance(item, dict):
-                continue
-            key = str(item.get("key") or "").strip()
-            if not key:
-                continue
-            quantity_rule = item.get("quantity_rule")
-            if not isinstance(quantity_rule, dict):
-                continue
-            quantity_by_key[key] = self._resolve_scope_item_quantity(
-                quantity_rule,
-                float(square_footage),
-                override_sources,
-                item_key=key,
-                profile_id=profile_id,
-            )
-            ordered_items.append(item)
-
-        share_by_key: Dict[str, float] = {}
-        for item in ordered_items:
-            allocation = item.get("allocation")
-            if not isinstance(allocation, dict):
-                continue
-            if allocation.get("type") != "share_of_trade":
-                continue
-            key = str(item.get("key") or "").strip()
-            share_by_key[key] = max(0.0, float(allocation.get("share", 0.0) or 0.0))
-
-        conditional_rescales = trade_profile.get("conditional_rescales")
-        if isinstance(conditional_rescales, list):
-            for rule in conditional_rescales:
-                if not isinstance(rule, dict):
-                    continue
-                trigger_key = str(rule.get("trigger_item_key") or "").strip()
-                if not trigger_key:
-                    continue
-                if float(quantity_by_key.get(trigger_key, 0.0) or 0.0) <= 0:
-                    continue
-                target_item_keys = rule.get("target_item_keys")
-                if not isinstance(target_item_keys, list) or not target_item_keys:
-                    continue
-                remaining_share = float(rule.get("remaining_share", 1.0) or 1.0)
-                target_total = sum(float(share_by_key.get(str(key), 0.0) or 0.0) for key in target_item_keys)
-                if target_total <= 0:
-                    continue
-                scale = remaining_share / target_total
-                for key in target_item_keys:
-                    key_name = str(key)
-                    if key_name in share_by_key:
-                        share_by_key[key_name] = share_by_key[key_name] * scale
-
-        systems: List[Dict[str, Any]] = []
-        for item in ordered_items:
-            key = str(item.get("key") or "").strip()
-            quantity = quantity_by_key.get(key, 0.0)
-            numeric_quantity = float(quantity or 0.0)
-            if item.get("omit_if_zero_quantity") and numeric_quantity <= 0:
-                continue
-
-            share = float(share_by_key.get(key, 0.0) or 0.0)
-            total_cost = trade_total * share
-            unit = str(item.get("unit") or "LS")
-            label = str(item.get("label") or key)
-
-            systems.append({
-                "name": label,
-                "quantity": quantity,
-                "unit": unit,
-                "unit_cost": self._safe_unit_cost(total_cost, numeric_quantity),
-                "total_cost": total_cost,
-            })
-
-        if not systems:
-            return None
-
-        systems = self._apply_healthcare_scope_depth_uplift(
-            profile_id=profile_id,
-            trade_key=trade_key,
-            systems=systems,
-            square_footage=square_footage,
-        )
-
-        trade_label = str(trade_profile.get("trade_label") or trade_key.replace("_", " ").title())
-        return {"trade": trade_label, "systems": systems}
-
     def _build_scope_items_from_profile(
         self,
         building_type: BuildingType,
@@ -4486,38 +4413,35 @@ class UnifiedEngine:
         scope_context: Optional[Dict[str, Any]],
         profile_overrides: Optional[Dict[str, Any]],
     ) -> List[Dict[str, Any]]:
-        profile = self._load_scope_item_profile(profile_id, building_type)
-        if not profile:
+        compiled_profile = self._get_compiled_scope_item_profile(profile_id, building_type, profile_overrides)
+        if compiled_profile is None:
             return []
 
-        profile = self._apply_scope_item_overrides(profile, profile_overrides)
         override_sources = self._collect_scope_override_sources(scope_context)
-        built_scope_items: List[Dict[str, Any]] = []
 
-        trade_profiles = profile.get("trade_profiles")
-        if isinstance(trade_profiles, list):
-            for trade_profile in trade_profiles:
-                if not isinstance(trade_profile, dict):
-                    continue
-                built = self._build_scope_items_for_trade_profile(
-                    trade_profile=trade_profile,
-                    trades=trades,
-                    square_footage=square_footage,
-                    override_sources=override_sources,
-                    profile_id=profile_id,
-                )
-                if built:
-                    built_scope_items.append(built)
-        else:
-            built = self._build_scope_items_for_trade_profile(
-                trade_profile=profile,
-                trades=trades,
-                square_footage=square_footage,
-                override_sources=override_sources,
+        def _resolve_dynamic_quantity(quantity_rule: Dict[str, Any], sf: float, item_key: str) -> Any:
+            return self._resolve_scope_item_quantity(
+                quantity_rule,
+                sf,
+                override_sources,
+                item_key=item_key,
+                profile_id=profile_id,
+            )
+
+        built_scope_items: List[Dict[str, Any]] = []
+        for trade, systems in build_profile_systems(
+            compiled_profile,
+            trades,
+            float(square_footage),
+            _resolve_dynamic_quantity,
+        ):
+            systems = self._apply_healthcare_scope_depth_uplift(
                 profile_id=profile_id,
+                trade_key=trade.trade_key,
+                systems=systems,
+                square_footage=square_footage,
             )
-            if built:
-                built_scope_items.append(built)
+            built_scope_items.append({"trade": trade.trade_label, "systems": systems})
 
         if not built_scope_items:
             return []
@@ -8439,7 +8363,7 @@ class UnifiedEngine:
         """
         Get market-specific rates based on location.
         """
-        context = resolve_location_context(location or "")
+        context = lookup_location_context(location)
         multiplier = context.get('market_factor', context.get('multiplier', 1.0))
         
         # Apply multiplier to default rate
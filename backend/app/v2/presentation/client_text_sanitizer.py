@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any, Dict
 
 _TILE_PATTERN = re.compile(r"\s*\(tile:\s*[^)]*\)", re.IGNORECASE)
@@ -12,8 +13,11 @@ _BANNED_LINE_PATTERNS = [
 ]
 _BANNED_KEY_PATTERN = re.compile(r"metric_refs_used", re.IGNORECASE)
 _EXTRA_SPACE_PATTERN = re.compile(r"\s{2,}")
+_MARGINAL_PATTERN = re.compile(r"\bMarginal\b", re.IGNORECASE)
+_NOT_FEASIBLE_PATTERN = re.compile(r"\bNot\s+Feasible\b", re.IGNORECASE)
 
 
+@lru_cache(maxsize=8192)
 def _sanitize_string(value: str) -> str:
     cleaned = _TILE_PATTERN.sub("", value)
 
@@ -24,8 +28,8 @@ def _sanitize_string(value: str) -> str:
         line = raw_line.replace("\t", " ").strip()
         if not line:
             continue
-        line = re.sub(r"\bMarginal\b", "Thin Cushion", line, flags=re.IGNORECASE)
-        line = re.sub(r"\bNot\s+Feasible\b", "Target Yield: Not Met", line, flags=re.IGNORECASE)
+        line = _MARGINAL_PATTERN.sub("Thin Cushion", line)
+        line = _NOT_FEASIBLE_PATTERN.sub("Target Yield: Not Met", line)
         line = _EXTRA_SPACE_PATTERN.sub(" ", line)
         lines.append(line)
 
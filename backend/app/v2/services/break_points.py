@@ -0,0 +1,177 @@
+"""Exact break points for DealShield collapse triggers.
+
+A collapse trigger (``value_gap_pct <= 6``, ``value_gap <= -1.5M`` ...) fires
+somewhere along a stress path: total cost, stabilized value, NOI and debt
+service moving in a straight line from a start state. That covers a driver
+tile scaled by a multiple of its configured shock as well as the segment from
+the base scenario row to a stressed one.
+
+Every metric here is a ratio of two quantities that are linear in that
+state, so ``metric <= threshold`` reduces to the sign of one linear function
+and the break point is a closed-form root. Metrics registered without a
+linear form are solved by bisection instead. Either way, all paths are
+solved in the same array pass.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Mapping, Optional, Sequence, Union
+
+import numpy as np
+
+BREAK_STATE_FIELDS = ("total_cost", "stabilized_value", "noi", "annual_debt_service")
+MAX_STRESS_MULTIPLE = 50.0
+BISECTION_STEPS = 60
+
+State = Mapping[str, np.ndarray]
+StateInput = Mapping[str, Union[float, Sequence[Optional[float]], np.ndarray, None]]
+
+
+@dataclass(frozen=True)
+class BreakMetric:
+    """``numerator / denominator`` over the stress state; ``denominator`` must stay positive."""
+
+    numerator: Callable[[State], np.ndarray]
+    denominator: Callable[[State], np.ndarray]
+    linear: bool = True
+
+    def evaluate(self, state: State) -> np.ndarray:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return self.numerator(state) / self.denominator(state)
+
+
+def _ones(state: State) -> np.ndarray:
+    return np.ones_like(state["total_cost"])
+
+
+BREAK_METRICS: Dict[str, BreakMetric] = {
+    "value_gap": BreakMetric(
+        numerator=lambda s: s["stabilized_value"] - s["total_cost"],
+        denominator=_ones,
+    ),
+    "value_gap_pct": BreakMetric(
+        numerator=lambda s: (s["stabilized_value"] - s["total_cost"]) * 100.0,
+        denominator=lambda s: s["total_cost"],
+    ),
+    "yield_on_cost_pct": BreakMetric(
+        numerator=lambda s: s["noi"] * 100.0,
+        denominator=lambda s: s["total_cost"],
+    ),
+    "dscr": BreakMetric(
+        numerator=lambda s: s["noi"],
+        denominator=lambda s: s["annual_debt_service"],
+    ),
+}
+
+_FIRES_WHEN_BELOW = {"<=": True, "<": True, ">=": False, ">": False}
+
+
+def supports_break_trigger(metric: str, operator: str) -> bool:
+    return metric in BREAK_METRICS and operator in _FIRES_WHEN_BELOW
+
+
+def _state(values: StateInput, size: int) -> Dict[str, np.ndarray]:
+    state: Dict[str, np.ndarray] = {}
+    for field_name in BREAK_STATE_FIELDS:
+        raw = values.get(field_name)
+        if raw is None:
+            state[field_name] = np.full(size, np.nan)
+            continue
+        array = np.asarray(raw, dtype=float)
+        if array.ndim == 0:
+            array = np.full(size, float(array))
+        state[field_name] = array
+    return state
+
+
+def _along(start: State, direction: State, stress: np.ndarray) -> Dict[str, np.ndarray]:
+    return {field_name: start[field_name] + stress * direction[field_name] for field_name in BREAK_STATE_FIELDS}
+
+
+def _gap(metric: BreakMetric, state: State, threshold: float, fires_when_below: bool) -> np.ndarray:
+    """Positive while the trigger is clear, zero or below once it fires."""
+    with np.errstate(invalid="ignore"):
+        gap = metric.numerator(state) - threshold * metric.denominator(state)
+    return gap if fires_when_below else -gap
+
+
+def _fires(metric: BreakMetric, state: State, threshold: float, operator: str) -> np.ndarray:
+    observed = metric.evaluate(state)
+    with np.errstate(invalid="ignore"):
+        if operator == "<=":
+            return observed <= threshold
+        if operator == "<":
+            return observed < threshold
+        if operator == ">=":
+            return observed >= threshold
+        return observed > threshold
+
+
+def solve_break_stress(
+    metric_name: str,
+    operator: str,
+    threshold: float,
+    start: StateInput,
+    direction: StateInput,
+    size: int,
+    max_stress: float = MAX_STRESS_MULTIPLE,
+) -> np.ndarray:
+    """Smallest stress ``t`` in ``[0, max_stress]`` at which the trigger fires, per path.
+
+    The state at stress ``t`` is ``start + t * direction``. Paths that never
+    reach the threshold, or lack a state field the metric needs, return NaN.
+    """
+    if not supports_break_trigger(metric_name, operator):
+        raise ValueError(f"Unsupported break trigger '{metric_name} {operator}'")
+    metric = BREAK_METRICS[metric_name]
+    start_state = _state(start, size)
+    direction_state = _state(direction, size)
+    return (
+        _solve_linear(metric, threshold, operator, start_state, direction_state, max_stress)
+        if metric.linear
+        else _solve_bisection(metric, threshold, operator, start_state, direction_state, max_stress)
+    )
+
+
+def _solve_linear(
+    metric: BreakMetric,
+    threshold: float,
+    operator: str,
+    start: State,
+    direction: State,
+    max_stress: float,
+) -> np.ndarray:
+    fires_when_below = _FIRES_WHEN_BELOW[operator]
+    gap_at_start = _gap(metric, start, threshold, fires_when_below)
+    gap_at_one = _gap(metric, _along(start, direction, np.ones_like(gap_at_start)), threshold, fires_when_below)
+    slope = gap_at_one - gap_at_start
+    with np.errstate(divide="ignore", invalid="ignore"):
+        root = np.where(slope < 0, -gap_at_start / slope, np.nan)
+        stress = np.where(gap_at_start <= 0, 0.0, root)
+        return np.where(stress <= max_stress, stress, np.nan)
+
+
+def _solve_bisection(
+    metric: BreakMetric,
+    threshold: float,
+    operator: str,
+    start: State,
+    direction: State,
+    max_stress: float,
+) -> np.ndarray:
+    size = start["total_cost"].shape[0]
+    low = np.zeros(size)
+    high = np.full(size, max_stress)
+    fires_at_start = _fires(metric, start, threshold, operator)
+    fires_at_max = _fires(metric, _along(start, direction, high), threshold, operator)
+    for _ in range(BISECTION_STEPS):
+        middle = (low + high) * 0.5
+        fired = _fires(metric, _along(start, direction, middle), threshold, operator)
+        high = np.where(fired, middle, high)
+        low = np.where(fired, low, middle)
+    return np.where(fires_at_start, 0.0, np.where(fires_at_max, high, np.nan))
+
+
+def break_stress_values(stress: np.ndarray) -> list:
+    """``solve_break_stress`` output as floats, with unreachable paths as ``None``."""
+    return [float(value) if np.isfinite(value) else None for value in stress]
@@ -0,0 +1,393 @@
+"""Comparable projects from the org's stored projects and an optional reference set.
+
+Each project is reduced to a feature row: building type and subtype
+(categorical), log square footage, regional cost multiplier, finish level
+factor and log cost/SF. A ``ComparableIndex`` keeps those rows in one NumPy
+matrix, so a top-k query is a single weighted distance pass plus an
+``argpartition``. Projects of another building type are never comparable, and
+a different subtype adds a fixed penalty.
+
+``ComparablesRegistry`` holds one index per org, built from the
+``project_summaries`` columns on first use (no stored payload is parsed) and
+then kept current by the write paths
+(``record_project_write`` / ``record_project_delete``). Indexes are rebuilt
+after ``INDEX_MAX_AGE_SECONDS`` so writes from other workers and offline jobs
+(re-pricing, imports) show up without a restart.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import math
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.db.models import Project, ProjectSummary
+from app.v2.config.master_config import get_finish_cost_factor
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOP_K = 5
+MAX_TOP_K = 25
+INDEX_MAX_AGE_SECONDS = 900.0
+SOURCE_PORTFOLIO = "portfolio"
+SOURCE_REFERENCE = "reference"
+
+FEATURE_NAMES = ("log_square_footage", "regional_multiplier", "finish_factor", "log_cost_per_sf")
+# Per-feature scale for the weighted Euclidean distance: doubling the size
+# (~0.69 in log SF) weighs about as much as a 0.14 regional multiplier gap
+# or a one-step finish change.
+FEATURE_WEIGHTS = np.array([1.0, 5.0, 3.0, 2.0])
+SUBTYPE_MISMATCH_PENALTY = 0.5
+
+_INITIAL_CAPACITY = 64
+
+
+def _as_dict(value: Any) -> Dict[str, Any]:
+    return value if isinstance(value, dict) else {}
+
+
+def _positive(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    number = float(value)
+    return number if math.isfinite(number) and number > 0 else None
+
+
+def _label(value: Any) -> Optional[str]:
+    return value.strip().lower() if isinstance(value, str) and value.strip() else None
+
+
+@dataclass(frozen=True)
+class ComparableRecord:
+    project_id: str
+    name: str
+    building_type: str
+    subtype: Optional[str]
+    square_footage: float
+    cost_per_sf: float
+    regional_multiplier: float = 1.0
+    finish_level: str = "standard"
+    location: Optional[str] = None
+    source: str = SOURCE_PORTFOLIO
+
+    def features(self) -> Tuple[float, float, float, float]:
+        return (
+            math.log(self.square_footage),
+            self.regional_multiplier,
+            get_finish_cost_factor(self.finish_level),
+            math.log(self.cost_per_sf),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def comparable_record(
+    project_id: str,
+    name: Optional[str],
+    payload: Mapping[str, Any],
+    source: str = SOURCE_PORTFOLIO,
+) -> Optional[ComparableRecord]:
+    """Feature record for a calculation payload; None when it lacks type, size or cost."""
+    payload = payload if isinstance(payload, Mapping) else {}
+    project_info = _as_dict(payload.get("project_info"))
+    totals = _as_dict(payload.get("totals"))
+    regional = _as_dict(payload.get("regional"))
+
+    building_type = _label(project_info.get("building_type"))
+    square_footage = _positive(project_info.get("square_footage"))
+    cost_per_sf = _positive(totals.get("cost_per_sf"))
+    if cost_per_sf is None and square_footage:
+        total_cost = _positive(totals.get("total_project_cost"))
+        cost_per_sf = total_cost / square_footage if total_cost else None
+    if not project_id or building_type is None or square_footage is None or cost_per_sf is None:
+        return None
+
+    return ComparableRecord(
+        project_id=str(project_id),
+        name=name or str(project_id),
+        building_type=building_type,
+        subtype=_label(project_info.get("subtype")),
+        square_footage=square_footage,
+        cost_per_sf=cost_per_sf,
+        regional_multiplier=_positive(regional.get("multiplier")) or 1.0,
+        finish_level=_label(project_info.get("finish_level")) or "standard",
+        location=project_info.get("location") or regional.get("location_display"),
+        source=source,
+    )
+
+
+class ComparableIndex:
+    """Nearest-neighbor index over comparable records with in-place upserts and removals."""
+
+    def __init__(self, records: Iterable[ComparableRecord] = ()):
+        self._lock = threading.Lock()
+        self._records: List[ComparableRecord] = []
+        self._rows: Dict[str, int] = {}
+        self._codes: Dict[Optional[str], int] = {}
+        self._vectors = np.empty((_INITIAL_CAPACITY, len(FEATURE_NAMES)))
+        self._type_codes = np.empty(_INITIAL_CAPACITY, dtype=np.int64)
+        self._subtype_codes = np.empty(_INITIAL_CAPACITY, dtype=np.int64)
+        for record in records:
+            self.upsert(record)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, project_id: object) -> bool:
+        return project_id in self._rows
+
+    def _code(self, label: Optional[str]) -> int:
+        return self._codes.setdefault(label, len(self._codes))
+
+    def _grow(self) -> None:
+        capacity = self._vectors.shape[0] * 2
+        self._vectors = np.resize(self._vectors, (capacity, len(FEATURE_NAMES)))
+        self._type_codes = np.resize(self._type_codes, capacity)
+        self._subtype_codes = np.resize(self._subtype_codes, capacity)
+
+    def upsert(self, record: ComparableRecord) -> None:
+        with self._lock:
+            row = self._rows.get(record.project_id)
+            if row is None:
+                row = len(self._records)
+                if row == self._vectors.shape[0]:
+                    self._grow()
+                self._records.append(record)
+                self._rows[record.project_id] = row
+            else:
+                self._records[row] = record
+            self._vectors[row] = record.features()
+            self._type_codes[row] = self._code(record.building_type)
+            self._subtype_codes[row] = self._code(record.subtype)
+
+    def remove(self, project_id: str) -> bool:
+        with self._lock:
+            row = self._rows.pop(project_id, None)
+            if row is None:
+                return False
+            # Move the last row into the gap so the live rows stay contiguous.
+            last = len(self._records) - 1
+            if row != last:
+                moved = self._records[last]
+                self._records[row] = moved
+                self._rows[moved.project_id] = row
+                self._vectors[row] = self._vectors[last]
+                self._type_codes[row] = self._type_codes[last]
+                self._subtype_codes[row] = self._subtype_codes[last]
+            self._records.pop()
+            return True
+
+    def query(
+        self,
+        target: ComparableRecord,
+        k: int = DEFAULT_TOP_K,
+        exclude_project_id: Optional[str] = None,
+    ) -> List[Tuple[float, ComparableRecord]]:
+        """The ``k`` nearest records of the target's building type, nearest first."""
+        with self._lock:
+            count = len(self._records)
+            type_code = self._codes.get(target.building_type)
+            if not count or type_code is None or k <= 0:
+                return []
+            diff = (self._vectors[:count] - np.asarray(target.features())) * FEATURE_WEIGHTS
+            distances = np.einsum("ij,ij->i", diff, diff)
+            subtype_code = self._codes.get(target.subtype, -1)
+            distances += SUBTYPE_MISMATCH_PENALTY * (self._subtype_codes[:count] != subtype_code)
+            distances[self._type_codes[:count] != type_code] = np.inf
+            excluded = self._rows.get(exclude_project_id) if exclude_project_id else None
+            if excluded is not None:
+                distances[excluded] = np.inf
+
+            candidates = np.flatnonzero(np.isfinite(distances))
+            k = min(k, candidates.size)
+            if k == 0:
+                return []
+            nearest = candidates[np.argpartition(distances[candidates], k - 1)[:k]]
+            nearest = nearest[np.argsort(distances[nearest], kind="stable")]
+            return [(float(np.sqrt(distances[row])), self._records[row]) for row in nearest]
+
+
+def load_org_records(db: Session, org_id: str) -> List[ComparableRecord]:
+    """Records for every summarized project in ``org_id``, read from ``project_summaries`` columns."""
+    rows = (
+        db.query(
+            ProjectSummary.project_id,
+            Project.name,
+            Project.location,
+            ProjectSummary.building_type,
+            ProjectSummary.subtype,
+            ProjectSummary.square_footage,
+            ProjectSummary.cost_per_sf,
+            ProjectSummary.total_cost,
+            ProjectSummary.regional_multiplier,
+            ProjectSummary.finish_level,
+        )
+        .join(Project, Project.project_id == ProjectSummary.project_id)
+        .filter(ProjectSummary.org_id == org_id)
+        .yield_per(500)
+    )
+    records = []
+    for (
+        project_id,
+        name,
+        location,
+        building_type,
+        subtype,
+        square_footage,
+        cost_per_sf,
+        total_cost,
+        regional_multiplier,
+        finish_level,
+    ) in rows:
+        payload = {
+            "project_info": {
+                "building_type": building_type,
+                "subtype": subtype,
+                "square_footage": square_footage,
+                "finish_level": finish_level,
+                "location": location,
+            },
+            "totals": {"cost_per_sf": cost_per_sf, "total_project_cost": total_cost},
+            "regional": {"multiplier": regional_multiplier},
+        }
+        record = comparable_record(project_id, name, payload)
+        if record is not None:
+            records.append(record)
+    return records
+
+
+def load_reference_records(path: Optional[str]) -> List[ComparableRecord]:
+    """Reference records from a JSON list of ``ComparableRecord`` fields; empty without a path."""
+    if not path:
+        return []
+    try:
+        entries = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError) as exc:
+        logger.warning("Comparables reference set %s not loaded: %s", path, exc)
+        return []
+
+    records = []
+    for entry in entries if isinstance(entries, list) else []:
+        entry = _as_dict(entry)
+        project_id = entry.get("project_id")
+        payload = {
+            "project_info": {
+                "building_type": entry.get("building_type"),
+                "subtype": entry.get("subtype"),
+                "square_footage": entry.get("square_footage"),
+                "finish_level": entry.get("finish_level"),
+                "location": entry.get("location"),
+            },
+            "totals": {"cost_per_sf": entry.get("cost_per_sf")},
+            "regional": {"multiplier": entry.get("regional_multiplier")},
+        }
+        record = comparable_record(project_id, entry.get("name"), payload, source=SOURCE_REFERENCE)
+        if record is not None:
+            records.append(record)
+    return records
+
+
+class ComparablesRegistry:
+    """Per-org comparable indexes plus the shared reference index."""
+
+    def __init__(
+        self,
+        reference_path: Optional[str] = None,
+        max_age_seconds: float = INDEX_MAX_AGE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._reference_path = reference_path
+        self._max_age_seconds = max_age_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._org_indexes: Dict[str, Tuple[float, ComparableIndex]] = {}
+        self._reference: Optional[ComparableIndex] = None
+
+    def reference_index(self) -> ComparableIndex:
+        with self._lock:
+            if self._reference is None:
+                self._reference = ComparableIndex(load_reference_records(self._reference_path))
+            return self._reference
+
+    def org_index(self, db: Session, org_id: str) -> ComparableIndex:
+        with self._lock:
+            entry = self._org_indexes.get(org_id)
+        if entry is not None and self._clock() - entry[0] < self._max_age_seconds:
+            return entry[1]
+        built_at = self._clock()
+        index = ComparableIndex(load_org_records(db, org_id))
+        with self._lock:
+            self._org_indexes[org_id] = (built_at, index)
+        return index
+
+    def _built_index(self, org_id: Optional[str]) -> Optional[ComparableIndex]:
+        with self._lock:
+            entry = self._org_indexes.get(org_id) if org_id else None
+        return entry[1] if entry is not None else None
+
+    def record_project_write(
+        self,
+        org_id: Optional[str],
+        project_id: str,
+        name: Optional[str],
+        payload: Mapping[str, Any],
+    ) -> None:
+        """Refresh one project in its org's index; orgs without a built index are left to build lazily."""
+        index = self._built_index(org_id)
+        if index is None:
+            return
+        record = comparable_record(project_id, name, payload)
+        if record is None:
+            index.remove(project_id)
+        else:
+            index.upsert(record)
+
+    def record_project_delete(self, org_id: Optional[str], project_id: str) -> None:
+        index = self._built_index(org_id)
+        if index is not None:
+            index.remove(project_id)
+
+    def similar_projects(
+        self,
+        db: Session,
+        org_id: Optional[str],
+        project_id: str,
+        name: Optional[str],
+        payload: Mapping[str, Any],
+        k: int = DEFAULT_TOP_K,
+    ) -> List[Dict[str, Any]]:
+        """Top-k comparables for a project across its org and the reference set, nearest first."""
+        target = comparable_record(project_id, name, payload)
+        if target is None:
+            return []
+        k = max(0, min(int(k), MAX_TOP_K))
+        matches = self.reference_index().query(target, k)
+        if org_id:
+            matches += self.org_index(db, org_id).query(target, k, exclude_project_id=project_id)
+        matches.sort(key=lambda match: match[0])
+        return [
+            {**record.to_dict(), "distance": round(distance, 4)}
+            for distance, record in matches[:k]
+        ]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._org_indexes.clear()
+            self._reference = None
+
+
+def _default_registry() -> ComparablesRegistry:
+    from app.core.config import settings
+
+    return ComparablesRegistry(reference_path=settings.comparables_reference_path)
+
+
+comparables_registry = _default_registry()
@@ -0,0 +1,287 @@
+"""Construction draw schedule and interest carry from the construction schedule.
+
+Hard costs follow an S-curve inside every schedule phase, weighted by the
+phase's length; soft costs are partly funded at closing (design, permits,
+fees) and the rest rides the hard-cost curve. Draws are funded equity first,
+then from the construction loan, whose monthly interest is capitalized and
+carried by an interest reserve sized to cover it. The loan commitment is the
+debt share of cost plus that reserve, so the balance never exceeds it.
+
+The per-schedule curves are cached, so re-running the draws for every
+DealShield scenario only rescales them and walks the loan balance once.
+Only the calculation payload stores the month-by-month table; DealShield
+scenarios keep the summary, and their monthly draws are rebuilt from the
+cached curves when the pro forma needs them.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+MONTHS_PER_YEAR = 12
+DEFAULT_CONSTRUCTION_MONTHS = 18
+SOFT_COST_UPFRONT_SHARE = 0.35
+
+_PhaseKey = Tuple[Tuple[int, int], ...]
+
+
+def _as_dict(value: Any) -> Dict[str, Any]:
+    return value if isinstance(value, dict) else {}
+
+
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    number = float(value)
+    return number if math.isfinite(number) else None
+
+
+def _s_curve(fraction: float) -> float:
+    """Cumulative share of a phase's spend after ``fraction`` of its duration."""
+    fraction = min(1.0, max(0.0, fraction))
+    return fraction * fraction * (3.0 - 2.0 * fraction)
+
+
+@dataclass(frozen=True)
+class DrawCurves:
+    """Monthly shares of hard and soft cost for one schedule; each sums to 1."""
+
+    hard: Tuple[float, ...]
+    soft: Tuple[float, ...]
+
+    @property
+    def months(self) -> int:
+        return len(self.hard)
+
+
+@lru_cache(maxsize=256)
+def _draw_curves(total_months: int, phases: _PhaseKey) -> DrawCurves:
+    hard = [0.0] * total_months
+    for start, duration in phases:
+        start = min(max(0, start), total_months - 1)
+        duration = max(1, min(duration, total_months - start))
+        # Longer phases carry proportionally more of the hard cost.
+        for offset in range(duration):
+            hard[start + offset] += duration * (
+                _s_curve((offset + 1) / duration) - _s_curve(offset / duration)
+            )
+
+    total_weight = sum(hard)
+    if total_weight <= 0:
+        hard = [_s_curve((month + 1) / total_months) - _s_curve(month / total_months) for month in range(total_months)]
+        total_weight = 1.0
+    hard_shares = tuple(weight / total_weight for weight in hard)
+
+    soft_shares = [share * (1 - SOFT_COST_UPFRONT_SHARE) for share in hard_shares]
+    soft_shares[0] += SOFT_COST_UPFRONT_SHARE
+    return DrawCurves(hard=hard_shares, soft=tuple(soft_shares))
+
+
+def draw_curves(schedule: Optional[Mapping[str, Any]]) -> DrawCurves:
+    """Hard and soft draw curves for a ``construction_schedule`` payload block."""
+    schedule = schedule or {}
+    total_months = _number(schedule.get("total_months"))
+    months = int(total_months) if total_months and total_months > 0 else DEFAULT_CONSTRUCTION_MONTHS
+    phases = []
+    for phase in schedule.get("phases") or []:
+        if not isinstance(phase, Mapping):
+            continue
+        duration = _number(phase.get("duration_months", phase.get("duration")))
+        if duration and duration > 0:
+            phases.append((int(_number(phase.get("start_month")) or 0), int(duration)))
+    return _draw_curves(months, tuple(phases))
+
+
+@dataclass
+class DrawSchedule:
+    hard_cost_draws: List[float]
+    soft_cost_draws: List[float]
+    equity_draws: List[float]
+    loan_draws: List[float]
+    interest: List[float]
+    loan_balance: List[float]
+    loan_commitment: float
+    annual_rate: float
+
+    @property
+    def capitalized_interest(self) -> float:
+        return sum(self.interest)
+
+    @property
+    def peak_loan_balance(self) -> float:
+        return max(self.loan_balance, default=0.0)
+
+    def monthly_draws(self) -> List[float]:
+        return [hard + soft for hard, soft in zip(self.hard_cost_draws, self.soft_cost_draws)]
+
+    def to_dict(self, include_months: bool = True) -> Dict[str, Any]:
+        summary = {
+            "total_months": len(self.hard_cost_draws),
+            "loan_commitment": round(self.loan_commitment, 2),
+            "interest_rate": self.annual_rate,
+            "capitalized_interest": round(self.capitalized_interest, 2),
+            "interest_reserve": round(self.capitalized_interest, 2),
+            "peak_loan_balance": round(self.peak_loan_balance, 2),
+        }
+        if not include_months:
+            return summary
+        summary["months"] = [
+            {
+                "month": month,
+                "hard_cost": round(hard, 2),
+                "soft_cost": round(soft, 2),
+                "equity": round(equity, 2),
+                "loan_draw": round(loan, 2),
+                "interest": round(interest, 2),
+                "loan_balance": round(balance, 2),
+            }
+            for month, (hard, soft, equity, loan, interest, balance) in enumerate(
+                zip(
+                    self.hard_cost_draws,
+                    self.soft_cost_draws,
+                    self.equity_draws,
+                    self.loan_draws,
+                    self.interest,
+                    self.loan_balance,
+                )
+            )
+        ]
+        return summary
+
+
+def build_draw_schedule(
+    curves: DrawCurves,
+    hard_costs: float,
+    soft_costs: float,
+    debt_ratio: float = 0.0,
+    annual_rate: float = 0.0,
+) -> DrawSchedule:
+    """Spread costs over the curves and carry the construction loan month by month."""
+    hard_draws = [hard_costs * share for share in curves.hard]
+    soft_draws = [soft_costs * share for share in curves.soft]
+    debt_ratio = min(1.0, max(0.0, debt_ratio))
+    cost_commitment = (hard_costs + soft_costs) * debt_ratio
+    equity_remaining = (hard_costs + soft_costs) - cost_commitment
+    monthly_rate = max(0.0, annual_rate) / MONTHS_PER_YEAR
+
+    equity_draws: List[float] = []
+    loan_draws: List[float] = []
+    interest: List[float] = []
+    balances: List[float] = []
+    balance = 0.0
+    for hard, soft in zip(hard_draws, soft_draws):
+        month_interest = balance * monthly_rate
+        need = hard + soft
+        equity = min(need, max(0.0, equity_remaining))
+        equity_remaining -= equity
+        loan = need - equity
+        balance += loan + month_interest
+        equity_draws.append(equity)
+        loan_draws.append(loan)
+        interest.append(month_interest)
+        balances.append(balance)
+
+    # Interest accrues only on the cost draws, so the reserve that carries it
+    # is known once the walk is done and the commitment funds both.
+    loan_commitment = cost_commitment + sum(interest)
+    return DrawSchedule(
+        hard_cost_draws=hard_draws,
+        soft_cost_draws=soft_draws,
+        equity_draws=equity_draws,
+        loan_draws=loan_draws,
+        interest=interest,
+        loan_balance=balances,
+        loan_commitment=loan_commitment,
+        annual_rate=annual_rate,
+    )
+
+
+def _cost_split(totals: Mapping[str, Any]) -> Optional[Tuple[float, float, float]]:
+    """(hard, soft, total) from a ``totals`` block, with hard cost absorbing any gap to the total."""
+    hard_costs = _number(totals.get("hard_costs"))
+    soft_costs = _number(totals.get("soft_costs"))
+    total_cost = _number(totals.get("total_project_cost"))
+    if hard_costs is None or soft_costs is None or total_cost is None:
+        return None
+    if total_cost != hard_costs + soft_costs:
+        # Anchors and scenario deltas move the total without a hard/soft split;
+        # treat the difference as hard cost so the draws add up to the total.
+        hard_costs = total_cost - soft_costs
+    return hard_costs, soft_costs, total_cost
+
+
+def apply_construction_draws(
+    payload: Dict[str, Any],
+    financing_terms: Any = None,
+    include_months: bool = True,
+) -> Optional[DrawSchedule]:
+    """Recompute the draw schedule for ``payload`` and fold its interest carry into the totals.
+
+    Writes ``construction_draw_schedule``, ``totals.capitalized_interest`` and
+    ``totals.total_capitalized_cost``, and adds the construction loan figures to
+    ``financing_assumptions`` when the payload has one. ``total_project_cost``
+    itself is left unchanged. With ``include_months=False`` the schedule block
+    holds only the summary figures.
+    """
+    totals = payload.get("totals")
+    if not isinstance(totals, dict):
+        return None
+    split = _cost_split(totals)
+    if split is None:
+        return None
+    hard_costs, soft_costs, total_cost = split
+
+    debt_ratio = _number(getattr(financing_terms, "debt_ratio", None)) or 0.0
+    annual_rate = _number(getattr(financing_terms, "debt_rate", None)) or 0.0
+    schedule = build_draw_schedule(
+        draw_curves(_as_dict(payload.get("construction_schedule"))),
+        hard_costs,
+        soft_costs,
+        debt_ratio=debt_ratio,
+        annual_rate=annual_rate,
+    )
+
+    summary = schedule.to_dict(include_months=include_months)
+    payload["construction_draw_schedule"] = summary
+    totals["capitalized_interest"] = summary["capitalized_interest"]
+    totals["total_capitalized_cost"] = round(total_cost + schedule.capitalized_interest, 2)
+    financing = payload.get("financing_assumptions")
+    if isinstance(financing, dict):
+        financing["construction_loan_commitment"] = summary["loan_commitment"]
+        financing["capitalized_interest"] = summary["capitalized_interest"]
+        financing["interest_reserve"] = summary["interest_reserve"]
+        financing["peak_construction_loan_balance"] = summary["peak_loan_balance"]
+    return schedule
+
+
+def monthly_cost_draws(payload: Mapping[str, Any]) -> Optional[Sequence[float]]:
+    """Total monthly cost draws for a payload that has a draw schedule.
+
+    Read from the stored months table when there is one, otherwise rebuilt
+    from the schedule curves and the payload's totals (DealShield scenarios).
+    """
+    draw_schedule = payload.get("construction_draw_schedule")
+    if not isinstance(draw_schedule, dict):
+        return None
+    months = draw_schedule.get("months")
+    if months is None:
+        split = _cost_split(_as_dict(payload.get("totals")))
+        if split is None:
+            return None
+        hard_costs, soft_costs, _ = split
+        curves = draw_curves(_as_dict(payload.get("construction_schedule")))
+        return [hard_costs * hard + soft_costs * soft for hard, soft in zip(curves.hard, curves.soft)]
+    if not isinstance(months, list) or not months:
+        return None
+    draws = []
+    for row in months:
+        row = _as_dict(row)
+        hard = _number(row.get("hard_cost"))
+        soft = _number(row.get("soft_cost"))
+        if hard is None or soft is None:
+            return None
+        draws.append(hard + soft)
+    return draws
@@ -0,0 +1,94 @@
+"""Non-persisting DealShield controls previews.
+
+Moving the stress band or toggling an anchor only changes ``dealshield_controls``;
+the stored calculation payload, building config and tile profile stay the same.
+A preview base holds those per-project inputs (with the stored scenario
+snapshots dropped), so each preview only rebuilds the scenario ownership
+bundles and the decision table for the requested controls. Nothing is written
+back; saving still goes through the controls endpoint.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, Mapping, Optional
+
+from app.v2.services.dealshield_scenarios import build_dealshield_scenarios
+from app.v2.services.dealshield_service import build_dealshield_view_model
+from app.v2.services.monthly_pro_forma import build_dealshield_pro_forma
+
+MAX_CACHED_PREVIEW_BASES = 256
+
+
+@dataclass(frozen=True)
+class DealShieldPreviewBase:
+    project_id: str
+    payload: Mapping[str, Any]
+    building_config: Any
+    profile: Dict[str, Any]
+
+
+def build_preview_base(
+    project_id: str,
+    payload: Mapping[str, Any],
+    building_config: Any,
+    profile: Dict[str, Any],
+) -> DealShieldPreviewBase:
+    """Snapshot the inputs a preview needs; stored scenarios are rebuilt per preview."""
+    return DealShieldPreviewBase(
+        project_id=project_id,
+        payload={key: value for key, value in payload.items() if key != "dealshield_scenarios"},
+        building_config=building_config,
+        profile=profile,
+    )
+
+
+def preview_dealshield_controls(
+    base: DealShieldPreviewBase,
+    controls: Dict[str, Any],
+    engine: Any,
+) -> Dict[str, Any]:
+    """DealShield view model for ``controls`` on top of ``base``; ``base`` is not modified."""
+    # build_dealshield_scenarios deep-copies what it changes, so a shallow
+    # overlay keeps the cached base intact.
+    payload = dict(base.payload)
+    payload["dealshield_controls"] = dict(controls)
+    payload["dealshield_scenarios"] = build_dealshield_scenarios(payload, base.building_config, engine)
+    view_model = build_dealshield_view_model(base.project_id, payload, base.profile)
+    # Same shape as the saved view, which adds the pro forma at the route.
+    view_model["pro_forma"] = build_dealshield_pro_forma(payload["dealshield_scenarios"], engine)
+    return view_model
+
+
+class DealShieldPreviewCache:
+    """Bounded LRU of preview bases keyed by project and stored payload version."""
+
+    def __init__(self, max_entries: int = MAX_CACHED_PREVIEW_BASES):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, DealShieldPreviewBase]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[DealShieldPreviewBase]:
+        with self._lock:
+            base = self._entries.get(key)
+            if base is not None:
+                self._entries.move_to_end(key)
+            return base
+
+    def put(self, key: Hashable, base: DealShieldPreviewBase) -> None:
+        with self._lock:
+            self._entries[key] = base
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+dealshield_preview_cache = DealShieldPreviewCache()
@@ -8,6 +8,8 @@ from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 from app.core.building_taxonomy import validate_building_type
 from app.v2.config.master_config import OwnershipType, BuildingType, MASTER_CONFIG
 from app.v2.config.type_profiles.dealshield_tiles import get_dealshield_profile
+from app.v2.services.construction_draws import apply_construction_draws
+from app.v2.services.monthly_pro_forma import apply_pro_forma_metrics
 
 
 WAVE1_PROFILES: Set[str] = {
@@ -73,7 +75,6 @@ WAVE1_PROFILES: Set[str] = {
 
 _ALLOWED_STRESS_BAND_PCTS: Set[int] = {10, 7, 5, 3}
 _COLD_STORAGE_UGLY_COMMISSIONING_DELAY_MONTHS = 3
-_MONTHS_PER_YEAR = 12.0
 
 
 class DealShieldScenarioError(ValueError):
@@ -359,14 +360,6 @@ def _driver_entry(
     return entry
 
 
-def _cold_storage_ugly_ramp_factor(commissioning_delay_months: int) -> float:
-    if commissioning_delay_months <= 0:
-        return 1.0
-    if commissioning_delay_months >= int(_MONTHS_PER_YEAR):
-        return 0.0
-    return (_MONTHS_PER_YEAR - float(commissioning_delay_months)) / _MONTHS_PER_YEAR
-
-
 def _build_calculation_context(
     payload: Dict[str, Any],
     scenario_id: str,
@@ -518,8 +511,10 @@ def build_dealshield_scenarios(
             "plus_tiles": plus_tiles,
         })
 
-    base_snapshot = copy.deepcopy(base_payload)
-    base_snapshot.pop("dealshield_scenarios", None)
+    # Previously stored scenarios are several times the size of the payload
+    # itself; leave them out before each scenario's deep copy.
+    scenario_source = {key: value for key, value in base_payload.items() if key != "dealshield_scenarios"}
+    base_snapshot = copy.deepcopy(scenario_source)
 
     scenario_inputs: Dict[str, Any] = {}
 
@@ -543,6 +538,8 @@ def build_dealshield_scenarios(
         calculation_context=calculation_context,
     )
     _apply_financial_bundle(base_snapshot, bundle)
+    financing_terms = (getattr(building_config, "ownership_types", None) or {}).get(ownership_type)
+    apply_construction_draws(base_snapshot, financing_terms, include_months=False)
 
     _assert_tile_metrics(base_snapshot, tile_metric_refs, "base")
     scenarios: Dict[str, Dict[str, Any]] = {"base": base_snapshot}
@@ -573,8 +570,7 @@ def build_dealshield_scenarios(
 
     for scenario in scenario_defs:
         scenario_id = scenario["scenario_id"]
-        scenario_payload = copy.deepcopy(base_payload)
-        scenario_payload.pop("dealshield_scenarios", None)
+        scenario_payload = copy.deepcopy(scenario_source)
 
         cost_transforms: List[Dict[str, Any]] = []
         revenue_transforms: List[Dict[str, Any]] = []
@@ -585,8 +581,6 @@ def build_dealshield_scenarios(
         driver_entries: List[Dict[str, Any]] = []
         applied_lever_labels: List[str] = []
         levers: List[str] = []
-        commissioning_delay_months: Optional[int] = None
-        ramp_factor: Optional[float] = None
 
         for tile_id in applied_tile_ids:
             tile = tile_by_id.get(tile_id)
@@ -655,13 +649,13 @@ def build_dealshield_scenarios(
             },
         }
         if profile_id == "industrial_cold_storage_v1" and scenario_id == "ugly":
+            # The delay is timed in the monthly pro forma, which sets this
+            # scenario's IRR, NPV and DSCR; stabilized revenue is unchanged.
             commissioning_delay_months = _COLD_STORAGE_UGLY_COMMISSIONING_DELAY_MONTHS
-            ramp_factor = _cold_storage_ugly_ramp_factor(commissioning_delay_months)
             scenario_input["commissioning_delay_months"] = commissioning_delay_months
-            scenario_input["ramp_factor"] = ramp_factor
             levers.append(
                 "Cold-storage ugly commissioning delay applied "
-                f"({commissioning_delay_months} months; year-1 ramp factor {ramp_factor:.2f})."
+                f"({commissioning_delay_months} months before revenue starts)."
             )
 
         if cost_tiles and cost_scalar is None:
@@ -719,14 +713,6 @@ def build_dealshield_scenarios(
                 modifiers["revenue_factor"] = _apply_transforms(float(base_factor), revenue_transforms)
             scenario_payload["modifiers"] = modifiers
 
-        if ramp_factor is not None:
-            modifiers = dict(scenario_payload.get("modifiers") or {})
-            base_factor = modifiers.get("revenue_factor", 1.0)
-            if not _is_number(base_factor):
-                base_factor = 1.0
-            modifiers["revenue_factor"] = float(base_factor) * float(ramp_factor)
-            scenario_payload["modifiers"] = modifiers
-
         ownership_type = _select_ownership_type(building_config)
         calculation_context = _build_calculation_context(scenario_payload, scenario_id)
         total_cost_value = (scenario_payload.get("totals") or {}).get("total_project_cost")
@@ -740,11 +726,14 @@ def build_dealshield_scenarios(
             calculation_context=calculation_context,
         )
         _apply_financial_bundle(scenario_payload, bundle)
+        apply_construction_draws(scenario_payload, financing_terms, include_months=False)
 
         _assert_tile_metrics(scenario_payload, tile_metric_refs, scenario_id)
 
         scenarios[scenario_id] = scenario_payload
 
+    apply_pro_forma_metrics(scenarios, scenario_inputs, engine)
+
     provenance = {
         "profile_id": profile_id,
         "scenario_ids": ["base"] + [row["scenario_id"] for row in scenario_defs],
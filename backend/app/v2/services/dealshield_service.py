@@ -12,6 +12,12 @@ from app.v2.config.type_profiles.decision_insurance_policy import (
 )
 from app.v2.presentation.client_text_sanitizer import sanitize_client_text
 from app.v2.presentation.dealshield_outcome_copy_renderer import build_outcome_copy_bundle
+from app.v2.services.break_points import (
+    MAX_STRESS_MULTIPLE,
+    break_stress_values,
+    solve_break_stress,
+    supports_break_trigger,
+)
 
 _MISSING = object()
 
@@ -1295,6 +1301,124 @@ def _resolve_policy_collapse_row(
     return None, None, metric_name, threshold
 
 
+_BREAK_STATE_METRIC_REFS = {
+    "noi": "ownership_analysis.return_metrics.estimated_annual_noi",
+    "annual_debt_service": "ownership_analysis.debt_metrics.annual_debt_service",
+}
+
+
+def _resolve_row_break_state(payload: Dict[str, Any], row: Dict[str, Any]) -> Dict[str, Optional[float]]:
+    scenario_id = row.get("scenario_id")
+    source = _resolve_dealshield_scenario_snapshot(payload, scenario_id) if isinstance(scenario_id, str) else None
+    if source is None and scenario_id == "base":
+        source = payload
+    state: Dict[str, Optional[float]] = {
+        "total_cost": float(row["total_cost"]) if _is_number(row.get("total_cost")) else None,
+        "stabilized_value": float(row["stabilized_value"]) if _is_number(row.get("stabilized_value")) else None,
+    }
+    for field_name, metric_ref in _BREAK_STATE_METRIC_REFS.items():
+        raw = _resolve_metric_ref(source, metric_ref) if isinstance(source, dict) else _MISSING
+        state[field_name] = float(raw) if raw is not _MISSING and _is_number(raw) else None
+    return state
+
+
+def _solve_scenario_path_break_fraction(
+    payload: Dict[str, Any],
+    base_row: Dict[str, Any],
+    break_row: Dict[str, Any],
+    metric: str,
+    operator: str,
+    threshold: float,
+) -> Optional[float]:
+    """Share of the base -> break-row stress at which the trigger fires, or None if unsolvable."""
+    if not supports_break_trigger(metric, operator):
+        return None
+    base_state = _resolve_row_break_state(payload, base_row)
+    break_state = _resolve_row_break_state(payload, break_row)
+    direction = {
+        field_name: (
+            break_state[field_name] - base_state[field_name]
+            if base_state[field_name] is not None and break_state[field_name] is not None
+            else None
+        )
+        for field_name in base_state
+    }
+    return break_stress_values(
+        solve_break_stress(metric, operator, threshold, base_state, direction, size=1, max_stress=1.0)
+    )[0]
+
+
+def _build_driver_break_points(
+    payload: Dict[str, Any],
+    driver_impacts: List[Dict[str, Any]],
+    base_row: Optional[Dict[str, Any]],
+    metric: str,
+    operator: str,
+    threshold: float,
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Multiple of each driver tile's configured shock at which the collapse trigger fires.
+
+    Driver tiles move cost only, so each tile is a path that adds its delta
+    cost per unit of stress, with debt service following cost at the base
+    leverage. All tiles are solved in one pass.
+    """
+    provenance: Dict[str, Any] = {
+        "metric": metric,
+        "operator": operator,
+        "threshold": threshold,
+        "max_stress_multiple": MAX_STRESS_MULTIPLE,
+        "source": "decision_insurance.driver_impacts",
+    }
+    if not supports_break_trigger(metric, operator):
+        return [], {**provenance, "status": "unavailable", "reason": "unsupported_break_trigger"}
+    if not isinstance(base_row, dict):
+        return [], {**provenance, "status": "unavailable", "reason": "base_row_missing"}
+    base_state = _resolve_row_break_state(payload, base_row)
+    base_total = base_state["total_cost"]
+    if base_total is None or base_total <= 0:
+        return [], {**provenance, "status": "unavailable", "reason": "base_total_cost_missing_or_non_positive"}
+
+    drivers = [
+        entry
+        for entry in driver_impacts
+        if isinstance(entry, dict) and _is_number(entry.get("delta_cost")) and float(entry["delta_cost"]) != 0
+    ]
+    if not drivers:
+        return [], {**provenance, "status": "unavailable", "reason": "no_driver_delta_cost_available"}
+
+    delta_costs = [float(entry["delta_cost"]) for entry in drivers]
+    debt_service = base_state["annual_debt_service"]
+    direction = {
+        "total_cost": delta_costs,
+        "stabilized_value": 0.0,
+        "noi": 0.0,
+        "annual_debt_service": (
+            [debt_service * delta / base_total for delta in delta_costs] if debt_service is not None else None
+        ),
+    }
+    multiples = break_stress_values(
+        solve_break_stress(metric, operator, threshold, base_state, direction, size=len(drivers))
+    )
+
+    break_points = []
+    for entry, delta_cost, multiple in zip(drivers, delta_costs, multiples):
+        break_delta_cost = multiple * delta_cost if multiple is not None else None
+        break_points.append(
+            {
+                "tile_id": entry.get("tile_id"),
+                "label": entry.get("label"),
+                "metric_ref": entry.get("metric_ref"),
+                "delta_cost": delta_cost,
+                "break_stress_multiple": multiple,
+                "break_delta_cost": break_delta_cost,
+                "break_cost_increase_pct": (
+                    (break_delta_cost / base_total) * 100.0 if break_delta_cost is not None else None
+                ),
+            }
+        )
+    return break_points, {**provenance, "status": "available", "base_row_index": base_row.get("index")}
+
+
 def _resolve_flex_band(flex_value_pct: Optional[float], calibration: Optional[Dict[str, Any]]) -> Optional[str]:
     if flex_value_pct is None or not isinstance(calibration, dict):
         return None
@@ -1388,6 +1512,8 @@ def _build_multifamily_decision_insurance(
         "break_risk": None,
         "exposure_concentration_pct": None,
         "ranked_likely_wrong": [],
+        "driver_break_points": [],
+        "primary_control_break_point": None,
     }
     provenance: Dict[str, Any] = {
         "enabled": True,
@@ -1629,6 +1755,13 @@ def _build_multifamily_decision_insurance(
         row_snapshots=row_snapshots,
         collapse_cfg=collapse_cfg if isinstance(collapse_cfg, dict) else None,
     )
+    policy_break_operator = (
+        collapse_cfg["operator"].strip()
+        if isinstance(collapse_cfg, dict)
+        and isinstance(collapse_cfg.get("operator"), str)
+        and collapse_cfg["operator"].strip()
+        else "<="
+    )
 
     fallback_break_row = next(
         (
@@ -1807,14 +1940,23 @@ def _build_multifamily_decision_insurance(
                     }
                 else:
                     stress_break_row_pct = ((float(break_total) - float(base_total)) / float(base_total)) * 100.0
-                    interpolation_numerator = base_metric_value - collapse_threshold
-                    outputs["flex_before_break_pct"] = max(
-                        0.0,
-                        stress_break_row_pct * (interpolation_numerator / denominator),
+                    break_fraction = _solve_scenario_path_break_fraction(
+                        payload,
+                        base_row_snapshot,
+                        first_break_row,
+                        collapse_metric,
+                        policy_break_operator,
+                        collapse_threshold,
                     )
+                    method = "exact_break_on_scenario_path"
+                    if break_fraction is None:
+                        break_fraction = (base_metric_value - collapse_threshold) / denominator
+                        method = "linear_interpolation_to_policy_threshold"
+                    outputs["flex_before_break_pct"] = max(0.0, stress_break_row_pct * break_fraction)
                     provenance["flex_before_break_pct"] = {
                         "status": "available",
-                        "method": "linear_interpolation_to_policy_threshold",
+                        "method": method,
+                        "break_stress_fraction": break_fraction,
                         "metric": collapse_metric,
                         "threshold": collapse_threshold,
                         "stress_break_row_pct": stress_break_row_pct,
@@ -1903,6 +2045,28 @@ def _build_multifamily_decision_insurance(
                 provenance["flex_before_break_pct"]["band"] = band
                 provenance["flex_before_break_pct"]["calibration_source"] = "decision_insurance_policy.flex_calibration"
 
+    driver_break_points, driver_break_provenance = _build_driver_break_points(
+        payload,
+        driver_impacts,
+        base_row_snapshot,
+        metric=(policy_break_metric or "value_gap") if isinstance(collapse_cfg, dict) else "value_gap",
+        operator=policy_break_operator,
+        threshold=policy_break_threshold if policy_break_threshold is not None else 0.0,
+    )
+    outputs["driver_break_points"] = driver_break_points
+    provenance["driver_break_points"] = driver_break_provenance
+    primary_control = outputs.get("primary_control_variable")
+    if isinstance(primary_control, dict):
+        outputs["primary_control_break_point"] = next(
+            (
+                entry
+                for entry in driver_break_points
+                if entry.get("tile_id") == primary_control.get("tile_id")
+                and entry.get("metric_ref") == primary_control.get("metric_ref")
+            ),
+            None,
+        )
+
     break_risk_level, break_risk_reason, break_risk_context = _classify_break_risk(
         first_break_condition=first_break_condition,
         flex_before_break_pct=outputs.get("flex_before_break_pct"),
@@ -58,6 +58,25 @@ _ITEM_META = {
     "yield_on_cost": {"label": "Yield on Cost", "format": "percentage", "decimals": 1},
     "market_cap_rate": {"label": "Market Cap Rate", "format": "percentage", "decimals": 1},
     "cap_rate_spread_bps": {"label": "Cap Spread", "format": "basis_points", "decimals": 0},
+    "construction_loan_commitment": {"label": "Construction Loan", "format": "currency"},
+    "capitalized_interest": {"label": "Capitalized Interest", "format": "currency"},
+    "interest_reserve": {"label": "Interest Reserve", "format": "currency"},
+    "peak_construction_loan_balance": {"label": "Peak Construction Loan Balance", "format": "currency"},
+}
+
+# Construction loan carry from the draw schedule (see construction_draws), shown for debt-financed families.
+_CONSTRUCTION_LOAN_FIELDS = (
+    "construction_loan_commitment",
+    "capitalized_interest",
+    "interest_reserve",
+    "peak_construction_loan_balance",
+)
+# financing_assumptions key -> construction_draw_schedule key, for payloads without financing assumptions.
+_DRAW_SCHEDULE_KEYS = {
+    "construction_loan_commitment": "loan_commitment",
+    "capitalized_interest": "capitalized_interest",
+    "interest_reserve": "interest_reserve",
+    "peak_construction_loan_balance": "peak_loan_balance",
 }
 
 
@@ -160,6 +179,8 @@ def _build_values(payload: Dict[str, Any]) -> Dict[str, Optional[float]]:
     financing_sources = _as_dict(ownership_analysis.get("financing_sources"))
     debt_metrics = _as_dict(ownership_analysis.get("debt_metrics"))
     totals = _as_dict(payload.get("totals"))
+    financing_assumptions = _as_dict(payload.get("financing_assumptions"))
+    draw_schedule = _as_dict(payload.get("construction_draw_schedule"))
 
     debt_amount = _to_number(financing_sources.get("debt_amount"))
     total_project_cost = _to_number(totals.get("total_project_cost"))
@@ -179,6 +200,10 @@ def _build_values(payload: Dict[str, Any]) -> Dict[str, Optional[float]]:
         "yield_on_cost": _to_number(ownership_analysis.get("yield_on_cost")),
         "market_cap_rate": _to_number(ownership_analysis.get("market_cap_rate")),
         "cap_rate_spread_bps": _to_number(ownership_analysis.get("cap_rate_spread_bps")),
+        **{
+            field_id: _to_number(financing_assumptions.get(field_id, draw_schedule.get(schedule_key)))
+            for field_id, schedule_key in _DRAW_SCHEDULE_KEYS.items()
+        },
     }
 
 
@@ -216,6 +241,11 @@ def _append_item(
     items.append(item)
 
 
+def _append_construction_loan_items(items: List[Dict[str, Any]], values: Dict[str, Optional[float]]) -> None:
+    for field_id in _CONSTRUCTION_LOAN_FIELDS:
+        _append_item(items, field_id, values, positive_only=True)
+
+
 def build_financing_summary(
     payload: Dict[str, Any], parsed_input: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
@@ -247,6 +277,7 @@ def build_financing_summary(
                 positive_only=field_id not in {"cap_rate_spread_bps"},
                 allow_zero=field_id in {"debt_ratio", "cap_rate_spread_bps"},
             )
+        _append_construction_loan_items(items, values)
     elif family_id == HOSPITALITY_FAMILY_ID:
         for field_id in ("debt_amount", "equity_amount"):
             _append_item(items, field_id, values, allow_zero=True)
@@ -265,6 +296,7 @@ def build_financing_summary(
                 positive_only=field_id not in {"cap_rate_spread_bps"},
                 allow_zero=field_id == "cap_rate_spread_bps",
             )
+        _append_construction_loan_items(items, values)
     elif family_id == OPERATING_BUSINESS_FIT_OUT_HEAVY_FAMILY_ID:
         for field_id in ("debt_amount", "equity_amount"):
             _append_item(items, field_id, values, allow_zero=True)
@@ -275,6 +307,7 @@ def build_financing_summary(
             "yield_on_cost",
         ):
             _append_item(items, field_id, values, positive_only=True)
+        _append_construction_loan_items(items, values)
     elif family_id == MIXED_USE_BLENDED_FAMILY_ID:
         for field_id in ("debt_amount", "equity_amount"):
             _append_item(items, field_id, values, allow_zero=True)
@@ -286,6 +319,7 @@ def build_financing_summary(
             "yield_on_cost",
         ):
             _append_item(items, field_id, values, positive_only=True)
+        _append_construction_loan_items(items, values)
     elif family_id == HIGH_CAPEX_PARKING_SPECIAL_CASE_FAMILY_ID:
         for field_id in ("debt_amount", "equity_amount"):
             _append_item(items, field_id, values, allow_zero=True)
@@ -296,6 +330,7 @@ def build_financing_summary(
             "yield_on_cost",
         ):
             _append_item(items, field_id, values, positive_only=True)
+        _append_construction_loan_items(items, values)
     else:
         for field_id in ("debt_amount", "equity_amount"):
             _append_item(items, field_id, values, allow_zero=True)
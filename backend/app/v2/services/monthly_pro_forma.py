@@ -0,0 +1,589 @@
+"""Monthly pro forma for the base case and every DealShield scenario.
+
+The ownership math underwrites one flat stabilized NOI per year followed by a
+terminal value. The pro forma lays the same project out month by month:
+- construction draws until delivery, on the payload's draw schedule when it
+  has one (see construction_draws);
+- a lease-up ramp from delivery to stabilized occupancy, shifted by any
+  commissioning delay;
+- annual rent and expense growth steps from stabilization, and replacement
+  reserves;
+- debt service from delivery;
+- a sale at the end of the hold, priced on forward NOI at the exit cap.
+
+The scenario figures are stabilized ones, so growth starts at the base
+case's stabilization month and the first stabilized year of an on-time
+scenario reproduces the flat NOI exactly. That year is the underwriting year
+the scenario DSCR is read from; a scenario that starts earning late (the
+cold-storage commissioning delay) is still ramping through part of it.
+
+``apply_pro_forma_metrics`` writes each scenario's IRR, NPV and DSCR into its
+``dealshield_scenarios`` snapshot, in the units of
+``ownership_analysis.return_metrics`` (IRR in percent, NPV in dollars, DSCR as
+a multiple), so the decision table reads them. ``build_dealshield_pro_forma``
+derives the full annual roll-up on demand for the DealShield view.
+
+Every scenario is one row of a scenarios x months array: the growth indices,
+ramp curve and discount factors are built once per payload in a
+``ProFormaTimeline``, and the cashflows, NPV and IRR of all rows are computed
+in the same array passes. The decision metrics run on every calculation, so
+they are built from a single unlevered cashflow buffer filled in place; the
+line-by-line breakdown (``build_scenario_cashflows``) is only built for the
+annual roll-up.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.v2.services.construction_draws import monthly_cost_draws
+
+MONTHS_PER_YEAR = 12
+
+HOLD_MONTHS = 120
+DEFAULT_CONSTRUCTION_MONTHS = 18
+RENT_GROWTH = 0.03
+EXPENSE_GROWTH = 0.03
+# Share of stabilized operating expenses incurred regardless of occupancy.
+EXPENSE_FIXED_SHARE = 0.6
+RESERVES_PER_SF = 0.25
+SELLING_COST_PCT = 0.02
+DEFAULT_EXIT_CAP_RATE = 0.07
+DEFAULT_DISCOUNT_RATE = 0.08
+
+# building_type -> (months from delivery to stabilization, share of stabilized revenue at delivery)
+LEASE_UP_PROFILES: Dict[str, Tuple[int, float]] = {
+    "multifamily": (18, 0.30),
+    "office": (24, 0.35),
+    "retail": (18, 0.50),
+    "industrial": (12, 0.40),
+    "hospitality": (24, 0.55),
+    "healthcare": (18, 0.50),
+    "restaurant": (6, 0.70),
+    "mixed_use": (24, 0.35),
+}
+DEFAULT_LEASE_UP_PROFILE: Tuple[int, float] = (12, 0.60)
+
+PRO_FORMA_LABEL = "Monthly pro forma (unlevered IRR with lease-up, growth and exit sale)"
+PRO_FORMA_METRIC_UNITS: Dict[str, str] = {"irr": "percent", "npv": "usd", "dscr": "multiple"}
+# Recorded on each scenario's ownership_analysis once its IRR, NPV and DSCR come from the pro forma.
+PRO_FORMA_BASIS = "monthly_pro_forma"
+
+_IRR_MAX_ITERATIONS = 60
+_IRR_TOLERANCE = 1e-9
+_IRR_BRACKET = (-0.5, 1.0)
+
+
+def _as_dict(value: Any) -> Dict[str, Any]:
+    return value if isinstance(value, dict) else {}
+
+
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    number = float(value)
+    return number if math.isfinite(number) else None
+
+
+@dataclass(frozen=True)
+class ProFormaAssumptions:
+    construction_months: int
+    lease_up_months: int
+    initial_occupancy: float
+    hold_months: int = HOLD_MONTHS
+    rent_growth: float = RENT_GROWTH
+    expense_growth: float = EXPENSE_GROWTH
+    expense_fixed_share: float = EXPENSE_FIXED_SHARE
+    reserves_per_sf: float = RESERVES_PER_SF
+    selling_cost_pct: float = SELLING_COST_PCT
+    exit_cap_rate: float = DEFAULT_EXIT_CAP_RATE
+    discount_rate: float = DEFAULT_DISCOUNT_RATE
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def resolve_pro_forma_assumptions(payload: Mapping[str, Any], engine: Any = None) -> ProFormaAssumptions:
+    """Assumptions for a calculation payload: schedule length, type lease-up, exit and discount rates."""
+    project_info = _as_dict(payload.get("project_info"))
+    building_type = str(project_info.get("building_type") or "").lower()
+
+    schedule_months = _number(_as_dict(payload.get("construction_schedule")).get("total_months"))
+    construction_months = int(schedule_months) if schedule_months and schedule_months > 0 else DEFAULT_CONSTRUCTION_MONTHS
+    lease_up_months, initial_occupancy = LEASE_UP_PROFILES.get(building_type, DEFAULT_LEASE_UP_PROFILE)
+
+    exit_cap_rate, discount_rate = DEFAULT_EXIT_CAP_RATE, DEFAULT_DISCOUNT_RATE
+    rates = getattr(engine, "get_exit_cap_and_discount_rate", None)
+    if callable(rates) and building_type:
+        exit_cap_rate, discount_rate = rates(building_type)
+    return_metrics = _as_dict(_as_dict(payload.get("ownership_analysis")).get("return_metrics"))
+    market_cap_rate = _number(return_metrics.get("market_cap_rate"))
+    if market_cap_rate and market_cap_rate > 0:
+        exit_cap_rate = market_cap_rate
+
+    return ProFormaAssumptions(
+        construction_months=construction_months,
+        lease_up_months=lease_up_months,
+        initial_occupancy=initial_occupancy,
+        exit_cap_rate=float(exit_cap_rate),
+        discount_rate=float(discount_rate),
+    )
+
+
+@dataclass(frozen=True)
+class ScenarioDrivers:
+    """Stabilized annual figures for one scenario."""
+
+    total_project_cost: float
+    annual_revenue: float
+    annual_operating_expenses: float
+    annual_debt_service: float
+    square_footage: float
+    commissioning_delay_months: int = 0
+    construction_draws: Tuple[float, ...] = ()
+
+
+def scenario_drivers(payload: Mapping[str, Any], scenario_input: Optional[Mapping[str, Any]] = None) -> Optional[ScenarioDrivers]:
+    """Drivers from a scenario payload; None when it has no cost or revenue to model."""
+    total_cost = _number(_as_dict(payload.get("totals")).get("total_project_cost"))
+    revenue_analysis = _as_dict(payload.get("revenue_analysis"))
+    annual_revenue = _number(revenue_analysis.get("annual_revenue"))
+    annual_noi = _number(revenue_analysis.get("net_income"))
+    if not total_cost or total_cost <= 0 or annual_revenue is None or annual_noi is None:
+        return None
+
+    delay = _number(_as_dict(scenario_input).get("commissioning_delay_months")) or 0.0
+    debt_metrics = _as_dict(_as_dict(payload.get("ownership_analysis")).get("debt_metrics"))
+    return ScenarioDrivers(
+        total_project_cost=total_cost,
+        annual_revenue=annual_revenue,
+        annual_operating_expenses=max(0.0, annual_revenue - annual_noi),
+        annual_debt_service=max(0.0, _number(debt_metrics.get("annual_debt_service")) or 0.0),
+        square_footage=_number(_as_dict(payload.get("project_info")).get("square_footage")) or 0.0,
+        commissioning_delay_months=max(0, int(delay)),
+        construction_draws=tuple(monthly_cost_draws(payload) or ()),
+    )
+
+
+class ProFormaTimeline:
+    """Month arrays shared by every scenario of one payload."""
+
+    def __init__(self, assumptions: ProFormaAssumptions):
+        self.assumptions = assumptions
+        self.construction_months = max(1, int(assumptions.construction_months))
+        self.hold_years = max(1, int(assumptions.hold_months) // MONTHS_PER_YEAR)
+        self.hold_months = self.hold_years * MONTHS_PER_YEAR
+        self.total_months = self.construction_months + self.hold_months
+        self.lease_up_months = max(0, int(assumptions.lease_up_months))
+        self.initial_occupancy = min(1.0, max(0.0, assumptions.initial_occupancy))
+        # The underwriting year is the base case's first stabilized year; it
+        # slides back only if lease-up outlasts the hold.
+        self.underwriting_start = min(self.lease_up_months, self.hold_months - MONTHS_PER_YEAR)
+        self.underwriting_window = slice(self.underwriting_start, self.underwriting_start + MONTHS_PER_YEAR)
+
+        months = np.arange(self.hold_months)
+        # Growth steps are counted from stabilization, so the underwriting
+        # year is in the same dollars as the stabilized scenario figures.
+        growth_steps = np.maximum(0, months - self.lease_up_months) // MONTHS_PER_YEAR
+        exit_step = max(0, self.hold_months - self.lease_up_months) // MONTHS_PER_YEAR
+        self.rent_index = (1 + assumptions.rent_growth) ** growth_steps
+        self.expense_index = (1 + assumptions.expense_growth) ** growth_steps
+        self.exit_rent_index = (1 + assumptions.rent_growth) ** exit_step
+        self.exit_expense_index = (1 + assumptions.expense_growth) ** exit_step
+
+        monthly_discount = (1 + assumptions.discount_rate) ** (1 / MONTHS_PER_YEAR)
+        self.discount_factors = monthly_discount ** -np.arange(self.total_months, dtype=float)
+        self.months = months
+
+    def occupancy(self, delays: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Share of stabilized revenue earned per scenario (row) and operating month (column).
+
+        Written into ``out`` (scenarios x hold months) when given.
+        """
+        ramp = np.subtract(self.months, delays[:, None], out=out, dtype=float)
+        started = ramp >= 0
+        if self.lease_up_months:
+            ramp /= self.lease_up_months
+            np.clip(ramp, 0.0, 1.0, out=ramp)
+            ramp *= 1 - self.initial_occupancy
+            ramp += self.initial_occupancy
+        else:
+            ramp.fill(1.0)
+        ramp *= started
+        return ramp
+
+
+def _column(drivers: Sequence[ScenarioDrivers], field_name: str) -> np.ndarray:
+    return np.array([float(getattr(entry, field_name)) for entry in drivers])
+
+
+def _delays(timeline: ProFormaTimeline, drivers: Sequence[ScenarioDrivers]) -> np.ndarray:
+    return np.minimum(_column(drivers, "commissioning_delay_months"), timeline.hold_months)
+
+
+def _sale_proceeds(timeline: ProFormaTimeline, forward_noi: np.ndarray) -> np.ndarray:
+    assumptions = timeline.assumptions
+    if assumptions.exit_cap_rate <= 0:
+        return np.zeros(len(forward_noi))
+    return np.maximum(0.0, forward_noi / assumptions.exit_cap_rate * (1 - assumptions.selling_cost_pct))
+
+
+def _forward_noi(timeline: ProFormaTimeline, drivers: Sequence[ScenarioDrivers]) -> np.ndarray:
+    return (
+        _column(drivers, "annual_revenue") * timeline.exit_rent_index
+        - _column(drivers, "annual_operating_expenses") * timeline.exit_expense_index
+    )
+
+
+def _construction_draws(timeline: ProFormaTimeline, drivers: Sequence[ScenarioDrivers], out: np.ndarray) -> None:
+    construction_months = timeline.construction_months
+    for row, entry in enumerate(drivers):
+        if len(entry.construction_draws) == construction_months:
+            out[row] = entry.construction_draws
+        else:
+            out[row] = entry.total_project_cost / construction_months
+
+
+@dataclass
+class UnleveredCashflows:
+    """Unlevered cashflows from month 0 (one row per scenario) and each row's underwriting-year NOI."""
+
+    cashflows: np.ndarray
+    underwriting_noi: np.ndarray
+
+
+def unlevered_cashflows(timeline: ProFormaTimeline, drivers: Sequence[ScenarioDrivers]) -> UnleveredCashflows:
+    """Draws, NOI less reserves and the exit sale for every scenario, filled into one buffer.
+
+    Same figures as ``build_scenario_cashflows`` without its per-line arrays:
+    NOI is ``occupancy x (revenue - variable expenses) - fixed expenses``,
+    accumulated in place in the operating columns.
+    """
+    assumptions = timeline.assumptions
+    construction_months = timeline.construction_months
+    cashflows = np.empty((len(drivers), timeline.total_months))
+    _construction_draws(timeline, drivers, cashflows[:, :construction_months])
+    np.negative(cashflows[:, :construction_months], out=cashflows[:, :construction_months])
+
+    monthly_revenue = _column(drivers, "annual_revenue") / MONTHS_PER_YEAR
+    monthly_expenses = _column(drivers, "annual_operating_expenses") / MONTHS_PER_YEAR
+    monthly_reserves = _column(drivers, "square_footage") * assumptions.reserves_per_sf / MONTHS_PER_YEAR
+    fixed_share = assumptions.expense_fixed_share
+
+    operating = timeline.occupancy(_delays(timeline, drivers), out=cashflows[:, construction_months:])
+    scratch = np.multiply(operating, timeline.expense_index)
+    scratch *= ((1 - fixed_share) * monthly_expenses)[:, None]
+    operating *= timeline.rent_index
+    operating *= monthly_revenue[:, None]
+    operating -= scratch
+    np.multiply.outer(fixed_share * monthly_expenses, timeline.expense_index, out=scratch)
+    operating -= scratch
+
+    window = timeline.underwriting_window
+    underwriting_noi = operating[:, window].sum(axis=1)
+    np.multiply.outer(monthly_reserves, timeline.expense_index, out=scratch)
+    operating -= scratch
+
+    cashflows[:, -1] += _sale_proceeds(timeline, _forward_noi(timeline, drivers))
+    return UnleveredCashflows(cashflows=cashflows, underwriting_noi=underwriting_noi)
+
+
+@dataclass
+class ScenarioCashflows:
+    """Scenario x month line items over the operating period, for the annual roll-up."""
+
+    occupancy: np.ndarray
+    revenue: np.ndarray
+    operating_expenses: np.ndarray
+    reserves: np.ndarray
+    noi: np.ndarray
+    annual_debt_service: np.ndarray
+    forward_noi: np.ndarray
+    sale_proceeds: np.ndarray
+
+
+def build_scenario_cashflows(timeline: ProFormaTimeline, drivers: Sequence[ScenarioDrivers]) -> ScenarioCashflows:
+    """Monthly line items for every scenario at once, one row per entry of ``drivers``."""
+    assumptions = timeline.assumptions
+    annual_revenue = _column(drivers, "annual_revenue")
+    annual_expenses = _column(drivers, "annual_operating_expenses")
+    occupancy = timeline.occupancy(_delays(timeline, drivers))
+
+    fixed_share = assumptions.expense_fixed_share
+    revenue = (annual_revenue / MONTHS_PER_YEAR)[:, None] * occupancy * timeline.rent_index
+    expenses = (
+        (annual_expenses / MONTHS_PER_YEAR)[:, None]
+        * timeline.expense_index
+        * (fixed_share + (1 - fixed_share) * occupancy)
+    )
+    monthly_reserves = _column(drivers, "square_footage") * assumptions.reserves_per_sf / MONTHS_PER_YEAR
+    forward_noi = _forward_noi(timeline, drivers)
+
+    return ScenarioCashflows(
+        occupancy=occupancy,
+        revenue=revenue,
+        operating_expenses=expenses,
+        reserves=monthly_reserves[:, None] * timeline.expense_index,
+        noi=revenue - expenses,
+        annual_debt_service=_column(drivers, "annual_debt_service"),
+        forward_noi=forward_noi,
+        sale_proceeds=_sale_proceeds(timeline, forward_noi),
+    )
+
+
+class _PresentValues:
+    """NPV and its rate derivative for fixed cashflow rows, reusing one discount-factor buffer."""
+
+    def __init__(self, cashflows: np.ndarray):
+        self.cashflows = cashflows
+        self.periods = np.arange(cashflows.shape[1], dtype=float)
+        self.weighted = cashflows * self.periods
+        self.factors = np.empty_like(cashflows)
+
+    def __call__(self, rates: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        np.multiply.outer(-np.log1p(rates), self.periods, out=self.factors)
+        np.exp(self.factors, out=self.factors)
+        value = np.einsum("ij,ij->i", self.cashflows, self.factors)
+        derivative = -np.einsum("ij,ij->i", self.weighted, self.factors) / (1.0 + rates)
+        return value, derivative
+
+
+def monthly_irrs(cashflows: Any) -> np.ndarray:
+    """Monthly IRR of each row via bracketed Newton steps; NaN without a sign change in the bracket."""
+    cashflows = np.atleast_2d(np.asarray(cashflows, dtype=float))
+    rows = cashflows.shape[0]
+    present_values = _PresentValues(cashflows)
+    low = np.full(rows, _IRR_BRACKET[0])
+    high = np.full(rows, _IRR_BRACKET[1])
+    low_value = present_values(low)[0]
+    high_value = present_values(high)[0]
+
+    result = np.full(rows, np.nan)
+    mixed_signs = (cashflows < 0).any(axis=1) & (cashflows > 0).any(axis=1)
+    result = np.where(mixed_signs & (high_value == 0), high, result)
+    result = np.where(mixed_signs & (low_value == 0), low, result)
+    active = mixed_signs & (low_value != 0) & (high_value != 0) & ((low_value > 0) != (high_value > 0))
+
+    # Newton from a typical monthly rate, falling back to a bisection step
+    # whenever Newton would leave the bracket (or is undefined) or stops
+    # halving its step, so deeply negative IRRs converge as quickly as
+    # ordinary ones.
+    rate = np.full(rows, 0.008)
+    previous_step = high - low
+    tolerance = _IRR_TOLERANCE * np.maximum(1.0, np.abs(cashflows[:, 0]))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(_IRR_MAX_ITERATIONS):
+            if not active.any():
+                break
+            value, derivative = present_values(rate)
+            converged = active & (np.abs(value) < tolerance)
+
+            on_low_side = (value > 0) == (low_value > 0)
+            np.copyto(low, rate, where=on_low_side)
+            np.copyto(low_value, value, where=on_low_side)
+            np.copyto(high, rate, where=~on_low_side)
+            newton = rate - value / derivative
+            bisect = ~((low < newton) & (newton < high)) | (np.abs(newton - rate) > previous_step / 2)
+            next_rate = np.where(bisect, (low + high) / 2, newton)
+            previous_step = np.abs(next_rate - rate)
+
+            settled = active & ~converged & (previous_step < _IRR_TOLERANCE)
+            np.copyto(result, rate, where=converged)
+            np.copyto(result, next_rate, where=settled)
+            active &= ~(converged | settled)
+            rate = next_rate
+    return np.where(active, rate, result)
+
+
+def monthly_irr(cashflows: Sequence[float]) -> Optional[float]:
+    """Monthly IRR of a single cashflow stream; None when it has none in the bracket."""
+    irr = float(monthly_irrs(cashflows)[0])
+    return irr if math.isfinite(irr) else None
+
+
+def _yearly(values: np.ndarray) -> np.ndarray:
+    return values.reshape(values.shape[0], -1, MONTHS_PER_YEAR).sum(axis=2)
+
+
+def _ratio(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(denominator > 0, numerator / denominator, np.nan)
+
+
+def _rounded(value: float, digits: int) -> Optional[float]:
+    return round(float(value), digits) if math.isfinite(value) else None
+
+
+@dataclass
+class ScenarioMetrics:
+    """Headline metrics per scenario row; IRR is annualized, NaN where undefined."""
+
+    irr: np.ndarray
+    npv: np.ndarray
+    dscr: np.ndarray
+
+
+def scenario_metrics(timeline: ProFormaTimeline, drivers: Sequence[ScenarioDrivers]) -> ScenarioMetrics:
+    unlevered = unlevered_cashflows(timeline, drivers)
+    monthly = monthly_irrs(unlevered.cashflows)
+    return ScenarioMetrics(
+        irr=((1 + monthly) ** MONTHS_PER_YEAR - 1) * 100,
+        npv=unlevered.cashflows @ timeline.discount_factors,
+        # The underwriting window is twelve months of level debt service.
+        dscr=_ratio(unlevered.underwriting_noi, _column(drivers, "annual_debt_service")),
+    )
+
+
+def _annual_rows(cashflows: ScenarioCashflows) -> List[List[Dict[str, Any]]]:
+    occupancy = _yearly(cashflows.occupancy) / MONTHS_PER_YEAR
+    revenue = _yearly(cashflows.revenue)
+    expenses = _yearly(cashflows.operating_expenses)
+    reserves = _yearly(cashflows.reserves)
+    noi = _yearly(cashflows.noi)
+    debt_service = np.broadcast_to(cashflows.annual_debt_service[:, None], noi.shape)
+    dscr = _ratio(noi, debt_service)
+    return [
+        [
+            {
+                "year": year + 1,
+                "occupancy": round(float(occupancy[row, year]), 4),
+                "revenue": round(float(revenue[row, year]), 2),
+                "operating_expenses": round(float(expenses[row, year]), 2),
+                "reserves": round(float(reserves[row, year]), 2),
+                "noi": round(float(noi[row, year]), 2),
+                "debt_service": round(float(debt_service[row, year]), 2),
+                "cash_flow_after_debt_service": round(float(noi[row, year] - reserves[row, year] - debt_service[row, year]), 2),
+                "dscr": _rounded(dscr[row, year], 3),
+            }
+            for year in range(noi.shape[1])
+        ]
+        for row in range(noi.shape[0])
+    ]
+
+
+def summarize_scenarios(timeline: ProFormaTimeline, drivers: Sequence[ScenarioDrivers]) -> List[Dict[str, Any]]:
+    """Metrics and annual roll-ups for every scenario, computed in one array pass."""
+    if not drivers:
+        return []
+    cashflows = build_scenario_cashflows(timeline, drivers)
+    metrics = scenario_metrics(timeline, drivers)
+    annual_rows = _annual_rows(cashflows)
+
+    summaries = []
+    for row, (entry, annual) in enumerate(zip(drivers, annual_rows)):
+        stabilized_year = min(
+            len(annual),
+            math.ceil((timeline.lease_up_months + entry.commissioning_delay_months) / MONTHS_PER_YEAR) + 1,
+        )
+        dscrs = [year["dscr"] for year in annual if year["dscr"] is not None]
+        summaries.append({
+            # Percent, like ownership_analysis.return_metrics["irr"].
+            "irr": _rounded(metrics.irr[row], 2),
+            "npv": round(float(metrics.npv[row]), 2),
+            "dscr": _rounded(metrics.dscr[row], 3),
+            "year_1_dscr": annual[0]["dscr"],
+            "stabilized_dscr": annual[stabilized_year - 1]["dscr"],
+            "min_dscr": min(dscrs) if dscrs else None,
+            "stabilized_year": stabilized_year,
+            "delivery_month": timeline.construction_months,
+            "revenue_start_month": timeline.construction_months + entry.commissioning_delay_months,
+            "underwriting_year_start_month": timeline.construction_months + timeline.underwriting_start,
+            "sale_month": timeline.total_months,
+            "forward_noi": round(float(cashflows.forward_noi[row]), 2),
+            "sale_proceeds": round(float(cashflows.sale_proceeds[row]), 2),
+            "total_project_cost": round(entry.total_project_cost, 2),
+            "annual": annual,
+        })
+    return summaries
+
+
+def summarize_scenario(timeline: ProFormaTimeline, drivers: ScenarioDrivers) -> Dict[str, Any]:
+    return summarize_scenarios(timeline, [drivers])[0]
+
+
+def _scenario_drivers_by_id(
+    scenarios: Mapping[str, Mapping[str, Any]],
+    scenario_inputs: Optional[Mapping[str, Mapping[str, Any]]],
+) -> Dict[str, Optional[ScenarioDrivers]]:
+    scenario_inputs = scenario_inputs or {}
+    return {
+        scenario_id: scenario_drivers(scenario_payload, scenario_inputs.get(scenario_id))
+        for scenario_id, scenario_payload in scenarios.items()
+    }
+
+
+def build_monthly_pro_forma(
+    base_payload: Mapping[str, Any],
+    scenarios: Mapping[str, Mapping[str, Any]],
+    scenario_inputs: Optional[Mapping[str, Mapping[str, Any]]] = None,
+    engine: Any = None,
+) -> Dict[str, Any]:
+    """Pro forma metrics and annual roll-ups for every scenario payload."""
+    assumptions = resolve_pro_forma_assumptions(base_payload, engine)
+    timeline = ProFormaTimeline(assumptions)
+    drivers_by_id = _scenario_drivers_by_id(scenarios, scenario_inputs)
+    modeled = [scenario_id for scenario_id, drivers in drivers_by_id.items() if drivers is not None]
+    summaries = dict(zip(modeled, summarize_scenarios(timeline, [drivers_by_id[scenario_id] for scenario_id in modeled])))
+    return {
+        "label": PRO_FORMA_LABEL,
+        "metric_units": dict(PRO_FORMA_METRIC_UNITS),
+        "assumptions": assumptions.to_dict(),
+        "months": timeline.total_months,
+        "scenarios": {scenario_id: summaries.get(scenario_id) for scenario_id in scenarios},
+    }
+
+
+def build_dealshield_pro_forma(dealshield_scenarios: Any, engine: Any = None) -> Optional[Dict[str, Any]]:
+    """Pro forma for a payload's ``dealshield_scenarios`` block; None when it has no base scenario."""
+    block = _as_dict(dealshield_scenarios)
+    scenarios = _as_dict(block.get("scenarios"))
+    base_payload = scenarios.get("base")
+    if not isinstance(base_payload, dict):
+        return None
+    scenario_inputs = _as_dict(_as_dict(block.get("provenance")).get("scenario_inputs"))
+    return build_monthly_pro_forma(base_payload, scenarios, scenario_inputs, engine)
+
+
+def apply_pro_forma_metrics(
+    scenarios: Mapping[str, Dict[str, Any]],
+    scenario_inputs: Optional[Mapping[str, Mapping[str, Any]]] = None,
+    engine: Any = None,
+) -> None:
+    """Replace each scenario's flat IRR, NPV and DSCR with the pro forma's, in place.
+
+    Scenarios without cost or revenue to model keep their flat metrics, as do
+    individual metrics the pro forma leaves undefined (no debt, no IRR).
+    """
+    base_payload = scenarios.get("base")
+    if not isinstance(base_payload, dict):
+        return
+    timeline = ProFormaTimeline(resolve_pro_forma_assumptions(base_payload, engine))
+    drivers_by_id = _scenario_drivers_by_id(scenarios, scenario_inputs)
+    modeled = [scenario_id for scenario_id, drivers in drivers_by_id.items() if drivers is not None]
+    if not modeled:
+        return
+    metrics = scenario_metrics(timeline, [drivers_by_id[scenario_id] for scenario_id in modeled])
+
+    for row, scenario_id in enumerate(modeled):
+        ownership_analysis = scenarios[scenario_id].get("ownership_analysis")
+        if not isinstance(ownership_analysis, dict):
+            continue
+        return_metrics = ownership_analysis.setdefault("return_metrics", {})
+        irr = _rounded(metrics.irr[row], 2)
+        if irr is not None:
+            return_metrics["irr"] = irr
+        return_metrics["npv"] = round(float(metrics.npv[row]), 2)
+        debt_metrics = ownership_analysis.get("debt_metrics")
+        dscr = float(metrics.dscr[row])
+        if isinstance(debt_metrics, dict) and math.isfinite(dscr):
+            debt_metrics["calculated_dscr"] = dscr
+            target_dscr = _number(debt_metrics.get("target_dscr"))
+            if target_dscr is not None:
+                debt_metrics["dscr_meets_target"] = dscr >= target_dscr
+        ownership_analysis["metrics_basis"] = PRO_FORMA_BASIS
+        scenario_return_metrics = scenarios[scenario_id].get("return_metrics")
+        if isinstance(scenario_return_metrics, dict) and scenario_return_metrics is not return_metrics:
+            scenario_return_metrics.update({key: return_metrics[key] for key in ("irr", "npv") if key in return_metrics})
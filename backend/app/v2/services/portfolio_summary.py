@@ -0,0 +1,269 @@
+"""Per-project summary rows and the SQL portfolio roll-ups built on them.
+
+``project_summaries`` keeps the handful of numbers portfolio views need (cost,
+cost/SF, yield on cost, DSCR, decision status) as plain columns, plus the
+regional multiplier and finish level the comparables index ranks on. Rows are
+written next to the calculation payload, so org roll-ups are GROUP BY queries
+over one indexed table and never parse a stored blob.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+
+from app.db.models import Project, ProjectAccess, ProjectSummary
+
+logger = logging.getLogger(__name__)
+
+UNAVAILABLE_BUCKET = "n/a"
+
+# Upper bounds (exclusive) and labels; values at or past the last bound fall in the last label.
+COST_PER_SF_BUCKETS: Tuple[Tuple[Optional[float], str], ...] = (
+    (150.0, "<150"),
+    (250.0, "150-250"),
+    (350.0, "250-350"),
+    (500.0, "350-500"),
+    (750.0, "500-750"),
+    (1000.0, "750-1000"),
+    (None, "1000+"),
+)
+YIELD_ON_COST_BUCKETS: Tuple[Tuple[Optional[float], str], ...] = (
+    (0.05, "<5%"),
+    (0.065, "5-6.5%"),
+    (0.08, "6.5-8%"),
+    (None, "8%+"),
+)
+DSCR_BUCKETS: Tuple[Tuple[Optional[float], str], ...] = (
+    (1.0, "<1.00x"),
+    (1.25, "1.00-1.25x"),
+    (1.5, "1.25-1.50x"),
+    (None, "1.50x+"),
+)
+
+SUMMARY_FIELDS = (
+    "building_type",
+    "subtype",
+    "square_footage",
+    "total_cost",
+    "cost_per_sf",
+    "yield_on_cost",
+    "dscr",
+    "decision_status",
+    "regional_multiplier",
+    "finish_level",
+)
+
+
+def _as_dict(value: Any) -> Dict[str, Any]:
+    return value if isinstance(value, dict) else {}
+
+
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    number = float(value)
+    return number if number == number else None
+
+
+def _positive(value: Any) -> Optional[float]:
+    # Zero yield/DSCR means "not modeled" (public and subsidized types), not a bucket.
+    number = _number(value)
+    return number if number is not None and number > 0 else None
+
+
+def _decision_status(project_id: str, payload: Dict[str, Any]) -> Optional[str]:
+    profile_id = payload.get("dealshield_tile_profile")
+    if not isinstance(profile_id, str) or not profile_id.strip():
+        return None
+    from app.v2.config.type_profiles.dealshield_tiles import get_dealshield_profile
+    from app.v2.services.dealshield_service import build_dealshield_view_model
+
+    try:
+        view_model = build_dealshield_view_model(project_id, payload, get_dealshield_profile(profile_id))
+    except Exception as exc:
+        logger.warning("Project summary for %s has no decision status: %s", project_id, exc)
+        return None
+    status = view_model.get("decision_status")
+    return status if isinstance(status, str) and status else None
+
+
+def project_summary_values(project_id: str, payload: Mapping[str, Any]) -> Dict[str, Any]:
+    """Summary column values for a calculation payload."""
+    payload = dict(payload) if isinstance(payload, Mapping) else {}
+    project_info = _as_dict(payload.get("project_info"))
+    totals = _as_dict(payload.get("totals"))
+    ownership_analysis = _as_dict(payload.get("ownership_analysis"))
+    debt_metrics = _as_dict(ownership_analysis.get("debt_metrics"))
+    return {
+        "building_type": project_info.get("building_type") or None,
+        "subtype": project_info.get("subtype") or None,
+        "square_footage": _number(project_info.get("square_footage")),
+        "total_cost": _number(totals.get("total_project_cost")),
+        "cost_per_sf": _number(totals.get("cost_per_sf")),
+        "yield_on_cost": _positive(ownership_analysis.get("yield_on_cost")),
+        "dscr": _positive(debt_metrics.get("calculated_dscr")),
+        "decision_status": _decision_status(project_id, payload),
+        "regional_multiplier": _positive(_as_dict(payload.get("regional")).get("multiplier")),
+        "finish_level": project_info.get("finish_level") or None,
+    }
+
+
+def upsert_project_summary(
+    db: Session,
+    project: Project,
+    org_id: str,
+    payload: Mapping[str, Any],
+) -> ProjectSummary:
+    """Refresh ``project``'s summary row in the caller's transaction."""
+    values = project_summary_values(project.project_id, payload)
+    summary = project.summary
+    if summary is None:
+        summary = ProjectSummary(project_id=project.project_id, org_id=org_id)
+        project.summary = summary
+    for field_name, value in values.items():
+        setattr(summary, field_name, value)
+    return summary
+
+
+def write_project_summaries(db: Session, values_by_project_id: Mapping[str, Dict[str, Any]]) -> int:
+    """Bulk upsert summary rows; projects without an org (unscoped) are skipped."""
+    if not values_by_project_id:
+        return 0
+    project_ids = list(values_by_project_id)
+    existing = dict(
+        db.query(ProjectSummary.project_id, ProjectSummary.id)
+        .filter(ProjectSummary.project_id.in_(project_ids))
+        .all()
+    )
+    missing = [project_id for project_id in project_ids if project_id not in existing]
+    org_by_project_id = dict(
+        db.query(ProjectAccess.project_id, ProjectAccess.org_id)
+        .filter(ProjectAccess.project_id.in_(missing))
+        .all()
+    ) if missing else {}
+
+    updates = [{"id": existing[project_id], **values_by_project_id[project_id]} for project_id in existing]
+    inserts = [
+        {"project_id": project_id, "org_id": org_by_project_id[project_id], **values_by_project_id[project_id]}
+        for project_id in missing
+        if project_id in org_by_project_id
+    ]
+    if updates:
+        db.bulk_update_mappings(ProjectSummary, updates)
+    if inserts:
+        db.bulk_insert_mappings(ProjectSummary, inserts)
+    return len(updates) + len(inserts)
+
+
+def _bucket_expression(column, buckets: Sequence[Tuple[Optional[float], str]]):
+    whens = [(column.is_(None), UNAVAILABLE_BUCKET)]
+    whens.extend((column < bound, label) for bound, label in buckets if bound is not None)
+    return case(*whens, else_=buckets[-1][1])
+
+
+def _bucket_counts(
+    db: Session,
+    org_id: str,
+    column,
+    buckets: Sequence[Tuple[Optional[float], str]],
+) -> List[Dict[str, Any]]:
+    bucket = _bucket_expression(column, buckets).label("bucket")
+    counts = dict(
+        db.query(bucket, func.count(ProjectSummary.id))
+        .filter(ProjectSummary.org_id == org_id)
+        .group_by(bucket)
+        .all()
+    )
+    labels = [label for _, label in buckets] + [UNAVAILABLE_BUCKET]
+    return [{"bucket": label, "project_count": int(counts.get(label, 0))} for label in labels]
+
+
+def _round(value: Any, digits: int = 2) -> Optional[float]:
+    return round(float(value), digits) if value is not None else None
+
+
+def portfolio_summary(db: Session, org_id: str) -> Dict[str, Any]:
+    """Org-wide roll-ups over ``project_summaries``; one aggregate query per section."""
+    org_filter = ProjectSummary.org_id == org_id
+    count, total_cost, total_sf, avg_cost_per_sf = (
+        db.query(
+            func.count(ProjectSummary.id),
+            func.sum(ProjectSummary.total_cost),
+            func.sum(ProjectSummary.square_footage),
+            func.avg(ProjectSummary.cost_per_sf),
+        )
+        .filter(org_filter)
+        .one()
+    )
+
+    by_building_type = [
+        {
+            "building_type": building_type or UNAVAILABLE_BUCKET,
+            "project_count": int(type_count),
+            "total_cost": _round(type_total_cost),
+            "total_square_footage": _round(type_total_sf),
+            "average_cost_per_sf": _round(type_avg),
+            "min_cost_per_sf": _round(type_min),
+            "max_cost_per_sf": _round(type_max),
+        }
+        for building_type, type_count, type_total_cost, type_total_sf, type_avg, type_min, type_max in (
+            db.query(
+                ProjectSummary.building_type,
+                func.count(ProjectSummary.id),
+                func.sum(ProjectSummary.total_cost),
+                func.sum(ProjectSummary.square_footage),
+                func.avg(ProjectSummary.cost_per_sf),
+                func.min(ProjectSummary.cost_per_sf),
+                func.max(ProjectSummary.cost_per_sf),
+            )
+            .filter(org_filter)
+            .group_by(ProjectSummary.building_type)
+            .order_by(func.sum(ProjectSummary.total_cost).desc())
+            .all()
+        )
+    ]
+
+    decision_status_counts = {
+        (status or UNAVAILABLE_BUCKET): int(status_count)
+        for status, status_count in (
+            db.query(ProjectSummary.decision_status, func.count(ProjectSummary.id))
+            .filter(org_filter)
+            .group_by(ProjectSummary.decision_status)
+            .all()
+        )
+    }
+
+    return {
+        "project_count": int(count or 0),
+        "total_pipeline_cost": _round(total_cost) or 0.0,
+        "total_square_footage": _round(total_sf) or 0.0,
+        "average_cost_per_sf": _round(avg_cost_per_sf),
+        "by_building_type": by_building_type,
+        "cost_per_sf_distribution": _bucket_counts(db, org_id, ProjectSummary.cost_per_sf, COST_PER_SF_BUCKETS),
+        "yield_on_cost_buckets": _bucket_counts(db, org_id, ProjectSummary.yield_on_cost, YIELD_ON_COST_BUCKETS),
+        "dscr_buckets": _bucket_counts(db, org_id, ProjectSummary.dscr, DSCR_BUCKETS),
+        "decision_status_counts": decision_status_counts,
+    }
+
+
+def iter_projects_without_summary(db: Session, batch_size: int) -> Iterable[List[Tuple[str, Optional[str]]]]:
+    """Batches of ``(project_id, calculation_data)`` for org-scoped projects lacking a summary row."""
+    last_id = 0
+    while True:
+        rows = (
+            db.query(Project.id, Project.project_id, Project.calculation_data)
+            .join(ProjectAccess, ProjectAccess.project_id == Project.project_id)
+            .outerjoin(ProjectSummary, ProjectSummary.project_id == Project.project_id)
+            .filter(ProjectSummary.id.is_(None))
+            .filter(Project.id > last_id)
+            .order_by(Project.id.asc())
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            return
+        last_id = rows[-1][0]
+        yield [(project_id, calculation_data) for _, project_id, calculation_data in rows]
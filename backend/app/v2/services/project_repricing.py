@@ -0,0 +1,212 @@
+"""Re-pricing stored projects against the current pricing configuration.
+
+Every calculation payload saved by ``/scope/generate`` is stamped with
+``pricing_config_fingerprint``, a digest of the pricing sources (MASTER_CONFIG
+and its subtype modules, margins, type profiles, regional multipliers). When
+any of them change, stored payloads carrying an older stamp are stale and can
+be recomputed from the inputs saved alongside them (``parsed_input``).
+
+``reprice_stored_calculation`` is the pure per-project step; it takes and
+returns JSON text so it can run in a worker process.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from app.v2.config.master_config import MASTER_CONFIG, BuildingType, OwnershipType, ProjectClass
+
+# Bump to re-price every stored project after an engine change that no config
+# source reflects.
+PRICING_FINGERPRINT_VERSION = 1
+PRICING_FINGERPRINT_KEY = "pricing_config_fingerprint"
+
+_APP_DIR = Path(__file__).resolve().parents[2]
+PRICING_CONFIG_SOURCE_DIRS: Tuple[Path, ...] = (_APP_DIR / "v2" / "config",)
+PRICING_CONFIG_SOURCE_FILES: Tuple[Path, ...] = (_APP_DIR / "config" / "regional_multipliers.py",)
+
+# Stored keys that are inputs or user choices rather than engine output.
+PRESERVED_PAYLOAD_KEYS = (
+    "request_data",
+    "parsed_input",
+    "project_classification",
+    "dealshield_controls",
+)
+
+# (label, dotted path) of the totals recorded in re-pricing diffs.
+KEY_TOTALS: Tuple[Tuple[str, str], ...] = (
+    ("total_project_cost", "totals.total_project_cost"),
+    ("hard_costs", "totals.hard_costs"),
+    ("soft_costs", "totals.soft_costs"),
+    ("cost_per_sf", "totals.cost_per_sf"),
+    ("construction_total", "construction_costs.construction_total"),
+    ("annual_revenue", "revenue_analysis.annual_revenue"),
+    ("net_income", "revenue_analysis.net_income"),
+)
+
+REPRICE_STATUS_REPRICED = "repriced"
+REPRICE_STATUS_SKIPPED = "skipped"
+REPRICE_STATUS_FAILED = "failed"
+
+
+@lru_cache(maxsize=1)
+def pricing_config_fingerprint() -> str:
+    """Digest of every pricing source file; stable for the life of the process."""
+    digest = hashlib.sha256(f"v{PRICING_FINGERPRINT_VERSION}".encode("utf-8"))
+    paths = list(PRICING_CONFIG_SOURCE_FILES)
+    for source_dir in PRICING_CONFIG_SOURCE_DIRS:
+        paths.extend(source_dir.rglob("*.py"))
+    for path in sorted(paths):
+        digest.update(path.relative_to(_APP_DIR).as_posix().encode("utf-8"))
+        digest.update(path.read_bytes())
+    return digest.hexdigest()[:32]
+
+
+def pricing_fingerprint_marker(fingerprint: Optional[str] = None) -> str:
+    """The stamp as it appears in ``json.dumps`` output, for text/SQL matching."""
+    return f'"{PRICING_FINGERPRINT_KEY}": "{fingerprint or pricing_config_fingerprint()}"'
+
+
+def stamp_pricing_fingerprint(payload: Dict[str, Any]) -> Dict[str, Any]:
+    payload[PRICING_FINGERPRINT_KEY] = pricing_config_fingerprint()
+    return payload
+
+
+def is_stale_calculation_data(calculation_data: Optional[str]) -> bool:
+    return bool(calculation_data) and pricing_fingerprint_marker() not in calculation_data
+
+
+def engine_kwargs_from_parsed_input(parsed: Mapping[str, Any]) -> Dict[str, Any]:
+    """``calculate_project`` arguments for a normalized ``parsed_input`` block."""
+    project_class = parsed.get("project_class") or parsed.get("project_classification") or "ground_up"
+    return {
+        "building_type": BuildingType(parsed.get("building_type", "office")),
+        "subtype": parsed.get("subtype"),
+        "square_footage": parsed.get("square_footage", 10000),
+        "location": parsed.get("location", "Nashville, TN"),
+        "project_class": ProjectClass(project_class),
+        "floors": parsed.get("floors", 1),
+        "ownership_type": OwnershipType(parsed.get("ownership_type", "for_profit")),
+        "finish_level": parsed.get("finish_level", "standard"),
+        "finish_level_source": parsed.get("finish_level_source"),
+        "special_features": parsed.get("special_features", []),
+        "parsed_input_overrides": dict(parsed),
+    }
+
+
+def _resolve_path(payload: Mapping[str, Any], dotted_path: str) -> Any:
+    current: Any = payload
+    for part in dotted_path.split("."):
+        if not isinstance(current, Mapping):
+            return None
+        current = current.get(part)
+    return current
+
+
+def key_totals(payload: Mapping[str, Any]) -> Dict[str, Optional[float]]:
+    totals: Dict[str, Optional[float]] = {}
+    for label, dotted_path in KEY_TOTALS:
+        value = _resolve_path(payload, dotted_path)
+        totals[label] = float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+    return totals
+
+
+def diff_key_totals(
+    before: Mapping[str, Optional[float]],
+    after: Mapping[str, Optional[float]],
+) -> Dict[str, Dict[str, Optional[float]]]:
+    """Changed totals only: ``{label: {before, after, delta, delta_pct}}``."""
+    changes: Dict[str, Dict[str, Optional[float]]] = {}
+    for label, _ in KEY_TOTALS:
+        old, new = before.get(label), after.get(label)
+        if old == new:
+            continue
+        delta = new - old if old is not None and new is not None else None
+        changes[label] = {
+            "before": old,
+            "after": new,
+            "delta": delta,
+            "delta_pct": (delta / old * 100.0) if delta is not None and old else None,
+        }
+    return changes
+
+
+def reprice_payload(payload: Mapping[str, Any], engine: Any) -> Optional[Dict[str, Any]]:
+    """Recompute a stored payload from its saved inputs; None when it has none."""
+    parsed = payload.get("parsed_input")
+    if not isinstance(parsed, Mapping) or not parsed.get("building_type"):
+        return None
+
+    from app.v2.services.dealshield_scenarios import build_dealshield_scenarios
+
+    kwargs = engine_kwargs_from_parsed_input(parsed)
+    repriced = engine.calculate_project(**kwargs)
+    for key in PRESERVED_PAYLOAD_KEYS:
+        if key in payload:
+            repriced[key] = payload[key]
+
+    # calculate_project builds scenarios with default controls.
+    if isinstance(payload.get("dealshield_controls"), dict) and repriced.get("dealshield_tile_profile"):
+        building_config = MASTER_CONFIG.get(kwargs["building_type"], {}).get(kwargs["subtype"])
+        if building_config is not None:
+            repriced["dealshield_scenarios"] = build_dealshield_scenarios(repriced, building_config, engine)
+    return stamp_pricing_fingerprint(repriced)
+
+
+@dataclass
+class RepricedProject:
+    row_id: int
+    project_id: str
+    status: str
+    calculation_data: Optional[str] = None
+    cost_data: Optional[str] = None
+    total_cost: Optional[float] = None
+    subtotal: Optional[float] = None
+    cost_per_sqft: Optional[float] = None
+    changes: Dict[str, Dict[str, Optional[float]]] = field(default_factory=dict)
+    summary: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def report_entry(self) -> Dict[str, Any]:
+        entry: Dict[str, Any] = {"project_id": self.project_id, "status": self.status}
+        if self.status == REPRICE_STATUS_REPRICED:
+            entry["changes"] = self.changes
+        if self.error:
+            entry["error"] = self.error
+        return entry
+
+
+def reprice_stored_calculation(row: Tuple[int, str, Optional[str]]) -> RepricedProject:
+    """Worker step: ``(row id, project_id, calculation_data)`` -> new column values."""
+    row_id, project_id, calculation_data = row
+    try:
+        payload = json.loads(calculation_data) if calculation_data else None
+        if not isinstance(payload, dict):
+            return RepricedProject(row_id, project_id, REPRICE_STATUS_SKIPPED, error="no stored calculation payload")
+
+        from app.v2.engines.unified_engine import unified_engine
+        from app.v2.services.portfolio_summary import project_summary_values
+
+        repriced = reprice_payload(payload, unified_engine)
+        if repriced is None:
+            return RepricedProject(row_id, project_id, REPRICE_STATUS_SKIPPED, error="no stored parsed_input")
+
+        after = key_totals(repriced)
+        return RepricedProject(
+            row_id,
+            project_id,
+            REPRICE_STATUS_REPRICED,
+            calculation_data=json.dumps(repriced),
+            cost_data=json.dumps(repriced.get("construction_costs", {})),
+            total_cost=after["total_project_cost"] or 0,
+            subtotal=after["construction_total"] or 0,
+            cost_per_sqft=after["cost_per_sf"] or 0,
+            changes=diff_key_totals(key_totals(payload), after),
+            summary=project_summary_values(project_id, repriced),
+        )
+    except Exception as exc:
+        return RepricedProject(row_id, project_id, REPRICE_STATUS_FAILED, error=f"{type(exc).__name__}: {exc}")
@@ -0,0 +1,305 @@
+"""Full-text and faceted project search over ``project_search_documents``.
+
+Every stored project has one search document: its name, description,
+location, building type and subtype as one text column, plus the facet
+columns (type, class, total cost, created date). Documents are written next
+to the calculation payload on generate and re-price and go away with the
+project. The text column is indexed by an FTS5 table on SQLite and a GIN
+``to_tsvector`` index on Postgres (see app/db/models.py).
+
+Facet counts use every active filter except the facet's own, so the UI can
+show how many projects each alternative value would return.
+"""
+from __future__ import annotations
+
+import re
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, bindparam, case, column, func, literal_column, or_, select, table, update
+from sqlalchemy.orm import Session
+
+from app.db.models import Project, ProjectAccess, ProjectSearchDocument
+
+DEFAULT_SEARCH_LIMIT = 25
+MAX_SEARCH_LIMIT = 100
+MAX_QUERY_TERMS = 8
+UNAVAILABLE_FACET = "n/a"
+
+# Upper bounds (exclusive) and labels for total project cost.
+COST_BANDS: Tuple[Tuple[Optional[float], str], ...] = (
+    (1_000_000.0, "<1M"),
+    (5_000_000.0, "1-5M"),
+    (20_000_000.0, "5-20M"),
+    (50_000_000.0, "20-50M"),
+    (None, "50M+"),
+)
+
+_TERM_PATTERN = re.compile(r"[^\W_]+", re.UNICODE)
+_fts_table = table("project_search_fts", column("rowid"), column("rank"))
+
+
+def _as_dict(value: Any) -> Dict[str, Any]:
+    return value if isinstance(value, dict) else {}
+
+
+def _number(value: Any) -> Optional[float]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    number = float(value)
+    return number if number == number else None
+
+
+def _readable(value: Any) -> Optional[str]:
+    return value.replace("_", " ") if isinstance(value, str) and value.strip() else None
+
+
+def project_search_values(project: Project, payload: Mapping[str, Any]) -> Dict[str, Any]:
+    """Search document column values for a project and its calculation payload."""
+    payload = payload if isinstance(payload, Mapping) else {}
+    project_info = _as_dict(payload.get("project_info"))
+    totals = _as_dict(payload.get("totals"))
+    building_type = project_info.get("building_type") or getattr(project, "building_type", None) or None
+    subtype = project_info.get("subtype") or None
+    text_parts = (
+        getattr(project, "name", None),
+        getattr(project, "description", None),
+        getattr(project, "location", None),
+        _readable(building_type),
+        _readable(subtype),
+        project_info.get("display_name"),
+    )
+    return {
+        "building_type": building_type,
+        "subtype": subtype,
+        "project_class": project_info.get("project_class") or getattr(project, "project_classification", None),
+        "total_cost": _number(totals.get("total_project_cost")) or _number(getattr(project, "total_cost", None)),
+        "project_created_at": getattr(project, "created_at", None),
+        "document": " ".join(part.strip() for part in text_parts if isinstance(part, str) and part.strip()),
+    }
+
+
+def upsert_project_search_document(
+    db: Session,
+    project: Project,
+    org_id: str,
+    payload: Mapping[str, Any],
+) -> ProjectSearchDocument:
+    """Refresh ``project``'s search document in the caller's transaction."""
+    values = project_search_values(project, payload)
+    document = project.search_document
+    if document is None:
+        document = ProjectSearchDocument(project_id=project.project_id, org_id=org_id)
+        project.search_document = document
+    for field_name, value in values.items():
+        setattr(document, field_name, value)
+    return document
+
+
+def update_search_document_costs(db: Session, total_cost_by_project_id: Mapping[str, Optional[float]]) -> None:
+    """Bulk-refresh the cost facet after a re-price; the searchable text is unchanged."""
+    if not total_cost_by_project_id:
+        return
+    statement = (
+        update(ProjectSearchDocument)
+        .where(ProjectSearchDocument.project_id == bindparam("target_project_id"))
+        .values(total_cost=bindparam("new_total_cost"))
+        .execution_options(synchronize_session=False)
+    )
+    db.connection().execute(
+        statement,
+        [
+            {"target_project_id": project_id, "new_total_cost": total_cost}
+            for project_id, total_cost in total_cost_by_project_id.items()
+        ],
+    )
+
+
+def iter_projects_without_search_document(db: Session, batch_size: int) -> Iterable[List[Tuple[Project, str]]]:
+    """Batches of ``(project, org_id)`` for org-scoped projects lacking a search document."""
+    last_id = 0
+    while True:
+        rows = (
+            db.query(Project, ProjectAccess.org_id)
+            .join(ProjectAccess, ProjectAccess.project_id == Project.project_id)
+            .outerjoin(ProjectSearchDocument, ProjectSearchDocument.project_id == Project.project_id)
+            .filter(ProjectSearchDocument.id.is_(None))
+            .filter(Project.id > last_id)
+            .order_by(Project.id.asc())
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            return
+        last_id = rows[-1][0].id
+        yield [(project, org_id) for project, org_id in rows]
+
+
+def search_terms(query: Optional[str]) -> List[str]:
+    """Lower-cased word terms of a free-text query; punctuation and operators are dropped."""
+    if not isinstance(query, str):
+        return []
+    return [term.lower() for term in _TERM_PATTERN.findall(query)][:MAX_QUERY_TERMS]
+
+
+def _cost_band_expression():
+    cost = ProjectSearchDocument.total_cost
+    whens = [(cost.is_(None), UNAVAILABLE_FACET)]
+    whens.extend((cost < bound, label) for bound, label in COST_BANDS if bound is not None)
+    return case(*whens, else_=COST_BANDS[-1][1])
+
+
+def _cost_band_condition(label: str):
+    cost = ProjectSearchDocument.total_cost
+    if label == UNAVAILABLE_FACET:
+        return cost.is_(None)
+    lower = None
+    for bound, band_label in COST_BANDS:
+        if band_label == label:
+            conditions = [cost.isnot(None)]
+            if lower is not None:
+                conditions.append(cost >= lower)
+            if bound is not None:
+                conditions.append(cost < bound)
+            return and_(*conditions)
+        lower = bound
+    raise ValueError(f"Unknown cost band '{label}'")
+
+
+def _text_match(db: Session, terms: Sequence[str]):
+    """(condition, rank ordering, optional ranked FTS source) for the dialect in use."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        match = literal_column("project_search_fts").op("MATCH")(" ".join('"{}"*'.format(term) for term in terms))
+        # Counts and facets only need membership; bm25 rank is computed once, for
+        # the page query, from a materialized CTE so MATCH isn't re-run per row.
+        ranked = (
+            select(_fts_table.c.rowid, _fts_table.c.rank)
+            .where(match)
+            .cte("fts_matches")
+            .prefix_with("MATERIALIZED")
+        )
+        condition = ProjectSearchDocument.id.in_(select(_fts_table.c.rowid).where(match))
+        return condition, ranked.c.rank.asc(), ranked
+    if dialect == "postgresql":
+        # Literal config so the expression matches the GIN index definition.
+        config = literal_column("'english'")
+        vector = func.to_tsvector(config, ProjectSearchDocument.document)
+        query = func.to_tsquery(config, " & ".join(f"{term}:*" for term in terms))
+        return vector.op("@@")(query), func.ts_rank(vector, query).desc(), None
+    conditions = [ProjectSearchDocument.document.ilike(f"%{term}%") for term in terms]
+    return and_(*conditions), ProjectSearchDocument.project_created_at.desc(), None
+
+
+def search_projects(
+    db: Session,
+    org_id: str,
+    query: Optional[str] = None,
+    *,
+    building_types: Sequence[str] = (),
+    project_classes: Sequence[str] = (),
+    cost_bands: Sequence[str] = (),
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    limit: int = DEFAULT_SEARCH_LIMIT,
+    offset: int = 0,
+) -> Dict[str, Any]:
+    """Ranked matches for ``query`` in the org plus facet counts for the filtered set."""
+    limit = max(1, min(int(limit), MAX_SEARCH_LIMIT))
+    offset = max(0, int(offset))
+    terms = search_terms(query)
+
+    base_conditions = [ProjectSearchDocument.org_id == org_id]
+    ordering = [ProjectSearchDocument.project_created_at.desc(), ProjectSearchDocument.id.desc()]
+    text_condition = fts_source = None
+    if terms:
+        text_condition, rank_order, fts_source = _text_match(db, terms)
+        ordering.insert(0, rank_order)
+        base_conditions.append(text_condition)
+    if created_from is not None:
+        base_conditions.append(ProjectSearchDocument.project_created_at >= created_from)
+    if created_to is not None:
+        base_conditions.append(ProjectSearchDocument.project_created_at <= created_to)
+
+    facet_conditions = {
+        "building_type": ProjectSearchDocument.building_type.in_(list(building_types)) if building_types else None,
+        "project_class": ProjectSearchDocument.project_class.in_(list(project_classes)) if project_classes else None,
+        "cost_band": or_(*[_cost_band_condition(label) for label in cost_bands]) if cost_bands else None,
+    }
+
+    def filtered(statement, skip_facet: Optional[str] = None):
+        conditions = list(base_conditions)
+        conditions.extend(
+            condition
+            for facet, condition in facet_conditions.items()
+            if condition is not None and facet != skip_facet
+        )
+        return statement.where(*conditions)
+
+    total = db.execute(filtered(select(func.count(ProjectSearchDocument.id)))).scalar_one()
+    page = select(
+        ProjectSearchDocument.project_id,
+        Project.name,
+        Project.location,
+        ProjectSearchDocument.building_type,
+        ProjectSearchDocument.subtype,
+        ProjectSearchDocument.project_class,
+        ProjectSearchDocument.total_cost,
+        ProjectSearchDocument.project_created_at,
+    ).join(Project, Project.project_id == ProjectSearchDocument.project_id)
+    if fts_source is not None:
+        page = page.join(fts_source, fts_source.c.rowid == ProjectSearchDocument.id)
+    rows = db.execute(
+        filtered(page)
+        .order_by(*ordering)
+        .limit(limit)
+        .offset(offset)
+    ).all()
+
+    facets = {
+        "building_type": _facet_counts(db, filtered, "building_type", ProjectSearchDocument.building_type),
+        "project_class": _facet_counts(db, filtered, "project_class", ProjectSearchDocument.project_class),
+        "cost_band": _facet_counts(db, filtered, "cost_band", _cost_band_expression(), order=COST_BANDS),
+    }
+    earliest, latest = db.execute(
+        filtered(select(func.min(ProjectSearchDocument.project_created_at), func.max(ProjectSearchDocument.project_created_at)))
+    ).one()
+    facets["created_at"] = {"earliest": _isoformat(earliest), "latest": _isoformat(latest)}
+
+    return {
+        "query": " ".join(terms),
+        "total": int(total),
+        "limit": limit,
+        "offset": offset,
+        "results": [
+            {
+                "project_id": project_id,
+                "name": name,
+                "location": location,
+                "building_type": building_type,
+                "subtype": subtype,
+                "project_class": project_class,
+                "total_cost": total_cost,
+                "created_at": _isoformat(created_at),
+            }
+            for project_id, name, location, building_type, subtype, project_class, total_cost, created_at in rows
+        ],
+        "facets": facets,
+    }
+
+
+def _facet_counts(db: Session, filtered, facet: str, expression, order=None) -> List[Dict[str, Any]]:
+    value = expression.label("value")
+    counts = db.execute(
+        filtered(select(value, func.count(ProjectSearchDocument.id)), skip_facet=facet).group_by(value)
+    ).all()
+    if order is None:
+        ranked = sorted(counts, key=lambda row: (-row[1], row[0] or ""))
+        return [{"value": row[0] or UNAVAILABLE_FACET, "project_count": int(row[1])} for row in ranked]
+    by_value = dict(counts)
+    labels = [label for _, label in order] + [UNAVAILABLE_FACET]
+    return [{"value": label, "project_count": int(by_value.get(label, 0))} for label in labels]
+
+
+def _isoformat(value: Any) -> Optional[str]:
+    return value.isoformat() if isinstance(value, datetime) else None
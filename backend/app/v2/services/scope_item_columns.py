@@ -0,0 +1,293 @@
+"""Columnar scope-item profiles.
+
+A scope-item profile is compiled once into flat per-item columns (keys,
+labels, unit codes, share-of-trade shares and quantity-rule coefficients), with
+each trade owning a contiguous row range. Per request, quantities for every
+square-footage driven rule are computed for all rows at once, totals are one
+multiply per row, and dicts are only built for the systems that are returned.
+
+Rules that read user overrides (office/warehouse SF, dock counts, mezzanines)
+or that fail to compile are left to the engine's per-item resolver, so their
+behaviour and error messages are unchanged.
+"""
+from __future__ import annotations
+
+import math
+from array import array
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Tuple
+
+QUANTITY_RULE_SF = 0
+QUANTITY_RULE_CONSTANT = 1
+QUANTITY_RULE_ROUND_PER_SF = 2
+QUANTITY_RULE_CEIL_PER_SF = 3
+QUANTITY_RULE_DYNAMIC = 4
+
+# quantity_rule.type -> (default sf per unit, default minimum) for count rules.
+_ROUND_PER_SF_RULES: Dict[str, Tuple[float, int]] = {
+    "rtu_count": (15000.0, 1),
+    "exhaust_fan_count": (40000.0, 1),
+}
+_CEIL_PER_SF_RULES: Dict[str, Tuple[float, int]] = {
+    "restroom_groups": (25000.0, 1),
+}
+_PER_SF_PARAM_NAMES = {
+    "rtu_count": "sf_per_unit",
+    "exhaust_fan_count": "sf_per_unit",
+    "restroom_groups": "sf_per_group",
+}
+
+DynamicQuantityResolver = Callable[[Mapping[str, Any], float, str], Any]
+
+
+@dataclass(frozen=True)
+class CompiledConditionalRescale:
+    trigger_row: int
+    target_rows: Tuple[int, ...]
+    remaining_share: float
+
+
+@dataclass(frozen=True)
+class CompiledScopeTrade:
+    trade_key: str
+    trade_label: str
+    start: int
+    stop: int
+    conditional_rescales: Tuple[CompiledConditionalRescale, ...] = ()
+
+
+@dataclass(frozen=True)
+class CompiledScopeItemProfile:
+    profile_id: str
+    trades: Tuple[CompiledScopeTrade, ...]
+    keys: Tuple[str, ...]
+    labels: Tuple[str, ...]
+    units: Tuple[str, ...]
+    shares: array
+    omit_if_zero_quantity: Tuple[bool, ...]
+    rule_kinds: bytes
+    rule_divisors: array
+    rule_minimums: Tuple[int, ...]
+    constant_quantities: Tuple[Any, ...]
+    dynamic_rules: Mapping[int, Mapping[str, Any]]
+    # Row indices per rule kind, so each kind is evaluated in one pass.
+    sf_rows: Tuple[int, ...] = ()
+    round_per_sf_rows: Tuple[int, ...] = ()
+    ceil_per_sf_rows: Tuple[int, ...] = ()
+
+    def static_quantities(self, square_footage: float) -> List[Any]:
+        """Quantities of every square-footage driven row; None for dynamic rows."""
+        sf = float(square_footage)
+        quantities = list(self.constant_quantities)
+        minimums, divisors = self.rule_minimums, self.rule_divisors
+        for row in self.sf_rows:
+            quantities[row] = sf
+        for row in self.round_per_sf_rows:
+            quantities[row] = max(minimums[row], int(round(sf / divisors[row])))
+        for row in self.ceil_per_sf_rows:
+            quantities[row] = max(minimums[row], int(math.ceil(sf / divisors[row])))
+        return quantities
+
+
+def _compile_quantity_rule(quantity_rule: Mapping[str, Any]) -> Tuple[int, float, int, Any]:
+    """(kind, divisor, minimum, constant) mirroring the engine's resolver."""
+    rule_type = str(quantity_rule.get("type") or "").strip().lower()
+    params = quantity_rule.get("params") if isinstance(quantity_rule.get("params"), dict) else {}
+
+    if rule_type == "sf":
+        return QUANTITY_RULE_SF, 0.0, 0, None
+    if rule_type == "constant":
+        return QUANTITY_RULE_CONSTANT, 0.0, 0, params.get("value", 1.0) or 1.0
+
+    per_sf_defaults = _ROUND_PER_SF_RULES.get(rule_type) or _CEIL_PER_SF_RULES.get(rule_type)
+    if per_sf_defaults is None:
+        return QUANTITY_RULE_DYNAMIC, 0.0, 0, None
+
+    default_divisor, default_minimum = per_sf_defaults
+    param_name = _PER_SF_PARAM_NAMES[rule_type]
+    divisor = float(params.get(param_name, default_divisor) or default_divisor)
+    minimum = int(params.get("minimum", default_minimum) or default_minimum)
+    if divisor <= 0:
+        return QUANTITY_RULE_CONSTANT, 0.0, 0, minimum
+    kind = QUANTITY_RULE_ROUND_PER_SF if rule_type in _ROUND_PER_SF_RULES else QUANTITY_RULE_CEIL_PER_SF
+    return kind, divisor, minimum, None
+
+
+def compile_scope_item_profile(profile_id: str, profile: Mapping[str, Any]) -> CompiledScopeItemProfile:
+    """Compile a profile (overrides already applied) into columns."""
+    trade_profiles = profile.get("trade_profiles")
+    if isinstance(trade_profiles, list):
+        trade_sources = [trade_profile for trade_profile in trade_profiles if isinstance(trade_profile, dict)]
+    else:
+        trade_sources = [profile]
+
+    keys: List[str] = []
+    labels: List[str] = []
+    units: List[str] = []
+    shares = array("d")
+    omit_if_zero: List[bool] = []
+    kinds = bytearray()
+    divisors = array("d")
+    minimums: List[int] = []
+    constants: List[Any] = []
+    dynamic_rules: Dict[int, Mapping[str, Any]] = {}
+    trades: List[CompiledScopeTrade] = []
+
+    for trade_profile in trade_sources:
+        trade_key = str(trade_profile.get("trade_key") or "").strip().lower()
+        items = trade_profile.get("items")
+        if not trade_key or not isinstance(items, list):
+            continue
+
+        start = len(keys)
+        row_by_key: Dict[str, int] = {}
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            key = str(item.get("key") or "").strip()
+            quantity_rule = item.get("quantity_rule")
+            if not key or not isinstance(quantity_rule, dict):
+                continue
+
+            row = len(keys)
+            row_by_key[key] = row
+            try:
+                kind, divisor, minimum, constant = _compile_quantity_rule(quantity_rule)
+            except (TypeError, ValueError):
+                # Malformed params: the engine resolver raises when (and only
+                # when) the trade is actually built.
+                kind, divisor, minimum, constant = QUANTITY_RULE_DYNAMIC, 0.0, 0, None
+            if kind == QUANTITY_RULE_DYNAMIC:
+                dynamic_rules[row] = quantity_rule
+
+            allocation = item.get("allocation")
+            share = 0.0
+            if isinstance(allocation, dict) and allocation.get("type") == "share_of_trade":
+                share = max(0.0, float(allocation.get("share", 0.0) or 0.0))
+
+            keys.append(key)
+            labels.append(str(item.get("label") or key))
+            units.append(str(item.get("unit") or "LS"))
+            shares.append(share)
+            omit_if_zero.append(bool(item.get("omit_if_zero_quantity")))
+            kinds.append(kind)
+            divisors.append(divisor)
+            minimums.append(minimum)
+            constants.append(constant)
+
+        if len(keys) == start:
+            continue
+
+        rescales: List[CompiledConditionalRescale] = []
+        conditional_rescales = trade_profile.get("conditional_rescales")
+        for rule in conditional_rescales if isinstance(conditional_rescales, list) else []:
+            if not isinstance(rule, dict):
+                continue
+            trigger_key = str(rule.get("trigger_item_key") or "").strip()
+            target_item_keys = rule.get("target_item_keys")
+            if not trigger_key or not isinstance(target_item_keys, list) or not target_item_keys:
+                continue
+            rescales.append(
+                CompiledConditionalRescale(
+                    # -1 never triggers: a missing item has no quantity.
+                    trigger_row=row_by_key.get(trigger_key, -1),
+                    target_rows=tuple(row_by_key[str(key)] for key in target_item_keys if str(key) in row_by_key),
+                    remaining_share=float(rule.get("remaining_share", 1.0) or 1.0),
+                )
+            )
+
+        trades.append(
+            CompiledScopeTrade(
+                trade_key=trade_key,
+                trade_label=str(trade_profile.get("trade_label") or trade_key.replace("_", " ").title()),
+                start=start,
+                stop=len(keys),
+                conditional_rescales=tuple(rescales),
+            )
+        )
+
+    return CompiledScopeItemProfile(
+        profile_id=profile_id,
+        trades=tuple(trades),
+        keys=tuple(keys),
+        labels=tuple(labels),
+        units=tuple(units),
+        shares=shares,
+        omit_if_zero_quantity=tuple(omit_if_zero),
+        rule_kinds=bytes(kinds),
+        rule_divisors=divisors,
+        rule_minimums=tuple(minimums),
+        constant_quantities=tuple(constants),
+        dynamic_rules=dynamic_rules,
+        sf_rows=tuple(row for row, kind in enumerate(kinds) if kind == QUANTITY_RULE_SF),
+        round_per_sf_rows=tuple(row for row, kind in enumerate(kinds) if kind == QUANTITY_RULE_ROUND_PER_SF),
+        ceil_per_sf_rows=tuple(row for row, kind in enumerate(kinds) if kind == QUANTITY_RULE_CEIL_PER_SF),
+    )
+
+
+def _safe_unit_cost(total: float, quantity: float) -> float:
+    if not quantity:
+        return 0.0
+    return total / quantity
+
+
+def build_trade_systems(
+    profile: CompiledScopeItemProfile,
+    trade: CompiledScopeTrade,
+    trade_total: float,
+    quantities: List[Any],
+    resolve_dynamic: DynamicQuantityResolver,
+    square_footage: float,
+) -> List[Dict[str, Any]]:
+    """System rows for one trade; fills the trade's dynamic quantities in place."""
+    rows = range(trade.start, trade.stop)
+    for row in rows:
+        if row in profile.dynamic_rules:
+            quantities[row] = resolve_dynamic(profile.dynamic_rules[row], square_footage, profile.keys[row])
+
+    shares = profile.shares[trade.start:trade.stop]
+    for rescale in trade.conditional_rescales:
+        if rescale.trigger_row < 0 or float(quantities[rescale.trigger_row] or 0.0) <= 0:
+            continue
+        target_total = sum(shares[row - trade.start] for row in rescale.target_rows)
+        if target_total <= 0:
+            continue
+        scale = rescale.remaining_share / target_total
+        for row in rescale.target_rows:
+            shares[row - trade.start] *= scale
+
+    totals = [trade_total * share for share in shares]
+    systems: List[Dict[str, Any]] = []
+    for offset, row in enumerate(rows):
+        quantity = quantities[row]
+        numeric_quantity = float(quantity or 0.0)
+        if numeric_quantity <= 0 and profile.omit_if_zero_quantity[row]:
+            continue
+        total_cost = totals[offset]
+        systems.append({
+            "name": profile.labels[row],
+            "quantity": quantity,
+            "unit": profile.units[row],
+            "unit_cost": _safe_unit_cost(total_cost, numeric_quantity),
+            "total_cost": total_cost,
+        })
+    return systems
+
+
+def build_profile_systems(
+    profile: CompiledScopeItemProfile,
+    trades: Mapping[str, Any],
+    square_footage: float,
+    resolve_dynamic: DynamicQuantityResolver,
+) -> List[Tuple[CompiledScopeTrade, List[Dict[str, Any]]]]:
+    """(trade, systems) for every trade with a positive total, in profile order."""
+    quantities = profile.static_quantities(square_footage)
+    built: List[Tuple[CompiledScopeTrade, List[Dict[str, Any]]]] = []
+    for trade in profile.trades:
+        trade_total = float(trades.get(trade.trade_key, 0.0) or 0.0)
+        if trade_total <= 0:
+            continue
+        systems = build_trade_systems(profile, trade, trade_total, quantities, resolve_dynamic, square_footage)
+        if systems:
+            built.append((trade, systems))
+    return built
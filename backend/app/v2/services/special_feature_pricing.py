@@ -1,8 +1,10 @@
 from dataclasses import dataclass, field
 import math
+from types import MappingProxyType
 from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 from app.v2.config.master_config import (
+    MASTER_CONFIG,
     BuildingConfig,
     SpecialFeaturePricingBasis,
     SpecialFeatureCountPricingMode,
@@ -51,7 +53,10 @@ class NormalizedSpecialFeatureCountBand:
 @dataclass(frozen=True)
 class NormalizedSpecialFeatureDefaultCountRule:
     rule_type: str
-    params: Dict[str, Any] = field(default_factory=dict)
+    params: Mapping[str, Any] = field(default_factory=dict)
+    # Coerced from ``params`` when the rule is normalized.
+    default_min_count: int = 1
+    sf_per_count: float = 10000.0
 
 
 @dataclass(frozen=True)
@@ -121,6 +126,14 @@ class AppliedSpecialFeaturePricing:
     trade_allocation_note: Optional[str] = None
 
 
+@dataclass(frozen=True)
+class CompiledSpecialFeaturePricingRules:
+    rules_by_feature_id: Mapping[str, NormalizedSpecialFeaturePricingRule]
+    pricing_status_by_feature_id: Mapping[str, str]
+    # The raw rules this was compiled from, to notice a swapped config dict.
+    source: Any = None
+
+
 @dataclass(frozen=True)
 class ComposedTradeBreakdown:
     trade_breakdown: Dict[str, float]
@@ -315,9 +328,41 @@ def _normalize_default_count_rule(
             "must be a dictionary"
         )
 
+    params = {str(key): value for key, value in raw_params.items()}
+    default_min = _coerce_optional_float(
+        feature_id=feature_id,
+        field_name="default_count_rule.params.default_min",
+        raw_value=params.get("default_min"),
+    )
+    default_min_count = max(0, int(round(default_min if default_min is not None else 1.0)))
+    if rule_type == "dock_count":
+        sf_per_count = _coerce_optional_float(
+            feature_id=feature_id,
+            field_name="default_count_rule.params.default_sf_per_dock",
+            raw_value=params.get("default_sf_per_dock"),
+        )
+        sf_per_count_value = float(sf_per_count if sf_per_count is not None else 10000.0)
+        sf_per_count_param = "default_sf_per_dock"
+    else:
+        sf_per_count = _coerce_optional_float(
+            feature_id=feature_id,
+            field_name="default_count_rule.params.sf_per_count",
+            raw_value=params.get("sf_per_count"),
+            required=True,
+        )
+        sf_per_count_value = float(sf_per_count)
+        sf_per_count_param = "sf_per_count"
+    if sf_per_count_value <= 0:
+        raise ValueError(
+            f"Special feature default count rule '{rule_type}' for feature '{feature_id}' "
+            f"must define a positive '{sf_per_count_param}'"
+        )
+
     return NormalizedSpecialFeatureDefaultCountRule(
         rule_type=rule_type,
-        params={str(key): value for key, value in raw_params.items()},
+        params=MappingProxyType(params),
+        default_min_count=default_min_count,
+        sf_per_count=sf_per_count_value,
     )
 
 
@@ -420,28 +465,11 @@ def _resolve_default_count_quantity(
     default_count_rule = rule.default_count_rule
     if default_count_rule is not None:
         if default_count_rule.rule_type == "dock_count":
-            default_min = _coerce_optional_float(
-                feature_id=rule.feature_id,
-                field_name="default_count_rule.params.default_min",
-                raw_value=default_count_rule.params.get("default_min"),
-            )
-            default_sf_per_dock = _coerce_optional_float(
-                feature_id=rule.feature_id,
-                field_name="default_count_rule.params.default_sf_per_dock",
-                raw_value=default_count_rule.params.get("default_sf_per_dock"),
-            )
-            default_min_count = max(
-                0,
-                int(round(default_min if default_min is not None else 1.0)),
-            )
-            sf_per_dock = float(default_sf_per_dock if default_sf_per_dock is not None else 10000.0)
-            if sf_per_dock <= 0:
-                raise ValueError(
-                    f"Special feature default count rule 'dock_count' for feature '{rule.feature_id}' "
-                    "must define a positive 'default_sf_per_dock'"
-                )
             resolved_quantity = _normalize_count_quantity(
-                max(default_min_count, int(round(sf_value / sf_per_dock)))
+                max(
+                    default_count_rule.default_min_count,
+                    int(round(sf_value / default_count_rule.sf_per_count)),
+                )
             )
             if resolved_quantity is not None:
                 return ResolvedSpecialFeatureCountQuantity(
@@ -451,29 +479,11 @@ def _resolve_default_count_quantity(
         if default_count_rule.rule_type == "count_per_sf_ceil":
             if sf_value <= 0:
                 return None
-            default_min = _coerce_optional_float(
-                feature_id=rule.feature_id,
-                field_name="default_count_rule.params.default_min",
-                raw_value=default_count_rule.params.get("default_min"),
-            )
-            sf_per_count = _coerce_optional_float(
-                feature_id=rule.feature_id,
-                field_name="default_count_rule.params.sf_per_count",
-                raw_value=default_count_rule.params.get("sf_per_count"),
-                required=True,
-            )
-            default_min_count = max(
-                0,
-                int(round(default_min if default_min is not None else 1.0)),
-            )
-            sf_per_count_value = float(sf_per_count if sf_per_count is not None else 5000.0)
-            if sf_per_count_value <= 0:
-                raise ValueError(
-                    f"Special feature default count rule 'count_per_sf_ceil' for feature '{rule.feature_id}' "
-                    "must define a positive 'sf_per_count'"
-                )
             resolved_quantity = _normalize_count_quantity(
-                max(default_min_count, int(math.ceil(sf_value / sf_per_count_value)))
+                max(
+                    default_count_rule.default_min_count,
+                    int(math.ceil(sf_value / default_count_rule.sf_per_count)),
+                )
             )
             if resolved_quantity is not None:
                 return ResolvedSpecialFeatureCountQuantity(
@@ -677,11 +687,81 @@ def resolve_default_count_quantity_for_rule(
     )
 
 
+def compile_special_feature_pricing_rules(
+    building_config: BuildingConfig,
+) -> CompiledSpecialFeaturePricingRules:
+    """Normalize and validate every special feature rule of one config."""
+    available_feature_costs = building_config.special_features or {}
+    pricing_statuses = building_config.special_feature_pricing_statuses or {}
+
+    rules_by_feature_id: Dict[str, NormalizedSpecialFeaturePricingRule] = {}
+    pricing_status_by_feature_id: Dict[str, str] = {}
+    for feature_id, raw_rule in available_feature_costs.items():
+        rules_by_feature_id[feature_id] = normalize_special_feature_pricing_rule(
+            feature_id=feature_id,
+            raw_rule=raw_rule,
+        )
+        status = pricing_statuses.get(feature_id, INCREMENTAL)
+        if status not in VALID_SPECIAL_FEATURE_PRICING_STATUSES:
+            raise ValueError(
+                f"Invalid special feature pricing status '{status}' for feature '{feature_id}'"
+            )
+        pricing_status_by_feature_id[feature_id] = status
+
+    return CompiledSpecialFeaturePricingRules(
+        rules_by_feature_id=MappingProxyType(rules_by_feature_id),
+        pricing_status_by_feature_id=MappingProxyType(pricing_status_by_feature_id),
+        source=building_config.special_features,
+    )
+
+
+# id(BuildingConfig) -> (config, compiled rules). Holding the config keeps its
+# id from being reused by another object.
+_COMPILED_RULES_BY_CONFIG: Dict[int, Tuple[BuildingConfig, CompiledSpecialFeaturePricingRules]] = {}
+
+
+def get_compiled_special_feature_pricing_rules(
+    building_config: BuildingConfig,
+) -> CompiledSpecialFeaturePricingRules:
+    cached = _COMPILED_RULES_BY_CONFIG.get(id(building_config))
+    if (
+        cached is not None
+        and cached[0] is building_config
+        and cached[1].source is building_config.special_features
+    ):
+        return cached[1]
+    compiled = compile_special_feature_pricing_rules(building_config)
+    _COMPILED_RULES_BY_CONFIG[id(building_config)] = (building_config, compiled)
+    return compiled
+
+
+def compile_master_config_special_feature_pricing_rules() -> int:
+    """
+    Compile the special feature rules of every MASTER_CONFIG subtype.
+
+    Called at startup so a malformed rule fails the deploy instead of the first
+    request that selects it. Returns the number of compiled rules.
+    """
+    compiled_rule_count = 0
+    for building_type, subtypes in MASTER_CONFIG.items():
+        for subtype, building_config in subtypes.items():
+            try:
+                compiled = get_compiled_special_feature_pricing_rules(building_config)
+            except ValueError as exc:
+                raise ValueError(
+                    f"Invalid special feature pricing config for {building_type.value}/{subtype}: {exc}"
+                ) from exc
+            compiled_rule_count += len(compiled.rules_by_feature_id)
+    return compiled_rule_count
+
+
 def resolve_normalized_special_feature_pricing_rules(
     building_config: BuildingConfig,
     selected_feature_ids: Optional[Iterable[str]],
 ) -> List[NormalizedSpecialFeaturePricingRule]:
-    available_feature_costs = building_config.special_features or {}
+    rules_by_feature_id = get_compiled_special_feature_pricing_rules(
+        building_config
+    ).rules_by_feature_id
     normalized_rules: List[NormalizedSpecialFeaturePricingRule] = []
     seen_feature_ids = set()
 
@@ -690,15 +770,11 @@ def resolve_normalized_special_feature_pricing_rules(
             continue
         if feature_id in seen_feature_ids:
             continue
-        if feature_id not in available_feature_costs:
+        rule = rules_by_feature_id.get(feature_id)
+        if rule is None:
             continue
 
-        normalized_rules.append(
-            normalize_special_feature_pricing_rule(
-                feature_id=feature_id,
-                raw_rule=available_feature_costs[feature_id],
-            )
-        )
+        normalized_rules.append(rule)
         seen_feature_ids.add(feature_id)
 
     return normalized_rules
@@ -1080,8 +1156,9 @@ def resolve_special_feature_pricing(
     building_config: BuildingConfig,
     selected_feature_ids: Optional[Iterable[str]],
 ) -> ResolvedSpecialFeaturePricing:
-    available_feature_costs = building_config.special_features or {}
-    pricing_statuses = building_config.special_feature_pricing_statuses or {}
+    compiled_status_by_feature_id = get_compiled_special_feature_pricing_rules(
+        building_config
+    ).pricing_status_by_feature_id
 
     resolved_selected_feature_ids: List[str] = []
     incremental_feature_ids: List[str] = []
@@ -1094,15 +1171,10 @@ def resolve_special_feature_pricing(
             continue
         if feature_id in seen_feature_ids:
             continue
-        if feature_id not in available_feature_costs:
+        status = compiled_status_by_feature_id.get(feature_id)
+        if status is None:
             continue
 
-        status = pricing_statuses.get(feature_id, INCREMENTAL)
-        if status not in VALID_SPECIAL_FEATURE_PRICING_STATUSES:
-            raise ValueError(
-                f"Invalid special feature pricing status '{status}' for feature '{feature_id}'"
-            )
-
         seen_feature_ids.add(feature_id)
         resolved_selected_feature_ids.append(feature_id)
         pricing_status_by_feature_id[feature_id] = status
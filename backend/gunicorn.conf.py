@@ -0,0 +1,58 @@
+"""Preforked production server: ``gunicorn -c gunicorn.conf.py app.main:app``.
+
+The app and its read-only config are loaded once in the master and shared
+copy-on-write with the uvicorn workers (see app/core/prefork.py).
+"""
+import os
+
+from app.core.prefork import (
+    freeze_for_fork,
+    read_process_memory,
+    reset_after_fork,
+    warm_shared_state,
+)
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+# os.cpu_count() reports the host's cores inside Railway/Docker containers, not
+# the container's CPU quota, and every worker starts its own export process
+# pool. Default to a small fixed count; raise WEB_CONCURRENCY to match the
+# container's actual CPU and memory.
+DEFAULT_WORKERS = 2
+workers = max(1, int(os.getenv("WEB_CONCURRENCY") or DEFAULT_WORKERS))
+worker_class = "uvicorn.workers.UvicornWorker"
+preload_app = True
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+graceful_timeout = 30
+keepalive = 5
+accesslog = "-"
+errorlog = "-"
+
+
+def when_ready(server):
+    summary = warm_shared_state()
+    frozen = freeze_for_fork()
+    server.log.info(
+        "Shared config loaded: %s; %s objects frozen before forking %s workers",
+        ", ".join(f"{key}={value}" for key, value in summary.items()),
+        frozen,
+        server.num_workers,
+    )
+    master = read_process_memory()
+    if master is not None:
+        server.log.info("Master memory %s", master.describe())
+
+
+def pre_fork(server, worker):
+    # Objects created since the last fork (e.g. by a replaced worker's
+    # bookkeeping) are frozen too, so every worker starts fully shared.
+    freeze_for_fork()
+
+
+def post_fork(server, worker):
+    reset_after_fork()
+
+
+def post_worker_init(worker):
+    memory = read_process_memory()
+    if memory is not None:
+        worker.log.info("Worker memory %s", memory.describe())
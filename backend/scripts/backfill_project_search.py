@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""Create project_search_documents rows for org-scoped projects saved before they existed.
+
+New and updated projects write their search document themselves; this only
+fills the gap for older rows, one batch per transaction, and is safe to re-run.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.db.models import ProjectSearchDocument
+from app.v2.services.project_search import iter_projects_without_search_document, project_search_values
+
+DEFAULT_BATCH_SIZE = 500
+
+
+def backfill_project_search(session_factory: Callable[[], Session], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    db = session_factory()
+    written = 0
+    try:
+        for rows in iter_projects_without_search_document(db, batch_size):
+            documents = []
+            for project, org_id in rows:
+                try:
+                    payload = json.loads(project.calculation_data) if project.calculation_data else {}
+                except ValueError:
+                    payload = {}
+                documents.append({
+                    "project_id": project.project_id,
+                    "org_id": org_id,
+                    **project_search_values(project, payload),
+                })
+            db.bulk_insert_mappings(ProjectSearchDocument, documents)
+            db.commit()
+            written += len(documents)
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+    return written
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Projects per transaction")
+    args = parser.parse_args()
+
+    from app.db.database import SessionLocal
+
+    written = backfill_project_search(SessionLocal, args.batch_size)
+    print(f"project_search_documents_written={written}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Create project_summaries rows for org-scoped projects saved before they existed.
+
+New and updated projects write their summary row themselves; this only fills
+the gap for older rows, one batch per transaction, and is safe to re-run.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.v2.services.portfolio_summary import (
+    iter_projects_without_summary,
+    project_summary_values,
+    write_project_summaries,
+)
+
+DEFAULT_BATCH_SIZE = 500
+
+
+def backfill_project_summaries(session_factory: Callable[[], Session], batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    db = session_factory()
+    written = 0
+    try:
+        for rows in iter_projects_without_summary(db, batch_size):
+            values_by_project_id = {}
+            for project_id, calculation_data in rows:
+                try:
+                    payload = json.loads(calculation_data) if calculation_data else {}
+                except ValueError:
+                    payload = {}
+                values_by_project_id[project_id] = project_summary_values(project_id, payload)
+            written += write_project_summaries(db, values_by_project_id)
+            db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+    return written
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Projects per transaction")
+    args = parser.parse_args()
+
+    from app.db.database import SessionLocal
+
+    written = backfill_project_summaries(SessionLocal, args.batch_size)
+    print(f"project_summaries_written={written}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
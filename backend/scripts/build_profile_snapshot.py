@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""Prebuild the type-profile snapshot that workers load via SPECSHARP_PROFILE_SNAPSHOT."""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.v2.config.type_profiles.profile_registry import PROFILE_SNAPSHOT_ENV, build_profile_snapshot
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("output", help="Snapshot path, e.g. build/type_profiles.snapshot")
+    args = parser.parse_args()
+
+    try:
+        counts = build_profile_snapshot(args.output)
+    except Exception as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 1
+    for registry_name, count in counts.items():
+        print(f"{registry_name}: {count} profiles")
+    print(f"Wrote {args.output}; set {PROFILE_SNAPSHOT_ENV}={args.output} to load it at startup")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
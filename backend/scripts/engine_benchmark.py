@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""Benchmark the engine and report pipeline across every MASTER_CONFIG subtype.
+
+Every (BuildingType, subtype) is run at several sizes and finish levels, and
+each pipeline stage is timed separately:
+
+    calculate_project -> build_dealshield_scenarios -> build_dealshield_view_model
+    -> compose_decision_packet_input -> render_decision_packet_html
+
+Timings are the best of ``--repeats`` runs per case. A second, untimed pass
+under tracemalloc records each stage's peak traced memory and the memory it
+leaves allocated (its output). Results are compared against the committed
+baseline (``engine_benchmark_baseline.json``); a stage or building type that
+is slower or heavier than the baseline by more than ``--threshold`` fails the
+run. Baselines are machine-specific, so refresh them with ``--write-baseline``
+on the machine that runs the comparison.
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.v2.config.master_config import MASTER_CONFIG, BuildingType, ProjectClass
+
+BASELINE_PATH = Path(__file__).resolve().with_name("engine_benchmark_baseline.json")
+BASELINE_VERSION = 1
+
+SQUARE_FOOTAGES = (12_000, 60_000, 240_000)
+FINISH_LEVELS = ("standard", "premium", "luxury")
+LOCATION = "Nashville, TN"
+
+STAGES = (
+    "calculate_project",
+    "build_dealshield_scenarios",
+    "build_dealshield_view_model",
+    "compose_decision_packet_input",
+    "render_decision_packet_html",
+)
+
+DEFAULT_THRESHOLD = 0.25
+# Differences below these floors are timer/allocator noise, never regressions.
+MIN_DELTA_MS = 0.25
+MIN_DELTA_KB = 32.0
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    building_type: BuildingType
+    subtype: str
+    square_footage: int
+    finish_level: str
+
+    @property
+    def name(self) -> str:
+        return f"{self.building_type.value}/{self.subtype}/{self.square_footage}/{self.finish_level}"
+
+
+@dataclass
+class StageSample:
+    seconds: float
+    peak_kb: float = 0.0
+    allocated_kb: float = 0.0
+
+
+def build_cases(
+    building_types: Optional[Iterable[str]] = None,
+    square_footages: Sequence[int] = SQUARE_FOOTAGES,
+    finish_levels: Sequence[str] = FINISH_LEVELS,
+) -> List[BenchmarkCase]:
+    selected = set(building_types) if building_types else None
+    cases: List[BenchmarkCase] = []
+    for building_type, subtypes in MASTER_CONFIG.items():
+        if selected is not None and building_type.value not in selected:
+            continue
+        for subtype in subtypes:
+            for square_footage in square_footages:
+                for finish_level in finish_levels:
+                    cases.append(BenchmarkCase(building_type, subtype, square_footage, finish_level))
+    return cases
+
+
+def _pipeline(case: BenchmarkCase) -> List[Tuple[str, Callable[[], Any]]]:
+    """Stage callables for one case; each stage reads the previous stage's output."""
+    from app.services.decision_packet_export import (
+        compose_decision_packet_input,
+        hydrate_project_payload_for_packet,
+        render_decision_packet_html,
+        sanitize_decision_packet_export,
+    )
+    from app.v2.config.type_profiles.dealshield_tiles import get_dealshield_profile
+    from app.v2.engines.unified_engine import unified_engine
+    from app.v2.services.dealshield_scenarios import build_dealshield_scenarios
+    from app.v2.services.dealshield_service import build_dealshield_view_model
+
+    building_config = MASTER_CONFIG[case.building_type][case.subtype]
+    project_id = f"bench_{case.building_type.value}_{case.subtype}"
+    project = SimpleNamespace(
+        project_id=project_id,
+        name=case.name,
+        square_footage=case.square_footage,
+        location=LOCATION,
+        building_type=case.building_type.value,
+    )
+    state: Dict[str, Any] = {}
+
+    def calculate() -> Any:
+        state["payload"] = unified_engine.calculate_project(
+            building_type=case.building_type,
+            subtype=case.subtype,
+            square_footage=case.square_footage,
+            location=LOCATION,
+            project_class=ProjectClass.GROUND_UP,
+            finish_level=case.finish_level,
+        )
+        return state["payload"]
+
+    def scenarios() -> Any:
+        state["payload"]["dealshield_scenarios"] = build_dealshield_scenarios(
+            state["payload"], building_config, unified_engine
+        )
+        return state["payload"]["dealshield_scenarios"]
+
+    def view_model() -> Any:
+        profile = get_dealshield_profile(state["payload"]["dealshield_tile_profile"])
+        state["view_model"] = build_dealshield_view_model(project_id, state["payload"], profile)
+        return state["view_model"]
+
+    def compose() -> Any:
+        project_payload = hydrate_project_payload_for_packet(
+            project,
+            {"project_name": case.name, "calculation_data": state["payload"], "location": LOCATION},
+        )
+        state["packet"] = compose_decision_packet_input(
+            project=project,
+            project_payload=project_payload,
+            payload=state["payload"],
+            dealshield_view_model=state["view_model"],
+            client_name="Benchmark Client",
+        )
+        return state["packet"]
+
+    def render() -> Any:
+        return render_decision_packet_html(sanitize_decision_packet_export(state["packet"]))
+
+    return list(zip(STAGES, (calculate, scenarios, view_model, compose, render)))
+
+
+@contextlib.contextmanager
+def _quiet_stdout():
+    # The engine prints trace lines; keep them out of the report.
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        yield
+
+
+def time_case(case: BenchmarkCase, repeats: int) -> Dict[str, StageSample]:
+    best: Dict[str, StageSample] = {}
+    for _ in range(max(1, repeats)):
+        for stage, run in _pipeline(case):
+            started = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - started
+            if stage not in best or elapsed < best[stage].seconds:
+                best[stage] = StageSample(seconds=elapsed)
+    return best
+
+
+def measure_case_memory(case: BenchmarkCase, samples: Dict[str, StageSample]) -> None:
+    tracemalloc.start()
+    try:
+        for stage, run in _pipeline(case):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            result = run()
+            after, peak = tracemalloc.get_traced_memory()
+            samples[stage].peak_kb = max(0, peak - before) / 1024
+            samples[stage].allocated_kb = max(0, after - before) / 1024
+            del result
+    finally:
+        tracemalloc.stop()
+
+
+def _percentile(values: Sequence[float], fraction: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def _stage_stats(samples: Sequence[StageSample]) -> Dict[str, float]:
+    milliseconds = [sample.seconds * 1000 for sample in samples]
+    return {
+        "calls": len(samples),
+        "total_ms": round(sum(milliseconds), 3),
+        "mean_ms": round(sum(milliseconds) / len(milliseconds), 3),
+        "p95_ms": round(_percentile(milliseconds, 0.95), 3),
+        "max_ms": round(max(milliseconds), 3),
+        "peak_kb_mean": round(sum(sample.peak_kb for sample in samples) / len(samples), 1),
+        "peak_kb_max": round(max(sample.peak_kb for sample in samples), 1),
+        "allocated_kb_mean": round(sum(sample.allocated_kb for sample in samples) / len(samples), 1),
+    }
+
+
+def run_benchmark(
+    cases: Sequence[BenchmarkCase],
+    repeats: int = 3,
+    measure_memory: bool = True,
+    on_case: Optional[Callable[[BenchmarkCase], None]] = None,
+) -> Dict[str, Any]:
+    by_stage: Dict[str, List[StageSample]] = {stage: [] for stage in STAGES}
+    by_building_type: Dict[str, Dict[str, List[StageSample]]] = {}
+    with _quiet_stdout():
+        for case in cases:
+            samples = time_case(case, repeats)
+            if measure_memory:
+                measure_case_memory(case, samples)
+            type_samples = by_building_type.setdefault(case.building_type.value, {stage: [] for stage in STAGES})
+            for stage, sample in samples.items():
+                by_stage[stage].append(sample)
+                type_samples[stage].append(sample)
+            if on_case is not None:
+                on_case(case)
+
+    return {
+        "version": BASELINE_VERSION,
+        "settings": {
+            "cases": len(cases),
+            "subtypes": len({(case.building_type, case.subtype) for case in cases}),
+            "square_footages": sorted({case.square_footage for case in cases}),
+            "finish_levels": sorted({case.finish_level for case in cases}),
+            "repeats": repeats,
+            "memory": measure_memory,
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+        },
+        "stages": {stage: _stage_stats(samples) for stage, samples in by_stage.items() if samples},
+        "building_types": {
+            building_type: {stage: _stage_stats(samples) for stage, samples in stages.items() if samples}
+            for building_type, stages in sorted(by_building_type.items())
+        },
+    }
+
+
+def _compared_metrics(memory: bool) -> Tuple[Tuple[str, float], ...]:
+    metrics: Tuple[Tuple[str, float], ...] = (("mean_ms", MIN_DELTA_MS), ("p95_ms", MIN_DELTA_MS))
+    if memory:
+        metrics += (("peak_kb_max", MIN_DELTA_KB),)
+    return metrics
+
+
+def compare_to_baseline(
+    results: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+) -> List[str]:
+    """Regressions of ``results`` against ``baseline``, as readable lines."""
+    memory = bool(results.get("settings", {}).get("memory")) and bool(baseline.get("settings", {}).get("memory"))
+    metrics = _compared_metrics(memory)
+    groups: List[Tuple[str, Dict[str, Any], Dict[str, Any]]] = [
+        ("stage", results.get("stages", {}), baseline.get("stages", {}))
+    ]
+    for building_type, stages in results.get("building_types", {}).items():
+        groups.append((building_type, stages, baseline.get("building_types", {}).get(building_type, {})))
+
+    regressions: List[str] = []
+    for label, current_stages, baseline_stages in groups:
+        for stage, current in current_stages.items():
+            reference = baseline_stages.get(stage)
+            if not reference:
+                continue
+            for metric, floor in metrics:
+                old, new = reference.get(metric), current.get(metric)
+                if old is None or new is None:
+                    continue
+                if new - old > floor and new > old * (1 + threshold):
+                    regressions.append(
+                        f"{label} {stage} {metric}: {new:.3f} vs baseline {old:.3f} "
+                        f"(+{(new / old - 1) * 100 if old else float('inf'):.0f}%)"
+                    )
+    return regressions
+
+
+def format_report(results: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None) -> str:
+    lines = [
+        f"cases={results['settings']['cases']} subtypes={results['settings']['subtypes']} "
+        f"repeats={results['settings']['repeats']}",
+        f"{'stage':<32}{'calls':>6}{'mean_ms':>10}{'p95_ms':>10}{'max_ms':>10}{'peak_kb':>10}{'alloc_kb':>10}{'vs_base':>9}",
+    ]
+    for stage, stats in results["stages"].items():
+        reference = (baseline or {}).get("stages", {}).get(stage)
+        change = f"{(stats['mean_ms'] / reference['mean_ms'] - 1) * 100:+.0f}%" if reference and reference["mean_ms"] else "-"
+        lines.append(
+            f"{stage:<32}{stats['calls']:>6}{stats['mean_ms']:>10.3f}{stats['p95_ms']:>10.3f}{stats['max_ms']:>10.3f}"
+            f"{stats['peak_kb_max']:>10.1f}{stats['allocated_kb_mean']:>10.1f}{change:>9}"
+        )
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark engine and report stages for every MASTER_CONFIG subtype.")
+    parser.add_argument("--building-type", action="append", default=None, help="Limit to a building type (repeatable)")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per case; the best is kept")
+    parser.add_argument("--quick", action="store_true", help="One size and finish level per subtype")
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc pass")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Allowed slowdown as a fraction")
+    parser.add_argument("--write-baseline", action="store_true", help="Write results to --baseline instead of comparing")
+    parser.add_argument("--output", type=Path, default=None, help="Also write results JSON to this path")
+    args = parser.parse_args()
+
+    cases = build_cases(
+        args.building_type,
+        square_footages=SQUARE_FOOTAGES[1:2] if args.quick else SQUARE_FOOTAGES,
+        finish_levels=FINISH_LEVELS[:1] if args.quick else FINISH_LEVELS,
+    )
+    if not cases:
+        print("ERROR: no benchmark cases selected", file=sys.stderr)
+        return 1
+
+    results = run_benchmark(cases, repeats=args.repeats, measure_memory=not args.no_memory)
+    if args.output is not None:
+        args.output.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    if args.write_baseline:
+        args.baseline.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(format_report(results))
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline.exists() else None
+    print(format_report(results, baseline))
+    if baseline is None:
+        print(f"no baseline at {args.baseline}; run with --write-baseline to record one")
+        return 0
+    if baseline.get("settings", {}).get("cases") != results["settings"]["cases"]:
+        print("note: case set differs from the baseline; per-call statistics are still compared")
+
+    regressions = compare_to_baseline(results, baseline, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION: {regression}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
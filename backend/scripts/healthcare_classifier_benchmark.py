@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Benchmark healthcare facility classification throughput.
+
+Classifies the healthcare NLP collision prompts
+(tests/test_healthcare_nlp_collision.py) with the compiled keyword scan and
+with a per-keyword substring scan over the same keyword tables, the way the
+classifier worked before the tables were compiled. Both scans must produce
+the same signals, and every prompt must classify as the facility type its
+fixture expects.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, List, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.services import healthcare_classifier
+from app.services.healthcare_classifier import HEALTHCARE_KEYWORDS, Signal, healthcare_classifier as classifier
+from tests.test_healthcare_nlp_collision import IMAGING_CENTER_PROMPTS, URGENT_CARE_WITH_IMAGING_PROMPTS
+
+Case = Tuple[str, str]
+
+
+def build_cases() -> List[Case]:
+    return [
+        *((prompt, "urgent_care") for prompt in URGENT_CARE_WITH_IMAGING_PROMPTS),
+        *((prompt, "imaging_center") for prompt in IMAGING_CENTER_PROMPTS),
+    ]
+
+
+def _keyword_tables() -> List[Tuple[Tuple[str, ...], Signal]]:
+    tables: List[Tuple[Tuple[str, ...], Signal]] = []
+    tables.extend((keywords, ("facility", name)) for name, keywords in healthcare_classifier.FACILITY_TYPE_KEYWORDS)
+    tables.extend((keywords, ("hospital", name)) for name, keywords in healthcare_classifier.HOSPITAL_SUBTYPE_KEYWORDS)
+    tables.extend((keywords, ("specialty", name)) for name, keywords in healthcare_classifier.SPECIALTY_KEYWORDS.items())
+    tables.extend((keywords, ("space", name)) for name, keywords in healthcare_classifier.SPECIAL_SPACE_KEYWORDS.items())
+    tables.append((healthcare_classifier.OSHPD_LOCATION_KEYWORDS, ("location", "oshpd")))
+    return tables
+
+
+KEYWORD_TABLES = _keyword_tables()
+
+
+def scan_by_substring(text: str) -> FrozenSet[Signal]:
+    """The pre-compilation path: one ``in`` check per keyword."""
+    return frozenset(signal for keywords, signal in KEYWORD_TABLES if any(keyword in text for keyword in keywords))
+
+
+def time_path(scan: Callable[[str], FrozenSet[Signal]], texts: Sequence[str], iterations: int) -> float:
+    """Best-of-iterations seconds for one pass over ``texts``."""
+    best = float("inf")
+    for _ in range(iterations):
+        started = time.perf_counter()
+        for text in texts:
+            scan(text)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run_benchmark(cases: Sequence[Case], iterations: int = 200, repeat: int = 50) -> Dict[str, object]:
+    texts = [description.lower() for description, _ in cases] * repeat
+    mismatches = [
+        description
+        for description, expected in cases
+        if classifier.classify_healthcare_facility(description)["facility_type"] != expected
+        or HEALTHCARE_KEYWORDS.scan(description.lower()) != scan_by_substring(description.lower())
+    ]
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for description, _ in cases:
+            classifier.classify_healthcare_facility(description)
+    classify_seconds = time.perf_counter() - started
+    classifications = len(cases) * repeat
+
+    return {
+        "classifications": classifications,
+        "classify_per_sec": classifications / classify_seconds,
+        "scan_us": {
+            "substring": time_path(scan_by_substring, texts, iterations) / len(texts) * 1e6,
+            "compiled": time_path(HEALTHCARE_KEYWORDS.scan, texts, iterations) / len(texts) * 1e6,
+        },
+        "mismatches": mismatches,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200, help="Passes per scan path; the best is reported")
+    parser.add_argument("--repeat", type=int, default=50, help="Copies of the prompt set per pass")
+    args = parser.parse_args()
+
+    cases = build_cases()
+    results = run_benchmark(cases, iterations=args.iterations, repeat=args.repeat)
+    if results["mismatches"]:
+        for description in results["mismatches"]:
+            print(f"ERROR: compiled classification disagrees for {description!r}", file=sys.stderr)
+        return 1
+
+    scan_us = results["scan_us"]
+    print(f"prompts={len(cases)} classifications={results['classifications']} "
+          f"classify_per_sec={results['classify_per_sec']:,.0f}")
+    for name, micros in scan_us.items():
+        print(f"{name:<10} scan_us={micros:6.2f}")
+    print(f"speedup={scan_us['substring'] / scan_us['compiled']:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
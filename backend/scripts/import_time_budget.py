@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Measure module import cost with ``-X importtime`` and enforce a startup budget.
+
+Each target is imported in a fresh interpreter (best of ``--runs``) so the
+numbers match what a new uvicorn worker or test process pays.
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Cumulative microseconds per target. Importing the engine used to cost ~850ms,
+# almost all of it matplotlib and pydantic models pulled in by app.services.
+IMPORT_BUDGETS_US: Dict[str, int] = {
+    "app.v2.engines.unified_engine": 400_000,
+}
+
+# Modules the target must not import at all; they belong to other request paths.
+FORBIDDEN_IMPORTS: Dict[str, Tuple[str, ...]] = {
+    "app.v2.engines.unified_engine": (
+        "matplotlib",
+        "numpy",
+        "app.services.sketcher",
+        "app.services.climate_service",
+        "app.models.scope",
+    ),
+}
+
+
+@dataclass(frozen=True)
+class ImportProfile:
+    target: str
+    cumulative_us: int
+    modules: Dict[str, Tuple[int, int]]
+
+    def top(self, limit: int = 10) -> List[Tuple[str, int, int]]:
+        ranked = sorted(self.modules.items(), key=lambda item: item[1][0], reverse=True)
+        return [(name, self_us, cumulative) for name, (self_us, cumulative) in ranked[:limit]]
+
+
+def parse_importtime(stderr: str) -> Dict[str, Tuple[int, int]]:
+    modules: Dict[str, Tuple[int, int]] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_part, cumulative_part, name = line[len("import time:"):].split("|", 2)
+        try:
+            modules[name.strip()] = (int(self_part), int(cumulative_part))
+        except ValueError:
+            continue  # header row
+    return modules
+
+
+def measure_import(target: str, runs: int = 3) -> ImportProfile:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT), env.get("PYTHONPATH")]))
+    best: ImportProfile | None = None
+    for _ in range(max(1, runs)):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+            cwd=ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        modules = parse_importtime(completed.stderr)
+        profile = ImportProfile(target, modules[target][1], modules)
+        if best is None or profile.cumulative_us < best.cumulative_us:
+            best = profile
+    return best
+
+
+def check_budget(profile: ImportProfile) -> List[str]:
+    problems = []
+    for forbidden in FORBIDDEN_IMPORTS.get(profile.target, ()):
+        if forbidden in profile.modules:
+            problems.append(f"{profile.target} imports {forbidden}")
+    budget = IMPORT_BUDGETS_US.get(profile.target)
+    if budget is not None and profile.cumulative_us > budget:
+        problems.append(
+            f"{profile.target} import took {profile.cumulative_us / 1000:.1f}ms "
+            f"(budget {budget / 1000:.1f}ms)"
+        )
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Check backend import-time budgets.")
+    parser.add_argument("targets", nargs="*", default=sorted(IMPORT_BUDGETS_US))
+    parser.add_argument("--runs", type=int, default=3, help="Fresh interpreters per target (best is kept).")
+    parser.add_argument("--top", type=int, default=10, help="Slowest modules to print by self time.")
+    args = parser.parse_args()
+
+    failures: List[str] = []
+    for target in args.targets:
+        profile = measure_import(target, runs=args.runs)
+        print(f"{target}: {profile.cumulative_us / 1000:.1f}ms cumulative")
+        for name, self_us, cumulative_us in profile.top(args.top):
+            print(f"  {self_us / 1000:8.1f}ms self {cumulative_us / 1000:8.1f}ms cum  {name}")
+        failures.extend(check_budget(profile))
+
+    for failure in failures:
+        print(f"ERROR: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""Local HTTP load test for the v2 API.
+
+Boots ``app.main:app`` under uvicorn in a subprocess with the TESTING auth
+bypass, rate limiting off and a throwaway SQLite database, so no external
+service is needed. It then replays a weighted mix of ``/analyze``,
+``/scope/generate`` and ``/scope/projects/{id}/dealshield`` requests at
+increasing concurrency. Descriptions and locations are built from the parity
+fixtures (``scripts/audit/parity/fixtures``); DealShield reads target projects
+created during warm-up and by the generate traffic itself. Server output goes
+to a log in the temporary directory and is printed if the run fails.
+
+Each concurrency step reports throughput, p50/p95/p99 latency and the error
+rate per endpoint. Error rates count non-2xx responses and ``success: false``
+bodies. ``--output`` writes the report as sorted JSON, so reports from two
+commits diff cleanly. Point ``--url`` at an already running server to skip
+booting one.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import httpx
+
+ROOT = Path(__file__).resolve().parents[1]
+PARITY_FIXTURES_PATH = ROOT.parent / "scripts" / "audit" / "parity" / "fixtures" / "basic_fixtures.json"
+
+REPORT_VERSION = 1
+API_PREFIX = "/api/v2"
+
+# Relative request weights; roughly how the UI spends its traffic.
+DEFAULT_MIX: Dict[str, int] = {
+    "analyze": 4,
+    "generate": 2,
+    "dealshield": 4,
+}
+DEFAULT_CONCURRENCY_STEPS = (1, 2, 4, 8, 16)
+DEFAULT_STEP_SECONDS = 10.0
+DEFAULT_LOCATION = "Nashville, TN"
+REQUEST_TIMEOUT_SECONDS = 60.0
+SERVER_START_TIMEOUT_SECONDS = 60.0
+
+
+@dataclass(frozen=True)
+class Sample:
+    endpoint: str
+    latency_ms: float
+    ok: bool
+
+
+def load_request_bodies(path: Optional[Path] = None) -> List[Dict[str, Any]]:
+    """Analyze/generate bodies, one per parity fixture, or one per description line of ``path``.
+
+    The UI sends the location field alongside the description, so every body
+    carries an explicit ``City, ST`` location.
+    """
+    if path is not None:
+        return [
+            {"description": line.strip(), "location": DEFAULT_LOCATION}
+            for line in path.read_text(encoding="utf-8").splitlines()
+            if line.strip()
+        ]
+
+    fixtures = json.loads(PARITY_FIXTURES_PATH.read_text(encoding="utf-8"))
+    bodies = []
+    for fixture in sorted(fixtures, key=lambda item: item.get("id", "")):
+        location = (fixture.get("extra_inputs") or {}).get("location", DEFAULT_LOCATION)
+        subtype = str(fixture.get("subtype") or fixture.get("building_type")).replace("_", " ")
+        prefix = "Renovate a" if fixture.get("project_class") == "renovation" else "New"
+        bodies.append(
+            {
+                "description": f"{prefix} {int(fixture['square_footage']):,} sf {subtype} in {location}",
+                "location": location,
+            }
+        )
+    return bodies
+
+
+class RequestMix:
+    """Seeded, weighted endpoint choice plus the pool of generated project ids."""
+
+    def __init__(self, bodies: Sequence[Dict[str, Any]], weights: Dict[str, int], seed: int = 0):
+        if not bodies:
+            raise ValueError("load test needs at least one request body")
+        self.bodies = list(bodies)
+        self.endpoints = [endpoint for endpoint, weight in weights.items() if weight > 0]
+        self.weights = [weights[endpoint] for endpoint in self.endpoints]
+        self.project_ids: List[str] = []
+        self._rng = random.Random(seed)
+
+    def next_request(self) -> Tuple[str, str, str, Optional[Dict[str, Any]]]:
+        """``(endpoint, method, path, json body)``; DealShield falls back to generate until a project exists."""
+        endpoint = self._rng.choices(self.endpoints, self.weights)[0]
+        if endpoint == "dealshield" and self.project_ids:
+            project_id = self._rng.choice(self.project_ids)
+            return endpoint, "GET", f"{API_PREFIX}/scope/projects/{project_id}/dealshield", None
+        if endpoint == "dealshield":
+            endpoint = "generate"
+        path = f"{API_PREFIX}/analyze" if endpoint == "analyze" else f"{API_PREFIX}/scope/generate"
+        return endpoint, "POST", path, dict(self._rng.choice(self.bodies))
+
+    def remember(self, endpoint: str, body: Any) -> None:
+        if endpoint != "generate" or not isinstance(body, dict):
+            return
+        project_id = (body.get("data") or {}).get("project_id")
+        if project_id:
+            self.project_ids.append(project_id)
+
+
+async def _send(client: httpx.AsyncClient, mix: RequestMix) -> Sample:
+    endpoint, method, path, body = mix.next_request()
+    started = time.perf_counter()
+    ok = False
+    try:
+        response = await client.request(method, path, json=body)
+        payload = response.json() if response.headers.get("content-type", "").startswith("application/json") else None
+        ok = response.is_success and not (isinstance(payload, dict) and payload.get("success") is False)
+        if ok:
+            mix.remember(endpoint, payload)
+    except (httpx.HTTPError, ValueError):
+        pass
+    return Sample(endpoint, (time.perf_counter() - started) * 1000, ok)
+
+
+async def run_step(client: httpx.AsyncClient, mix: RequestMix, concurrency: int, duration_s: float) -> Dict[str, Any]:
+    samples: List[Sample] = []
+    deadline = time.perf_counter() + duration_s
+
+    async def worker() -> None:
+        while time.perf_counter() < deadline:
+            samples.append(await _send(client, mix))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {"concurrency": concurrency, **summarize(samples, elapsed)}
+
+
+def _percentile(values: Sequence[float], fraction: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+def _endpoint_stats(samples: Sequence[Sample], elapsed_s: float) -> Dict[str, Any]:
+    latencies = [sample.latency_ms for sample in samples]
+    errors = sum(1 for sample in samples if not sample.ok)
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "error_rate": round(errors / len(samples), 4),
+        "throughput_rps": round(len(samples) / elapsed_s, 2) if elapsed_s > 0 else 0.0,
+        "p50_ms": round(_percentile(latencies, 0.50), 2),
+        "p95_ms": round(_percentile(latencies, 0.95), 2),
+        "p99_ms": round(_percentile(latencies, 0.99), 2),
+        "max_ms": round(max(latencies), 2),
+    }
+
+
+def summarize(samples: Sequence[Sample], elapsed_s: float) -> Dict[str, Any]:
+    by_endpoint: Dict[str, List[Sample]] = {}
+    for sample in samples:
+        by_endpoint.setdefault(sample.endpoint, []).append(sample)
+    return {
+        "duration_s": round(elapsed_s, 2),
+        "endpoints": {endpoint: _endpoint_stats(group, elapsed_s) for endpoint, group in sorted(by_endpoint.items())},
+        "total": _endpoint_stats(samples, elapsed_s) if samples else {"requests": 0},
+    }
+
+
+async def warm_up(client: httpx.AsyncClient, mix: RequestMix) -> None:
+    """Create one project per request body so DealShield reads have targets from the first step."""
+    for body in mix.bodies:
+        response = await client.post(f"{API_PREFIX}/scope/generate", json=body)
+        if response.is_success:
+            mix.remember("generate", response.json())
+    if not mix.project_ids:
+        raise RuntimeError("warm-up could not create any project; is the server running with the auth bypass?")
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    mix: RequestMix,
+    concurrency_steps: Sequence[int] = DEFAULT_CONCURRENCY_STEPS,
+    step_seconds: float = DEFAULT_STEP_SECONDS,
+) -> List[Dict[str, Any]]:
+    await warm_up(client, mix)
+    steps = []
+    for concurrency in concurrency_steps:
+        steps.append(await run_step(client, mix, concurrency, step_seconds))
+        print(format_step(steps[-1]), flush=True)
+    return steps
+
+
+def format_step(step: Dict[str, Any]) -> str:
+    lines = [f"concurrency={step['concurrency']} duration_s={step['duration_s']}"]
+    for endpoint, stats in list(step["endpoints"].items()) + [("total", step["total"])]:
+        if not stats.get("requests"):
+            continue
+        lines.append(
+            f"  {endpoint:<11} rps={stats['throughput_rps']:8.2f} p50={stats['p50_ms']:8.1f}ms "
+            f"p95={stats['p95_ms']:8.1f}ms p99={stats['p99_ms']:8.1f}ms errors={stats['error_rate'] * 100:5.1f}%"
+        )
+    return "\n".join(lines)
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def server_environment(database_path: Path) -> Dict[str, str]:
+    env = dict(os.environ)
+    env.update(
+        {
+            "ENVIRONMENT": "test",
+            "TESTING": "true",
+            "DATABASE_URL": f"sqlite:///{database_path}",
+            # slowapi reads RATELIMIT_ENABLED; per-user limits would cap the run.
+            "RATELIMIT_ENABLED": "false",
+            "TRUSTED_HOSTS": "127.0.0.1,localhost",
+            "PYTHONPATH": os.pathsep.join(filter(None, [str(ROOT), os.environ.get("PYTHONPATH")])),
+        }
+    )
+    env.pop("SKIP_AUTH", None)
+    env.pop("RATE_LIMIT_STORAGE_URI", None)
+    return env
+
+
+@contextmanager
+def boot_server(workers: int = 1) -> Iterator[str]:
+    """Run uvicorn against a temporary SQLite database; yields the base URL."""
+    port = _free_port()
+    with tempfile.TemporaryDirectory(prefix="specsharp-load-") as tmp:
+        command = [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--host", "127.0.0.1", "--port", str(port),
+            "--workers", str(workers), "--log-level", "warning",
+        ]
+        log_path = Path(tmp) / "server.log"
+        with log_path.open("w", encoding="utf-8") as log:
+            process = subprocess.Popen(
+                command,
+                cwd=ROOT,
+                env=server_environment(Path(tmp) / "load.db"),
+                stdout=log,
+                stderr=subprocess.STDOUT,
+            )
+        base_url = f"http://127.0.0.1:{port}"
+        try:
+            _wait_until_ready(base_url, process)
+            yield base_url
+        except Exception:
+            print(log_path.read_text(encoding="utf-8")[-4000:], file=sys.stderr)
+            raise
+        finally:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+
+def _wait_until_ready(base_url: str, process: subprocess.Popen) -> None:
+    deadline = time.monotonic() + SERVER_START_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"server exited during startup with code {process.returncode}")
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1.0).is_success:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.25)
+    raise RuntimeError(f"server did not become ready within {SERVER_START_TIMEOUT_SECONDS:.0f}s")
+
+
+def build_report(steps: List[Dict[str, Any]], settings: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "version": REPORT_VERSION,
+        "settings": settings,
+        "environment": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+        },
+        "steps": steps,
+    }
+
+
+async def _run(base_url: str, mix: RequestMix, concurrency_steps: Sequence[int], step_seconds: float) -> List[Dict[str, Any]]:
+    limits = httpx.Limits(max_connections=max(concurrency_steps), max_keepalive_connections=max(concurrency_steps))
+    async with httpx.AsyncClient(base_url=base_url, timeout=REQUEST_TIMEOUT_SECONDS, limits=limits) as client:
+        return await run_load(client, mix, concurrency_steps, step_seconds)
+
+
+def _parse_mix(value: str) -> Dict[str, int]:
+    weights = dict(DEFAULT_MIX)
+    for part in filter(None, (item.strip() for item in value.split(","))):
+        endpoint, _, weight = part.partition("=")
+        if endpoint not in DEFAULT_MIX or not weight.isdigit():
+            raise argparse.ArgumentTypeError(f"invalid mix entry {part!r}; expected e.g. analyze=4,generate=2")
+        weights[endpoint] = int(weight)
+    return weights
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Load test the v2 API on a local server.")
+    parser.add_argument("--url", default=None, help="Target a running server instead of booting one")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers for the booted server")
+    parser.add_argument(
+        "--concurrency",
+        default=",".join(str(step) for step in DEFAULT_CONCURRENCY_STEPS),
+        help="Comma-separated concurrency ramp",
+    )
+    parser.add_argument("--step-seconds", type=float, default=DEFAULT_STEP_SECONDS, help="Duration of each ramp step")
+    parser.add_argument("--mix", type=_parse_mix, default=dict(DEFAULT_MIX), help="Endpoint weights, e.g. analyze=4,generate=2,dealshield=4")
+    parser.add_argument("--descriptions", type=Path, default=None, help="File with one project description per line")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the request mix")
+    parser.add_argument("--output", type=Path, default=None, help="Write the JSON report to this path")
+    args = parser.parse_args()
+
+    try:
+        concurrency_steps = [int(step) for step in args.concurrency.split(",") if step.strip()]
+    except ValueError:
+        print("ERROR: --concurrency must be comma-separated integers", file=sys.stderr)
+        return 1
+    if not concurrency_steps or min(concurrency_steps) <= 0:
+        print("ERROR: --concurrency needs positive steps", file=sys.stderr)
+        return 1
+
+    mix = RequestMix(load_request_bodies(args.descriptions), args.mix, seed=args.seed)
+    settings = {
+        "concurrency_steps": concurrency_steps,
+        "step_seconds": args.step_seconds,
+        "mix": args.mix,
+        "request_bodies": len(mix.bodies),
+        "seed": args.seed,
+        "workers": None if args.url else args.workers,
+    }
+
+    if args.url:
+        steps = asyncio.run(_run(args.url, mix, concurrency_steps, args.step_seconds))
+    else:
+        with boot_server(args.workers) as base_url:
+            steps = asyncio.run(_run(base_url, mix, concurrency_steps, args.step_seconds))
+
+    report = build_report(steps, settings)
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"report written to {args.output}")
+    return 1 if any(step["total"].get("errors") for step in steps) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
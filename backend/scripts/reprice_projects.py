@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""Re-price stored projects whose pricing config fingerprint is stale.
+
+Run after MASTER_CONFIG, margins, type profiles or regional multipliers change.
+Stale projects (calculation_data without the current fingerprint stamp) are
+walked in primary-key batches, recomputed in a process pool and written back
+one batch per transaction, so the API's request path is never involved.
+Each row is written only if its ``calculation_data`` still matches what the
+batch read: a project saved by a user while its batch was being recomputed
+keeps the user's write and is counted as skipped, to be picked up by the next
+run if it is still stale.
+
+The job is resumable: every committed batch is stamped with the current
+fingerprint, so re-running after an interruption only picks up projects that
+are still stale. Projects that fail or have no stored inputs are reported and
+left untouched. Per-project changes to the key totals are written as JSON
+lines to ``--report``.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterator, List, Mapping, Optional, TextIO, Tuple
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.db.models import Project
+from app.v2.services.portfolio_summary import write_project_summaries
+from app.v2.services.project_search import update_search_document_costs
+from app.v2.services.project_repricing import (
+    REPRICE_STATUS_REPRICED,
+    REPRICE_STATUS_SKIPPED,
+    RepricedProject,
+    pricing_config_fingerprint,
+    pricing_fingerprint_marker,
+    reprice_stored_calculation,
+)
+
+DEFAULT_BATCH_SIZE = 200
+CHANGED_DURING_REPRICE = "project changed while re-pricing; left for the next run"
+
+
+@dataclass
+class RepricingProgress:
+    fingerprint: str
+    scanned: int = 0
+    repriced: int = 0
+    skipped: int = 0
+    failed: int = 0
+    batches: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+
+    @property
+    def elapsed_seconds(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    @property
+    def projects_per_second(self) -> float:
+        elapsed = self.elapsed_seconds
+        return self.scanned / elapsed if elapsed > 0 else 0.0
+
+    def record(self, result: RepricedProject) -> None:
+        self.scanned += 1
+        if result.status == REPRICE_STATUS_REPRICED:
+            self.repriced += 1
+        elif result.status == REPRICE_STATUS_SKIPPED:
+            self.skipped += 1
+        else:
+            self.failed += 1
+
+    def summary(self) -> str:
+        return (
+            f"batches={self.batches} scanned={self.scanned} repriced={self.repriced} "
+            f"skipped={self.skipped} failed={self.failed} "
+            f"elapsed_s={self.elapsed_seconds:.1f} projects_per_s={self.projects_per_second:.1f}"
+        )
+
+
+def iter_stale_batches(
+    db: Session,
+    batch_size: int,
+    limit: Optional[int] = None,
+) -> Iterator[List[Tuple[int, str, Optional[str]]]]:
+    """Primary-key ordered batches of stale ``(id, project_id, calculation_data)`` rows."""
+    marker = pricing_fingerprint_marker()
+    last_id = 0
+    remaining = limit
+    while remaining is None or remaining > 0:
+        size = batch_size if remaining is None else min(batch_size, remaining)
+        rows = (
+            db.query(Project.id, Project.project_id, Project.calculation_data)
+            .filter(Project.id > last_id)
+            .filter(Project.calculation_data.isnot(None))
+            .filter(~Project.calculation_data.contains(marker, autoescape=True))
+            .order_by(Project.id.asc())
+            .limit(size)
+            .all()
+        )
+        if not rows:
+            return
+        last_id = rows[-1][0]
+        if remaining is not None:
+            remaining -= len(rows)
+        yield [tuple(row) for row in rows]
+
+
+def write_batch(
+    db: Session,
+    results: List[RepricedProject],
+    read_calculation_data: Mapping[int, Optional[str]],
+) -> int:
+    """Persist one batch of re-priced projects in a single transaction.
+
+    Each update is a compare-and-swap against the ``calculation_data`` the
+    batch read. Rows changed since then are not written; their results are
+    marked skipped.
+    """
+    now = datetime.utcnow()
+    written: List[RepricedProject] = []
+    try:
+        for result in results:
+            if result.status != REPRICE_STATUS_REPRICED:
+                continue
+            outcome = db.execute(
+                update(Project)
+                .where(Project.id == result.row_id)
+                .where(Project.calculation_data == read_calculation_data[result.row_id])
+                .values(
+                    calculation_data=result.calculation_data,
+                    # Legacy mirrors written by /scope/generate.
+                    scope_data=result.calculation_data,
+                    cost_data=result.cost_data,
+                    total_cost=result.total_cost,
+                    subtotal=result.subtotal,
+                    cost_per_sqft=result.cost_per_sqft,
+                    updated_at=now,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            if outcome.rowcount == 1:
+                written.append(result)
+            else:
+                result.status = REPRICE_STATUS_SKIPPED
+                result.error = CHANGED_DURING_REPRICE
+        if not written:
+            db.rollback()
+            return 0
+        write_project_summaries(db, {result.project_id: result.summary for result in written})
+        update_search_document_costs(db, {result.project_id: result.total_cost for result in written})
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    return len(written)
+
+
+def reprice_stale_projects(
+    session_factory: Callable[[], Session],
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    executor: Optional[Executor] = None,
+    limit: Optional[int] = None,
+    dry_run: bool = False,
+    report: Optional[TextIO] = None,
+    on_batch: Optional[Callable[[RepricingProgress], None]] = None,
+) -> RepricingProgress:
+    """Re-price every stale project; without an executor the work runs in-process."""
+    progress = RepricingProgress(fingerprint=pricing_config_fingerprint())
+    db = session_factory()
+    try:
+        for rows in iter_stale_batches(db, batch_size, limit):
+            if executor is None:
+                results = [reprice_stored_calculation(row) for row in rows]
+            else:
+                results = list(executor.map(reprice_stored_calculation, rows, chunksize=max(1, len(rows) // 16)))
+            if not dry_run:
+                write_batch(db, results, {row_id: calculation_data for row_id, _, calculation_data in rows})
+            for result in results:
+                progress.record(result)
+                if report is not None:
+                    report.write(json.dumps(result.report_entry(), sort_keys=True) + "\n")
+            progress.batches += 1
+            if on_batch is not None:
+                on_batch(progress)
+    finally:
+        db.close()
+    return progress
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Re-price stored projects after a pricing config change.")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="Projects per DB read/write batch")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count, 0 = in-process)")
+    parser.add_argument("--limit", type=int, default=None, help="Stop after this many stale projects")
+    parser.add_argument("--report", default=None, help="Write per-project total diffs as JSON lines to this path")
+    parser.add_argument("--dry-run", action="store_true", help="Compute and report diffs without writing")
+    args = parser.parse_args()
+
+    if args.batch_size <= 0:
+        print("ERROR: --batch-size must be positive", file=sys.stderr)
+        return 1
+
+    from app.db.database import SessionLocal
+
+    def print_progress(progress: RepricingProgress) -> None:
+        print(progress.summary(), flush=True)
+
+    print(f"fingerprint={pricing_config_fingerprint()} dry_run={args.dry_run}")
+    executor = None if args.workers == 0 else ProcessPoolExecutor(max_workers=args.workers)
+    report = open(args.report, "w", encoding="utf-8") if args.report else None
+    try:
+        progress = reprice_stale_projects(
+            SessionLocal,
+            batch_size=args.batch_size,
+            executor=executor,
+            limit=args.limit,
+            dry_run=args.dry_run,
+            report=report,
+            on_batch=print_progress,
+        )
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if report is not None:
+            report.close()
+
+    print(f"done {progress.summary()}")
+    return 1 if progress.failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Benchmark special feature pricing: per-request normalization vs compiled rules.
+
+Prices every special feature of every MASTER_CONFIG subtype (a superset of the
+rules exercised by tests/test_special_feature_pricing_rules.py) at a few
+project sizes, with and without explicit count overrides, the way
+``calculate_project`` does for selected features.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.v2.config.master_config import MASTER_CONFIG, BuildingConfig
+from app.v2.services.special_feature_pricing import (
+    apply_special_feature_pricing_rule,
+    compile_master_config_special_feature_pricing_rules,
+    normalize_special_feature_pricing_rule,
+    resolve_normalized_special_feature_pricing_rules,
+    resolve_special_feature_pricing,
+)
+
+SQUARE_FOOTAGES = (12_000.0, 85_000.0, 240_000.0)
+
+Case = Tuple[BuildingConfig, Tuple[str, ...], float, Tuple[Mapping[str, Any], ...]]
+
+
+def build_cases() -> List[Case]:
+    cases: List[Case] = []
+    for subtypes in MASTER_CONFIG.values():
+        for building_config in subtypes.values():
+            feature_ids = tuple((building_config.special_features or {}).keys())
+            if not feature_ids:
+                continue
+            override_keys = {
+                key
+                for raw_rule in (building_config.special_features or {}).values()
+                if isinstance(raw_rule, Mapping)
+                for key in raw_rule.get("count_override_keys") or ()
+            }
+            overrides = ({key: 24 for key in sorted(override_keys)},)
+            for square_footage in SQUARE_FOOTAGES:
+                cases.append((building_config, feature_ids, square_footage, ()))
+                if override_keys:
+                    cases.append((building_config, feature_ids, square_footage, overrides))
+    return cases
+
+
+def price_per_request(case: Case) -> float:
+    """The pre-compilation path: normalize each selected raw rule per call."""
+    building_config, feature_ids, square_footage, overrides = case
+    resolution = resolve_special_feature_pricing(building_config, feature_ids)
+    total = 0.0
+    for feature_id in resolution.selected_feature_ids:
+        rule = normalize_special_feature_pricing_rule(
+            feature_id=feature_id,
+            raw_rule=building_config.special_features[feature_id],
+        )
+        total += apply_special_feature_pricing_rule(
+            rule=rule,
+            square_footage=square_footage,
+            pricing_status=resolution.pricing_status_by_feature_id[feature_id],
+            pricing_override_sources=overrides,
+        ).total_cost
+    return total
+
+
+def price_compiled(case: Case) -> float:
+    building_config, feature_ids, square_footage, overrides = case
+    resolution = resolve_special_feature_pricing(building_config, feature_ids)
+    total = 0.0
+    for rule in resolve_normalized_special_feature_pricing_rules(building_config, feature_ids):
+        total += apply_special_feature_pricing_rule(
+            rule=rule,
+            square_footage=square_footage,
+            pricing_status=resolution.pricing_status_by_feature_id[rule.feature_id],
+            pricing_override_sources=overrides,
+        ).total_cost
+    return total
+
+
+def time_path(price: Callable[[Case], float], cases: Sequence[Case], iterations: int) -> Tuple[float, float]:
+    """Best-of-iterations seconds for one pass over ``cases``, plus its total cost."""
+    best = float("inf")
+    total = 0.0
+    for _ in range(iterations):
+        started = time.perf_counter()
+        total = sum(price(case) for case in cases)
+        best = min(best, time.perf_counter() - started)
+    return best, total
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20, help="Passes per path; the best is reported")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    rule_count = compile_master_config_special_feature_pricing_rules()
+    compile_ms = (time.perf_counter() - started) * 1000
+    cases = build_cases()
+    applications = sum(len(case[1]) for case in cases)
+
+    results: Dict[str, Tuple[float, float]] = {
+        "per_request": time_path(price_per_request, cases, args.iterations),
+        "compiled": time_path(price_compiled, cases, args.iterations),
+    }
+    if abs(results["per_request"][1] - results["compiled"][1]) > 1e-6:
+        print("ERROR: compiled rules priced differently from per-request normalization", file=sys.stderr)
+        return 1
+
+    print(f"rules={rule_count} compile_ms={compile_ms:.2f} cases={len(cases)} feature_applications={applications}")
+    for name, (seconds, _) in results.items():
+        print(f"{name:<12} pass_ms={seconds * 1000:8.2f} per_feature_us={seconds / applications * 1e6:6.2f}")
+    print(f"speedup={results['per_request'][0] / results['compiled'][0]:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
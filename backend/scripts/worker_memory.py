@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Print per-worker memory for a running gunicorn master.
+
+PSS splits shared pages across the processes mapping them, so the PSS total is
+the real footprint of the deployment; RSS counts shared config once per worker.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.core.prefork import read_process_memory, worker_memory_report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("master_pid", type=int, help="PID of the gunicorn master process")
+    args = parser.parse_args()
+
+    master = read_process_memory(args.master_pid)
+    if master is None:
+        print(f"ERROR: no memory information for pid {args.master_pid}", file=sys.stderr)
+        return 1
+    workers = worker_memory_report(args.master_pid)
+
+    print(f"master  {master.describe()}")
+    for memory in workers.values():
+        print(f"worker  {memory.describe()}")
+    total_rss = master.rss_kb + sum(memory.rss_kb for memory in workers.values())
+    print(f"workers={len(workers)} total_rss_mb={total_rss / 1024:.1f}", end="")
+    if master.pss_kb is not None:
+        total_pss = master.pss_kb + sum(memory.pss_kb or 0 for memory in workers.values())
+        print(f" total_pss_mb={total_pss / 1024:.1f}", end="")
+    print()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -55,6 +55,53 @@ create table if not exists public.organization_run_quotas (
 create index if not exists idx_org_run_quotas_org_id
   on public.organization_run_quotas(org_id);
 
+create table if not exists public.project_summaries (
+  id bigserial primary key,
+  project_id text not null unique,
+  org_id text not null references public.organizations(id) on delete cascade,
+  building_type text,
+  subtype text,
+  square_footage double precision,
+  total_cost double precision,
+  cost_per_sf double precision,
+  yield_on_cost double precision,
+  dscr double precision,
+  decision_status text,
+  regional_multiplier double precision,
+  finish_level text,
+  updated_at timestamptz default now()
+);
+
+alter table public.project_summaries add column if not exists regional_multiplier double precision;
+alter table public.project_summaries add column if not exists finish_level text;
+
+create index if not exists ix_project_summaries_org_id
+  on public.project_summaries(org_id);
+create index if not exists ix_project_summaries_org_building_type
+  on public.project_summaries(org_id, building_type);
+
+create table if not exists public.project_search_documents (
+  id bigserial primary key,
+  project_id text not null unique,
+  org_id text not null references public.organizations(id) on delete cascade,
+  building_type text,
+  subtype text,
+  project_class text,
+  total_cost double precision,
+  project_created_at timestamptz,
+  document text not null default '',
+  updated_at timestamptz default now()
+);
+
+create index if not exists ix_project_search_documents_org_id
+  on public.project_search_documents(org_id);
+create index if not exists ix_project_search_documents_org_building_type
+  on public.project_search_documents(org_id, building_type);
+create index if not exists ix_project_search_documents_org_created
+  on public.project_search_documents(org_id, project_created_at);
+create index if not exists ix_project_search_documents_tsv
+  on public.project_search_documents using gin (to_tsvector('english', document));
+
 do $$
 begin
   if to_regclass('public.projects') is not null then
@@ -67,6 +114,8 @@ alter table if exists public.organization_members enable row level security;
 alter table if exists public.project_access enable row level security;
 alter table if exists public.organization_run_quotas enable row level security;
 alter table if exists public.projects enable row level security;
+alter table if exists public.project_summaries enable row level security;
+alter table if exists public.project_search_documents enable row level security;
 
 -- Remove any legacy policies regardless of their names before applying canonical policies.
 do $$
@@ -79,7 +128,9 @@ begin
     'organization_members',
     'project_access',
     'organization_run_quotas',
-    'projects'
+    'projects',
+    'project_summaries',
+    'project_search_documents'
   ]
   loop
     if to_regclass(format('public.%s', target_table)) is not null then
@@ -199,19 +250,71 @@ begin
   end if;
 end $$;
 
+do $$
+begin
+  if to_regclass('public.project_summaries') is not null then
+    create policy project_summaries_select_scoped_member
+      on public.project_summaries
+      for select
+      to authenticated
+      using (
+        exists (
+          select 1
+          from public.project_access pa
+          join public.organization_members m
+            on m.org_id = pa.org_id
+          where pa.project_id = project_summaries.project_id
+            and (
+              m.user_id = auth.uid()::text
+              or lower(m.email) = lower(coalesce(auth.jwt() ->> 'email', ''))
+            )
+        )
+      );
+  end if;
+end $$;
+
+do $$
+begin
+  if to_regclass('public.project_search_documents') is not null then
+    create policy project_search_documents_select_scoped_member
+      on public.project_search_documents
+      for select
+      to authenticated
+      using (
+        exists (
+          select 1
+          from public.project_access pa
+          join public.organization_members m
+            on m.org_id = pa.org_id
+          where pa.project_id = project_search_documents.project_id
+            and (
+              m.user_id = auth.uid()::text
+              or lower(m.email) = lower(coalesce(auth.jwt() ->> 'email', ''))
+            )
+        )
+      );
+  end if;
+end $$;
+
 revoke all on table public.organizations from anon;
 revoke all on table public.organization_members from anon;
 revoke all on table public.project_access from anon;
 revoke all on table public.organization_run_quotas from anon;
+revoke all on table public.project_summaries from anon;
+revoke all on table public.project_search_documents from anon;
 revoke all on table public.organizations from authenticated;
 revoke all on table public.organization_members from authenticated;
 revoke all on table public.project_access from authenticated;
 revoke all on table public.organization_run_quotas from authenticated;
+revoke all on table public.project_summaries from authenticated;
+revoke all on table public.project_search_documents from authenticated;
 
 grant select on table public.organizations to authenticated;
 grant select on table public.organization_members to authenticated;
 grant select on table public.project_access to authenticated;
 grant select on table public.organization_run_quotas to authenticated;
+grant select on table public.project_summaries to authenticated;
+grant select on table public.project_search_documents to authenticated;
 
 do $$
 begin
@@ -0,0 +1,90 @@
+import math
+
+import numpy as np
+import pytest
+
+from app.v2.config.master_config import BuildingType, ProjectClass
+from app.v2.config.type_profiles.dealshield_tiles import get_dealshield_profile
+from app.v2.engines.unified_engine import unified_engine
+from app.v2.services import break_points
+from app.v2.services.break_points import BreakMetric, break_stress_values, solve_break_stress
+from app.v2.services.dealshield_service import build_dealshield_view_model
+
+
+def test_closed_form_matches_brute_force_scan_for_each_metric():
+    start = {
+        "total_cost": [20_000_000.0, 20_000_000.0, 10_000_000.0],
+        "stabilized_value": [24_000_000.0, 19_000_000.0, 30_000_000.0],
+        "noi": [1_500_000.0, 1_500_000.0, 900_000.0],
+        "annual_debt_service": [1_000_000.0, 1_000_000.0, 500_000.0],
+    }
+    direction = {
+        "total_cost": [1_000_000.0, 1_000_000.0, -1_000_000.0],
+        "stabilized_value": 0.0,
+        "noi": 0.0,
+        "annual_debt_service": [50_000.0, 50_000.0, -50_000.0],
+    }
+    scan = np.linspace(0.0, 10.0, 100_001)
+    for metric_name, threshold in (("value_gap", -500_000.0), ("value_gap_pct", 6.0), ("dscr", 1.25), ("yield_on_cost_pct", 6.5)):
+        solved = break_stress_values(solve_break_stress(metric_name, "<=", threshold, start, direction, size=3, max_stress=10.0))
+        metric = break_points.BREAK_METRICS[metric_name]
+        for path, stress in enumerate(solved):
+            states = {
+                field: np.asarray(start[field][path] if isinstance(start[field], list) else start[field])
+                + scan * np.asarray(direction[field][path] if isinstance(direction[field], list) else direction[field])
+                for field in break_points.BREAK_STATE_FIELDS
+            }
+            fired = np.nonzero(metric.evaluate(states) <= threshold)[0]
+            if fired.size == 0:
+                assert stress is None, (metric_name, path)
+            else:
+                assert stress == pytest.approx(scan[fired[0]], abs=1e-3), (metric_name, path)
+
+
+def test_bisection_agrees_with_closed_form_and_rejects_unknown_triggers(monkeypatch):
+    linear = break_points.BREAK_METRICS["value_gap_pct"]
+    monkeypatch.setitem(
+        break_points.BREAK_METRICS,
+        "value_gap_pct_bisected",
+        BreakMetric(numerator=linear.numerator, denominator=linear.denominator, linear=False),
+    )
+    start = {"total_cost": [20e6, 20e6, 30e6], "stabilized_value": [25e6, 25e6, 25e6]}
+    direction = {"total_cost": [1e6, 4e5, 1e6], "stabilized_value": [0.0, -2e5, 0.0]}
+
+    exact = solve_break_stress("value_gap_pct", "<=", 5.0, start, direction, size=3)
+    bisected = solve_break_stress("value_gap_pct_bisected", "<=", 5.0, start, direction, size=3)
+
+    assert exact[2] == 0.0
+    np.testing.assert_allclose(bisected, exact, rtol=1e-9)
+    assert math.isnan(solve_break_stress("value_gap", ">=", 10e6, start, direction, size=3)[0])
+    with pytest.raises(ValueError):
+        solve_break_stress("irr", "<=", 0.1, start, direction, size=3)
+
+
+def test_view_model_reports_exact_flex_and_driver_break_points():
+    payload = unified_engine.calculate_project(
+        building_type=BuildingType.MULTIFAMILY,
+        subtype="market_rate_apartments",
+        square_footage=120_000,
+        location="Nashville, TN",
+        project_class=ProjectClass.GROUND_UP,
+    )
+    profile = get_dealshield_profile(payload["dealshield_scenarios"]["profile_id"])
+    view_model = build_dealshield_view_model(project_id="bp", payload=payload, profile=profile)
+    provenance = view_model["decision_insurance_provenance"]
+    trigger = provenance["driver_break_points"]
+
+    base_row = provenance["row_snapshots"][0]
+    assert trigger["status"] == "available" and trigger["metric"] == "value_gap_pct"
+    # value_gap_pct <= T breaks once total cost reaches stabilized value / (1 + T).
+    break_cost = base_row["stabilized_value"] / (1.0 + trigger["threshold"] / 100.0)
+    expected_increase_pct = (break_cost / base_row["total_cost"] - 1.0) * 100.0
+
+    assert provenance["flex_before_break_pct"]["method"] == "exact_break_on_scenario_path"
+    assert view_model["flex_before_break_pct"] == pytest.approx(expected_increase_pct)
+    assert view_model["driver_break_points"]
+    for entry in view_model["driver_break_points"]:
+        assert entry["break_cost_increase_pct"] == pytest.approx(expected_increase_pct)
+        assert entry["break_delta_cost"] == pytest.approx(entry["break_stress_multiple"] * entry["delta_cost"])
+    primary = view_model["primary_control_break_point"]
+    assert primary["tile_id"] == view_model["primary_control_variable"]["tile_id"]
@@ -0,0 +1,150 @@
+import json
+import random
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.database import Base
+from app.db.models import Organization, Project, ProjectAccess, ProjectSummary
+from app.v2.services.comparables import (
+    ComparableIndex,
+    ComparableRecord,
+    ComparablesRegistry,
+    comparable_record,
+    load_org_records,
+)
+from app.v2.services.portfolio_summary import project_summary_values
+
+
+def _record(project_id, building_type="office", subtype="class_a", square_footage=50_000, cost_per_sf=300.0, **extra):
+    return ComparableRecord(
+        project_id=project_id,
+        name=project_id,
+        building_type=building_type,
+        subtype=subtype,
+        square_footage=square_footage,
+        cost_per_sf=cost_per_sf,
+        **extra,
+    )
+
+
+def _payload(building_type="office", subtype="class_a", square_footage=50_000, cost_per_sf=300.0):
+    return {
+        "project_info": {
+            "building_type": building_type,
+            "subtype": subtype,
+            "square_footage": square_footage,
+            "finish_level": "standard",
+            "location": "Nashville, TN",
+        },
+        "totals": {"cost_per_sf": cost_per_sf},
+        "regional": {"multiplier": 1.03},
+    }
+
+
+def test_query_ranks_same_type_neighbors_and_skips_other_types():
+    index = ComparableIndex([
+        _record("near", square_footage=55_000, cost_per_sf=310.0),
+        _record("far", square_footage=400_000, cost_per_sf=520.0),
+        _record("other_subtype", subtype="class_b", square_footage=55_000, cost_per_sf=310.0),
+        _record("retail", building_type="retail", square_footage=50_000, cost_per_sf=300.0),
+    ])
+
+    matches = index.query(_record("target"), k=10, exclude_project_id="target")
+
+    assert [record.project_id for _, record in matches] == ["near", "other_subtype", "far"]
+    assert [distance for distance, _ in matches] == sorted(distance for distance, _ in matches)
+    assert index.query(_record("x", building_type="parking"), k=3) == []
+
+
+def test_upserts_and_removals_keep_rows_consistent():
+    rng = random.Random(7)
+    records = [
+        _record(f"p{i}", square_footage=rng.uniform(5_000, 500_000), cost_per_sf=rng.uniform(150, 900))
+        for i in range(300)
+    ]
+    removed = {record.project_id for record in records[::3]}
+    index = ComparableIndex(records)
+    for project_id in removed:
+        assert index.remove(project_id)
+    index.upsert(_record("p1", square_footage=60_000, cost_per_sf=320.0))
+    assert not index.remove("missing")
+
+    live = {record.project_id: record for record in records if record.project_id not in removed}
+    live["p1"] = _record("p1", square_footage=60_000, cost_per_sf=320.0)
+    assert len(index) == len(live)
+
+    target = _record("target", square_footage=60_000, cost_per_sf=320.0)
+    matches = index.query(target, k=5)
+    brute_force = sorted(live.values(), key=lambda record: ComparableIndex([record]).query(target, k=1)[0][0])
+    assert [record.project_id for _, record in matches] == [record.project_id for record in brute_force[:5]]
+    assert matches[0][1].project_id == "p1"
+
+
+def test_comparable_record_requires_type_size_and_cost():
+    record = comparable_record("p1", "Tower", _payload())
+    assert record.regional_multiplier == 1.03
+    assert record.subtype == "class_a"
+    assert comparable_record("p2", None, {"project_info": {"building_type": "office"}}) is None
+
+
+@pytest.fixture
+def org_db():
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    db.add_all([Organization(id="org_a", name="A"), Organization(id="org_b", name="B")])
+    for project_id, org_id, cost_per_sf in (("a1", "org_a", 310.0), ("a2", "org_a", 600.0), ("b1", "org_b", 300.0)):
+        payload = _payload(cost_per_sf=cost_per_sf)
+        db.add(
+            Project(
+                project_id=project_id,
+                name=project_id,
+                square_footage=50_000,
+                location="Nashville, TN",
+                total_cost=1.0,
+                scope_data="{}",
+                calculation_data=json.dumps(payload),
+            )
+        )
+        db.add(ProjectAccess(project_id=project_id, org_id=org_id, owner_user_id=f"user_{org_id}"))
+        db.add(ProjectSummary(project_id=project_id, org_id=org_id, **project_summary_values(project_id, payload)))
+    db.commit()
+    yield db
+    db.close()
+
+
+def test_registry_scopes_to_the_org_and_applies_writes_incrementally(org_db, tmp_path):
+    reference_path = tmp_path / "reference.json"
+    reference_path.write_text(json.dumps([
+        {"project_id": "ref1", "name": "Reference Tower", "building_type": "office", "subtype": "class_a",
+         "square_footage": 52_000, "cost_per_sf": 305.0, "regional_multiplier": 1.0},
+    ]))
+    now = [0.0]
+    registry = ComparablesRegistry(reference_path=str(reference_path), clock=lambda: now[0])
+
+    comparables = registry.similar_projects(org_db, "org_a", "a1", "a1", _payload(cost_per_sf=310.0))
+    assert [entry["project_id"] for entry in comparables] == ["ref1", "a2"]
+    assert comparables[0]["source"] == "reference"
+
+    registry.record_project_write("org_a", "a3", "a3", _payload(cost_per_sf=312.0))
+    registry.record_project_delete("org_a", "a2")
+    comparables = registry.similar_projects(org_db, "org_a", "a1", "a1", _payload(cost_per_sf=310.0))
+    assert [entry["project_id"] for entry in comparables] == ["a3", "ref1"]
+
+    # A stale index is rebuilt from the database, which never saw a3.
+    now[0] = 10_000.0
+    comparables = registry.similar_projects(org_db, "org_a", "a1", "a1", _payload(cost_per_sf=310.0))
+    assert [entry["project_id"] for entry in comparables] == ["ref1", "a2"]
+    assert registry.similar_projects(org_db, None, "a1", "a1", _payload())[0]["project_id"] == "ref1"
+
+
+def test_org_records_come_from_summary_columns_without_parsing_payloads(org_db):
+    org_db.query(Project).update({Project.calculation_data: "not json"})
+    org_db.commit()
+
+    records = {record.project_id: record for record in load_org_records(org_db, "org_a")}
+
+    assert set(records) == {"a1", "a2"}
+    assert records["a1"] == comparable_record("a1", "a1", _payload(cost_per_sf=310.0))
@@ -0,0 +1,96 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.v2.config.construction_schedule import build_construction_schedule
+from app.v2.config.master_config import BuildingType, ProjectClass
+from app.v2.engines.unified_engine import unified_engine
+from app.v2.services.construction_draws import (
+    SOFT_COST_UPFRONT_SHARE,
+    apply_construction_draws,
+    build_draw_schedule,
+    draw_curves,
+    monthly_cost_draws,
+)
+
+
+def test_draw_curves_follow_the_schedule_phases():
+    schedule = build_construction_schedule(BuildingType.OFFICE)
+    curves = draw_curves(schedule)
+
+    assert curves.months == schedule["total_months"]
+    assert sum(curves.hard) == pytest.approx(1.0)
+    assert sum(curves.soft) == pytest.approx(1.0)
+    assert curves.soft[0] > SOFT_COST_UPFRONT_SHARE
+    # S-curves start and finish slowly relative to the middle of the job.
+    peak = max(curves.hard)
+    assert curves.hard[0] < peak and curves.hard[-1] < peak
+    assert draw_curves(schedule) is curves
+
+
+def test_equity_funds_first_and_loan_interest_is_capitalized():
+    curves = draw_curves({"total_months": 12, "phases": [{"start_month": 0, "duration_months": 12}]})
+    schedule = build_draw_schedule(curves, 9_000_000.0, 1_000_000.0, debt_ratio=0.6, annual_rate=0.06)
+
+    assert sum(schedule.monthly_draws()) == pytest.approx(10_000_000.0)
+    assert sum(schedule.equity_draws) == pytest.approx(4_000_000.0)
+    assert sum(schedule.loan_draws) == pytest.approx(6_000_000.0)
+    first_loan_month = next(month for month, draw in enumerate(schedule.loan_draws) if draw > 0)
+    assert all(equity == 0 for equity in schedule.equity_draws[first_loan_month + 1:])
+    assert schedule.capitalized_interest > 0
+    assert schedule.loan_balance[-1] == pytest.approx(6_000_000.0 + schedule.capitalized_interest)
+    # The commitment funds the interest reserve as well as the cost share.
+    assert schedule.loan_commitment == pytest.approx(6_000_000.0 + schedule.capitalized_interest)
+    assert schedule.peak_loan_balance == pytest.approx(schedule.loan_commitment)
+    summary = schedule.to_dict(include_months=False)
+    assert summary["peak_loan_balance"] <= summary["loan_commitment"]
+
+    unlevered = build_draw_schedule(curves, 9_000_000.0, 1_000_000.0)
+    assert unlevered.capitalized_interest == 0
+    assert unlevered.peak_loan_balance == 0
+    assert unlevered.loan_commitment == 0
+
+
+def test_apply_construction_draws_updates_totals_and_financing_summary():
+    payload = {
+        "totals": {"hard_costs": 8_000_000.0, "soft_costs": 2_000_000.0, "total_project_cost": 10_500_000.0},
+        "construction_schedule": {"total_months": 18, "phases": []},
+        "financing_assumptions": {"debt_ratio": 0.7},
+    }
+    schedule = apply_construction_draws(payload, SimpleNamespace(debt_ratio=0.7, debt_rate=0.065))
+
+    totals = payload["totals"]
+    assert sum(schedule.monthly_draws()) == pytest.approx(10_500_000.0)
+    assert totals["total_project_cost"] == 10_500_000.0
+    assert totals["total_capitalized_cost"] == round(10_500_000.0 + schedule.capitalized_interest, 2)
+    assert payload["financing_assumptions"]["interest_reserve"] == totals["capitalized_interest"]
+    assert payload["construction_draw_schedule"]["total_months"] == 18
+    assert payload["construction_draw_schedule"]["interest_rate"] == 0.065
+    assert apply_construction_draws({"totals": {}}) is None
+
+
+def test_engine_and_dealshield_scenarios_carry_their_own_draw_schedules():
+    payload = unified_engine.calculate_project(
+        building_type=BuildingType.MULTIFAMILY,
+        subtype="market_rate_apartments",
+        square_footage=100_000,
+        location="Nashville, TN",
+        project_class=ProjectClass.GROUND_UP,
+    )
+
+    assert payload["totals"]["capitalized_interest"] > 0
+    financing = payload["financing_assumptions"]
+    assert 0 < financing["peak_construction_loan_balance"] <= financing["construction_loan_commitment"]
+    scenarios = payload["dealshield_scenarios"]["scenarios"]
+    base_interest = scenarios["base"]["totals"]["capitalized_interest"]
+    assert base_interest == payload["totals"]["capitalized_interest"]
+    assert scenarios["conservative"]["totals"]["capitalized_interest"] > base_interest
+    assert "months" in payload["construction_draw_schedule"]
+    for scenario in scenarios.values():
+        assert "months" not in scenario["construction_draw_schedule"]
+        draw_schedule = scenario["construction_draw_schedule"]
+        assert draw_schedule["peak_loan_balance"] <= draw_schedule["loan_commitment"]
+    stored = monthly_cost_draws(payload)
+    rebuilt = monthly_cost_draws(scenarios["base"])
+    assert len(rebuilt) == len(stored)
+    assert rebuilt == pytest.approx(stored, abs=0.01)
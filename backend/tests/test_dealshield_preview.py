@@ -0,0 +1,143 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from app.db.models import Project
+from app.v2.api import scope as scope_module
+from app.v2.config.master_config import BuildingType, ProjectClass, get_building_config
+from app.v2.engines.unified_engine import unified_engine
+from app.v2.services.dealshield_preview import DealShieldPreviewCache, build_preview_base
+from app.v2.services.dealshield_scenarios import build_dealshield_scenarios
+
+PREVIEW_CONTROLS = {
+    "stress_band_pct": 5,
+    "anchor_total_project_cost": 6_500_000.0,
+    "use_cost_anchor": True,
+    "anchor_annual_revenue": None,
+    "use_revenue_anchor": False,
+}
+
+
+def _stored_project():
+    payload = unified_engine.calculate_project(
+        building_type=BuildingType.RESTAURANT,
+        subtype="full_service",
+        square_footage=8_000,
+        location="Nashville, TN",
+        project_class=ProjectClass.GROUND_UP,
+    )
+    payload["dealshield_scenarios"] = build_dealshield_scenarios(
+        payload,
+        get_building_config(BuildingType.RESTAURANT, "full_service"),
+        unified_engine,
+    )
+    return Project(
+        project_id="project-preview",
+        name="Preview Bistro",
+        building_type="restaurant",
+        square_footage=8_000,
+        location="Nashville, TN",
+        calculation_data=json.dumps(payload, default=str),
+    )
+
+
+@pytest.fixture
+def stored_project(monkeypatch):
+    project = _stored_project()
+    scope_module.dealshield_preview_cache.clear()
+    monkeypatch.setattr(scope_module, "_get_scoped_project", lambda db, project_id, auth: project)
+    yield project
+    scope_module.dealshield_preview_cache.clear()
+
+
+def _fake_db():
+    return SimpleNamespace(commit=lambda: None, refresh=lambda project: None, rollback=lambda: None)
+
+
+def _without_trace_timestamps(value):
+    if isinstance(value, dict):
+        return {key: _without_trace_timestamps(item) for key, item in value.items() if key != "timestamp"}
+    if isinstance(value, list):
+        return [_without_trace_timestamps(item) for item in value]
+    return value
+
+
+@pytest.mark.asyncio
+async def test_preview_matches_the_saved_view_without_persisting(stored_project):
+    stored_blob = stored_project.calculation_data
+    request = scope_module.DealShieldControlsUpdateRequest(**PREVIEW_CONTROLS)
+
+    preview = await scope_module.preview_dealshield_controls_view(
+        "project-preview", request, db=object(), auth=object()
+    )
+
+    assert preview.success is True
+    assert stored_project.calculation_data == stored_blob
+
+    saved = await scope_module.update_dealshield_controls(
+        "project-preview", request, db=_fake_db(), auth=SimpleNamespace(org_id="org-preview")
+    )
+    assert saved.success is True
+    view = await scope_module.get_dealshield_view("project-preview", db=object(), auth=object())
+
+    # Comparables only come with the saved view; the preview skips the index.
+    assert "comparables" not in preview.data
+    saved_view = {key: value for key, value in view.data.items() if key != "comparables"}
+    assert _without_trace_timestamps(preview.data) == _without_trace_timestamps(saved_view)
+    base_inputs = preview.data["provenance"]["scenario_inputs"]["base"]
+    assert base_inputs["stress_band_pct"] == 5
+    assert base_inputs["cost_anchor_value"] == 6_500_000.0
+
+
+@pytest.mark.asyncio
+async def test_preview_reuses_the_cached_base_until_the_stored_payload_changes(stored_project, monkeypatch):
+    profile_calls = []
+    original_get_profile = scope_module.get_dealshield_profile
+
+    def counted_get_profile(profile_id):
+        profile_calls.append(profile_id)
+        return original_get_profile(profile_id)
+
+    monkeypatch.setattr(scope_module, "get_dealshield_profile", counted_get_profile)
+
+    for band in (10, 7, 3):
+        request = scope_module.DealShieldControlsUpdateRequest(stress_band_pct=band)
+        response = await scope_module.preview_dealshield_controls_view(
+            "project-preview", request, db=object(), auth=object()
+        )
+        assert response.data["provenance"]["scenario_inputs"]["base"]["stress_band_pct"] == band
+    assert len(profile_calls) == 1
+
+    payload = json.loads(stored_project.calculation_data)
+    payload["dealshield_controls"] = {"stress_band_pct": 7}
+    stored_project.calculation_data = json.dumps(payload)
+    await scope_module.preview_dealshield_controls_view(
+        "project-preview", scope_module.DealShieldControlsUpdateRequest(), db=object(), auth=object()
+    )
+    assert len(profile_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_preview_reports_projects_without_dealshield(monkeypatch):
+    project = Project(project_id="project-plain", name="Plain", calculation_data=json.dumps({"totals": {}}))
+    monkeypatch.setattr(scope_module, "_get_scoped_project", lambda db, project_id, auth: project)
+
+    response = await scope_module.preview_dealshield_controls_view(
+        "project-plain", scope_module.DealShieldControlsUpdateRequest(), db=object(), auth=object()
+    )
+
+    assert response.success is False
+    assert response.errors == ["DealShield not available for this project"]
+
+
+def test_preview_base_drops_stored_scenarios_and_cache_is_bounded():
+    base = build_preview_base("p", {"totals": {}, "dealshield_scenarios": {"scenarios": {}}}, None, {})
+    assert "dealshield_scenarios" not in base.payload
+
+    cache = DealShieldPreviewCache(max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.put(key, base)
+    assert len(cache) == 2
+    assert cache.get("a") is None
+    assert cache.get("c") is base
@@ -0,0 +1,46 @@
+import copy
+import json
+
+from app.v2.config.master_config import MASTER_CONFIG
+from scripts import engine_benchmark
+
+
+def test_cases_cover_every_master_config_subtype():
+    cases = engine_benchmark.build_cases()
+
+    expected = {(building_type, subtype) for building_type, subtypes in MASTER_CONFIG.items() for subtype in subtypes}
+    assert {(case.building_type, case.subtype) for case in cases} == expected
+    assert len(cases) == len(expected) * len(engine_benchmark.SQUARE_FOOTAGES) * len(engine_benchmark.FINISH_LEVELS)
+
+
+def test_single_case_reports_every_stage_with_memory():
+    case = engine_benchmark.build_cases(["office"], square_footages=(40_000,), finish_levels=("standard",))[0]
+
+    results = engine_benchmark.run_benchmark([case], repeats=1)
+
+    assert list(results["stages"]) == list(engine_benchmark.STAGES)
+    assert list(results["building_types"]) == ["office"]
+    for stats in results["stages"].values():
+        assert stats["calls"] == 1
+        assert stats["mean_ms"] > 0
+        assert stats["peak_kb_max"] >= stats["allocated_kb_mean"] >= 0
+    assert engine_benchmark.compare_to_baseline(results, results) == []
+
+
+def test_compare_flags_only_regressions_past_threshold_and_noise_floor():
+    baseline = json.loads(engine_benchmark.BASELINE_PATH.read_text(encoding="utf-8"))
+    assert set(baseline["building_types"]) == {building_type.value for building_type in MASTER_CONFIG}
+
+    results = copy.deepcopy(baseline)
+    stage = results["stages"]["calculate_project"]
+    stage["mean_ms"] = baseline["stages"]["calculate_project"]["mean_ms"] * 1.2
+    results["stages"]["compose_decision_packet_input"]["mean_ms"] += engine_benchmark.MIN_DELTA_MS / 2
+    assert engine_benchmark.compare_to_baseline(results, baseline, threshold=0.25) == []
+
+    stage["mean_ms"] = baseline["stages"]["calculate_project"]["mean_ms"] * 2
+    results["building_types"]["office"]["render_decision_packet_html"]["peak_kb_max"] += 10_000
+    regressions = engine_benchmark.compare_to_baseline(results, baseline, threshold=0.25)
+
+    assert len(regressions) == 2
+    assert regressions[0].startswith("stage calculate_project mean_ms")
+    assert regressions[1].startswith("office render_decision_packet_html peak_kb_max")
@@ -0,0 +1,138 @@
+import io
+import threading
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+from openpyxl import Workbook, load_workbook
+from openpyxl.worksheet._writer import ALL_TEMP_FILES
+
+from app.services.excel_export_service_v2 import (
+    XLSX_MEDIA_TYPE,
+    _StreamingWorksheet,
+    _discard_write_only_workbook,
+    excel_export_service_v2,
+)
+from app.v2.api import scope as scope_module
+
+
+def _project_data(trades: int = 3, systems_per_trade: int = 40):
+    categories = []
+    for trade_index in range(trades):
+        systems = [
+            {
+                "name": f"System {trade_index}-{index}",
+                "quantity": index + 1,
+                "unit": "SF",
+                "unit_cost": 12.5,
+                "total_cost": 12.5 * (index + 1),
+            }
+            for index in range(systems_per_trade)
+        ]
+        categories.append({
+            "name": f"Trade {trade_index}",
+            "subtotal": sum(system["total_cost"] for system in systems),
+            "systems": systems,
+        })
+    return {
+        "project_name": "Nashville Medical Office",
+        "total_cost": 12_500_000,
+        "cost_per_sqft": 312.5,
+        "subtotal": 11_000_000,
+        "categories": categories,
+        "request_data": {"square_footage": 40000, "location": "Nashville, TN", "num_floors": 3},
+    }
+
+
+def _sheet_snapshot(workbook):
+    snapshot = {}
+    for ws in workbook.worksheets:
+        snapshot[ws.title] = {
+            "values": [[cell.value for cell in row] for row in ws.iter_rows()],
+            "merged": sorted(str(merged) for merged in ws.merged_cells.ranges),
+            "freeze_panes": ws.freeze_panes,
+            "widths": {key: dim.width for key, dim in ws.column_dimensions.items()},
+        }
+    return snapshot
+
+
+def test_streamed_workbook_matches_in_memory_workbook():
+    project_data = _project_data()
+    in_memory = load_workbook(excel_export_service_v2.generate_professional_excel(project_data, "Acme"))
+
+    chunks = list(excel_export_service_v2.generate_professional_excel_stream(project_data, "Acme", chunk_size=4096))
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 4096 for chunk in chunks)
+    streamed = load_workbook(io.BytesIO(b"".join(chunks)))
+
+    assert streamed.sheetnames == in_memory.sheetnames
+    assert _sheet_snapshot(streamed) == _sheet_snapshot(in_memory)
+    cell = streamed["Cost Breakdown"]["F14"]
+    assert cell.number_format == in_memory["Cost Breakdown"]["F14"].number_format
+    assert len(streamed["Executive Dashboard"]._charts) == 1
+
+
+def test_streaming_worksheet_rejects_writes_to_flushed_rows():
+    wb = Workbook(write_only=True)
+    ws = _StreamingWorksheet(wb.create_sheet("Rows"))
+    ws["B3"] = "kept"
+    ws.flush_before(3)
+    ws.cell(row=3, column=1, value="same row is still open")
+
+    with pytest.raises(ValueError):
+        ws["A2"] = "already streamed"
+    _discard_write_only_workbook(wb)
+
+
+def test_abandoned_stream_stops_writer_and_removes_temp_files():
+    existing = set(ALL_TEMP_FILES)
+    chunks = excel_export_service_v2.generate_professional_excel_stream(_project_data(), chunk_size=256)
+    first = next(chunks)
+    assert first.startswith(b"PK")
+    chunks.close()
+
+    leftover = [path for path in ALL_TEMP_FILES if path not in existing]
+    assert leftover == []
+    assert not any(thread.name == "excel-stream-writer" for thread in threading.enumerate())
+
+
+@pytest.mark.asyncio
+async def test_excel_route_streams_project_categories(monkeypatch):
+    project = SimpleNamespace(project_id="project-412", id=412, square_footage=40000, location="Nashville, TN")
+    monkeypatch.setattr(scope_module, "_get_scoped_project", lambda db, project_id, auth: project)
+    monkeypatch.setattr(
+        scope_module,
+        "format_project_response",
+        lambda project_arg: {
+            "name": "Music Row Clinic",
+            "building_type": "healthcare",
+            "total_cost": 9_000_000,
+            "cost_per_sqft": 225.0,
+            "scope_items": [
+                {
+                    "trade": "Mechanical",
+                    "systems": [
+                        {"name": "Rooftop units", "quantity": 4, "unit": "EA", "unit_cost": 50000, "total_cost": 200000},
+                        {"name": "Ductwork", "quantity": 40000, "unit": "SF", "unit_cost": 6, "total_cost": 240000},
+                    ],
+                }
+            ],
+            "calculation_data": {},
+        },
+    )
+
+    response = await scope_module.export_project_excel("project-412", client_name=None, db=object(), auth=object())
+    assert response.media_type == XLSX_MEDIA_TYPE
+    assert 'filename="Music_Row_Clinic_' in response.headers["content-disposition"]
+
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    workbook = load_workbook(io.BytesIO(body))
+    breakdown = workbook["Cost Breakdown"]
+    rows = [[cell.value for cell in row] for row in breakdown.iter_rows(min_row=14, max_row=16)]
+    assert rows[0][:6] == ["Mechanical", "Rooftop units", 4, "EA", 50000, 200000]
+    assert rows[2][4:6] == ["Subtotal:", 440000]
+
+    monkeypatch.setattr(scope_module, "_get_scoped_project", lambda db, project_id, auth: None)
+    with pytest.raises(HTTPException) as exc:
+        await scope_module.export_project_excel("missing", client_name=None, db=object(), auth=object())
+    assert exc.value.status_code == 404
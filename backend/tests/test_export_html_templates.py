@@ -0,0 +1,53 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from app.services import dealshield_export, decision_packet_export
+from app.services.decision_packet_export import render_decision_packet_html, sanitize_decision_packet_export
+from app.services.dealshield_export import render_dealshield_html
+
+# Export contract fixtures: a sanitized decision packet and DealShield view
+# model per subtype, with the HTML the renderers produced for them before the
+# document shells were reworked. Rendering must stay byte-for-byte identical.
+GOLDEN_DIR = Path(__file__).parent / "fixtures" / "export_html"
+GOLDEN_CASES = sorted(path.name[: -len(".input.json")] for path in GOLDEN_DIR.glob("*.input.json"))
+
+
+def _golden(name: str) -> str:
+    with open(GOLDEN_DIR / name, encoding="utf-8", newline="") as handle:
+        return handle.read()
+
+
+def test_document_css_is_kept_verbatim():
+    assert "{{" not in decision_packet_export._DECISION_PACKET_CSS
+    assert "{{" not in dealshield_export._DEALSHIELD_CSS
+
+
+def test_rendered_documents_embed_css_and_escape_values():
+    packet = sanitize_decision_packet_export(
+        {"cover_summary": {"project_name": "Smith & Sons <Tower>"}, "key_metrics": {"dscr": 1.3}}
+    )
+    html = render_decision_packet_html(packet)
+
+    assert html.startswith("\n<!DOCTYPE html>")
+    assert decision_packet_export._DECISION_PACKET_CSS in html
+    assert "<title>Smith &amp; Sons &lt;Tower&gt;</title>" in html
+    assert html == render_decision_packet_html(packet)
+
+    dealshield_html = render_dealshield_html({"profile_id": "retail_<v1>", "columns": [], "rows": []})
+    assert dealshield_html.startswith("<!doctype html>")
+    assert dealshield_export._DEALSHIELD_CSS in dealshield_html
+    assert "Profile: retail_&lt;v1&gt;" in dealshield_html
+
+
+def test_golden_cases_cover_several_subtypes():
+    assert len(GOLDEN_CASES) >= 3
+
+
+@pytest.mark.parametrize("case", GOLDEN_CASES)
+def test_rendered_html_matches_golden_fixtures(case):
+    inputs = json.loads(_golden(f"{case}.input.json"))
+
+    assert render_decision_packet_html(inputs["decision_packet"]) == _golden(f"{case}.decision_packet.html")
+    assert render_dealshield_html(inputs["dealshield_view_model"]) == _golden(f"{case}.dealshield.html")
@@ -0,0 +1,215 @@
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.services.export_jobs import (
+    EXPORT_KIND_DEALSHIELD,
+    EXPORT_KIND_DECISION_PACKET,
+    JOB_STATUS_COMPLETED,
+    JOB_STATUS_FAILED,
+    ExportJobError,
+    ExportJobManager,
+    FilesystemArtifactStore,
+    export_artifact_key,
+    render_export_artifact,
+)
+from app.v2.api import scope as scope_module
+
+
+PACKET = {"cover_summary": {"project_name": "Nashville Market Apartments"}, "key_metrics": {"dscr": 1.36}}
+
+
+def _manager(tmp_path, renderer):
+    return ExportJobManager(
+        FilesystemArtifactStore(tmp_path / "artifacts"),
+        executor=ThreadPoolExecutor(max_workers=2),
+        renderer=renderer,
+    )
+
+
+def test_artifact_key_is_stable_across_key_order_and_kind_specific():
+    reordered = {"key_metrics": {"dscr": 1.36}, "cover_summary": {"project_name": "Nashville Market Apartments"}}
+    assert export_artifact_key(EXPORT_KIND_DECISION_PACKET, PACKET) == export_artifact_key(
+        EXPORT_KIND_DECISION_PACKET, reordered
+    )
+    assert export_artifact_key(EXPORT_KIND_DECISION_PACKET, PACKET) != export_artifact_key(
+        EXPORT_KIND_DEALSHIELD, PACKET
+    )
+    changed = {**PACKET, "key_metrics": {"dscr": 1.2}}
+    assert export_artifact_key(EXPORT_KIND_DECISION_PACKET, PACKET) != export_artifact_key(
+        EXPORT_KIND_DECISION_PACKET, changed
+    )
+
+
+def test_filesystem_store_round_trip_and_rejects_path_like_keys(tmp_path):
+    store = FilesystemArtifactStore(tmp_path)
+    key = export_artifact_key(EXPORT_KIND_DEALSHIELD, PACKET)
+    assert store.get(key) is None
+    store.put(key, b"%PDF-1.7\n")
+    assert store.exists(key)
+    assert store.get(key) == b"%PDF-1.7\n"
+    assert not [p for p in store.path_for(key).parent.iterdir() if p.name.startswith(".tmp-")]
+
+    with pytest.raises(ExportJobError):
+        store.path_for("../../etc/passwd")
+
+
+@pytest.mark.asyncio
+async def test_repeat_export_of_unchanged_packet_is_served_from_store(tmp_path):
+    calls = []
+
+    def renderer(kind, export_input):
+        calls.append(kind)
+        return b"%PDF-1.7\n" + kind.encode()
+
+    manager = _manager(tmp_path, renderer)
+    first = manager.submit(EXPORT_KIND_DECISION_PACKET, PACKET, org_id="org_a", project_id="p1", filename="a.pdf")
+    first = await manager.wait(first, timeout=5)
+    assert first.status == JOB_STATUS_COMPLETED
+    assert first.cache_hit is False
+    assert manager.read_artifact(first) == b"%PDF-1.7\ndecision_packet"
+
+    second = manager.submit(EXPORT_KIND_DECISION_PACKET, dict(PACKET), org_id="org_a", project_id="p1", filename="a.pdf")
+    assert second.status == JOB_STATUS_COMPLETED
+    assert second.cache_hit is True
+    assert second.job_id != first.job_id
+    assert manager.read_artifact(second) == manager.read_artifact(first)
+    assert calls == [EXPORT_KIND_DECISION_PACKET]
+    manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_submissions_share_one_render(tmp_path):
+    release = threading.Event()
+    calls = []
+
+    def renderer(kind, export_input):
+        calls.append(kind)
+        release.wait(5)
+        return b"%PDF-1.7\n"
+
+    manager = _manager(tmp_path, renderer)
+    job_a = manager.submit(EXPORT_KIND_DEALSHIELD, PACKET, org_id="org_a", project_id="p1", filename="d.pdf")
+    job_b = manager.submit(EXPORT_KIND_DEALSHIELD, PACKET, org_id="org_a", project_id="p1", filename="d.pdf")
+    assert not job_a.is_finished
+
+    pending = await manager.wait(job_a, timeout=0.05)
+    assert not pending.is_finished
+
+    release.set()
+    job_a = await manager.wait(job_a, timeout=5)
+    job_b = await manager.wait(job_b, timeout=5)
+    assert job_a.status == job_b.status == JOB_STATUS_COMPLETED
+    assert calls == [EXPORT_KIND_DEALSHIELD]
+    manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_failed_render_marks_job_failed_without_storing_artifact(tmp_path):
+    def renderer(kind, export_input):
+        raise RuntimeError("chromium exploded")
+
+    manager = _manager(tmp_path, renderer)
+    job = manager.submit(EXPORT_KIND_DECISION_PACKET, PACKET, org_id="org_a", project_id="p1", filename="a.pdf")
+    job = await manager.wait(job, timeout=5)
+    assert job.status == JOB_STATUS_FAILED
+    assert "chromium" not in (job.error or "")
+    assert not manager.store.exists(job.artifact_key)
+    with pytest.raises(ExportJobError):
+        manager.read_artifact(job)
+    manager.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_wait_follows_job_record_rendered_by_another_worker(tmp_path):
+    release = threading.Event()
+
+    def renderer(kind, export_input):
+        release.wait(5)
+        return b"%PDF-1.7\n"
+
+    store = FilesystemArtifactStore(tmp_path / "artifacts")
+    owner = ExportJobManager(store, executor=ThreadPoolExecutor(max_workers=1), renderer=renderer)
+    other = ExportJobManager(store, executor=ThreadPoolExecutor(max_workers=1), renderer=renderer)
+    submitted = owner.submit(EXPORT_KIND_DEALSHIELD, PACKET, org_id="org_a", project_id="p1", filename="d.pdf")
+
+    polled = other.get(submitted.job_id, org_id="org_a")
+    assert polled is not None and polled is not submitted
+    pending = await other.wait(polled, timeout=0.2)
+    assert not pending.is_finished
+
+    threading.Timer(0.1, release.set).start()
+    finished = await other.wait(polled, timeout=5)
+    assert finished.status == JOB_STATUS_COMPLETED
+    assert other.read_artifact(finished) == b"%PDF-1.7\n"
+    owner.shutdown()
+    other.shutdown()
+
+
+def test_jobs_are_scoped_to_submitting_org(tmp_path):
+    manager = _manager(tmp_path, lambda kind, export_input: b"%PDF-1.7\n")
+    job = manager.submit(EXPORT_KIND_DEALSHIELD, PACKET, org_id="org_a", project_id="p1", filename="d.pdf")
+    assert manager.get(job.job_id, org_id="org_a") is job
+    assert manager.get(job.job_id, org_id="org_b") is None
+    with pytest.raises(ExportJobError):
+        manager.submit("spreadsheet", PACKET, org_id="org_a", project_id="p1", filename="x.pdf")
+    manager.shutdown()
+
+
+def test_render_export_artifact_dispatches_by_kind(monkeypatch):
+    from app.services.pdf_export_service import pdf_export_service
+
+    monkeypatch.setattr(pdf_export_service, "generate_dealshield_pdf", lambda vm: io.BytesIO(b"dealshield"))
+    monkeypatch.setattr(pdf_export_service, "generate_decision_packet_pdf", lambda packet: io.BytesIO(b"packet"))
+
+    assert render_export_artifact(EXPORT_KIND_DEALSHIELD, {}) == b"dealshield"
+    assert render_export_artifact(EXPORT_KIND_DECISION_PACKET, {}) == b"packet"
+
+
+@pytest.mark.asyncio
+async def test_export_job_routes_submit_poll_and_download(monkeypatch, tmp_path):
+    project = SimpleNamespace(project_id="project-297")
+    auth = SimpleNamespace(org_id="org_a")
+    view_model = {"profile_id": "multifamily_apartment_v1", "decision_status": "GO"}
+    rendered = []
+
+    def renderer(kind, export_input):
+        rendered.append((kind, export_input))
+        return b"%PDF-1.7\n"
+
+    manager = _manager(tmp_path, renderer)
+    monkeypatch.setattr(scope_module, "export_job_manager", manager)
+    monkeypatch.setattr(scope_module, "_get_scoped_project", lambda db, project_id, auth: project)
+    monkeypatch.setattr(
+        scope_module,
+        "_prepare_dealshield_export",
+        lambda context_arg, project_id, route_name: (dict(view_model), "DealShield_20260101.pdf"),
+    )
+
+    request = SimpleNamespace(headers={})
+    submit_payload = scope_module.ExportJobRequest(kind=EXPORT_KIND_DEALSHIELD)
+    submitted = await scope_module.submit_export_job.__wrapped__(
+        request, "project-297", submit_payload, db=object(), auth=auth
+    )
+    assert submitted.success is True
+    job_id = submitted.data["job_id"]
+
+    polled = await scope_module.get_export_job(job_id, wait=5, auth=auth)
+    assert polled.data["status"] == JOB_STATUS_COMPLETED
+
+    response = await scope_module.download_export_job(job_id, auth=auth)
+    assert response.media_type == "application/pdf"
+    assert 'filename="DealShield_20260101.pdf"' in response.headers["content-disposition"]
+    assert rendered == [(EXPORT_KIND_DEALSHIELD, view_model)]
+
+    other_org = SimpleNamespace(org_id="org_b")
+    missing = await scope_module.get_export_job(job_id, wait=0, auth=other_org)
+    assert missing.success is False
+    with pytest.raises(HTTPException) as exc:
+        await scope_module.download_export_job(job_id, auth=other_org)
+    assert exc.value.status_code == 404
+    manager.shutdown()
@@ -189,3 +189,37 @@ def test_resolve_financing_family_prefers_explicit_config_over_old_ownership_heu
     )
 
     assert family_id == HIGH_CAPEX_PARKING_SPECIAL_CASE_FAMILY_ID
+
+
+def test_build_financing_summary_shows_construction_loan_carry_for_debt_financed_families():
+    from app.v2.config.master_config import ProjectClass
+    from app.v2.engines.unified_engine import unified_engine
+
+    payload = unified_engine.calculate_project(
+        building_type=BuildingType.MULTIFAMILY,
+        subtype="market_rate_apartments",
+        square_footage=100_000,
+        location="Nashville, TN",
+        project_class=ProjectClass.GROUND_UP,
+    )
+    parsed_input = {"building_type": "multifamily", "subtype": "market_rate_apartments", "ownership_type": "for_profit"}
+
+    items = {item["id"]: item for item in build_financing_summary(payload, parsed_input)["items"]}
+
+    financing = payload["financing_assumptions"]
+    for field_id in (
+        "construction_loan_commitment",
+        "capitalized_interest",
+        "interest_reserve",
+        "peak_construction_loan_balance",
+    ):
+        assert items[field_id]["value"] == financing[field_id] > 0
+        assert items[field_id]["format"] == "currency"
+
+    subsidized = _build_payload(building_type="multifamily", subtype="affordable_housing")
+    subsidized["financing_assumptions"] = dict(financing)
+    summary = build_financing_summary(
+        subsidized,
+        parsed_input={"building_type": "multifamily", "subtype": "affordable_housing", "ownership_type": "non_profit"},
+    )
+    assert "capitalized_interest" not in _item_ids(summary)
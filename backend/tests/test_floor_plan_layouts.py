@@ -0,0 +1,49 @@
+import xml.etree.ElementTree as ET
+
+from app.models.floor_plan import FloorPlanRequest
+from app.services.architectural_floor_plan_service import Point, Wall, WallType, architectural_floor_plan_service
+from app.services.floor_plan_layouts import floor_plan_layout_cache, program_key
+from app.services.floor_plan_service import floor_plan_service
+from app.services.sketcher import floor_plan_generator
+
+
+def test_repeat_requests_reuse_cached_layout_with_fresh_output():
+    floor_plan_layout_cache.clear()
+    mix = {"warehouse": 0.7, "office": 0.3}
+    first = architectural_floor_plan_service.generate_architectural_plan(50_000, "mixed_use", mix)
+    first["walls"][0]["start"]["x"] = -999
+    # 50,010 SF rounds to the same 5 ft grid dimensions.
+    second = architectural_floor_plan_service.generate_architectural_plan(50_010, "mixed_use", {"office": 0.3, "warehouse": 0.7})
+
+    assert len(floor_plan_layout_cache) == 1
+    assert [wall["id"] for wall in second["walls"]] == [wall["id"] for wall in first["walls"]]
+    assert second["walls"][0]["start"]["x"] == 0
+
+    architectural_floor_plan_service.generate_architectural_plan(50_000, "mixed_use", {"warehouse": 0.5, "office": 0.5})
+    floor_plan_service.generate_floor_plan(50_000, "office")
+    assert len(floor_plan_layout_cache) == 3
+    assert program_key({"office": 1.0, "retail": 0}) == (("office", 1.0),)
+
+
+def test_geometry_objects_use_slots():
+    wall = Wall(id="w1", type=WallType.EXTERIOR, start=Point(0, 0), end=Point(10, 0))
+    assert not hasattr(wall, "__dict__")
+    assert not hasattr(wall.start, "__dict__")
+
+
+def test_svg_is_streamed_in_chunks():
+    plan = architectural_floor_plan_service.generate_architectural_plan(80_000, "industrial")
+    chunks = list(architectural_floor_plan_service.iter_svg(plan))
+
+    assert len(chunks) > len(plan["walls"])
+    root = ET.fromstring("".join(chunks))
+    assert root.tag.endswith("svg")
+    assert sum(1 for element in root.iter() if element.tag.endswith("line")) >= len(plan["walls"])
+
+    response = floor_plan_generator.generate(FloorPlanRequest(square_footage=5_000, num_rooms=10))
+    ET.fromstring(response.svg_data)
+    assert 0 < response.efficiency_ratio <= 1
+    repeat = floor_plan_generator.generate(FloorPlanRequest(square_footage=5_000, num_rooms=10))
+    assert repeat.svg_data is response.svg_data and repeat.id != response.id
+    assert repeat.rooms == response.rooms
+    assert all(mine is not theirs for mine, theirs in zip(repeat.rooms, response.rooms))
@@ -0,0 +1,48 @@
+import itertools
+
+from app.services import healthcare_classifier
+from app.services.healthcare_classifier import HEALTHCARE_KEYWORDS, KeywordAutomaton, healthcare_classifier as classifier
+from scripts import healthcare_classifier_benchmark
+
+
+def test_automaton_finds_nested_and_overlapping_keywords():
+    automaton = KeywordAutomaton({
+        "er": [("k", "er")],
+        "emergency": [("k", "emergency")],
+        "emergency room": [("k", "room")],
+        "cy r": [("k", "cy r")],
+    })
+
+    assert automaton.scan("emergency room") == {("k", "er"), ("k", "emergency"), ("k", "room"), ("k", "cy r")}
+    assert automaton.scan("emergency") == {("k", "er"), ("k", "emergency")}
+    assert automaton.scan("center") == {("k", "er")}
+    assert automaton.scan("clinic") == frozenset()
+
+    words = ["medical", "center", " or ", "ct scan", "hospital", "california", "rehab", "x-ray", "children's"]
+    for combo in itertools.permutations(words, 3):
+        text = " ".join(combo)
+        assert HEALTHCARE_KEYWORDS.scan(text) == healthcare_classifier_benchmark.scan_by_substring(text), text
+
+
+def test_classification_uses_signals_from_one_scan():
+    result = classifier.classify_healthcare_facility("50,000 SF children's hospital with MRI and 4 ORs in Los Angeles")
+
+    assert result["facility_type"] == "pediatric_hospital"
+    assert {"mri_suite", "operating_room"} <= set(result["special_spaces"])
+    assert result["compliance_requirements"]["oshpd_seismic"] is True
+    assert result["compliance_requirements"]["magnetic_shielding"] is True
+    assert result["base_construction_per_sf"] == 475
+    assert result["equipment_cost_per_sf"] == 140 + sum(
+        healthcare_classifier.SPECIALTY_EQUIPMENT_ADDERS.get(specialty, 0) for specialty in result["specialties"]
+    )
+    assert classifier.classify_healthcare_facility("Office building")["facility_type"] == "unknown"
+
+
+def test_benchmark_classifies_every_collision_prompt():
+    cases = healthcare_classifier_benchmark.build_cases()
+    results = healthcare_classifier_benchmark.run_benchmark(cases, iterations=1, repeat=1)
+
+    assert {expected for _, expected in cases} == {"urgent_care", "imaging_center"}
+    assert results["mismatches"] == []
+    assert results["classifications"] == len(cases)
+    assert results["scan_us"]["compiled"] > 0
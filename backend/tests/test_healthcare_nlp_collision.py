@@ -2,19 +2,23 @@ import pytest
 
 from app.services.nlp_service import NLPService
 
+URGENT_CARE_WITH_IMAGING_PROMPTS = (
+    "18,000 SF urgent care center with imaging suites in Manchester, NH",
+    "12,000 SF walk-in clinic with imaging suite in Nashville, TN",
+)
+
+IMAGING_CENTER_PROMPTS = (
+    "12,000 SF imaging center with 2 MRI suites in Nashville, TN",
+    "14,000 SF diagnostic imaging suite with CT in Nashville, TN",
+)
+
 
 @pytest.fixture(scope="module")
 def nlp_parser() -> NLPService:
     return NLPService()
 
 
-@pytest.mark.parametrize(
-    "description",
-    [
-        "18,000 SF urgent care center with imaging suites in Manchester, NH",
-        "12,000 SF walk-in clinic with imaging suite in Nashville, TN",
-    ],
-)
+@pytest.mark.parametrize("description", URGENT_CARE_WITH_IMAGING_PROMPTS)
 def test_explicit_urgent_care_identity_beats_supporting_imaging_language(
     nlp_parser: NLPService,
     description: str,
@@ -26,13 +30,7 @@ def test_explicit_urgent_care_identity_beats_supporting_imaging_language(
     assert parsed["building_subtype"] == "urgent_care"
 
 
-@pytest.mark.parametrize(
-    "description",
-    [
-        "12,000 SF imaging center with 2 MRI suites in Nashville, TN",
-        "14,000 SF diagnostic imaging suite with CT in Nashville, TN",
-    ],
-)
+@pytest.mark.parametrize("description", IMAGING_CENTER_PROMPTS)
 def test_true_imaging_center_prompts_still_route_to_imaging_center(
     nlp_parser: NLPService,
     description: str,
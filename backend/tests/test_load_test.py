@@ -0,0 +1,69 @@
+import re
+
+import httpx
+import pytest
+
+from scripts import load_test
+
+
+def test_request_bodies_come_from_parity_fixtures_with_city_state_locations():
+    bodies = load_test.load_request_bodies()
+
+    assert len(bodies) >= 10
+    for body in bodies:
+        assert re.search(r"\d[\d,]* sf ", body["description"])
+        assert re.fullmatch(r"[A-Za-z .'-]+, [A-Z]{2}", body["location"])
+
+
+def test_request_mix_is_seeded_and_waits_for_projects_before_dealshield_reads():
+    bodies = [{"description": "New 10,000 sf office in Nashville, TN", "location": "Nashville, TN"}]
+    first = load_test.RequestMix(bodies, {"analyze": 1, "generate": 1, "dealshield": 1}, seed=3)
+    second = load_test.RequestMix(bodies, {"analyze": 1, "generate": 1, "dealshield": 1}, seed=3)
+
+    planned = [first.next_request() for _ in range(20)]
+    assert planned == [second.next_request() for _ in range(20)]
+    assert {endpoint for endpoint, *_ in planned} == {"analyze", "generate"}
+
+    first.remember("generate", {"success": True, "data": {"project_id": "proj_1"}})
+    dealshield_only = load_test.RequestMix(bodies, {"dealshield": 1})
+    dealshield_only.project_ids = list(first.project_ids)
+    assert dealshield_only.next_request() == (
+        "dealshield",
+        "GET",
+        "/api/v2/scope/projects/proj_1/dealshield",
+        None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_load_reports_latency_and_error_rates_per_endpoint():
+    generated = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/scope/generate"):
+            generated.append(request.url.path)
+            return httpx.Response(200, json={"success": True, "data": {"project_id": f"proj_{len(generated)}"}})
+        if request.url.path.endswith("/dealshield"):
+            # Application-level failures arrive as 200 with success: false.
+            return httpx.Response(200, json={"success": False, "errors": ["DealShield not available"]})
+        return httpx.Response(200, json={"success": True, "data": {}})
+
+    bodies = load_test.load_request_bodies()
+    mix = load_test.RequestMix(bodies, load_test.DEFAULT_MIX, seed=1)
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="http://load.test") as client:
+        steps = await load_test.run_load(client, mix, concurrency_steps=(1, 3), step_seconds=0.05)
+
+    assert len(generated) >= len(bodies)
+    assert [step["concurrency"] for step in steps] == [1, 3]
+    for step in steps:
+        assert set(step["endpoints"]) == {"analyze", "dealshield", "generate"}
+        assert step["endpoints"]["analyze"]["error_rate"] == 0
+        assert step["endpoints"]["dealshield"]["error_rate"] == 1
+        total = step["total"]
+        assert total["requests"] == sum(stats["requests"] for stats in step["endpoints"].values())
+        assert total["p50_ms"] <= total["p95_ms"] <= total["p99_ms"] <= total["max_ms"]
+        assert total["throughput_rps"] > 0
+
+    report = load_test.build_report(steps, {"seed": 1})
+    assert report["version"] == load_test.REPORT_VERSION
+    assert report["steps"] == steps
@@ -0,0 +1,212 @@
+import math
+
+import pytest
+
+from app.v2.config.master_config import BuildingType, ProjectClass, get_building_config
+from app.v2.config.type_profiles.dealshield_tiles import get_dealshield_profile
+from app.v2.engines.unified_engine import unified_engine
+from app.v2.services.dealshield_scenarios import build_dealshield_scenarios
+from app.v2.services.dealshield_service import build_dealshield_view_model
+from app.v2.services.monthly_pro_forma import (
+    PRO_FORMA_BASIS,
+    ProFormaAssumptions,
+    ProFormaTimeline,
+    ScenarioDrivers,
+    build_dealshield_pro_forma,
+    build_scenario_cashflows,
+    monthly_irr,
+    monthly_irrs,
+    scenario_drivers,
+    summarize_scenario,
+    summarize_scenarios,
+    unlevered_cashflows,
+)
+
+
+def _payload(total_cost=10_000_000.0, revenue=2_000_000.0, noi=1_200_000.0):
+    return {
+        "project_info": {"building_type": "multifamily", "square_footage": 50_000},
+        "totals": {"total_project_cost": total_cost},
+        "revenue_analysis": {"annual_revenue": revenue, "net_income": noi},
+        "ownership_analysis": {"debt_metrics": {"annual_debt_service": 600_000.0}},
+    }
+
+
+def test_monthly_irr_recovers_known_rates():
+    assert monthly_irr([-100.0] + [0.0] * 11 + [100.0 * 1.01 ** 12]) == pytest.approx(0.01, abs=1e-9)
+    assert monthly_irr([-100.0, 0.0, 81.0]) == pytest.approx(-0.1, abs=1e-9)
+    assert monthly_irr([100.0, 50.0]) is None
+
+    rates = monthly_irrs([[-100.0, 0.0, 121.0], [-100.0, 0.0, 81.0], [100.0, 50.0, 10.0]])
+    assert rates[0] == pytest.approx(0.1, abs=1e-9)
+    assert rates[1] == pytest.approx(-0.1, abs=1e-9)
+    assert math.isnan(rates[2])
+
+
+def test_commissioning_delay_is_timed_not_scaled():
+    delayed = scenario_drivers(_payload(), {"commissioning_delay_months": 3})
+    assert delayed.annual_revenue == pytest.approx(2_000_000.0)
+    assert delayed.annual_operating_expenses == pytest.approx(800_000.0)
+    assert delayed.commissioning_delay_months == 3
+    assert scenario_drivers({"totals": {}}) is None
+
+    timeline = ProFormaTimeline(ProFormaAssumptions(construction_months=12, lease_up_months=6, initial_occupancy=0.5))
+    on_time = summarize_scenario(timeline, scenario_drivers(_payload()))
+    late = summarize_scenario(timeline, delayed)
+
+    assert on_time["revenue_start_month"] == 12
+    assert late["revenue_start_month"] == 15
+    assert late["annual"][0]["revenue"] < on_time["annual"][0]["revenue"]
+    assert late["irr"] < on_time["irr"]
+    assert late["annual"][-1]["noi"] == pytest.approx(on_time["annual"][-1]["noi"])
+    # The underwriting year starts at the on-time stabilization month, where
+    # the on-time scenario earns exactly its stabilized NOI.
+    assert on_time["underwriting_year_start_month"] == 18
+    assert on_time["dscr"] == pytest.approx(1_200_000.0 / 600_000.0, abs=1e-3)
+    assert late["dscr"] < on_time["dscr"]
+
+
+def test_scenarios_are_computed_as_one_array():
+    timeline = ProFormaTimeline(ProFormaAssumptions(construction_months=12, lease_up_months=6, initial_occupancy=0.5))
+    drivers = [
+        scenario_drivers(_payload()),
+        scenario_drivers(_payload(total_cost=11_000_000.0, revenue=1_800_000.0, noi=1_000_000.0)),
+        scenario_drivers(_payload(), {"commissioning_delay_months": 3}),
+    ]
+    together = summarize_scenarios(timeline, drivers)
+    for entry, summary in zip(drivers, together):
+        assert summary == summarize_scenario(timeline, entry)
+
+
+def test_metric_cashflows_match_the_line_items():
+    timeline = ProFormaTimeline(ProFormaAssumptions(construction_months=12, lease_up_months=6, initial_occupancy=0.5))
+    drivers = [
+        scenario_drivers(_payload()),
+        scenario_drivers(_payload(), {"commissioning_delay_months": 9}),
+    ]
+    unlevered = unlevered_cashflows(timeline, drivers)
+    line_items = build_scenario_cashflows(timeline, drivers)
+
+    operating = unlevered.cashflows[:, timeline.construction_months:].copy()
+    operating[:, -1] -= line_items.sale_proceeds
+    assert operating == pytest.approx(line_items.noi - line_items.reserves)
+    assert unlevered.cashflows[:, :timeline.construction_months].sum(axis=1) == pytest.approx([-10_000_000.0] * 2)
+    assert unlevered.underwriting_noi == pytest.approx(line_items.noi[:, timeline.underwriting_window].sum(axis=1))
+
+
+def test_lease_up_ramp_reaches_stabilization():
+    timeline = ProFormaTimeline(ProFormaAssumptions(construction_months=6, lease_up_months=12, initial_occupancy=0.6))
+    drivers = ScenarioDrivers(
+        total_project_cost=5_000_000.0,
+        annual_revenue=900_000.0,
+        annual_operating_expenses=300_000.0,
+        annual_debt_service=400_000.0,
+        square_footage=20_000.0,
+    )
+    summary = summarize_scenario(timeline, drivers)
+
+    assert summary["annual"][0]["occupancy"] < 1.0
+    assert summary["annual"][1]["occupancy"] == pytest.approx(1.0)
+    assert summary["stabilized_year"] == 2
+    assert summary["year_1_dscr"] < summary["stabilized_dscr"]
+    assert len(summary["annual"]) == 10
+    assert summary["sale_month"] == 126
+    # Growth steps start at stabilization, not at delivery.
+    assert summary["annual"][1]["revenue"] == pytest.approx(900_000.0)
+    assert summary["annual"][2]["revenue"] == pytest.approx(900_000.0 * 1.03)
+
+
+def test_every_dealshield_scenario_gets_a_pro_forma():
+    payload = unified_engine.calculate_project(
+        building_type=BuildingType.INDUSTRIAL,
+        subtype="cold_storage",
+        square_footage=100_000,
+        location="Nashville, TN",
+        project_class=ProjectClass.GROUND_UP,
+    )
+    dealshield = payload["dealshield_scenarios"]
+    assert "pro_forma" not in dealshield
+    pro_forma = build_dealshield_pro_forma(dealshield, unified_engine)
+
+    assert set(pro_forma["scenarios"]) == set(dealshield["scenarios"])
+    assert pro_forma["label"] and pro_forma["metric_units"]["irr"] == "percent"
+    # Same units as the flat ownership metrics: IRR in percent, not a fraction.
+    assert 1 < pro_forma["scenarios"]["base"]["irr"] < 100
+    for metrics in pro_forma["scenarios"].values():
+        assert metrics["irr"] is not None
+        assert metrics["npv"] is not None
+        assert len(metrics["annual"]) == pro_forma["assumptions"]["hold_months"] // 12
+    delay = dealshield["provenance"]["scenario_inputs"]["ugly"]["commissioning_delay_months"]
+    assert pro_forma["scenarios"]["ugly"]["revenue_start_month"] == (
+        pro_forma["scenarios"]["base"]["revenue_start_month"] + delay
+    )
+    assert build_dealshield_pro_forma({"scenarios": {}}) is None
+
+
+def _cold_storage_payload():
+    return unified_engine.calculate_project(
+        building_type=BuildingType.INDUSTRIAL,
+        subtype="cold_storage",
+        square_footage=100_000,
+        location="Nashville, TN",
+        project_class=ProjectClass.GROUND_UP,
+    )
+
+
+def test_scenario_decision_metrics_come_from_the_pro_forma():
+    payload = _cold_storage_payload()
+    dealshield = payload["dealshield_scenarios"]
+    pro_forma = build_dealshield_pro_forma(dealshield, unified_engine)
+    scenarios = dealshield["scenarios"]
+
+    for scenario_id, scenario in scenarios.items():
+        ownership = scenario["ownership_analysis"]
+        modeled = pro_forma["scenarios"][scenario_id]
+        assert ownership["metrics_basis"] == PRO_FORMA_BASIS
+        assert ownership["return_metrics"]["irr"] == modeled["irr"]
+        assert ownership["return_metrics"]["npv"] == modeled["npv"]
+        assert ownership["debt_metrics"]["calculated_dscr"] == pytest.approx(modeled["dscr"], abs=1e-3)
+        assert scenario["return_metrics"]["irr"] == modeled["irr"]
+
+    # On schedule, the underwriting-year DSCR is the flat stabilized DSCR.
+    base_debt = scenarios["base"]["ownership_analysis"]["debt_metrics"]
+    base_noi = scenarios["base"]["revenue_analysis"]["net_income"]
+    assert base_debt["calculated_dscr"] == pytest.approx(base_noi / base_debt["annual_debt_service"], rel=1e-6)
+
+    # The ugly commissioning delay no longer scales stabilized revenue; it only
+    # pushes revenue out, which lowers DSCR, IRR and NPV against conservative.
+    ugly, conservative = scenarios["ugly"], scenarios["conservative"]
+    ugly_input = dealshield["provenance"]["scenario_inputs"]["ugly"]
+    assert "ramp_factor" not in ugly_input
+    assert ugly["revenue_analysis"]["annual_revenue"] == pytest.approx(conservative["revenue_analysis"]["annual_revenue"])
+    assert ugly["ownership_analysis"]["debt_metrics"]["calculated_dscr"] < conservative["ownership_analysis"]["debt_metrics"]["calculated_dscr"]
+    assert ugly["ownership_analysis"]["return_metrics"]["irr"] < conservative["ownership_analysis"]["return_metrics"]["irr"]
+    assert ugly["ownership_analysis"]["return_metrics"]["npv"] < conservative["ownership_analysis"]["return_metrics"]["npv"]
+
+    view_model = build_dealshield_view_model("cold-storage", payload, get_dealshield_profile("industrial_cold_storage_v1"))
+    ugly_row = next(row for row in view_model["decision_table"]["rows"] if row["scenario_id"] == "ugly")
+    dscr_cell = next(cell for cell in ugly_row["cells"] if cell["col_id"] == "dscr")
+    assert dscr_cell["value"] == ugly["ownership_analysis"]["debt_metrics"]["calculated_dscr"]
+
+
+def test_cold_storage_ugly_row_no_longer_breaks_on_the_ramp_scalar():
+    payload = _cold_storage_payload()
+    payload["dealshield_controls"] = {
+        "use_cost_anchor": True,
+        "anchor_total_project_cost": payload["totals"]["total_project_cost"] * 0.6,
+    }
+    payload["dealshield_scenarios"] = build_dealshield_scenarios(
+        payload, get_building_config(BuildingType.INDUSTRIAL, "cold_storage"), unified_engine
+    )
+    view_model = build_dealshield_view_model("cold-storage", payload, get_dealshield_profile("industrial_cold_storage_v1"))
+
+    # With the 0.75 ramp scalar the ugly row tripped the -30% value gap trigger
+    # (-33.6%) and set a ~11.6% flex buffer. Timed, the delay leaves ugly's
+    # stabilized value alone, so no row trips the trigger and the first break
+    # falls back to the first negative value gap, in the conservative row.
+    assert view_model["decision_status"] == "GO"
+    assert view_model["decision_reason_code"] == "base_value_gap_positive"
+    first_break = view_model["first_break_condition"]
+    assert first_break["scenario_id"] == "conservative"
+    assert first_break["break_metric"] == "value_gap"
+    assert view_model["flex_before_break_pct"] == pytest.approx(20.3, abs=0.1)
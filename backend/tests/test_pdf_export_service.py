@@ -739,7 +739,7 @@ async def test_dealshield_pdf_route_uses_dedicated_renderer(monkeypatch):
     calls = []
 
     monkeypatch.setattr(scope_module, "_get_scoped_project", lambda db, project_id, auth: project)
-    monkeypatch.setattr(scope_module, "_resolve_project_payload", lambda project_arg: dict(payload))
+    monkeypatch.setattr(scope_module.ProjectRequestContext, "payload", lambda context: dict(payload))
     monkeypatch.setattr(
         scope_module,
         "_refresh_dealshield_payload_for_project",
@@ -787,7 +787,7 @@ async def test_project_pdf_route_sends_customer_safe_decision_packet_to_renderer
         "hydrate_project_payload_for_packet",
         lambda project_arg, project_payload: {"project_name": "Nashville Market Apartments"},
     )
-    monkeypatch.setattr(scope_module, "_resolve_project_payload", lambda project_arg: dict(payload))
+    monkeypatch.setattr(scope_module.ProjectRequestContext, "payload", lambda context: dict(payload))
     monkeypatch.setattr(
         scope_module,
         "_refresh_dealshield_payload_for_project",
@@ -0,0 +1,201 @@
+import json
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.auth import AuthContext
+from app.db.database import Base
+from app.db.models import Organization, Project, ProjectAccess, ProjectSummary
+from app.v2.api import portfolio as portfolio_module
+from app.v2.config.master_config import BuildingType, ProjectClass
+from app.v2.engines.unified_engine import unified_engine
+from app.v2.services.portfolio_summary import (
+    portfolio_summary,
+    project_summary_values,
+    upsert_project_summary,
+    write_project_summaries,
+)
+from scripts import backfill_project_summaries
+
+
+def _session_factory():
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def _add_project(db, project_id, org_id, calculation_data=None, **summary):
+    db.add(
+        Project(
+            project_id=project_id,
+            name=project_id,
+            square_footage=10_000,
+            location="Nashville, TN",
+            total_cost=1.0,
+            scope_data="{}",
+            calculation_data=calculation_data,
+        )
+    )
+    db.add(ProjectAccess(project_id=project_id, org_id=org_id, owner_user_id=f"user_{org_id}"))
+    if summary:
+        db.add(ProjectSummary(project_id=project_id, org_id=org_id, **summary))
+
+
+@pytest.fixture
+def seeded_db():
+    db = _session_factory()()
+    db.add_all([Organization(id="org_a", name="A"), Organization(id="org_b", name="B")])
+    _add_project(
+        db, "a1", "org_a", building_type="office", square_footage=10_000, total_cost=3_000_000,
+        cost_per_sf=300.0, yield_on_cost=0.07, dscr=1.3, decision_status="GO",
+    )
+    _add_project(
+        db, "a2", "org_a", building_type="office", square_footage=20_000, total_cost=4_000_000,
+        cost_per_sf=200.0, yield_on_cost=0.045, dscr=0.9, decision_status="NO-GO",
+    )
+    _add_project(
+        db, "a3", "org_a", building_type="healthcare", square_footage=5_000, total_cost=6_000_000,
+        cost_per_sf=1_200.0, yield_on_cost=None, dscr=None, decision_status=None,
+    )
+    _add_project(
+        db, "b1", "org_b", building_type="retail", square_footage=9_000, total_cost=99_000_000,
+        cost_per_sf=11_000.0, yield_on_cost=0.2, dscr=3.0, decision_status="GO",
+    )
+    db.commit()
+    yield db
+    db.close()
+
+
+def _bucket_counts(buckets):
+    return {entry["bucket"]: entry["project_count"] for entry in buckets if entry["project_count"]}
+
+
+def test_portfolio_summary_aggregates_only_the_org(seeded_db):
+    summary = portfolio_summary(seeded_db, "org_a")
+
+    assert summary["project_count"] == 3
+    assert summary["total_pipeline_cost"] == 13_000_000
+    assert summary["total_square_footage"] == 35_000
+    assert summary["average_cost_per_sf"] == pytest.approx((300 + 200 + 1_200) / 3, abs=0.01)
+    assert [entry["building_type"] for entry in summary["by_building_type"]] == ["office", "healthcare"]
+    office = summary["by_building_type"][0]
+    assert (office["project_count"], office["min_cost_per_sf"], office["max_cost_per_sf"]) == (2, 200.0, 300.0)
+    assert _bucket_counts(summary["cost_per_sf_distribution"]) == {"150-250": 1, "250-350": 1, "1000+": 1}
+    assert _bucket_counts(summary["yield_on_cost_buckets"]) == {"<5%": 1, "6.5-8%": 1, "n/a": 1}
+    assert _bucket_counts(summary["dscr_buckets"]) == {"<1.00x": 1, "1.25-1.50x": 1, "n/a": 1}
+    assert summary["decision_status_counts"] == {"GO": 1, "NO-GO": 1, "n/a": 1}
+
+
+def test_portfolio_summary_for_an_empty_org():
+    db = _session_factory()()
+    summary = portfolio_summary(db, "org_empty")
+    db.close()
+
+    assert summary["project_count"] == 0
+    assert summary["total_pipeline_cost"] == 0.0
+    assert summary["average_cost_per_sf"] is None
+    assert summary["by_building_type"] == []
+    assert all(entry["project_count"] == 0 for entry in summary["dscr_buckets"])
+
+
+def test_summary_values_come_from_the_engine_payload():
+    payload = unified_engine.calculate_project(
+        building_type=BuildingType.RESTAURANT,
+        subtype="full_service",
+        square_footage=8_000,
+        location="Nashville, TN",
+        project_class=ProjectClass.GROUND_UP,
+    )
+
+    values = project_summary_values("p1", payload)
+
+    assert values["building_type"] == "restaurant"
+    assert values["subtype"] == "full_service"
+    assert values["square_footage"] == 8_000
+    assert values["total_cost"] == pytest.approx(payload["totals"]["total_project_cost"])
+    assert values["cost_per_sf"] == pytest.approx(payload["totals"]["cost_per_sf"])
+    assert values["decision_status"]
+    assert values["regional_multiplier"] == pytest.approx(payload["regional"]["multiplier"])
+    assert values["finish_level"] == payload["project_info"].get("finish_level")
+    assert project_summary_values("p2", {"ownership_analysis": {"yield_on_cost": 0, "debt_metrics": {}}}) == {
+        "building_type": None,
+        "subtype": None,
+        "square_footage": None,
+        "total_cost": None,
+        "cost_per_sf": None,
+        "yield_on_cost": None,
+        "dscr": None,
+        "decision_status": None,
+        "regional_multiplier": None,
+        "finish_level": None,
+    }
+
+
+def test_write_and_upsert_keep_one_row_per_project(seeded_db):
+    _add_project(seeded_db, "a4", "org_a")
+    seeded_db.add(Project(project_id="unscoped", name="unscoped", square_footage=1, location="Nashville, TN", total_cost=1.0, scope_data="{}"))
+    seeded_db.commit()
+
+    written = write_project_summaries(
+        seeded_db,
+        {
+            "a1": {"total_cost": 1_000_000.0, "cost_per_sf": 100.0},
+            "a4": {"building_type": "office", "total_cost": 2_000_000.0},
+            "unscoped": {"total_cost": 5.0},
+        },
+    )
+    seeded_db.commit()
+
+    assert written == 2
+    assert seeded_db.query(ProjectSummary).filter_by(project_id="a4").one().org_id == "org_a"
+    assert seeded_db.query(ProjectSummary).filter_by(project_id="unscoped").first() is None
+
+    project = seeded_db.query(Project).filter_by(project_id="a1").one()
+    upsert_project_summary(seeded_db, project, "org_a", {"totals": {"total_project_cost": 7.0}})
+    seeded_db.commit()
+    rows = seeded_db.query(ProjectSummary).filter_by(project_id="a1").all()
+    assert [(row.total_cost, row.cost_per_sf) for row in rows] == [(7.0, None)]
+
+
+def test_backfill_fills_only_missing_rows():
+    factory = _session_factory()
+    db = factory()
+    db.add(Organization(id="org_a", name="A"))
+    payload = {"project_info": {"building_type": "office"}, "totals": {"total_project_cost": 1_000.0}}
+    _add_project(db, "old", "org_a", calculation_data=json.dumps(payload))
+    _add_project(db, "broken", "org_a", calculation_data="{not json")
+    _add_project(db, "new", "org_a", building_type="retail", total_cost=5.0)
+    db.commit()
+    db.close()
+
+    assert backfill_project_summaries.backfill_project_summaries(factory, batch_size=1) == 2
+    assert backfill_project_summaries.backfill_project_summaries(factory) == 0
+
+    db = factory()
+    rows = {row.project_id: (row.building_type, row.total_cost) for row in db.query(ProjectSummary).all()}
+    db.close()
+    assert rows == {"old": ("office", 1_000.0), "broken": (None, None), "new": ("retail", 5.0)}
+
+
+@pytest.mark.asyncio
+async def test_portfolio_route_is_org_scoped():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(bind=engine, expire_on_commit=False)() as db:
+        db.add_all([Organization(id="org_a", name="A"), Organization(id="org_b", name="B")])
+        await db.flush()
+        for project_id, org_id, total_cost in (("a1", "org_a", 10.0), ("b1", "org_b", 20.0), ("b2", "org_b", 30.0)):
+            _add_project(db, project_id, org_id, building_type="office", total_cost=total_cost, cost_per_sf=1.0)
+        await db.commit()
+
+        auth = AuthContext(user_id="user_b", email="owner@b.example.com", org_id="org_b", role="owner", access_token="t")
+        response = await portfolio_module.get_portfolio_summary.__wrapped__(request=None, auth=auth, db=db)
+    await engine.dispose()
+
+    assert response["success"] is True
+    assert response["data"]["project_count"] == 2
+    assert response["data"]["total_pipeline_cost"] == 50.0
@@ -0,0 +1,110 @@
+import gc
+import os
+import runpy
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import prefork
+from app.services.export_jobs import (
+    EXPORT_KIND_DEALSHIELD,
+    JOB_STATUS_COMPLETED,
+    ExportJobManager,
+    FilesystemArtifactStore,
+)
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_warm_shared_state_loads_every_registry_and_regex():
+    summary = prefork.warm_shared_state(descriptions=["50,000 sf class A office building in Nashville, TN"])
+
+    assert summary["building_types"] >= 10
+    assert summary["subtypes"] > summary["building_types"]
+    assert summary["profiles"] > 100
+    assert summary["compiled_regexes"] > 0
+
+
+def test_freeze_for_fork_moves_live_objects_to_permanent_generation():
+    try:
+        assert prefork.freeze_for_fork() > 0
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+
+@pytest.mark.skipif(not Path("/proc/self/status").exists(), reason="needs /proc")
+def test_process_memory_reports_rss_for_self_and_forked_children():
+    memory = prefork.read_process_memory()
+    assert memory is not None
+    assert memory.pid == os.getpid()
+    assert memory.rss_kb > 0
+    assert "rss_mb=" in memory.describe()
+
+    read_fd, write_fd = os.pipe()
+    child = os.fork()
+    if child == 0:
+        os.close(write_fd)
+        os.read(read_fd, 1)
+        os._exit(0)
+    try:
+        os.close(read_fd)
+        report = prefork.worker_memory_report(os.getpid())
+        assert child in report
+        assert report[child].rss_kb > 0
+    finally:
+        os.write(write_fd, b"x")
+        os.close(write_fd)
+        os.waitpid(child, 0)
+
+
+def test_gunicorn_config_preloads_and_wires_prefork_hooks(monkeypatch):
+    monkeypatch.setenv("WEB_CONCURRENCY", "3")
+    monkeypatch.setenv("PORT", "9123")
+    config = runpy.run_path(str(BACKEND_ROOT / "gunicorn.conf.py"))
+
+    assert config["preload_app"] is True
+    assert config["workers"] == 3
+    assert config["bind"] == "0.0.0.0:9123"
+    assert config["worker_class"] == "uvicorn.workers.UvicornWorker"
+
+    calls = []
+    monkeypatch.setitem(config["when_ready"].__globals__, "warm_shared_state", lambda: calls.append("warm") or {})
+    monkeypatch.setitem(config["when_ready"].__globals__, "freeze_for_fork", lambda: calls.append("freeze") or 1)
+    monkeypatch.setitem(config["post_fork"].__globals__, "reset_after_fork", lambda: calls.append("reset"))
+    log = SimpleNamespace(info=lambda *args: calls.append("log"))
+    server = SimpleNamespace(log=log, num_workers=3)
+
+    config["when_ready"](server)
+    config["pre_fork"](server, None)
+    config["post_fork"](server, None)
+    assert calls[:2] == ["warm", "freeze"]
+    assert calls.count("freeze") == 2
+    assert calls[-1] == "reset"
+
+
+@pytest.mark.asyncio
+async def test_export_job_status_is_visible_from_another_worker(tmp_path):
+    def _manager():
+        return ExportJobManager(
+            FilesystemArtifactStore(tmp_path),
+            executor=ThreadPoolExecutor(max_workers=1),
+            renderer=lambda kind, export_input: b"%PDF-1.7\n",
+        )
+
+    submitting_worker, polling_worker = _manager(), _manager()
+    job = submitting_worker.submit(
+        EXPORT_KIND_DEALSHIELD, {"profile_id": "office_class_a_v1"}, org_id="org_a", project_id="p1", filename="d.pdf"
+    )
+    await submitting_worker.wait(job, timeout=5)
+
+    seen = polling_worker.get(job.job_id, org_id="org_a")
+    assert seen is not None
+    assert seen.status == JOB_STATUS_COMPLETED
+    assert polling_worker.read_artifact(seen) == b"%PDF-1.7\n"
+    assert polling_worker.get(job.job_id, org_id="org_b") is None
+    assert polling_worker.get("not-a-job-id", org_id="org_a") is None
+    submitting_worker.shutdown()
+    polling_worker.shutdown()
@@ -0,0 +1,207 @@
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.database import Base
+from app.db.models import Project
+from app.v2.engines.unified_engine import unified_engine
+from app.v2.services import project_repricing
+from app.v2.services.project_repricing import (
+    PRICING_FINGERPRINT_KEY,
+    engine_kwargs_from_parsed_input,
+    is_stale_calculation_data,
+    pricing_config_fingerprint,
+    stamp_pricing_fingerprint,
+)
+from scripts import reprice_projects
+
+PARSED_INPUT = {
+    "building_type": "restaurant",
+    "subtype": "full_service",
+    "square_footage": 8000,
+    "location": "Nashville, TN",
+    "project_class": "ground_up",
+    "project_classification": "ground_up",
+    "finish_level": "standard",
+    "finish_level_source": "default",
+    "special_features": [],
+}
+
+
+def _session_factory():
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def _stored_payload(*, stamped: bool, total_cost_scale: float = 1.0):
+    payload = unified_engine.calculate_project(**engine_kwargs_from_parsed_input(PARSED_INPUT))
+    payload["parsed_input"] = dict(PARSED_INPUT)
+    payload["totals"]["total_project_cost"] *= total_cost_scale
+    if stamped:
+        stamp_pricing_fingerprint(payload)
+    return payload
+
+
+def _add_project(db, project_id, payload):
+    blob = json.dumps(payload) if payload is not None else None
+    db.add(
+        Project(
+            project_id=project_id,
+            name=project_id,
+            square_footage=8000,
+            location="Nashville, TN",
+            total_cost=1.0,
+            scope_data=blob or "{}",
+            calculation_data=blob,
+            created_at=datetime.utcnow(),
+        )
+    )
+
+
+@pytest.fixture
+def seeded_sessions():
+    factory = _session_factory()
+    db = factory()
+    stale = _stored_payload(stamped=False, total_cost_scale=0.9)
+    stale["dealshield_controls"] = {"stress_band_pct": 5}
+    _add_project(db, "proj_stale", stale)
+    _add_project(db, "proj_current", _stored_payload(stamped=True))
+    _add_project(db, "proj_legacy", {"totals": {"total_project_cost": 1.0}})
+    _add_project(db, "proj_empty", None)
+    db.commit()
+    db.close()
+    return factory
+
+
+def _stored(factory, project_id):
+    db = factory()
+    try:
+        return db.query(Project).filter(Project.project_id == project_id).one()
+    finally:
+        db.close()
+
+
+def test_reprices_stale_projects_and_reports_total_diffs(seeded_sessions):
+    current_blob = _stored(seeded_sessions, "proj_current").calculation_data
+    report = io.StringIO()
+    seen_batches = []
+
+    progress = reprice_projects.reprice_stale_projects(
+        seeded_sessions,
+        batch_size=1,
+        report=report,
+        on_batch=lambda p: seen_batches.append(p.scanned),
+    )
+
+    assert (progress.scanned, progress.repriced, progress.skipped, progress.failed) == (2, 1, 1, 0)
+    assert seen_batches == [1, 2]
+
+    stale = _stored(seeded_sessions, "proj_stale")
+    payload = json.loads(stale.calculation_data)
+    assert payload[PRICING_FINGERPRINT_KEY] == pricing_config_fingerprint()
+    assert payload["parsed_input"] == PARSED_INPUT
+    assert payload["dealshield_controls"] == {"stress_band_pct": 5}
+    assert payload["dealshield_scenarios"]["provenance"]["scenario_inputs"]["base"]["stress_band_pct"] == 5
+    assert stale.total_cost == pytest.approx(payload["totals"]["total_project_cost"])
+    assert stale.scope_data == stale.calculation_data
+    assert _stored(seeded_sessions, "proj_current").calculation_data == current_blob
+
+    entries = {entry["project_id"]: entry for entry in map(json.loads, report.getvalue().splitlines())}
+    assert entries["proj_legacy"] == {
+        "project_id": "proj_legacy",
+        "status": "skipped",
+        "error": "no stored parsed_input",
+    }
+    change = entries["proj_stale"]["changes"]["total_project_cost"]
+    assert change["after"] == pytest.approx(change["before"] / 0.9)
+    assert change["delta_pct"] == pytest.approx((1 / 0.9 - 1) * 100)
+    assert "construction_total" not in entries["proj_stale"]["changes"]
+
+
+def test_rerun_resumes_with_only_still_stale_projects(seeded_sessions):
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = reprice_projects.reprice_stale_projects(seeded_sessions, executor=executor, limit=1)
+        second = reprice_projects.reprice_stale_projects(seeded_sessions, executor=executor)
+
+    assert (first.scanned, first.repriced) == (1, 1)
+    # Only the project without stored inputs is still stale.
+    assert (second.scanned, second.repriced, second.skipped) == (1, 0, 1)
+
+
+class _UserSavesDuringBatch:
+    """Executor stand-in: a user saves proj_stale after the batch is read, before it is written."""
+
+    def __init__(self, factory, saved_blob):
+        self._factory = factory
+        self._saved_blob = saved_blob
+
+    def map(self, fn, rows, chunksize=1):
+        db = self._factory()
+        try:
+            db.query(Project).filter(Project.project_id == "proj_stale").update(
+                {Project.calculation_data: self._saved_blob}, synchronize_session=False
+            )
+            db.commit()
+        finally:
+            db.close()
+        return [fn(row) for row in rows]
+
+
+def test_user_write_during_a_batch_survives_and_is_left_stale(seeded_sessions):
+    user_payload = json.loads(_stored(seeded_sessions, "proj_stale").calculation_data)
+    user_payload["dealshield_controls"] = {"stress_band_pct": 10}
+    user_blob = json.dumps(user_payload)
+    report = io.StringIO()
+
+    progress = reprice_projects.reprice_stale_projects(
+        seeded_sessions,
+        executor=_UserSavesDuringBatch(seeded_sessions, user_blob),
+        report=report,
+    )
+
+    assert (progress.scanned, progress.repriced, progress.skipped) == (2, 0, 2)
+    assert _stored(seeded_sessions, "proj_stale").calculation_data == user_blob
+    entries = {entry["project_id"]: entry for entry in map(json.loads, report.getvalue().splitlines())}
+    assert entries["proj_stale"]["error"] == reprice_projects.CHANGED_DURING_REPRICE
+
+    # The next run re-prices the user's version.
+    rerun = reprice_projects.reprice_stale_projects(seeded_sessions)
+    assert rerun.repriced == 1
+    payload = json.loads(_stored(seeded_sessions, "proj_stale").calculation_data)
+    assert payload[PRICING_FINGERPRINT_KEY] == pricing_config_fingerprint()
+    assert payload["dealshield_controls"] == {"stress_band_pct": 10}
+
+
+def test_dry_run_leaves_stored_projects_untouched(seeded_sessions):
+    before = _stored(seeded_sessions, "proj_stale").calculation_data
+
+    progress = reprice_projects.reprice_stale_projects(seeded_sessions, dry_run=True)
+
+    assert progress.repriced == 1
+    assert _stored(seeded_sessions, "proj_stale").calculation_data == before
+
+
+def test_fingerprint_tracks_pricing_sources(tmp_path, monkeypatch):
+    source = tmp_path / "margins.py"
+    source.write_text("MARGIN = 0.10\n")
+    monkeypatch.setattr(project_repricing, "_APP_DIR", tmp_path)
+    monkeypatch.setattr(project_repricing, "PRICING_CONFIG_SOURCE_DIRS", ())
+    monkeypatch.setattr(project_repricing, "PRICING_CONFIG_SOURCE_FILES", (source,))
+    pricing_config_fingerprint.cache_clear()
+    try:
+        original = pricing_config_fingerprint()
+        stamped = json.dumps(stamp_pricing_fingerprint({"totals": {}}))
+        assert not is_stale_calculation_data(stamped)
+
+        source.write_text("MARGIN = 0.12\n")
+        pricing_config_fingerprint.cache_clear()
+        assert pricing_config_fingerprint() != original
+        assert is_stale_calculation_data(stamped)
+    finally:
+        pricing_config_fingerprint.cache_clear()
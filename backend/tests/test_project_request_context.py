@@ -0,0 +1,110 @@
+import io
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from app.v2.api import scope as scope_module
+
+
+def _project():
+    calculation_data = {
+        "dealshield_tile_profile": "multifamily_market_rate_apartments_v1",
+        "project_info": {"building_type": "multifamily", "subtype": "market_rate_apartments"},
+        "dealshield_scenarios": {"stale": True},
+    }
+    return SimpleNamespace(
+        project_id="project-301",
+        name="Request Context Apartments",
+        calculation_data=json.dumps(calculation_data),
+        scope_data=None,
+        cost_data=json.dumps({"legacy": True}),
+    )
+
+
+def _count_calls(monkeypatch, name, replacement=None):
+    original = getattr(scope_module, name)
+    calls = []
+
+    def counted(*args, **kwargs):
+        calls.append(args)
+        return (replacement or original)(*args, **kwargs)
+
+    monkeypatch.setattr(scope_module, name, counted)
+    return calls
+
+
+def test_context_formats_once_and_refreshes_a_copy(monkeypatch):
+    project = _project()
+    format_calls = _count_calls(
+        monkeypatch,
+        "format_project_response",
+        lambda project_arg: {"calculation_data": json.loads(project_arg.calculation_data), "name": project_arg.name},
+    )
+
+    def refresh(project_arg, payload):
+        payload["dealshield_scenarios"] = {"stale": False}
+        return payload
+
+    refresh_calls = _count_calls(monkeypatch, "_refresh_dealshield_payload_for_project", refresh)
+    context = scope_module.ProjectRequestContext(project)
+
+    response = context.project_response()
+    response["project_name"] = "Hydrated"
+    assert "project_name" not in context.project_response()
+    assert context.dealshield_profile_id() == "multifamily_market_rate_apartments_v1"
+    assert context.dealshield_payload() is context.dealshield_payload()
+    assert context.dealshield_payload()["dealshield_scenarios"] == {"stale": False}
+    # The formatted response keeps the stored scenarios.
+    assert context.payload()["dealshield_scenarios"] == {"stale": True}
+    assert len(format_calls) == 1
+    assert len(refresh_calls) == 1
+
+
+def test_context_parses_each_stored_column_once(monkeypatch):
+    project = _project()
+    loads_calls = []
+    real_loads = json.loads
+    monkeypatch.setattr(scope_module.json, "loads", lambda raw: loads_calls.append(raw) or real_loads(raw))
+    context = scope_module.ProjectRequestContext(project)
+
+    assert context.stored_json("cost_data") == {"legacy": True}
+    assert context.stored_json("cost_data") is context.stored_json("cost_data")
+    assert context.stored_json("scope_data") is None
+    assert len(loads_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_project_pdf_route_derives_each_view_once(monkeypatch):
+    project = _project()
+    monkeypatch.setattr(scope_module, "_get_scoped_project", lambda db, project_id, auth: project)
+    format_calls = _count_calls(
+        monkeypatch,
+        "format_project_response",
+        lambda project_arg: {"calculation_data": json.loads(project_arg.calculation_data), "name": project_arg.name},
+    )
+    refresh_calls = _count_calls(
+        monkeypatch,
+        "_refresh_dealshield_payload_for_project",
+        lambda project_arg, payload_arg: payload_arg,
+    )
+    view_model_calls = _count_calls(
+        monkeypatch,
+        "build_dealshield_view_model",
+        lambda project_id, payload_arg, profile_arg: {"decision_status": "GO"},
+    )
+    monkeypatch.setattr(scope_module, "get_dealshield_profile", lambda profile_id: {"profile_id": profile_id})
+    monkeypatch.setattr(scope_module, "compose_decision_packet_input", lambda **kwargs: {"project": kwargs["project_payload"]})
+    monkeypatch.setattr(scope_module, "sanitize_decision_packet_export", lambda packet: packet)
+    monkeypatch.setattr(
+        scope_module.pdf_export_service,
+        "generate_decision_packet_pdf",
+        lambda packet: io.BytesIO(b"%PDF-1.7\n"),
+    )
+
+    response = await scope_module.export_project_pdf("project-301", db=object(), auth=object())
+
+    assert response.media_type == "application/pdf"
+    assert len(format_calls) == 1
+    assert len(refresh_calls) == 1
+    assert len(view_model_calls) == 1
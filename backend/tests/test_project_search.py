@@ -0,0 +1,185 @@
+import json
+import time
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.auth import AuthContext
+from app.db.database import Base
+from app.db.models import Organization, Project, ProjectAccess, ProjectSearchDocument
+from app.v2.api import scope as scope_module
+from app.v2.services.project_search import (
+    search_projects,
+    search_terms,
+    update_search_document_costs,
+    upsert_project_search_document,
+)
+from scripts import backfill_project_search
+
+
+def _session_factory():
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def _payload(building_type, subtype, total_cost):
+    return {
+        "project_info": {"building_type": building_type, "subtype": subtype, "project_class": "ground_up"},
+        "totals": {"total_project_cost": total_cost},
+    }
+
+
+def _add_project(db, project_id, org_id, name, building_type, subtype, total_cost, created_at, **fields):
+    project = Project(
+        project_id=project_id,
+        name=name,
+        description=fields.pop("description", None),
+        square_footage=10_000,
+        location=fields.pop("location", "Nashville, TN"),
+        total_cost=total_cost,
+        scope_data="{}",
+        calculation_data=json.dumps(_payload(building_type, subtype, total_cost)),
+        created_at=created_at,
+        **fields,
+    )
+    db.add(project)
+    db.add(ProjectAccess(project_id=project_id, org_id=org_id, owner_user_id=f"user_{org_id}"))
+    return project
+
+
+@pytest.fixture
+def search_db():
+    db = _session_factory()()
+    db.add_all([Organization(id="org_a", name="A"), Organization(id="org_b", name="B")])
+    projects = [
+        _add_project(db, "a1", "org_a", "Riverside Medical Office", "healthcare", "medical_office", 4_200_000,
+                     datetime(2025, 3, 1), description="Two-story MOB with imaging suite"),
+        _add_project(db, "a2", "org_a", "Gulch Apartments", "multifamily", "market_rate_apartments", 38_000_000,
+                     datetime(2025, 6, 1), location="Nashville, TN"),
+        _add_project(db, "a3", "org_a", "Franklin Imaging Center", "healthcare", "imaging_center", 12_500_000,
+                     datetime(2026, 1, 15), location="Franklin, TN"),
+        _add_project(db, "b1", "org_b", "Imaging Tower", "healthcare", "imaging_center", 9_000_000,
+                     datetime(2025, 5, 1)),
+    ]
+    db.flush()
+    for project in projects:
+        org_id = "org_b" if project.project_id.startswith("b") else "org_a"
+        upsert_project_search_document(db, project, org_id, json.loads(project.calculation_data))
+    db.commit()
+    yield db
+    db.close()
+
+
+def _ids(result):
+    return [row["project_id"] for row in result["results"]]
+
+
+def test_text_search_matches_prefixes_within_the_org(search_db):
+    result = search_projects(search_db, "org_a", "imag")
+
+    assert sorted(_ids(result)) == ["a1", "a3"]
+    assert result["total"] == 2
+    assert _ids(search_projects(search_db, "org_a", "franklin imaging")) == ["a3"]
+    assert _ids(search_projects(search_db, "org_a", "market rate")) == ["a2"]
+    assert search_projects(search_db, "org_a", "nonexistent")["total"] == 0
+    # FTS5 syntax in the query is treated as plain words.
+    assert search_terms('imaging" OR * NEAR(') == ["imaging", "or", "near"]
+
+
+def test_facets_count_everything_but_their_own_filter(search_db):
+    result = search_projects(search_db, "org_a", building_types=["healthcare"], cost_bands=["1-5M"])
+
+    assert _ids(result) == ["a1"]
+    type_counts = {entry["value"]: entry["project_count"] for entry in result["facets"]["building_type"]}
+    assert type_counts == {"healthcare": 1}
+    band_counts = {entry["value"]: entry["project_count"] for entry in result["facets"]["cost_band"]}
+    assert band_counts["1-5M"] == 1 and band_counts["5-20M"] == 1 and band_counts["20-50M"] == 0
+
+    dated = search_projects(search_db, "org_a", created_from=datetime(2025, 5, 1), created_to=datetime(2025, 12, 31))
+    assert _ids(dated) == ["a2"]
+    assert dated["facets"]["created_at"]["earliest"].startswith("2025-06-01")
+    with pytest.raises(ValueError):
+        search_projects(search_db, "org_a", cost_bands=["huge"])
+
+
+def test_index_follows_updates_deletes_and_reprices(search_db):
+    project = search_db.query(Project).filter_by(project_id="a2").one()
+    project.name = "Riverbend Lofts"
+    upsert_project_search_document(search_db, project, "org_a", json.loads(project.calculation_data))
+    search_db.commit()
+    assert _ids(search_projects(search_db, "org_a", "lofts")) == ["a2"]
+    assert search_projects(search_db, "org_a", "gulch")["total"] == 0
+
+    update_search_document_costs(search_db, {"a2": 900_000.0})
+    search_db.commit()
+    assert _ids(search_projects(search_db, "org_a", cost_bands=["<1M"])) == ["a2"]
+
+    search_db.delete(project)
+    search_db.commit()
+    assert search_projects(search_db, "org_a", "lofts")["total"] == 0
+    assert search_db.query(ProjectSearchDocument).filter_by(project_id="a2").count() == 0
+
+
+def test_backfill_and_search_stay_fast_at_volume():
+    session_factory = _session_factory()
+    db = session_factory()
+    db.add(Organization(id="org_a", name="A"))
+    for index in range(5_000):
+        _add_project(
+            db, f"p{index}", "org_a", f"Project {index} {'Harbor' if index % 50 == 0 else 'Main'} Street",
+            ("office", "retail", "healthcare")[index % 3], None, 1_000_000 + index * 10_000,
+            datetime(2025, 1, 1),
+        )
+    db.commit()
+    db.close()
+
+    assert backfill_project_search.backfill_project_search(session_factory, batch_size=1_000) == 5_000
+    assert backfill_project_search.backfill_project_search(session_factory) == 0
+
+    db = session_factory()
+    started = time.perf_counter()
+    result = search_projects(db, "org_a", "harbor", building_types=["office"])
+    elapsed = time.perf_counter() - started
+    db.close()
+
+    assert result["total"] == 34
+    assert elapsed < 0.5
+
+
+@pytest.mark.asyncio
+async def test_search_route_is_org_scoped():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(bind=engine, expire_on_commit=False)() as db:
+        db.add_all([Organization(id="org_a", name="A"), Organization(id="org_b", name="B")])
+        await db.flush()
+        for project_id, org_id in (("a1", "org_a"), ("b1", "org_b")):
+            project = _add_project(
+                db, project_id, org_id, "Harbor Clinic", "healthcare", "outpatient_clinic", 2_000_000,
+                datetime(2025, 1, 1),
+            )
+            db.add(ProjectSearchDocument(
+                project_id=project_id, org_id=org_id, building_type="healthcare", document=project.name,
+            ))
+        await db.commit()
+
+        auth = AuthContext(user_id="user_b", email="owner@b.example.com", org_id="org_b", role="owner", access_token="t")
+        response = await scope_module.search_org_projects.__wrapped__(
+            request=None, q="harbor", building_type=None, project_class=None, cost_band=None,
+            created_from=None, created_to=None, limit=25, offset=0, db=db, auth=auth,
+        )
+        rejected = await scope_module.search_org_projects.__wrapped__(
+            request=None, q=None, building_type=None, project_class=None, cost_band=["huge"],
+            created_from=None, created_to=None, limit=25, offset=0, db=db, auth=auth,
+        )
+    await engine.dispose()
+
+    assert response.success is True
+    assert [row["project_id"] for row in response.data["results"]] == ["b1"]
+    assert rejected.success is False
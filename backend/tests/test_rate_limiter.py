@@ -0,0 +1,94 @@
+from types import SimpleNamespace
+
+import fakeredis
+import pytest
+import redis
+from fastapi import Depends, FastAPI, Request
+from fastapi.testclient import TestClient
+from slowapi import _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
+
+from app.core.auth import AuthContext, get_auth_context
+from app.core.rate_limiter import build_limiter, rate_limit_key, remember_rate_limit_identity
+
+
+def _fake_redis_options(server: fakeredis.FakeServer) -> dict:
+    pool = redis.ConnectionPool(connection_class=fakeredis.FakeConnection, server=server)
+    return {"connection_pool": pool}
+
+
+def _worker_app(limiter) -> FastAPI:
+    """One API process: its own limiter instance over the shared storage."""
+    app = FastAPI()
+    app.state.limiter = limiter
+    app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+
+    def _auth(request: Request) -> AuthContext:
+        auth = AuthContext(
+            user_id=request.headers.get("x-user", "user_1"),
+            email="member@example.com",
+            org_id=request.headers.get("x-org", "org_a"),
+            role="owner",
+            access_token="token",
+        )
+        remember_rate_limit_identity(request, auth)
+        return auth
+
+    @app.get("/generate")
+    @limiter.limit("2/minute")
+    async def generate(request: Request, auth: AuthContext = Depends(_auth)):
+        return {"org_id": auth.org_id}
+
+    return app
+
+
+def _request(client="203.0.113.9"):
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": [], "client": (client, 1234)})
+
+
+def test_rate_limit_key_prefers_org_member_over_remote_address():
+    request = _request()
+    assert rate_limit_key(request) == "ip:203.0.113.9"
+
+    remember_rate_limit_identity(request, SimpleNamespace(org_id="org_a", user_id="user_7"))
+    assert rate_limit_key(request) == "org:org_a:user:user_7"
+
+
+def test_workers_share_one_sliding_window_in_redis():
+    server = fakeredis.FakeServer()
+    worker_a = TestClient(_worker_app(build_limiter("redis://rate-limits", _fake_redis_options(server))))
+    worker_b = TestClient(_worker_app(build_limiter("redis://rate-limits", _fake_redis_options(server))))
+
+    assert worker_a.get("/generate").status_code == 200
+    assert worker_b.get("/generate").status_code == 200
+    # Third request in the window is refused even though it hits a fresh worker.
+    assert worker_a.get("/generate").status_code == 429
+
+    # Another member of the same org, and the same user id in another org, have their own windows.
+    assert worker_b.get("/generate", headers={"x-user": "user_2"}).status_code == 200
+    assert worker_b.get("/generate", headers={"x-org": "org_b"}).status_code == 200
+
+    keys = fakeredis.FakeStrictRedis(server=server).keys("*")
+    assert any(b"org:org_a:user:user_1" in key for key in keys)
+
+
+def test_unreachable_redis_falls_back_to_local_limits():
+    server = fakeredis.FakeServer()
+    server.connected = False
+    client = TestClient(_worker_app(build_limiter("redis://rate-limits", _fake_redis_options(server))))
+
+    assert client.get("/generate").status_code == 200
+    assert client.get("/generate").status_code == 200
+    assert client.get("/generate").status_code == 429
+
+
+@pytest.mark.asyncio
+async def test_auth_context_dependency_records_rate_limit_identity(monkeypatch):
+    monkeypatch.setenv("TESTING", "true")
+    monkeypatch.setenv("ENVIRONMENT", "test")
+    request = _request()
+
+    auth = await get_auth_context(credentials=None, requested_org_id=None, db=None, request=request)
+
+    assert request.state.auth_context is auth
+    assert rate_limit_key(request) == f"org:{auth.org_id}:user:{auth.user_id}"
@@ -0,0 +1,79 @@
+import pytest
+
+from app.config import regional_multipliers as regional
+from app.config.regional_multipliers import (
+    SORTED_STATE_NAMES,
+    STATE_NAME_TO_CODE,
+    STATE_SUFFIX_INDEX,
+    _location_has_explicit_state,
+    lookup_location_context,
+    parse_location,
+    resolve_location_context,
+    resolve_location_contexts,
+)
+
+
+def _linear_state_suffix(location: str):
+    normalized = regional._normalize_state_name_text(location)
+    for state_name in SORTED_STATE_NAMES:
+        if normalized.endswith(f" {state_name}"):
+            return state_name
+    return None
+
+
+def test_state_suffix_index_matches_linear_scan():
+    assert set(name for names in STATE_SUFFIX_INDEX.values() for name in names) == set(STATE_NAME_TO_CODE)
+    assert STATE_SUFFIX_INDEX["virginia"] == ("west virginia", "virginia")
+
+    samples = [f"Springfield {name}" for name in STATE_NAME_TO_CODE]
+    samples += ["Charleston West  Virginia", "Kansas City Kansas", "New York New York", "Nashville", "Dallas TX", ""]
+    for location in samples:
+        assert regional._match_state_suffix(regional._normalize_state_name_text(location)) == _linear_state_suffix(
+            location
+        )
+
+
+@pytest.mark.parametrize(
+    "location,expected",
+    [
+        ("Nashville, TN", ("nashville", "TN")),
+        ("Nashville Tennessee", ("nashville", "TN")),
+        ("Charleston West Virginia", ("charleston", "WV")),
+        ("Richmond virginia", ("richmond", "VA")),
+        ("Charlotte, North Carolina", ("charlotte", "NC")),
+    ],
+)
+def test_parse_location_resolves_trailing_state_names(location, expected):
+    assert parse_location(location) == expected
+    assert _location_has_explicit_state(location) is True
+
+
+def test_whitespace_only_location_resolves_to_baseline():
+    assert _location_has_explicit_state("   ") is False
+    context = resolve_location_context("   ")
+    assert context["source"] == "baseline"
+    assert context["multiplier"] == regional.BASELINE_MULTIPLIER
+
+
+def test_lookup_location_context_is_memoized_and_read_only():
+    first = lookup_location_context("Nashville, TN")
+    assert lookup_location_context("Nashville, TN") is first
+    with pytest.raises(TypeError):
+        first["multiplier"] = 2.0
+
+    # The public dict variant stays safe to modify and shares the memo.
+    copy = resolve_location_context("Nashville, TN")
+    copy["multiplier"] = 2.0
+    assert lookup_location_context("Nashville, TN")["multiplier"] == first["cost_factor"]
+    assert lookup_location_context(None) is lookup_location_context("")
+
+
+def test_resolve_location_contexts_keeps_order_and_reuses_results():
+    locations = ["Dallas, TX", "Nashville Tennessee", None, "Dallas, TX"] * 500
+
+    contexts = resolve_location_contexts(locations)
+
+    assert len(contexts) == len(locations)
+    assert contexts[0] is contexts[3]
+    assert [context["state"] for context in contexts[:4]] == ["TX", "TN", None, "TX"]
+    assert dict(contexts[1]) == resolve_location_context("Nashville Tennessee")
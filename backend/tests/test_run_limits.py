@@ -1,8 +1,13 @@
+from types import SimpleNamespace
+
 from fastapi import HTTPException
 import pytest
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
+from app.core.auth import AuthContext
 from app.core.config import settings
 from app.core.run_limits import (
     assert_run_available,
@@ -10,9 +15,11 @@ from app.core.run_limits import (
     get_effective_run_limit_snapshot,
     get_run_limit_snapshot,
     grant_bonus_runs,
+    release_run,
 )
 from app.db.database import Base
 from app.db.models import Organization, OrganizationRunQuota
+from app.v2.api import scope as scope_api
 
 
 def _session():
@@ -172,3 +179,107 @@ def test_skip_auth_no_longer_bypasses_run_limits(monkeypatch):
     with pytest.raises(HTTPException) as exc:
         assert_run_available(db, org_id=org_id, email="member@example.com")
     assert exc.value.status_code == 403
+
+
+def test_consume_run_is_conditional_on_current_row_not_session_state(monkeypatch, tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'quota.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    monkeypatch.delenv("SKIP_AUTH", raising=False)
+    monkeypatch.setattr(settings, "default_deal_runs", 1)
+    monkeypatch.setattr(settings, "unlimited_access_emails", "")
+
+    first, second = SessionLocal(), SessionLocal()
+    org_id = _seed_org(first)
+    stale = get_run_limit_snapshot(first, org_id=org_id, email="member@example.com")
+    first.commit()
+    assert stale.remaining_runs == 1
+
+    reserved = consume_run(second, org_id=org_id, email="member@example.com")
+    second.commit()
+    assert reserved.used_runs == 1
+    assert reserved.remaining_runs == 0
+
+    # The first session still holds the pre-reservation row in its identity map;
+    # the conditional update must not let it overdraw the quota.
+    with pytest.raises(HTTPException) as exc:
+        consume_run(first, org_id=org_id, email="member@example.com")
+    assert exc.value.status_code == 403
+    first.rollback()
+    assert get_run_limit_snapshot(first, org_id=org_id, email="member@example.com").used_runs == 1
+
+
+def test_release_run_compensates_without_going_negative(monkeypatch):
+    db = _session()
+    org_id = _seed_org(db)
+    monkeypatch.delenv("SKIP_AUTH", raising=False)
+    monkeypatch.setattr(settings, "default_deal_runs", 2)
+    monkeypatch.setattr(settings, "unlimited_access_emails", "")
+
+    consume_run(db, org_id=org_id, email="member@example.com")
+    released = release_run(db, org_id=org_id, email="member@example.com")
+    assert released.used_runs == 0
+    assert released.remaining_runs == 2
+    assert release_run(db, org_id=org_id, email="member@example.com") is None
+    assert get_run_limit_snapshot(db, org_id=org_id, email="member@example.com").used_runs == 0
+
+
+def _generate_auth(org_id: str) -> AuthContext:
+    return AuthContext(
+        user_id="user_1",
+        email="member@example.com",
+        org_id=org_id,
+        role="owner",
+        access_token="token",
+    )
+
+
+@pytest.mark.asyncio
+async def test_generate_releases_reserved_run_when_project_save_fails(monkeypatch):
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    db = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)()
+    org_id = await db.run_sync(_seed_org)
+    monkeypatch.delenv("SKIP_AUTH", raising=False)
+    monkeypatch.setattr(settings, "default_deal_runs", 1)
+    monkeypatch.setattr(settings, "unlimited_access_emails", "")
+    monkeypatch.setattr(
+        scope_api.nlp_service,
+        "extract_project_details",
+        lambda _description: {
+            "building_type": "office",
+            "subtype": "class_a",
+            "square_footage": 50000,
+            "location": "Nashville, TN",
+            "project_class": "ground_up",
+        },
+    )
+    monkeypatch.setattr(
+        scope_api.unified_engine,
+        "calculate_project",
+        lambda **_kwargs: {"totals": {"total_project_cost": 1000, "cost_per_sf": 10}},
+    )
+
+    def _fail_access(**_kwargs):
+        raise RuntimeError("access insert failed")
+
+    monkeypatch.setattr(scope_api, "ProjectAccess", _fail_access)
+    released = []
+    monkeypatch.setattr(
+        scope_api,
+        "release_run",
+        lambda db_arg, **kwargs: released.append(kwargs) or release_run(db_arg, **kwargs),
+    )
+    request = SimpleNamespace(headers={})
+    payload = scope_api.AnalyzeRequest(description="50,000 sf office in Nashville")
+
+    response = await scope_api.generate_scope.__wrapped__(request, payload, db, _generate_auth(org_id))
+
+    assert response.success is False
+    assert released == [{"org_id": org_id, "email": "member@example.com"}]
+    snapshot = await db.run_sync(get_run_limit_snapshot, org_id=org_id, email="member@example.com")
+    assert snapshot.used_runs == 0
+    assert snapshot.remaining_runs == 1
+    await db.close()
+    await engine.dispose()
@@ -0,0 +1,197 @@
+from typing import Any, Dict, List
+
+import pytest
+
+from app.v2.config.master_config import MASTER_CONFIG, BuildingType
+from app.v2.engines.unified_engine import UnifiedEngine
+from app.v2.services.scope_item_columns import (
+    QUANTITY_RULE_CEIL_PER_SF,
+    QUANTITY_RULE_CONSTANT,
+    QUANTITY_RULE_DYNAMIC,
+    QUANTITY_RULE_SF,
+    build_profile_systems,
+    compile_scope_item_profile,
+)
+
+TRADES = {
+    "structural": 2_400_000.0,
+    "mechanical": 1_700_000.0,
+    "electrical": 1_100_000.0,
+    "plumbing": 650_000.0,
+    "finishes": 1_300_000.0,
+}
+OVERRIDE_CONTEXT = {
+    "dock_count": 14,
+    "office_share": 12,
+    "mezzanine_sf": 3000,
+    "parsed_input": {"unit_count": 80, "office_sf": 6000},
+}
+
+
+def _reference_scope_items(engine, building_type, profile_id, trades, square_footage, scope_context, overrides):
+    """Item-at-a-time dict walk the engine used before profiles were compiled."""
+    profile = engine._load_scope_item_profile(profile_id, building_type)
+    if not profile:
+        return []
+    profile = engine._apply_scope_item_overrides(profile, overrides)
+    override_sources = engine._collect_scope_override_sources(scope_context)
+    trade_profiles = profile.get("trade_profiles") if isinstance(profile.get("trade_profiles"), list) else [profile]
+
+    built: List[Dict[str, Any]] = []
+    for trade_profile in trade_profiles:
+        trade_key = str(trade_profile.get("trade_key") or "").strip().lower()
+        trade_total = float(trades.get(trade_key, 0.0) or 0.0)
+        if not trade_key or trade_total <= 0:
+            continue
+        quantity_by_key, share_by_key, ordered_items = {}, {}, []
+        for item in trade_profile.get("items") or []:
+            key = str(item.get("key") or "").strip()
+            if not key or not isinstance(item.get("quantity_rule"), dict):
+                continue
+            quantity_by_key[key] = engine._resolve_scope_item_quantity(
+                item["quantity_rule"], float(square_footage), override_sources, item_key=key, profile_id=profile_id
+            )
+            ordered_items.append(item)
+            allocation = item.get("allocation")
+            if isinstance(allocation, dict) and allocation.get("type") == "share_of_trade":
+                share_by_key[key] = max(0.0, float(allocation.get("share", 0.0) or 0.0))
+        for rule in trade_profile.get("conditional_rescales") or []:
+            if float(quantity_by_key.get(rule["trigger_item_key"], 0.0) or 0.0) <= 0:
+                continue
+            target_total = sum(share_by_key.get(key, 0.0) for key in rule["target_item_keys"])
+            if target_total > 0:
+                for key in rule["target_item_keys"]:
+                    if key in share_by_key:
+                        share_by_key[key] *= float(rule.get("remaining_share", 1.0) or 1.0) / target_total
+        systems = []
+        for item in ordered_items:
+            key = str(item.get("key") or "").strip()
+            quantity = quantity_by_key.get(key, 0.0)
+            if item.get("omit_if_zero_quantity") and float(quantity or 0.0) <= 0:
+                continue
+            total_cost = trade_total * share_by_key.get(key, 0.0)
+            systems.append({
+                "name": str(item.get("label") or key),
+                "quantity": quantity,
+                "unit": str(item.get("unit") or "LS"),
+                "unit_cost": engine._safe_unit_cost(total_cost, float(quantity or 0.0)),
+                "total_cost": total_cost,
+            })
+        if systems:
+            systems = engine._apply_healthcare_scope_depth_uplift(
+                profile_id=profile_id, trade_key=trade_key, systems=systems, square_footage=square_footage
+            )
+            label = str(trade_profile.get("trade_label") or trade_key.replace("_", " ").title())
+            built.append({"trade": label, "systems": systems})
+    return built
+
+
+def _configs_with_scope_profiles():
+    for building_type, subtypes in MASTER_CONFIG.items():
+        for subtype, config in subtypes.items():
+            if getattr(config, "scope_items_profile", None):
+                yield building_type, subtype, config
+
+
+@pytest.mark.parametrize("square_footage", [800.0, 48_000.0, 265_000.0])
+@pytest.mark.parametrize("scope_context", [None, OVERRIDE_CONTEXT])
+def test_compiled_scope_items_match_item_at_a_time_output(square_footage, scope_context):
+    engine = UnifiedEngine()
+    checked = 0
+    for building_type, subtype, config in _configs_with_scope_profiles():
+        for trades in (TRADES, {**TRADES, "plumbing": 0.0}):
+            args = (building_type, config.scope_items_profile, trades, square_footage, scope_context)
+            expected = _reference_scope_items(engine, *args, config.scope_items_overrides)
+            actual = engine._build_scope_items_from_profile(*args, config.scope_items_overrides)
+            assert actual == expected, f"{building_type.value}/{subtype}"
+            checked += 1
+    assert checked > 100
+
+
+def test_compile_scope_item_profile_lays_out_columns_per_trade():
+    profile = {
+        "trade_profiles": [
+            {
+                "trade_key": "plumbing",
+                "items": [
+                    {"key": "fixtures", "label": "Fixtures", "unit": "SF",
+                     "allocation": {"type": "share_of_trade", "share": 0.6},
+                     "quantity_rule": {"type": "sf"}},
+                    {"key": "restrooms", "label": "Restroom groups", "unit": "EA",
+                     "allocation": {"type": "share_of_trade", "share": 0.4},
+                     "quantity_rule": {"type": "restroom_groups", "params": {"sf_per_group": 10000}}},
+                ],
+            },
+            {
+                "trade_key": "electrical",
+                "trade_label": "Power",
+                "items": [
+                    {"key": "service", "label": "Service", "unit": "LS",
+                     "allocation": {"type": "share_of_trade", "share": 1.0},
+                     "quantity_rule": {"type": "constant", "params": {"value": 2}}},
+                    {"key": "office", "label": "Office", "unit": "SF",
+                     "allocation": {"type": "share_of_trade", "share": 0.0},
+                     "quantity_rule": {"type": "office_sf"}},
+                ],
+            },
+        ]
+    }
+
+    compiled = compile_scope_item_profile("test_profile", profile)
+
+    assert [(trade.trade_key, trade.start, trade.stop) for trade in compiled.trades] == [
+        ("plumbing", 0, 2),
+        ("electrical", 2, 4),
+    ]
+    assert list(compiled.shares) == [0.6, 0.4, 1.0, 0.0]
+    assert compiled.units == ("SF", "EA", "LS", "SF")
+    assert list(compiled.rule_kinds) == [
+        QUANTITY_RULE_SF,
+        QUANTITY_RULE_CEIL_PER_SF,
+        QUANTITY_RULE_CONSTANT,
+        QUANTITY_RULE_DYNAMIC,
+    ]
+    assert compiled.static_quantities(25_000) == [25_000.0, 3, 2, None]
+
+    built = build_profile_systems(compiled, {"plumbing": 1000.0, "electrical": 500.0}, 25_000, lambda *_: 1800.0)
+    assert [trade.trade_label for trade, _ in built] == ["Plumbing", "Power"]
+    assert built[0][1][1] == {"name": "Restroom groups", "quantity": 3, "unit": "EA",
+                              "unit_cost": pytest.approx(400.0 / 3), "total_cost": 400.0}
+    assert built[1][1][1]["quantity"] == 1800.0
+
+
+def test_unsupported_quantity_rule_only_fails_when_its_trade_is_built():
+    profile = {
+        "trade_key": "mechanical",
+        "items": [
+            {"key": "mystery", "label": "Mystery", "unit": "EA",
+             "allocation": {"type": "share_of_trade", "share": 1.0},
+             "quantity_rule": {"type": "per_moon_phase"}},
+        ],
+    }
+    engine = UnifiedEngine()
+    compiled = compile_scope_item_profile("mystery_profile", profile)
+
+    def _resolve(rule, sf, key):
+        return engine._resolve_scope_item_quantity(rule, sf, [], item_key=key, profile_id="mystery_profile")
+
+    assert build_profile_systems(compiled, {"mechanical": 0.0}, 10_000, _resolve) == []
+    with pytest.raises(ValueError, match="Unsupported quantity_rule.type: per_moon_phase"):
+        build_profile_systems(compiled, {"mechanical": 100.0}, 10_000, _resolve)
+
+
+def test_engine_reuses_compiled_profile_until_the_source_profile_changes(monkeypatch):
+    engine = UnifiedEngine()
+    config = MASTER_CONFIG[BuildingType.HEALTHCARE]["hospital"]
+    profile_id = config.scope_items_profile
+
+    first = engine._get_compiled_scope_item_profile(profile_id, BuildingType.HEALTHCARE, config.scope_items_overrides)
+    assert engine._get_compiled_scope_item_profile(
+        profile_id, BuildingType.HEALTHCARE, config.scope_items_overrides
+    ) is first
+
+    replacement = engine._load_scope_item_profile(profile_id, BuildingType.HEALTHCARE)
+    monkeypatch.setattr(engine, "_find_scope_item_profile", lambda *_: replacement)
+    assert engine._get_compiled_scope_item_profile(
+        profile_id, BuildingType.HEALTHCARE, config.scope_items_overrides
+    ) is not first
@@ -1,3 +1,5 @@
+from dataclasses import replace
+
 import pytest
 
 from app.v2.config.master_config import (
@@ -14,8 +16,12 @@ from app.v2.services.special_feature_pricing import (
     SPECIAL_FEATURE_TRADE_ALLOCATION_NOTE,
     STRUCTURED_RULE_SOURCE,
     apply_special_feature_pricing_rule,
+    compile_master_config_special_feature_pricing_rules,
+    get_compiled_special_feature_pricing_rules,
     normalize_special_feature_pricing_rule,
+    resolve_normalized_special_feature_pricing_rules,
 )
+from scripts import special_feature_pricing_benchmark
 
 
 def _special_feature_breakdown_by_id(result):
@@ -2300,3 +2306,47 @@ def test_warehouse_available_special_feature_pricing_uses_loading_docks_for_expl
     assert pricing_row["billed_quantity"] == pytest.approx(4.0)
     assert pricing_row["billed_quantity_source"] == "overage_above_default"
     assert "extra_loading_docks" not in pricing_by_id
+
+
+def test_master_config_special_feature_rules_compile_once_into_read_only_rules():
+    assert compile_master_config_special_feature_pricing_rules() > 0
+
+    config = get_building_config(BuildingType.INDUSTRIAL, "warehouse")
+    compiled = get_compiled_special_feature_pricing_rules(config)
+    assert get_compiled_special_feature_pricing_rules(config) is compiled
+    assert sorted(compiled.rules_by_feature_id) == sorted(config.special_features)
+
+    dock_rule = compiled.rules_by_feature_id["loading_docks"]
+    assert resolve_normalized_special_feature_pricing_rules(config, ["loading_docks"]) == [dock_rule]
+    assert dock_rule == normalize_special_feature_pricing_rule("loading_docks", config.special_features["loading_docks"])
+    assert dock_rule.default_count_rule.sf_per_count > 0
+    with pytest.raises(TypeError):
+        compiled.rules_by_feature_id["loading_docks"] = dock_rule
+    with pytest.raises(TypeError):
+        dock_rule.default_count_rule.params["default_sf_per_dock"] = 1
+
+
+def test_invalid_special_feature_rule_fails_at_compile_time_not_per_request():
+    config = get_building_config(BuildingType.INDUSTRIAL, "warehouse")
+    broken = replace(
+        config,
+        special_features={
+            **config.special_features,
+            "yard_lighting": {
+                "basis": SpecialFeaturePricingBasis.COUNT_BASED.value,
+                "value": 900.0,
+                "default_count_rule": {"type": "count_per_sf_ceil", "params": {"sf_per_count": 0}},
+            },
+        },
+    )
+
+    # Not selected, but still rejected: the whole config is validated up front.
+    with pytest.raises(ValueError, match="must define a positive 'sf_per_count'"):
+        resolve_normalized_special_feature_pricing_rules(broken, ["office_buildout"])
+
+
+def test_special_feature_pricing_benchmark_prices_compiled_rules_identically(monkeypatch, capsys):
+    monkeypatch.setattr("sys.argv", ["special_feature_pricing_benchmark.py", "--iterations", "1"])
+
+    assert special_feature_pricing_benchmark.main() == 0
+    assert "speedup=" in capsys.readouterr().out
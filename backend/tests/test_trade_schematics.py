@@ -0,0 +1,90 @@
+import base64
+import io
+import xml.etree.ElementTree as ET
+
+from PIL import Image
+
+from app.services import trade_schematics
+from app.services.professional_trade_package import professional_trade_package_service
+from app.services.trade_package_service import trade_package_service
+
+
+def _request(square_footage=45_000, **extra):
+    return {"square_footage": square_footage, "occupancy_type": "office", **extra}
+
+
+def test_svg_schematics_are_valid_and_trade_specific():
+    electrical = trade_schematics.trade_schematic_svg("electrical", _request())
+    general = trade_schematics.trade_schematic_svg("general", _request())
+
+    root = ET.fromstring(general)
+    assert root.tag.endswith("svg")
+    texts = {element.text for element in root.iter() if element.tag.endswith("text")}
+    assert {"MDP", "RTU-1", "WH", "A1", "Office - 45,000 SF"} <= texts
+    assert "RTU-1" not in electrical and "MDP" in electrical
+    assert trade_schematics.trade_schematic_svg("hvac", _request()) == trade_schematics.trade_schematic_svg("Mechanical", _request())
+
+
+def test_geometry_is_cached_by_trade_and_size_bucket():
+    trade_schematics.clear_schematic_caches()
+    first = trade_schematics.trade_schematic_data_url("plumbing", _request(45_100))
+    assert trade_schematics.trade_schematic_data_url("plumbing", _request(45_100)) is first
+    same_bucket = trade_schematics.trade_schematic_data_url("plumbing", _request(44_900, project_name="Other"))
+    assert same_bucket != first
+    assert trade_schematics._geometry_svg.cache_info().misses == 1
+    assert trade_schematics._geometry_svg.cache_info().hits == 1
+
+    trade_schematics.trade_schematic_data_url("plumbing", {"square_footage": 45_000, "occupancy_type": "retail"})
+    assert trade_schematics._geometry_svg.cache_info().misses == 1
+    trade_schematics.trade_schematic_data_url("plumbing", _request(60_000))
+    assert trade_schematics._geometry_svg.cache_info().misses == 2
+    # Smaller buildings get fewer restroom groups.
+    assert "Restroom 3" not in trade_schematics.trade_schematic_svg("plumbing", _request(12_000))
+
+
+def test_labels_show_the_real_size_and_project_name():
+    trade_schematics.clear_schematic_caches()
+    svg = trade_schematics.trade_schematic_svg("electrical", _request(10_240, project_name="Tower"))
+    texts = {element.text for element in ET.fromstring(svg).iter() if element.tag.endswith("text")}
+    # 10,240 SF at a 1.5 aspect ratio is 124 ft x 83 ft; the 10,000 SF bucket would read 122 ft x 82 ft.
+    assert {"Electrical Schematic - Tower", "Office - 10,240 SF", "124 ft", "83 ft"} <= texts
+    assert "Office - 10,000 SF" not in texts
+
+    small = trade_schematics.trade_schematic_svg("electrical", _request(200))
+    assert "Office - 200 SF" in small and "17 ft" in small and "12 ft" in small
+
+    png = trade_schematics.trade_schematic_png("electrical", _request(10_240, project_name="Tower"))
+    assert png != trade_schematics.trade_schematic_png("electrical", _request(10_000, project_name="Tower"))
+    assert trade_schematics._geometry_image.cache_info().misses == 1
+
+
+def test_services_return_svg_and_rasterize_only_for_pdf():
+    trade_schematics.clear_schematic_caches()
+    schematic = professional_trade_package_service.create_improved_schematic({}, "electrical", _request())
+    assert schematic.startswith("data:image/svg+xml;base64,")
+    assert base64.b64decode(schematic.split(",")[1]).decode("utf-8").startswith("<svg")
+    assert trade_package_service._generate_trade_schematic({}, "electrical", _request()) is schematic
+    assert trade_schematics._render_png.cache_info().currsize == 0
+
+    png = trade_schematics.trade_schematic_png("electrical", _request())
+    image = Image.open(io.BytesIO(png))
+    assert image.format == "PNG"
+    assert image.size == (1650, 1275)
+    assert trade_schematics.trade_schematic_png("electrical", _request()) is png
+
+
+def test_electrical_one_line_is_cached_per_service_size():
+    trade_schematics.clear_schematic_caches()
+    assert trade_schematics.main_service_amps(45_000) == 700
+    assert trade_schematics.main_service_amps(0) == 400
+
+    png = trade_schematics.electrical_one_line_png("Tower", 45_000)
+    assert Image.open(io.BytesIO(png)).size == (1500, 1425)
+    assert trade_schematics.electrical_one_line_png("Tower", 45_100) is png
+    assert trade_schematics.electrical_one_line_png("Tower", 90_000) is not png
+
+    package = professional_trade_package_service._create_electrical_diagram_page(
+        {"project_name": "Tower", "request_data": _request()}, professional_trade_package_service._create_professional_styles()
+    )
+    assert trade_schematics._render_one_line_png.cache_info().hits >= 1
+    assert package
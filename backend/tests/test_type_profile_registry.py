@@ -0,0 +1,92 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from app.v2.config.type_profiles import dealshield_content, dealshield_tiles, profile_registry, scope_items
+from scripts import import_time_budget
+
+BACKEND_ROOT = Path(__file__).resolve().parents[1]
+
+
+@pytest.fixture
+def clean_snapshot(monkeypatch):
+    monkeypatch.delenv(profile_registry.PROFILE_SNAPSHOT_ENV, raising=False)
+    profile_registry.reset_profile_snapshot()
+    yield monkeypatch
+    profile_registry.reset_profile_snapshot()
+
+
+def _full_scan(sources, profile_id):
+    for source in sources:
+        if profile_id in source:
+            return source[profile_id]
+    raise KeyError(profile_id)
+
+
+def test_lookup_imports_only_the_owning_building_type():
+    probe = (
+        "import sys\n"
+        "from app.v2.config.type_profiles.dealshield_tiles import get_dealshield_profile\n"
+        "get_dealshield_profile('office_class_a_v1')\n"
+        "loaded = sorted(m.rsplit('.', 1)[-1] for m in sys.modules\n"
+        "                if m.startswith('app.v2.config.type_profiles.dealshield_tiles.'))\n"
+        "print(','.join(loaded))\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", probe], cwd=BACKEND_ROOT, capture_output=True, text=True, check=True
+    )
+    assert completed.stdout.strip() == "office"
+
+
+def test_routed_lookups_match_full_registry_scan(clean_snapshot):
+    for source in scope_items.SCOPE_ITEM_PROFILE_SOURCES:
+        for profile_id in source:
+            assert scope_items.get_scope_item_profile(profile_id) is _full_scan(
+                scope_items.SCOPE_ITEM_PROFILE_SOURCES, profile_id
+            )
+    for source in dealshield_tiles.DEALSHIELD_TILE_PROFILE_SOURCES:
+        for profile_id in source:
+            expected = _full_scan(dealshield_tiles.DEALSHIELD_TILE_PROFILE_SOURCES, profile_id)
+            assert dealshield_tiles.get_dealshield_profile(profile_id) == {"profile_id": profile_id, **expected}
+    for source in dealshield_content.DEALSHIELD_CONTENT_PROFILE_SOURCES:
+        for profile_id in source:
+            expected = _full_scan(dealshield_content.DEALSHIELD_CONTENT_PROFILE_SOURCES, profile_id)
+            assert dealshield_content.get_dealshield_content_profile(profile_id) == {
+                "profile_id": profile_id,
+                **expected,
+            }
+    assert scope_items.get_scope_item_profile("office_unknown_v9") is None
+    with pytest.raises(KeyError):
+        dealshield_tiles.get_dealshield_profile("office_unknown_v9")
+
+
+def test_snapshot_serves_profiles_and_is_ignored_once_sources_change(clean_snapshot, tmp_path):
+    snapshot_path = tmp_path / "type_profiles.snapshot"
+    counts = profile_registry.build_profile_snapshot(str(snapshot_path))
+    assert counts["dealshield_tiles"] > 0
+    assert counts["scope_items"] > 0
+
+    clean_snapshot.setenv(profile_registry.PROFILE_SNAPSHOT_ENV, str(snapshot_path))
+    module_profile = dealshield_tiles.office.DEALSHIELD_TILE_PROFILES["office_class_a_v1"]
+    served = dealshield_tiles._REGISTRY.profiles("office")["office_class_a_v1"]
+    assert served == module_profile
+    assert served is not module_profile
+
+    profile_registry.reset_profile_snapshot()
+    clean_snapshot.setattr(profile_registry, "profile_source_fingerprint", lambda: "edited")
+    assert dealshield_tiles._REGISTRY.profiles("office")["office_class_a_v1"] is module_profile
+
+
+def test_snapshot_loader_rejects_garbage(clean_snapshot, tmp_path):
+    garbage = tmp_path / "garbage.snapshot"
+    garbage.write_bytes(b"not a marshal payload")
+    assert profile_registry.load_profile_snapshot(str(garbage)) is None
+    assert profile_registry.load_profile_snapshot(str(tmp_path / "missing.snapshot")) is None
+
+
+def test_engine_import_stays_within_startup_budget():
+    profile = import_time_budget.measure_import("app.v2.engines.unified_engine", runs=3)
+    assert import_time_budget.check_budget(profile) == []
+    assert not [name for name in profile.modules if name.startswith("app.v2.config.type_profiles.dealshield_")]
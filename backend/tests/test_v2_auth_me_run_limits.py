@@ -1,7 +1,7 @@
 from starlette.requests import Request
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
 
 from app.core.auth import AuthContext
 from app.core.config import settings
@@ -11,16 +11,20 @@ from app.db.models import Organization, OrganizationRunQuota
 from app.v2.api.auth import get_auth_me
 
 
-def _session():
-    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    Base.metadata.create_all(bind=engine)
-    return TestingSessionLocal()
+@pytest.fixture
+async def db():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    TestingSessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    async with TestingSessionLocal() as session:
+        yield session
+    await engine.dispose()
 
 
-def _seed_org(db, org_id: str = "org_auth_me"):
+async def _seed_org(db, org_id: str = "org_auth_me"):
     db.add(Organization(id=org_id, name="Auth Me Org"))
-    db.commit()
+    await db.commit()
     return org_id
 
 
@@ -29,14 +33,13 @@ def _request() -> Request:
 
 
 @pytest.mark.asyncio
-async def test_auth_me_reports_real_exhaustion_for_normal_org_users(monkeypatch):
-    db = _session()
-    org_id = _seed_org(db)
+async def test_auth_me_reports_real_exhaustion_for_normal_org_users(db, monkeypatch):
+    org_id = await _seed_org(db)
     monkeypatch.delenv("SKIP_AUTH", raising=False)
     monkeypatch.setattr(settings, "default_deal_runs", 1)
     monkeypatch.setattr(settings, "unlimited_access_emails", "")
 
-    consume_run(db, org_id=org_id, email="member@example.com")
+    await db.run_sync(consume_run, org_id=org_id, email="member@example.com")
 
     response = await get_auth_me(
         request=_request(),
@@ -61,9 +64,8 @@ async def test_auth_me_reports_real_exhaustion_for_normal_org_users(monkeypatch)
 
 
 @pytest.mark.asyncio
-async def test_auth_me_reports_ordinary_quota_truth_when_runs_remain(monkeypatch):
-    db = _session()
-    org_id = _seed_org(db)
+async def test_auth_me_reports_ordinary_quota_truth_when_runs_remain(db, monkeypatch):
+    org_id = await _seed_org(db)
     monkeypatch.delenv("SKIP_AUTH", raising=False)
     monkeypatch.setattr(settings, "default_deal_runs", 1)
     monkeypatch.setattr(settings, "unlimited_access_emails", "")
@@ -91,9 +93,8 @@ async def test_auth_me_reports_ordinary_quota_truth_when_runs_remain(monkeypatch
 
 
 @pytest.mark.asyncio
-async def test_auth_me_reports_unlimited_internal_access_without_false_exhaustion(monkeypatch):
-    db = _session()
-    org_id = _seed_org(db)
+async def test_auth_me_reports_unlimited_internal_access_without_false_exhaustion(db, monkeypatch):
+    org_id = await _seed_org(db)
     monkeypatch.delenv("SKIP_AUTH", raising=False)
     monkeypatch.setattr(settings, "default_deal_runs", 1)
     monkeypatch.setattr(settings, "unlimited_access_emails", "vip@example.com")
@@ -106,7 +107,7 @@ async def test_auth_me_reports_unlimited_internal_access_without_false_exhaustio
             used_runs=1,
         )
     )
-    db.commit()
+    await db.commit()
 
     response = await get_auth_me(
         request=_request(),
@@ -132,10 +133,10 @@ async def test_auth_me_reports_unlimited_internal_access_without_false_exhaustio
 
 @pytest.mark.asyncio
 async def test_auth_me_uses_non_blocking_effective_snapshot_when_local_dev_bypass_bypasses_generation(
+    db,
     monkeypatch,
 ):
-    db = _session()
-    org_id = _seed_org(db)
+    org_id = await _seed_org(db)
     monkeypatch.setenv("ENVIRONMENT", "development")
     monkeypatch.setenv("DATABASE_URL", "sqlite:///:memory:")
     monkeypatch.setenv("LOCAL_DEV_AUTH_BYPASS", "true")
@@ -150,7 +151,7 @@ async def test_auth_me_uses_non_blocking_effective_snapshot_when_local_dev_bypas
             used_runs=1,
         )
     )
-    db.commit()
+    await db.commit()
 
     response = await get_auth_me(
         request=_request(),
@@ -11,9 +11,15 @@ class _RollbackOnlyDB:
     def __init__(self) -> None:
         self.rollback_called = False
 
-    def rollback(self) -> None:
+    async def rollback(self) -> None:
         self.rollback_called = True
 
+    async def commit(self) -> None:
+        pass
+
+    async def run_sync(self, fn, *args, **kwargs):
+        return fn(self, *args, **kwargs)
+
 
 def _auth() -> AuthContext:
     return AuthContext(
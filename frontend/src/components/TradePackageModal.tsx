@@ -169,8 +169,10 @@ function TradePackageModal({ isOpen, onClose, projectId, trade, onGenerate }: Tr
 
   const handleDownloadSchematic = () => {
     if (packageData?.schematic) {
-      const base64Data = packageData.schematic.split(',')[1];
-      downloadFile(base64Data, `${trade}_schematic_${projectId}.png`, 'image/png');
+      const [header, base64Data] = packageData.schematic.split(',');
+      const isSvg = header.startsWith('data:image/svg+xml');
+      const extension = isSvg ? 'svg' : 'png';
+      downloadFile(base64Data, `${trade}_schematic_${projectId}.${extension}`, isSvg ? 'image/svg+xml' : 'image/png');
     }
   };
 
@@ -77,6 +77,10 @@ export const toUserSafeApiErrorMessage = (params: {
     return "We couldn't compare these scenarios right now. Please try again.";
   }
 
+  if (endpoint.endsWith('/dealshield/controls/preview')) {
+    return "We couldn't preview these DealShield assumptions right now. Please try again.";
+  }
+
   if (endpoint.includes('/dealshield/controls')) {
     return "We couldn't save DealShield assumptions right now. Please try again.";
   }
@@ -92,6 +96,23 @@ export const toUserSafeApiErrorMessage = (params: {
   return DEFAULT_USER_SAFE_ERROR_MESSAGE;
 };
 
+const normalizeDealShieldControls = (controls: DealShieldControls): DealShieldControls => {
+  const stressBand = [10, 7, 5, 3].includes(controls.stress_band_pct) ? controls.stress_band_pct : 10;
+  return {
+    stress_band_pct: stressBand as DealShieldControls['stress_band_pct'],
+    anchor_total_project_cost:
+      typeof controls.anchor_total_project_cost === 'number' && Number.isFinite(controls.anchor_total_project_cost)
+        ? controls.anchor_total_project_cost
+        : null,
+    use_cost_anchor: !!controls.use_cost_anchor,
+    anchor_annual_revenue:
+      typeof controls.anchor_annual_revenue === 'number' && Number.isFinite(controls.anchor_annual_revenue)
+        ? controls.anchor_annual_revenue
+        : null,
+    use_revenue_anchor: !!controls.use_revenue_anchor,
+  };
+};
+
 // eslint-disable-next-line @typescript-eslint/no-explicit-any
 const summarizeProject = (project: any) => {
   if (!project || typeof project !== 'object') {
@@ -500,28 +521,23 @@ class V2APIClient {
     return this.request<DealShieldViewModel>(`/scope/projects/${projectId}/dealshield`, {}, 'v2');
   }
 
+  /**
+   * Rebuild the DealShield view for unsaved controls; nothing is persisted.
+   */
+  async previewDealShieldControls(projectId: string, controls: DealShieldControls): Promise<DealShieldViewModel> {
+    return this.request<DealShieldViewModel>(`/scope/projects/${projectId}/dealshield/controls/preview`, {
+      method: 'POST',
+      body: JSON.stringify(normalizeDealShieldControls(controls)),
+    }, 'v2');
+  }
+
   /**
    * Persist DealShield controls onto the project calculation payload.
    */
   async updateDealShieldControls(projectId: string, controls: DealShieldControls): Promise<void> {
-    const stressBand = [10, 7, 5, 3].includes(controls.stress_band_pct) ? controls.stress_band_pct : 10;
-    const updatedControls: DealShieldControls = {
-      stress_band_pct: stressBand as DealShieldControls['stress_band_pct'],
-      anchor_total_project_cost:
-        typeof controls.anchor_total_project_cost === 'number' && Number.isFinite(controls.anchor_total_project_cost)
-          ? controls.anchor_total_project_cost
-          : null,
-      use_cost_anchor: !!controls.use_cost_anchor,
-      anchor_annual_revenue:
-        typeof controls.anchor_annual_revenue === 'number' && Number.isFinite(controls.anchor_annual_revenue)
-          ? controls.anchor_annual_revenue
-          : null,
-      use_revenue_anchor: !!controls.use_revenue_anchor,
-    };
-
     await this.request<any>(`/scope/projects/${projectId}/dealshield/controls`, {
       method: 'POST',
-      body: JSON.stringify(updatedControls),
+      body: JSON.stringify(normalizeDealShieldControls(controls)),
     }, 'v2');
   }
 
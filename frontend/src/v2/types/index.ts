@@ -244,6 +244,8 @@ export interface ProjectTotals {
   soft_costs: number;
   total_project_cost: number;
   cost_per_sf: number;
+  capitalized_interest?: number;
+  total_capitalized_cost?: number;
 }
 
 export interface TraceEntry {
@@ -521,6 +523,16 @@ export interface DecisionInsuranceFirstBreakCondition {
   observed_value_pct?: number | null;
 }
 
+export interface DecisionInsuranceDriverBreakPoint {
+  tile_id?: string | null;
+  label?: string | null;
+  metric_ref?: string | null;
+  delta_cost?: number | null;
+  break_stress_multiple?: number | null;
+  break_delta_cost?: number | null;
+  break_cost_increase_pct?: number | null;
+}
+
 export interface DecisionInsuranceRankedLikelyWrongItem {
   id?: string | null;
   text?: string | null;
@@ -563,6 +575,7 @@ export interface DecisionInsuranceProvenance {
   break_risk?: DecisionInsuranceProvenanceEntry;
   exposure_concentration_pct?: DecisionInsuranceProvenanceEntry;
   ranked_likely_wrong?: DecisionInsuranceProvenanceEntry;
+  driver_break_points?: DecisionInsuranceProvenanceEntry;
   [key: string]: any;
 }
 
@@ -577,6 +590,8 @@ export interface DealShieldDecisionInsuranceFields {
   break_risk?: DecisionInsuranceBreakRisk | null;
   exposure_concentration_pct?: number | null;
   ranked_likely_wrong?: DecisionInsuranceRankedLikelyWrongItem[];
+  driver_break_points?: DecisionInsuranceDriverBreakPoint[];
+  primary_control_break_point?: DecisionInsuranceDriverBreakPoint | null;
   decision_insurance_provenance?: DecisionInsuranceProvenance;
   decision_status?: DecisionStatus;
   decision_reason_code?: string;